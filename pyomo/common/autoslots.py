@@ -23,6 +23,11 @@ def _deepcopy_tuple(obj, memo, _id):
     ans = []
     unchanged = True
     for item in obj:
+        # Most tuples that we encounter (e.g., component indices) only
+        # contain atomic types (that do not need to be copied)
+        if item.__class__ in _atomic_types:
+            ans.append(item)
+            continue
         new_item = fast_deepcopy(item, memo)
         ans.append(new_item)
         if new_item is not item:
@@ -46,7 +51,9 @@ def _deepcopy_tuple(obj, memo, _id):
 def _deepcopy_list(obj, memo, _id):
     # Two steps here because a list can include itself
     memo[_id] = ans = []
-    ans.extend(fast_deepcopy(x, memo) for x in obj)
+    ans.extend(
+        [x if x.__class__ in _atomic_types else fast_deepcopy(x, memo) for x in obj]
+    )
     return ans
 
 
@@ -59,9 +66,64 @@ def _deepcopy_dict(obj, memo, _id):
 
 
 def _deepcopier(obj, memo, _id):
+    cls = obj.__class__
+    if getattr(cls, '__deepcopy__', None) is AutoSlots.Mixin.__deepcopy__:
+        # Dispatch directly to the generated state copier for
+        # subsequent objects of this type (bypassing the overhead of
+        # calling __deepcopy__())
+        _deepcopy_mapper[cls] = _deepcopy_autoslots(cls)
+        return _deepcopy_mapper[cls](obj, memo, _id)
+    if hasattr(cls, '__deepcopy__') and not isinstance(obj, type):
+        # Dispatch directly to the class __deepcopy__ for subsequent
+        # objects of this type (bypassing the overhead of
+        # copy.deepcopy()).
+        _deepcopy_mapper[obj.__class__] = _deepcopy_method
+        return _deepcopy_method(obj, memo, _id)
     return deepcopy(obj, memo)
 
 
+def _deepcopy_method(obj, memo, _id):
+    # Note: this is equivalent to copy.deepcopy() for objects that
+    # define __deepcopy__, except that it does not add the original
+    # object to the memo's "keep alive" list.  That is not necessary
+    # here, as the objects that we are copying are referenced by the
+    # (persistent) object being deepcopied.
+    ans = obj.__deepcopy__(memo)
+    if ans is not obj:
+        memo[_id] = ans
+    return ans
+
+
+def _deepcopy_autoslots(cls):
+    # Equivalent to AutoSlots.Mixin.__deepcopy__ for objects of type `cls`
+    copier = get_state_copier(cls)
+    new = cls.__new__
+
+    def deepcopier(obj, memo, _id):
+        memo[_id] = ans = new(cls)
+        copier(obj, ans, memo)
+        return ans
+
+    return deepcopier
+
+
+def _deepcopy_state(state, has_dict, memo):
+    """Deepcopy an object state generated by :py:meth:`AutoSlots.Mixin.__getstate__`
+
+    The `__dict__` in the state is a temporary copy, so we copy the
+    fields directly (and avoid registering the temporary dict in the memo).
+
+    """
+    if state.__class__ is not list:
+        return fast_deepcopy(state, memo)
+    if has_dict and state and state[-1].__class__ is dict:
+        fields = state.pop()
+        ans = [fast_deepcopy(field, memo) for field in state]
+        ans.append({k: fast_deepcopy(v, memo) for k, v in fields.items()})
+        return ans
+    return [fast_deepcopy(field, memo) for field in state]
+
+
 _atomic_types = {
     int,
     float,
@@ -269,10 +331,9 @@ class AutoSlots(type):
             """
             # Note: this implementation avoids deepcopying the temporary
             # 'state' list, significantly speeding things up.
-            memo[id(self)] = ans = self.__class__.__new__(self.__class__)
-            ans.__setstate__(
-                [fast_deepcopy(field, memo) for field in self.__getstate__()]
-            )
+            cls = self.__class__
+            memo[id(self)] = ans = cls.__new__(cls)
+            get_state_copier(cls)(self, ans, memo)
             return ans
 
         def __getstate__(self):
@@ -292,20 +353,11 @@ class AutoSlots(type):
             :py:class:`AutoSlots`)
 
             """
-            slots = [getattr(self, attr) for attr in self.__auto_slots__.slots]
-            # Map (encode) the slot values
-            for idx, mapper in self.__auto_slots__.slot_mappers.items():
-                slots[idx] = mapper(True, slots[idx])
-            # Copy and add the fields from __dict__ (if present)
-            if self.__auto_slots__.has_dict:
-                fields = dict(self.__dict__)
-                # Map (encode) any field values.  It is not an error if
-                # the field if not present.
-                for name, mapper in self.__auto_slots__.field_mappers.items():
-                    if name in fields:
-                        fields[name] = mapper(True, fields[name])
-                slots.append(fields)
-            return slots
+            try:
+                getter = _state_getters[self.__class__]
+            except KeyError:
+                getter = _generate_state_accessors(self.__class__)[0]
+            return getter(self)
 
         def __setstate__(self, state):
             """Generic implementation of `__setstate__`
@@ -319,26 +371,179 @@ class AutoSlots(type):
             :py:class:`AutoSlots`)
 
             """
-            # Map (decode) the slot values
-            for idx, mapper in self.__auto_slots__.slot_mappers.items():
-                state[idx] = mapper(False, state[idx])
-            #
-            # Note: per the Python data model docs, we explicitly set the
-            # attribute using object.__setattr__() instead of setting
-            # self.__dict__[key] = val.
-            #
-            # Restore the slots
-            setter = object.__setattr__
-            for attr, val in zip(self.__auto_slots__.slots, state):
-                setter(self, attr, val)
-            # If this class is not fully slotized, then pull off the
-            # __dict__ fields and map their values (if necessary)
-            if self.__auto_slots__.has_dict:
-                fields = state[-1]
-                for name, mapper in self.__auto_slots__.field_mappers.items():
-                    if name in fields:
-                        fields[name] = mapper(False, fields[name])
-                # Note that it appears to be faster to clear()/update()
-                # than to simplify assign to __dict__.
-                self.__dict__.clear()
-                self.__dict__.update(fields)
+            try:
+                setter = _state_setters[self.__class__]
+            except KeyError:
+                setter = _generate_state_accessors(self.__class__)[1]
+            setter(self, state)
+
+
+def _generic_setstate(self, state):
+    # Map (decode) the slot values
+    for idx, mapper in self.__auto_slots__.slot_mappers.items():
+        state[idx] = mapper(False, state[idx])
+    #
+    # Note: per the Python data model docs, we explicitly set the
+    # attribute using object.__setattr__() instead of setting
+    # self.__dict__[key] = val.
+    #
+    # Restore the slots
+    setter = object.__setattr__
+    for attr, val in zip(self.__auto_slots__.slots, state):
+        setter(self, attr, val)
+    # If this class is not fully slotized, then pull off the
+    # __dict__ fields and map their values (if necessary)
+    if self.__auto_slots__.has_dict:
+        fields = state[-1]
+        for name, mapper in self.__auto_slots__.field_mappers.items():
+            if name in fields:
+                fields[name] = mapper(False, fields[name])
+        # Note that it appears to be faster to clear()/update()
+        # than to simplify assign to __dict__.
+        self.__dict__.clear()
+        self.__dict__.update(fields)
+
+
+_state_getters = {}
+_state_setters = {}
+
+
+def _generate_state_accessors(cls):
+    """Generate the AutoSlots.Mixin `__getstate__` / `__setstate__` for `cls`
+
+    The generated functions unroll the loops over the slots (and slot
+    mappers) in the generic implementation, which significantly speeds
+    up pickling and unpickling.
+
+    """
+    has_dict, slots, slot_mappers, field_mappers = cls.__auto_slots__
+    namespace = {
+        '_setter': object.__setattr__,
+        '_field_mappers': field_mappers,
+        '_generic_setstate': _generic_setstate,
+    }
+    get_body = []
+    set_body = [
+        f"if len(state) != {len(slots) + has_dict}:",
+        "    return _generic_setstate(obj, state)",
+    ]
+    for i, slot in enumerate(slots):
+        if slot.isidentifier():
+            val = f"obj.{slot}"
+        else:
+            val = f"getattr(obj, {slot!r})"
+        mapper = slot_mappers.get(i, None)
+        if mapper is None:
+            get_body.append(f"{val},")
+            set_body.append(f"_setter(obj, {slot!r}, state[{i}])")
+        else:
+            namespace[f'_m{i}'] = mapper
+            get_body.append(f"_m{i}(True, {val}),")
+            set_body.append(f"_setter(obj, {slot!r}, _m{i}(False, state[{i}]))")
+    if has_dict:
+        get_body = (
+            [
+                "fields = dict(obj.__dict__)",
+                "for name, mapper in _field_mappers.items():",
+                "    if name in fields: fields[name] = mapper(True, fields[name])",
+                "return [",
+            ]
+            + ["    " + line for line in get_body]
+            + ["    fields,", "]"]
+        )
+        set_body.extend(
+            [
+                "fields = state[-1]",
+                "for name, mapper in _field_mappers.items():",
+                "    if name in fields: fields[name] = mapper(False, fields[name])",
+                "obj.__dict__.clear()",
+                "obj.__dict__.update(fields)",
+            ]
+        )
+    else:
+        get_body = ["return ["] + ["    " + line for line in get_body] + ["]"]
+    src = (
+        "def getter(obj):\n    "
+        + "\n    ".join(get_body)
+        + "\ndef setter(obj, state):\n    "
+        + "\n    ".join(set_body)
+    )
+    exec(src, namespace)
+    _state_getters[cls] = getter = namespace['getter']
+    _state_setters[cls] = setter = namespace['setter']
+    return getter, setter
+
+
+_copiers = {}
+
+
+def get_state_copier(cls):
+    """Return a function that deepcopies the state of one `cls` object into another
+
+    The returned function has the signature ``copier(src, dest, memo)``
+    and is equivalent to
+    ``dest.__setstate__(deepcopy(src.__getstate__(), memo))``, but it
+    does not generate the intermediate state lists.  The function is
+    generated (and cached) the first time it is requested for a class.
+    Classes that overload the :py:class:`AutoSlots.Mixin`
+    `__getstate__` / `__setstate__` methods get a generic copier that
+    calls their `__getstate__` / `__setstate__`.
+
+    """
+    try:
+        return _copiers[cls]
+    except KeyError:
+        pass
+    if (
+        getattr(cls, '__auto_slots__', None) is None
+        or cls.__getstate__ is not AutoSlots.Mixin.__getstate__
+        or cls.__setstate__ is not AutoSlots.Mixin.__setstate__
+    ):
+        has_dict = getattr(cls, '__auto_slots__', None) is not None and (
+            cls.__auto_slots__.has_dict
+        )
+
+        def copier(src, dest, memo):
+            dest.__setstate__(_deepcopy_state(src.__getstate__(), has_dict, memo))
+
+        _copiers[cls] = copier
+        return copier
+
+    has_dict, slots, slot_mappers, field_mappers = cls.__auto_slots__
+    namespace = {
+        '_atomic': _atomic_types,
+        '_copy': fast_deepcopy,
+        '_setter': object.__setattr__,
+        '_field_mappers': field_mappers,
+    }
+    body = []
+    for i, slot in enumerate(slots):
+        if slot.isidentifier():
+            body.append(f"v = src.{slot}")
+        else:
+            body.append(f"v = getattr(src, {slot!r})")
+        mapper = slot_mappers.get(i, None)
+        if mapper is None:
+            body.append("if v.__class__ not in _atomic: v = _copy(v, memo)")
+        else:
+            namespace[f'_m{i}'] = mapper
+            body.append(f"v = _m{i}(False, _copy(_m{i}(True, v), memo))")
+        body.append(f"_setter(dest, {slot!r}, v)")
+    if has_dict:
+        body.extend(
+            [
+                "fields = dict(src.__dict__)",
+                "for name, mapper in _field_mappers.items():",
+                "    if name in fields: fields[name] = mapper(True, fields[name])",
+                "for name, v in fields.items():",
+                "    if v.__class__ not in _atomic: fields[name] = _copy(v, memo)",
+                "for name, mapper in _field_mappers.items():",
+                "    if name in fields: fields[name] = mapper(False, fields[name])",
+                "dest.__dict__.clear()",
+                "dest.__dict__.update(fields)",
+            ]
+        )
+    src = "def copier(src, dest, memo):\n    " + "\n    ".join(body or ['pass'])
+    exec(src, namespace)
+    _copiers[cls] = copier = namespace['copier']
+    return copier
@@ -35,6 +35,52 @@ deletion_errors_are_fatal = True
 
 logger = logging.getLogger(__name__)
 
+# Filesystem types that hold their contents in memory
+_memory_filesystems = {'tmpfs', 'ramfs'}
+
+
+def memory_tempdir():
+    """Return a directory on a memory-backed filesystem
+
+    The candidate directories are ``/dev/shm`` and
+    ``$XDG_RUNTIME_DIR``.  A candidate is only returned if it is a
+    writable directory on a ``tmpfs`` (or ``ramfs``) filesystem (as
+    reported by ``/proc/mounts``).  Assigning the result to a
+    :class:`TempfileContext` ``tempdir`` keeps short-lived files (e.g.,
+    solver input and output files) out of (possibly network-mounted)
+    disk storage.
+
+    Returns
+    -------
+    dir: str or None
+        the memory-backed directory, or ``None`` if one is not available
+
+    """
+    try:
+        with open('/proc/mounts') as MOUNTS:
+            mounts = [line.split()[1:3] for line in MOUNTS]
+    except OSError:
+        return None
+    for dir in ('/dev/shm', os.environ.get('XDG_RUNTIME_DIR', None)):
+        if not dir or not os.path.isdir(dir):
+            continue
+        if not os.access(dir, os.W_OK | os.X_OK):
+            continue
+        path = os.path.realpath(dir)
+        # The filesystem holding the directory is the one mounted on
+        # the longest matching mount point
+        fs_type = None
+        mount_len = -1
+        for mount_point, _fs_type in mounts:
+            if len(mount_point) <= mount_len:
+                continue
+            if path == mount_point or path.startswith(mount_point.rstrip('/') + '/'):
+                mount_len = len(mount_point)
+                fs_type = _fs_type
+        if fs_type in _memory_filesystems:
+            return dir
+    return None
+
 
 class TempfileManagerClass(object):
     """A class for managing tempfile contexts
@@ -35,6 +35,7 @@ from pyomo.common.tempfiles import (
     TempfileManager,
     TempfileManagerClass,
     TempfileContextError,
+    memory_tempdir,
 )
 
 try:
@@ -441,6 +442,18 @@ class Test_TempfileManager(unittest.TestCase):
             self.TM.shutdown()
         self.assertEqual(LOG.getvalue(), "")
 
+    def test_memory_tempdir(self):
+        dname = memory_tempdir()
+        if dname is None:
+            self.skipTest("no memory-backed filesystem is available")
+        self.assertTrue(os.path.isdir(dname))
+        context = self.TM.push()
+        context.tempdir = dname
+        fname = self.TM.create_tempfile()
+        self.assertEqual(os.path.dirname(fname), dname)
+        self.TM.pop()
+        self.assertFalse(os.path.exists(fname))
+
     def test_del_clears_contexts(self):
         TM = TempfileManagerClass()
         ctx = TM.push()
@@ -15,7 +15,9 @@ from pyomo.core.base.sos import _SOSConstraintData, SOSConstraint
 from pyomo.core.base.var import _GeneralVarData, Var
 from pyomo.core.base.param import _ParamData, Param
 from pyomo.core.base.block import _BlockData, Block
-from pyomo.core.base.objective import _GeneralObjectiveData
+from pyomo.core.base.objective import _GeneralObjectiveData, _ObjectiveData
+from pyomo.core.base.expression import _ExpressionData
+from pyomo.core.base.component import ModelChangeLog
 from pyomo.common.collections import ComponentMap
 from .utils.get_objective import get_objective
 from .utils.collect_vars_and_named_exprs import collect_vars_and_named_exprs
@@ -427,6 +429,7 @@ class UpdateConfig(ConfigDict):
     update_vars: bool
     update_params: bool
     update_named_expressions: bool
+    track_changes: bool
     """
 
     def __init__(
@@ -571,6 +574,23 @@ class UpdateConfig(ConfigDict):
                 updating the values of fixed variables is much faster this way.""",
             ),
         )
+        self.declare(
+            'track_changes',
+            ConfigValue(
+                domain=bool,
+                default=False,
+                doc="""
+                If True, the solver records changes made to the model (through a
+                pyomo.core.base.component.ModelChangeLog) between calls to update(), and
+                update() only processes the components that were added, removed,
+                (de)activated, or modified instead of rescanning the entire model. Only
+                changes made through the public component APIs are detected (e.g.,
+                var.setlb() or param.set_value(), but not assignment to private attributes
+                like var._lb). Changes to the variables referenced by SOS constraints are
+                also not detected. The other update_config options still determine which
+                kinds of changes are processed.""",
+            ),
+        )
 
         self.check_for_new_or_removed_constraints: bool = True
         self.check_for_new_or_removed_vars: bool = True
@@ -582,6 +602,7 @@ class UpdateConfig(ConfigDict):
         self.update_named_expressions: bool = True
         self.update_objective: bool = True
         self.treat_fixed_vars_as_params: bool = True
+        self.track_changes: bool = False
 
 
 class Solver(abc.ABC):
@@ -922,6 +943,10 @@ class PersistentBase(abc.ABC):
         self._expr_types = None
         self.use_extensions = False
         self._only_child_vars = only_child_vars
+        self._change_log = None
+        # Logs for the models that own variables referenced by (but
+        # not declared on) the model (only_child_vars=False)
+        self._external_change_logs = dict()
 
     @property
     def update_config(self):
@@ -983,6 +1008,8 @@ class PersistentBase(abc.ABC):
             if v_id not in self._referenced_variables:
                 new_vars[v_id] = v
         self.add_variables(list(new_vars.values()))
+        if self._change_log is not None:
+            self._track_external_changes(new_vars.values())
 
     def _check_to_remove_vars(self, variables: List[_GeneralVarData]):
         vars_to_remove = dict()
@@ -1254,10 +1281,300 @@ class PersistentBase(abc.ABC):
     def update_params(self):
         pass
 
+    def _constraint_changed(self, c):
+        lower, body, upper = self._active_constraints[c]
+        new_lower, new_body, new_upper = c.lower, c.body, c.upper
+        if new_body is not body:
+            return True
+        if new_lower is not lower:
+            if not (
+                type(new_lower) is NumericConstant
+                and type(lower) is NumericConstant
+                and new_lower.value == lower.value
+            ):
+                return True
+        if new_upper is not upper:
+            if not (
+                type(new_upper) is NumericConstant
+                and type(upper) is NumericConstant
+                and new_upper.value == upper.value
+            ):
+                return True
+        return False
+
+    def _update_changed_vars(self, vars_to_check, cons_to_remove_and_add):
+        """Update the variables whose attributes changed since they were
+        added / last updated.
+
+        Constraints that must be reprocessed (because a fixed variable
+        changed) are added to `cons_to_remove_and_add`.  Returns True if
+        the objective must also be reprocessed.
+        """
+        need_to_set_objective = False
+        vars_to_update = list()
+        for v in vars_to_check:
+            _v, lb, ub, fixed, domain_interval, value = self._vars[id(v)]
+            if lb is not v._lb:
+                vars_to_update.append(v)
+            elif ub is not v._ub:
+                vars_to_update.append(v)
+            elif (fixed is not v.fixed) or (fixed and (value != v.value)):
+                vars_to_update.append(v)
+                if self.update_config.treat_fixed_vars_as_params:
+                    for c in self._referenced_variables[id(v)][0]:
+                        cons_to_remove_and_add[c] = None
+                    if self._referenced_variables[id(v)][2] is not None:
+                        need_to_set_objective = True
+            elif domain_interval != v.domain.get_interval():
+                vars_to_update.append(v)
+        self.update_variables(vars_to_update)
+        return need_to_set_objective
+
+    def _update_named_expressions(self, new_cons_set):
+        """Reprocess the constraints that use named expressions whose
+        expression changed.  Returns True if the objective must also be
+        reprocessed.
+        """
+        cons_to_update = list()
+        for c, expr_list in self._named_expressions.items():
+            if c in new_cons_set:
+                continue
+            for named_expr, old_expr in expr_list:
+                if named_expr.expr is not old_expr:
+                    cons_to_update.append(c)
+                    break
+        self.remove_constraints(cons_to_update)
+        self.add_constraints(cons_to_update)
+        for named_expr, old_expr in self._obj_named_expressions:
+            if named_expr.expr is not old_expr:
+                return True
+        return False
+
     def update(self, timer: HierarchicalTimer = None):
         if timer is None:
             timer = HierarchicalTimer()
         config = self.update_config
+        if not config.track_changes:
+            if self._change_log is not None:
+                self._change_log.stop()
+                self._change_log = None
+                for log in self._external_change_logs.values():
+                    log.stop()
+                self._external_change_logs.clear()
+        elif self._change_log is not None:
+            self._update_from_change_log(timer)
+            return
+        self._update_all(timer)
+        if config.track_changes:
+            # Start recording changes once the solver is in sync with
+            # the model; subsequent updates only process the changes
+            self._change_log = ModelChangeLog(self._model)
+            self._change_log.start()
+            if not self._only_child_vars:
+                self._track_external_changes(v[0] for v in self._vars.values())
+
+    def _track_external_changes(self, variables):
+        """Start change logs for the models that own any of `variables`
+        that are not declared on the model"""
+        for v in variables:
+            root = v
+            parent = root.parent_block()
+            while parent is not None:
+                root = parent
+                parent = root.parent_block()
+            if root is self._model or id(root) in self._external_change_logs:
+                continue
+            log = self._external_change_logs[id(root)] = ModelChangeLog(root)
+            log.start()
+
+    def _pop_change_records(self):
+        ans = self._change_log.pop_records()
+        for log in self._external_change_logs.values():
+            ans.extend(log.pop_records())
+        return ans
+
+    def _in_model(self, obj, active):
+        """Return True if `obj` is (still) part of the model (and, if
+        `active` is True, is active and on an active block)"""
+        model = self._model
+        while obj is not model:
+            comp = obj.parent_component()
+            if comp is None or comp._data.get(obj._index, None) is not obj:
+                return False
+            if active and not (obj.active and comp.active):
+                return False
+            obj = comp.parent_block()
+            if obj is None:
+                return False
+        return not active or obj.active
+
+    def _update_from_change_log(self, timer):
+        """Update the solver using only the components recorded in the
+        change log since the last update"""
+        config = self.update_config
+        # The components that were added, removed, or (de)activated
+        changed_vars = dict()
+        changed_params = dict()
+        changed_cons = dict()
+        changed_sos = dict()
+        # The components that were modified
+        modified_vars = dict()
+        modified_cons = dict()
+        params_modified = False
+        named_exprs_modified = False
+        objective_modified = False
+        check_for_new_objective = False
+
+        for event, obj in self._pop_change_records():
+            if event == 'modify':
+                if isinstance(obj, _GeneralVarData):
+                    modified_vars[id(obj)] = obj
+                elif isinstance(obj, _ParamData):
+                    if id(obj) in self._params:
+                        params_modified = True
+                elif isinstance(obj, _GeneralConstraintData):
+                    modified_cons[obj] = None
+                elif isinstance(obj, _ObjectiveData):
+                    objective_modified = True
+                elif isinstance(obj, _ExpressionData):
+                    named_exprs_modified = True
+                continue
+            if obj.is_indexed():
+                obj_data = obj.values()
+            else:
+                obj_data = (obj,)
+            for _obj in obj_data:
+                if isinstance(_obj, _BlockData):
+                    check_for_new_objective = True
+                    data = _obj.component_data_objects(
+                        (Var, Param, Constraint, SOSConstraint), descend_into=True
+                    )
+                else:
+                    data = (_obj,)
+                for o in data:
+                    if isinstance(o, _GeneralVarData):
+                        changed_vars[id(o)] = o
+                    elif isinstance(o, _ParamData):
+                        changed_params[id(o)] = o
+                    elif isinstance(o, _GeneralConstraintData):
+                        changed_cons[o] = None
+                    elif isinstance(o, _SOSConstraintData):
+                        changed_sos[o] = None
+                    elif isinstance(o, _ObjectiveData):
+                        check_for_new_objective = True
+
+        new_vars = list()
+        old_vars = list()
+        new_params = list()
+        old_params = list()
+        new_cons = list()
+        old_cons = list()
+        new_sos = list()
+        old_sos = list()
+        timer.start('vars')
+        if self._only_child_vars and (
+            config.check_for_new_or_removed_vars or config.update_vars
+        ):
+            for v_id, v in changed_vars.items():
+                if self._in_model(v, False):
+                    if v_id not in self._vars:
+                        new_vars.append(v)
+                elif v_id in self._vars:
+                    old_vars.append(v)
+        timer.stop('vars')
+        timer.start('params')
+        if config.check_for_new_or_removed_params:
+            for p_id, p in changed_params.items():
+                if self._in_model(p, False) and p.parent_component().mutable:
+                    if p_id not in self._params:
+                        new_params.append(p)
+                elif p_id in self._params:
+                    old_params.append(p)
+        timer.stop('params')
+        timer.start('cons')
+        if config.check_for_new_or_removed_constraints or config.update_constraints:
+            for con_dict, new_list, old_list in (
+                (changed_cons, new_cons, old_cons),
+                (changed_sos, new_sos, old_sos),
+            ):
+                for c in con_dict:
+                    if self._in_model(c, True):
+                        if c not in self._vars_referenced_by_con:
+                            new_list.append(c)
+                    elif c in self._vars_referenced_by_con:
+                        old_list.append(c)
+        self.remove_constraints(old_cons)
+        self.remove_sos_constraints(old_sos)
+        timer.stop('cons')
+        timer.start('vars')
+        self.remove_variables(old_vars)
+        timer.stop('vars')
+        timer.start('params')
+        self.remove_params(old_params)
+        if config.update_params and params_modified:
+            self.update_params()
+        self.add_params(new_params)
+        timer.stop('params')
+        timer.start('vars')
+        self.add_variables(new_vars)
+        timer.stop('vars')
+        timer.start('cons')
+        self.add_constraints(new_cons)
+        self.add_sos_constraints(new_sos)
+        new_cons_set = set(new_cons)
+        new_vars_set = set(id(v) for v in new_vars)
+        cons_to_remove_and_add = dict()
+        need_to_set_objective = False
+        if config.update_constraints:
+            for c in modified_cons:
+                if (
+                    c in self._active_constraints
+                    and c not in new_cons_set
+                    and self._constraint_changed(c)
+                ):
+                    cons_to_remove_and_add[c] = None
+        timer.stop('cons')
+        timer.start('vars')
+        if config.update_vars:
+            vars_to_check = [
+                v
+                for v_id, v in modified_vars.items()
+                if v_id in self._vars and v_id not in new_vars_set
+            ]
+            if self._update_changed_vars(vars_to_check, cons_to_remove_and_add):
+                need_to_set_objective = True
+        timer.stop('vars')
+        timer.start('cons')
+        cons_to_remove_and_add = list(cons_to_remove_and_add.keys())
+        self.remove_constraints(cons_to_remove_and_add)
+        self.add_constraints(cons_to_remove_and_add)
+        timer.stop('cons')
+        timer.start('named expressions')
+        if config.update_named_expressions and named_exprs_modified:
+            if self._update_named_expressions(new_cons_set):
+                need_to_set_objective = True
+        timer.stop('named expressions')
+        timer.start('objective')
+        if config.check_for_new_objective and check_for_new_objective:
+            pyomo_obj = get_objective(self._model)
+            if pyomo_obj is not self._objective:
+                need_to_set_objective = True
+        else:
+            pyomo_obj = self._objective
+        if config.update_objective and objective_modified and pyomo_obj is not None:
+            if pyomo_obj.expr is not self._objective_expr:
+                need_to_set_objective = True
+            elif pyomo_obj.sense is not self._objective_sense:
+                need_to_set_objective = True
+        if need_to_set_objective:
+            self.set_objective(pyomo_obj)
+        timer.stop('objective')
+        # Discard the changes made while updating the solver (e.g.,
+        # temporarily unfixing variables in add_constraints())
+        self._pop_change_records()
+
+    def _update_all(self, timer):
+        config = self.update_config
         new_vars = list()
         old_vars = list()
         new_params = list()
@@ -1368,31 +1685,8 @@ class PersistentBase(abc.ABC):
                 if c not in new_sos_set:
                     sos_to_update.append(c)
             for c in cons_to_update:
-                lower, body, upper = self._active_constraints[c]
-                new_lower, new_body, new_upper = c.lower, c.body, c.upper
-                if new_body is not body:
+                if self._constraint_changed(c):
                     cons_to_remove_and_add[c] = None
-                    continue
-                if new_lower is not lower:
-                    if (
-                        type(new_lower) is NumericConstant
-                        and type(lower) is NumericConstant
-                        and new_lower.value == lower.value
-                    ):
-                        pass
-                    else:
-                        cons_to_remove_and_add[c] = None
-                        continue
-                if new_upper is not upper:
-                    if (
-                        type(new_upper) is NumericConstant
-                        and type(upper) is NumericConstant
-                        and new_upper.value == upper.value
-                    ):
-                        pass
-                    else:
-                        cons_to_remove_and_add[c] = None
-                        continue
             self.remove_sos_constraints(sos_to_update)
             self.add_sos_constraints(sos_to_update)
         timer.stop('cons')
@@ -1406,23 +1700,8 @@ class PersistentBase(abc.ABC):
             end_vars = {v_id: v_tuple[0] for v_id, v_tuple in self._vars.items()}
             vars_to_check = [v for v_id, v in end_vars.items() if v_id in start_vars]
         if config.update_vars:
-            vars_to_update = list()
-            for v in vars_to_check:
-                _v, lb, ub, fixed, domain_interval, value = self._vars[id(v)]
-                if lb is not v._lb:
-                    vars_to_update.append(v)
-                elif ub is not v._ub:
-                    vars_to_update.append(v)
-                elif (fixed is not v.fixed) or (fixed and (value != v.value)):
-                    vars_to_update.append(v)
-                    if self.update_config.treat_fixed_vars_as_params:
-                        for c in self._referenced_variables[id(v)][0]:
-                            cons_to_remove_and_add[c] = None
-                        if self._referenced_variables[id(v)][2] is not None:
-                            need_to_set_objective = True
-                elif domain_interval != v.domain.get_interval():
-                    vars_to_update.append(v)
-            self.update_variables(vars_to_update)
+            if self._update_changed_vars(vars_to_check, cons_to_remove_and_add):
+                need_to_set_objective = True
         timer.stop('vars')
         timer.start('cons')
         cons_to_remove_and_add = list(cons_to_remove_and_add.keys())
@@ -1431,20 +1710,8 @@ class PersistentBase(abc.ABC):
         timer.stop('cons')
         timer.start('named expressions')
         if config.update_named_expressions:
-            cons_to_update = list()
-            for c, expr_list in self._named_expressions.items():
-                if c in new_cons_set:
-                    continue
-                for named_expr, old_expr in expr_list:
-                    if named_expr.expr is not old_expr:
-                        cons_to_update.append(c)
-                        break
-            self.remove_constraints(cons_to_update)
-            self.add_constraints(cons_to_update)
-            for named_expr, old_expr in self._obj_named_expressions:
-                if named_expr.expr is not old_expr:
-                    need_to_set_objective = True
-                    break
+            if self._update_named_expressions(new_cons_set):
+                need_to_set_objective = True
         timer.stop('named expressions')
         timer.start('objective')
         if self.update_config.check_for_new_objective:
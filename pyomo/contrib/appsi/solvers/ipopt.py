@@ -31,6 +31,7 @@ from pyomo.common.errors import PyomoException
 import os
 from pyomo.contrib.appsi.cmodel import cmodel_available
 from pyomo.core.staleflag import StaleFlagManager
+from pyomo.opt.plugins.sol import parse_sol_file
 
 
 logger = logging.getLogger(__name__)
@@ -297,11 +298,10 @@ class Ipopt(PersistentSolver):
         solve_cons = self._writer.get_ordered_cons()
         results = Results()
 
-        f = open(self._filename + '.sol', 'r')
-        all_lines = list(f.readlines())
-        f.close()
+        with open(self._filename + '.sol', 'rb') as f:
+            sol = parse_sol_file(f)
 
-        termination_line = all_lines[1]
+        termination_line = sol.message
         if 'Optimal Solution Found' in termination_line:
             results.termination_condition = TerminationCondition.optimal
         elif 'Problem may be infeasible' in termination_line:
@@ -315,63 +315,21 @@ class Ipopt(PersistentSolver):
         else:
             results.termination_condition = TerminationCondition.unknown
 
-        n_cons = len(solve_cons)
-        n_vars = len(solve_vars)
-        dual_lines = all_lines[12 : 12 + n_cons]
-        primal_lines = all_lines[12 + n_cons : 12 + n_cons + n_vars]
-
-        rc_upper_info_line = all_lines[12 + n_cons + n_vars + 1]
-        assert rc_upper_info_line.startswith('suffix')
-        n_rc_upper = int(rc_upper_info_line.split()[2])
-        assert 'ipopt_zU_out' in all_lines[12 + n_cons + n_vars + 2]
-        upper_rc_lines = all_lines[
-            12 + n_cons + n_vars + 3 : 12 + n_cons + n_vars + 3 + n_rc_upper
-        ]
+        assert len(sol.duals) == len(solve_cons)
+        assert len(sol.primals) == len(solve_vars)
+        assert 'ipopt_zU_out' in sol.var_suffixes
+        assert 'ipopt_zL_out' in sol.var_suffixes
 
-        rc_lower_info_line = all_lines[12 + n_cons + n_vars + 3 + n_rc_upper]
-        assert rc_lower_info_line.startswith('suffix')
-        n_rc_lower = int(rc_lower_info_line.split()[2])
-        assert 'ipopt_zL_out' in all_lines[12 + n_cons + n_vars + 3 + n_rc_upper + 1]
-        lower_rc_lines = all_lines[
-            12
-            + n_cons
-            + n_vars
-            + 3
-            + n_rc_upper
-            + 2 : 12
-            + n_cons
-            + n_vars
-            + 3
-            + n_rc_upper
-            + 2
-            + n_rc_lower
-        ]
-
-        self._dual_sol = dict()
-        self._primal_sol = ComponentMap()
+        self._dual_sol = dict(zip(solve_cons, sol.duals.tolist()))
+        self._primal_sol = ComponentMap(zip(solve_vars, sol.primals.tolist()))
         self._reduced_costs = ComponentMap()
 
-        for ndx, dual in enumerate(dual_lines):
-            dual = float(dual)
-            con = solve_cons[ndx]
-            self._dual_sol[con] = dual
-
-        for ndx, primal in enumerate(primal_lines):
-            primal = float(primal)
-            var = solve_vars[ndx]
-            self._primal_sol[var] = primal
-
-        for rcu_line in upper_rc_lines:
-            split_line = rcu_line.split()
-            var_ndx = int(split_line[0])
-            rcu = float(split_line[1])
-            var = solve_vars[var_ndx]
-            self._reduced_costs[var] = rcu
+        rcu_ndx, rcu_vals = sol.var_suffixes['ipopt_zU_out']
+        for var_ndx, rcu in zip(rcu_ndx.tolist(), rcu_vals.tolist()):
+            self._reduced_costs[solve_vars[var_ndx]] = rcu
 
-        for rcl_line in lower_rc_lines:
-            split_line = rcl_line.split()
-            var_ndx = int(split_line[0])
-            rcl = float(split_line[1])
+        rcl_ndx, rcl_vals = sol.var_suffixes['ipopt_zL_out']
+        for var_ndx, rcl in zip(rcl_ndx.tolist(), rcl_vals.tolist()):
             var = solve_vars[var_ndx]
             if var in self._reduced_costs:
                 if abs(rcl) > abs(self._reduced_costs[var]):
@@ -1,4 +1,5 @@
 from pyomo.common import unittest
+from pyomo.common.dependencies import numpy_available
 from pyomo.contrib import appsi
 import pyomo.environ as pe
 from pyomo.core.base.var import ScalarVar
@@ -89,3 +90,236 @@ class TestResults(unittest.TestCase):
         slacks2 = res.solution_loader.get_slacks([m.c2])
         self.assertNotIn(m.c1, slacks2)
         self.assertAlmostEqual(slacks[m.c2], slacks2[m.c2])
+
+
+class _RecordingPersistent(appsi.base.PersistentBase):
+    def __init__(self, only_child_vars=True):
+        super().__init__(only_child_vars=only_child_vars)
+        self.calls = list()
+
+    def _record(self, method, items):
+        if items:
+            self.calls.append((method, sorted(str(i) for i in items)))
+
+    def set_instance(self, model):
+        # Mirror the appsi writers (PersistentBase.set_instance() does
+        # not preserve only_child_vars)
+        saved_update_config = self.update_config
+        self.__init__(only_child_vars=self._only_child_vars)
+        self.update_config = saved_update_config
+        self._model = model
+        self.add_block(model)
+        if self._objective is None:
+            self.set_objective(None)
+
+    def _add_variables(self, variables):
+        self._record('add_variables', [v.name for v in variables])
+
+    def _add_params(self, params):
+        self._record('add_params', [p.name for p in params])
+
+    def _add_constraints(self, cons):
+        self._record('add_constraints', [c.name for c in cons])
+
+    def _add_sos_constraints(self, cons):
+        self._record('add_sos_constraints', [c.name for c in cons])
+
+    def _set_objective(self, obj):
+        self.calls.append(('set_objective', None if obj is None else obj.name))
+
+    def _remove_constraints(self, cons):
+        self._record('remove_constraints', [c.name for c in cons])
+
+    def _remove_sos_constraints(self, cons):
+        self._record('remove_sos_constraints', [c.name for c in cons])
+
+    def _remove_variables(self, variables):
+        self._record('remove_variables', [v.name for v in variables])
+
+    def _remove_params(self, params):
+        self._record('remove_params', [p.name for p in params])
+
+    def _update_variables(self, variables):
+        self._record('update_variables', [v.name for v in variables])
+
+    def update_params(self):
+        self.calls.append(('update_params',))
+
+
+class TestTrackChanges(unittest.TestCase):
+    def _model(self):
+        m = pe.ConcreteModel()
+        m.I = pe.Set(initialize=[1, 2, 3])
+        m.x = pe.Var(m.I, bounds=(0, 10))
+        m.y = pe.Var()
+        m.p = pe.Param(m.I, mutable=True, initialize=1)
+        m.e = pe.Expression(expr=m.x[1] + m.x[2])
+        m.c = pe.Constraint(m.I, rule=lambda m, i: m.p[i] * m.x[i] <= m.y)
+        m.d = pe.Constraint(expr=m.e >= 1)
+        m.cl = pe.ConstraintList()
+        m.o = pe.Objective(expr=m.y)
+        m.b = pe.Block()
+        m.b.z = pe.Var()
+        m.b.c = pe.Constraint(expr=m.b.z == m.x[3])
+        return m
+
+    def _check(self, m, tracked, full, compare_calls=True):
+        for opt in (tracked, full):
+            opt.calls = list()
+            opt.update()
+        if compare_calls:
+            # the full update always calls update_params()
+            self.assertEqual(
+                [c for c in tracked.calls if c[0] != 'update_params'],
+                [c for c in full.calls if c[0] != 'update_params'],
+            )
+        self.assertEqual(set(tracked._vars), set(full._vars))
+        self.assertEqual(set(tracked._params), set(full._params))
+        self.assertEqual(
+            set(tracked._vars_referenced_by_con), set(full._vars_referenced_by_con)
+        )
+        self.assertIs(tracked._objective, full._objective)
+        return tracked.calls
+
+    def test_track_changes(self):
+        m = self._model()
+        tracked = _RecordingPersistent()
+        tracked.update_config.track_changes = True
+        tracked.set_instance(m)
+        full = _RecordingPersistent()
+        full.set_instance(m)
+        self.assertIsNone(tracked._change_log)
+        # The first update does the full rescan and starts the log
+        self._check(m, tracked, full)
+        self.assertTrue(tracked._change_log.active)
+
+        # No changes: nothing to do
+        self.assertEqual(self._check(m, tracked, full), [])
+
+        m.x[1].setub(5)
+        m.p[2] = 3
+        self.assertEqual(
+            self._check(m, tracked, full, compare_calls=False),
+            [('update_params',), ('update_variables', ['x[1]'])],
+        )
+
+        m.x[2].fix(1)
+        self._check(m, tracked, full)
+        m.x[2].value = 2
+        self._check(m, tracked, full)
+        m.x[2].unfix()
+        self._check(m, tracked, full)
+
+        m.c[1].deactivate()
+        self._check(m, tracked, full)
+        m.c[1].activate()
+        self._check(m, tracked, full)
+        m.b.deactivate()
+        self._check(m, tracked, full)
+        m.b.activate()
+        self._check(m, tracked, full)
+
+        m.c[3].set_value(m.x[3] >= 1)
+        self._check(m, tracked, full)
+        m.e.expr = m.x[1] - m.x[2]
+        self._check(m, tracked, full)
+
+        m.q = pe.Param(mutable=True, initialize=2)
+        m.w = pe.Var()
+        m.c2 = pe.Constraint(expr=m.w + m.b.z >= m.q)
+        self._check(m, tracked, full)
+        m.cl.add(m.w <= 4)
+        self._check(m, tracked, full)
+        del m.cl[1]
+        self._check(m, tracked, full)
+        m.del_component(m.c2)
+        m.del_component(m.w)
+        m.del_component(m.q)
+        self._check(m, tracked, full)
+        m.del_component(m.b)
+        self._check(m, tracked, full)
+
+        m.o.sense = pe.maximize
+        self._check(m, tracked, full)
+        m.o.deactivate()
+        m.o2 = pe.Objective(expr=m.x[3])
+        self._check(m, tracked, full)
+        self.assertIs(tracked._objective, m.o2)
+
+        # Changes to other models are ignored
+        m2 = self._model()
+        m2.x[1].setub(1)
+        self.assertEqual(self._check(m, tracked, full), [])
+
+        # Disabling change tracking stops the log
+        tracked.update_config.track_changes = False
+        log = tracked._change_log
+        self._check(m, tracked, full)
+        self.assertIsNone(tracked._change_log)
+        self.assertFalse(log.active)
+
+    def test_track_changes_fixed_vars(self):
+        m = self._model()
+        tracked = _RecordingPersistent()
+        tracked.update_config.track_changes = True
+        tracked.update_config.treat_fixed_vars_as_params = False
+        tracked.set_instance(m)
+        full = _RecordingPersistent()
+        full.update_config.treat_fixed_vars_as_params = False
+        full.set_instance(m)
+        self._check(m, tracked, full)
+        m.x[1].fix(2)
+        self._check(m, tracked, full)
+        # The temporary unfix/fix in add_constraints is not recorded
+        self.assertEqual(tracked._change_log.records, [])
+        m.x[1].value = 3
+        self._check(m, tracked, full)
+
+    @unittest.skipUnless(numpy_available, "Numpy is not installed")
+    def test_track_changes_bulk_updates(self):
+        m = self._model()
+        tracked = _RecordingPersistent()
+        tracked.update_config.track_changes = True
+        tracked.set_instance(m)
+        full = _RecordingPersistent()
+        full.set_instance(m)
+        self._check(m, tracked, full)
+        m.x.set_values_array([1, 2, 3], 'lb')
+        self.assertEqual(
+            self._check(m, tracked, full),
+            [('update_variables', ['x[1]', 'x[2]', 'x[3]'])],
+        )
+        m.x.set_values_array([True, False, False], 'fixed')
+        self._check(m, tracked, full)
+        m.x.set_values_array([4, 5, 6], skip_validation=True)
+        self._check(m, tracked, full)
+
+    def test_track_changes_other_models(self):
+        m = self._model()
+        other = self._model()
+        m.c_other = pe.Constraint(expr=other.x[1] + m.y >= 0)
+        tracked = _RecordingPersistent(only_child_vars=False)
+        tracked.update_config.track_changes = True
+        tracked.set_instance(m)
+        full = _RecordingPersistent(only_child_vars=False)
+        full.set_instance(m)
+        self._check(m, tracked, full)
+
+        # Changes to other models are only recorded for the models
+        # that own variables referenced by this model
+        other.x[1].setub(5)
+        self.assertEqual(
+            self._check(m, tracked, full), [('update_variables', ['x[1]'])]
+        )
+        other.x[2].setub(5)
+        self.assertEqual(self._check(m, tracked, full), [])
+        third = self._model()
+        m.c_third = pe.Constraint(expr=third.y >= 1)
+        self._check(m, tracked, full)
+        third.y.setlb(-1)
+        self.assertEqual(self._check(m, tracked, full), [('update_variables', ['y'])])
+        self.assertEqual(len(tracked._external_change_logs), 2)
+
+        tracked.update_config.track_changes = False
+        self._check(m, tracked, full)
+        self.assertEqual(tracked._external_change_logs, {})
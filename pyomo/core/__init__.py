@@ -196,6 +196,7 @@ from pyomo.core.base.PyomoModel import (
 from pyomo.core.base.transformation import Transformation, TransformationFactory
 
 from pyomo.core.base.instance2dat import instance2dat
+from pyomo.core.base.snapshot import save_model, load_model
 
 from pyomo.core.util import (
     prod,
@@ -237,6 +237,20 @@ class ModelSolutions(object):
             #
             self.clear(clear_symbol_maps=False)
         #
+        # Solutions read directly into arrays (see the `direct_load`
+        # solver option) bypass the Solution objects and the symbol map
+        #
+        direct = results.__dict__.get('_direct_solution', None)
+        if direct is not None:
+            if delete_symbol_map:
+                results._smap = None
+                smap_id = results.__dict__.get('_smap_id')
+                if smap_id in self.symbol_map:
+                    self.delete_symbol_map(smap_id)
+            if not select is None:
+                self._load_direct(direct, default_variable_value)
+            return
+        #
         # Load all solutions
         #
         if len(results.solution) == 0:
@@ -283,6 +297,49 @@ class ModelSolutions(object):
                 ignore_fixed_vars=ignore_fixed_vars,
             )
 
+    def _load_direct(self, soln, default_variable_value=None):
+        """
+        Load a DirectSolution into the model (following the semantics
+        of select()).  If the solution does not contain variable values,
+        the variables written to the NL file are set to the
+        default_variable_value (if not None).
+        """
+        instance = self._instance()
+        StaleFlagManager.mark_all_as_stale()
+
+        valid_import_suffixes = dict(active_import_suffix_generator(instance))
+        for suffix in valid_import_suffixes.values():
+            suffix.clear_all_values()
+
+        nl_info = soln.nl_info
+        sol = soln.sol
+        if len(sol.primals):
+            nl_info.load_vars(sol.primals)
+        elif default_variable_value is not None:
+            nl_info.load_vars([default_variable_value] * len(nl_info.variables))
+        if 'dual' in valid_import_suffixes:
+            valid_import_suffixes['dual'].update_values(
+                nl_info.get_duals(sol.duals), expand=False
+            )
+        for components, suffix_data in (
+            (nl_info.variables, sol.var_suffixes),
+            (nl_info.constraints, sol.con_suffixes),
+            (nl_info.objectives, sol.obj_suffixes),
+        ):
+            for name, (idx, vals) in suffix_data.items():
+                name = name[0].lower() + name[1:]
+                if name not in valid_import_suffixes:
+                    continue
+                valid_import_suffixes[name].update_values(
+                    (
+                        (components[i][0], val)
+                        for i, val in zip(idx.tolist(), vals.tolist())
+                    ),
+                    expand=False,
+                )
+
+        StaleFlagManager.mark_all_as_stale(delayed=True)
+
     def store_to(self, results, cuid=False, skip_stale_vars=False):
         """
         Return a Solution() object that is populated with the values in the model.
@@ -138,6 +138,7 @@ from pyomo.core.base.PyomoModel import (
 from pyomo.core.base.transformation import Transformation, TransformationFactory
 
 from pyomo.core.base.instance2dat import instance2dat
+from pyomo.core.base.snapshot import save_model, load_model
 
 # These APIs are deprecated and should be removed in the near future
 from pyomo.core.base.set import set_options, RealSet, IntegerSet, BooleanSet
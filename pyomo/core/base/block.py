@@ -41,20 +41,33 @@ from pyomo.common.deprecation import deprecated, deprecation_warning, RenamedCla
 from pyomo.common.formatting import StreamIndenter
 from pyomo.common.gc_manager import PauseGC
 from pyomo.common.log import is_debug_set
+from pyomo.common.modeling import NOTSET
 from pyomo.common.sorting import sorted_robust
 from pyomo.common.timing import ConstructionTimer
 from pyomo.core.base.component import (
     Component,
     ActiveComponentData,
     ModelComponentFactory,
+    structure_version,
+    _change_logs,
+    _log_change,
 )
 from pyomo.core.base.enums import SortComponents, TraversalStrategy
 from pyomo.core.base.global_set import UnindexedComponent_index
 from pyomo.core.base.componentuid import ComponentUID
-from pyomo.core.base.set import Any, GlobalSetBase, _SetDataBase
+from pyomo.core.base.set import (
+    Any,
+    GlobalSetBase,
+    Set,
+    _SetDataBase,
+    _FiniteSetData,
+    _OrderedSetData,
+)
+from pyomo.core.base.param import Param
 from pyomo.core.base.var import Var
 from pyomo.core.base.initializer import Initializer
 from pyomo.core.base.indexed_component import (
+    IndexedComponent,
     ActiveIndexedComponent,
     UnindexedComponent_set,
 )
@@ -497,6 +510,38 @@ class PseudoMap(AutoSlots.Mixin):
         return self.items()
 
 
+def _traversal_cache_mapper(encode, val):
+    if encode and val is not None:
+        return {}
+    return val
+
+
+def _hashable_ctypes(ctype):
+    # Return a hashable (order-independent) representation of the
+    # ctype / descend_into traversal arguments, or NOTSET if the
+    # argument should not be cached (e.g., SubclassOf)
+    if ctype is None or ctype is True or ctype is False or isclass(ctype):
+        return ctype
+    if ctype.__class__ in (tuple, list, set, frozenset) and all(
+        isclass(x) for x in ctype
+    ):
+        return frozenset(ctype)
+    return NOTSET
+
+
+def _iter_cached_traversal(data, fcn, args):
+    version = structure_version.value
+    for i, obj in enumerate(data):
+        yield obj
+        if structure_version.value != version:
+            # The model was changed during the traversal.  Continue with
+            # a (lazy) uncached traversal so that we see the changes
+            # (skipping anything that was already returned).
+            seen = set(map(id, data[: i + 1]))
+            yield from (obj for obj in fcn(*args) if id(obj) not in seen)
+            return
+
+
 class _BlockData(ActiveComponentData):
     """
     This class holds the fundamental block data.
@@ -508,6 +553,11 @@ class _BlockData(ActiveComponentData):
     #  TODO: remove repn caching from the model
     __autoslot_mappers = {'_repn': AutoSlots.encode_as_none}
 
+    # Cached block traversals (see enable_traversal_cache()) are not
+    # copied or pickled (only whether the cache is enabled)
+    __autoslot_mappers__ = {'_traversal_cache': _traversal_cache_mapper}
+    _traversal_cache = None
+
     def __init__(self, component):
         #
         # BLOCK DATA ELEMENTS
@@ -1065,6 +1115,9 @@ component, use the block del_component() and add_component() methods.
         #
         val._parent = weakref.ref(self)
         val._name = name
+        structure_version.value += 1
+        if _change_logs:
+            _log_change('add', val)
         #
         # We want to add the temporary / implicit sets first so that
         # they get constructed before this component
@@ -1234,8 +1287,12 @@ Components must now specify their rules explicitly using 'rule=' keywords."""
         if ctype_info[2] == 0:
             del self._ctypes[obj.ctype]
 
+        if _change_logs:
+            # (record the change while obj is still on the model)
+            _log_change('remove', obj)
         # Clear the _parent attribute
         obj._parent = None
+        structure_version.value += 1
 
         # Now that this component is not in the _decl map, we can call
         # delattr as usual.
@@ -1295,6 +1352,7 @@ Components must now specify their rules explicitly using 'rule=' keywords."""
                 ctype_info[1] = prev
 
         obj._ctype = new_ctype
+        structure_version.value += 1
 
         # Insert into the new ctype list
         if new_ctype not in self._ctypes:
@@ -1361,6 +1419,80 @@ Components must now specify their rules explicitly using 'rule=' keywords."""
 
         return new_block
 
+    def instantiate_overlay(self, data=None):
+        """Create a copy-on-write overlay of this (template) block
+
+        The overlay is a clone of this block that shares the storage of
+        the Set members and the immutable indexed Param values with this
+        block and only owns its Vars, mutable Params, Constraints, etc.
+        Instantiating many near-identical blocks (e.g., scenarios) from
+        a template this way is both faster and uses less memory than
+        constructing (or cloning) each block.  The shared Set storage
+        is copied the first time either this block or the overlay
+        modifies it, so the two blocks remain independent (immutable
+        Param values cannot change after construction).
+
+        Parameters
+        ----------
+        data: dict, optional
+            New values for mutable Params in the overlay.  The keys are
+            Params on this block (or their names relative to this
+            block) and the values are either a dict mapping indices to
+            values or a single value for all indices (see
+            :py:meth:`Param.store_values`).
+
+        Returns
+        -------
+        _BlockData
+            The new (unattached) block
+
+        """
+        memo = {}
+        for s in self.component_data_objects(Set, descend_into=True):
+            if not isinstance(s, _FiniteSetData):
+                continue
+            # Mapping the storage to itself in the memo causes the
+            # clone to share (and not copy) it
+            s._shared_values = True
+            memo[id(s._values)] = s._values
+            if isinstance(s, _OrderedSetData):
+                memo[id(s._ordered_values)] = s._ordered_values
+                if s._removed is not None:
+                    memo[id(s._removed)] = s._removed
+        for p in self.component_objects(Param, descend_into=True):
+            # Note that the values of immutable Params cannot change
+            # after construction (and that immutable scalar Params
+            # store themselves in _data)
+            if p.is_indexed() and not p.mutable:
+                memo[id(p._data)] = p._data
+
+        new_block = self.clone(memo)
+
+        if data:
+            for key, val in data.items():
+                if isinstance(key, str):
+                    comp = self.find_component(key)
+                else:
+                    comp = key
+                if (
+                    getattr(comp, 'ctype', None) is not Param
+                    or comp.parent_component() is not comp
+                    or memo.get(id(comp), comp) is comp
+                ):
+                    raise ValueError(
+                        "Cannot set the value of '%s' in the overlay of block '%s': "
+                        "not a Param on the block" % (key, self.name)
+                    )
+                if not comp.mutable:
+                    raise ValueError(
+                        "Cannot set the value of immutable Param '%s' in the "
+                        "overlay of block '%s': immutable Param values are "
+                        "shared with (and were substituted into the "
+                        "expressions of) the template" % (comp.name, self.name)
+                    )
+                memo[id(comp)].store_values(val)
+        return new_block
+
     def contains_component(self, ctype):
         """
         Return True if the component type is in _ctypes and ... TODO.
@@ -1603,12 +1735,86 @@ Components must now specify their rules explicitly using 'rule=' keywords."""
         block.  By default, this generator recursively
         descends into sub-blocks.
         """
+        if self._traversal_cache is not None:
+            return self._cached_traversal(
+                (_hashable_ctypes(ctype), active, sort)
+                + (_hashable_ctypes(descend_into), descent_order),
+                self._component_data_objects,
+                (ctype, active, sort, descend_into, descent_order),
+            )
+        return self._component_data_objects(
+            ctype, active, sort, descend_into, descent_order
+        )
+
+    def _component_data_objects(self, ctype, active, sort, descend_into, descent_order):
         dedup = _DeduplicateInfo()
         for _block in self.block_data_objects(
             active, sort, descend_into, descent_order
         ):
             yield from _block._component_data_itervalues(ctype, active, sort, dedup)
 
+    def enable_traversal_cache(self, enable=True):
+        """Enable (or disable) caching block traversals on this block
+
+        When enabled, the results of :py:meth:`component_data_objects`
+        and :py:meth:`block_data_objects` called on this block are
+        cached (as flat tuples), so that repeated traversals of an
+        unchanged model become a scan of the cached tuple.  Cached
+        traversals are discarded when any component is added to,
+        removed from, or reclassified on a block, when component data
+        are removed from an indexed component, when any component is
+        activated or deactivated, or when the number of component data
+        in an indexed component in the traversed blocks changes.  If
+        one of these changes happens while iterating over a cached
+        traversal, the iteration continues with an uncached traversal.
+
+        Notes
+        -----
+        Cached traversals are not invalidated by changes to the
+        components pointed to by a :py:func:`Reference` (or by direct
+        manipulation of the private component data structures).
+
+        Parameters
+        ----------
+        enable: bool
+            Enable (True) or disable (False) the traversal cache
+
+        """
+        super().__setattr__('_traversal_cache', {} if enable else None)
+
+    def _cached_traversal(self, key, fcn, args):
+        """Return an iterator over the (possibly cached) result of fcn(*args)"""
+        if NOTSET in key:
+            return fcn(*args)
+        key = (fcn.__name__,) + key
+        cache = self._traversal_cache
+        ans = cache.get(key, None)
+        if (
+            ans is None
+            or ans[0] != structure_version.value
+            or not all(len(comp._data) == n for comp, n in ans[1])
+        ):
+            version = structure_version.value
+            data = tuple(fcn(*args))
+            if fcn.__name__ == '_block_data_objects':
+                blocks = data
+            else:
+                blocks = self.block_data_objects(*args[1:])
+            # Record the number of component data in each indexed
+            # component in the traversed blocks (so we can detect new
+            # component data; References are skipped, as computing their
+            # length is expensive)
+            sizes = tuple(
+                (comp, len(comp._data))
+                for b in blocks
+                for comp, _ in b._decl_order
+                if comp is not None
+                and isinstance(comp, IndexedComponent)
+                and comp._data.__class__ is dict
+            )
+            ans = cache[key] = (version, sizes, data)
+        return _iter_cached_traversal(ans[2], fcn, args)
+
     @deprecated(
         "The component_data_iterindex method is deprecated.  "
         "Components now know their index, so it is more efficient to use the "
@@ -1692,6 +1898,15 @@ Components must now specify their rules explicitly using 'rule=' keywords."""
         tuple or generator
 
         """
+        if self._traversal_cache is not None:
+            return self._cached_traversal(
+                (active, sort, _hashable_ctypes(descend_into), descent_order),
+                self._block_data_objects,
+                (active, sort, descend_into, descent_order),
+            )
+        return self._block_data_objects(active, sort, descend_into, descent_order)
+
+    def _block_data_objects(self, active, sort, descend_into, descent_order):
         # TODO: we should determine if that is desirable behavior(it is
         # historical, so there are backwards compatibility arguments to
         # not change it, but because of block_data_objects() use in
@@ -2031,6 +2246,16 @@ class Block(ActiveIndexedComponent):
     that they contain except blocks.  Blocks contained by other
     blocks use their local attribute to determine whether construction
     is deferred.
+
+    If ``lazy_constraints=True``, the rules for IndexedConstraint
+    components declared on this block (or any of its sub-blocks) are
+    only evaluated when the constraints are constructed to determine
+    which indices are skipped, and the resulting expressions are not
+    kept.  Instead, the expression for each constraint is regenerated
+    on demand (e.g., by the writers) and discarded when the expression
+    for the next constraint in the same component is generated.  This
+    significantly reduces the memory required by models that are built
+    only to be written to a file.
     """
 
     _ComponentDataClass = _BlockData
@@ -2046,7 +2271,14 @@ class Block(ActiveIndexedComponent):
     # `options` is ignored since it is deprecated
     @overload
     def __init__(
-        self, *indexes, rule=None, concrete=False, dense=True, name=None, doc=None
+        self,
+        *indexes,
+        rule=None,
+        concrete=False,
+        dense=True,
+        lazy_constraints=False,
+        name=None,
+        doc=None
     ):
         ...
 
@@ -2061,6 +2293,9 @@ class Block(ActiveIndexedComponent):
         # As dense applies to the whole container, we will not use an
         # initializer
         self._dense = kwargs.pop('dense', True)
+        # As lazy_constraints applies to the whole container (and all
+        # sub-blocks), we will not use an initializer
+        self._lazy_constraints = kwargs.pop('lazy_constraints', False)
         kwargs.setdefault('ctype', Block)
         ActiveIndexedComponent.__init__(self, *args, **kwargs)
         if _options is not None:
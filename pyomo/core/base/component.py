@@ -17,7 +17,7 @@ from weakref import ref as weakref_ref
 
 import pyomo.common
 from pyomo.common import DeveloperError
-from pyomo.common.autoslots import AutoSlots, fast_deepcopy
+from pyomo.common.autoslots import AutoSlots, fast_deepcopy, get_state_copier
 from pyomo.common.collections import OrderedDict
 from pyomo.common.deprecation import (
     deprecated,
@@ -79,6 +79,119 @@ class CloneError(pyomo.common.errors.PyomoException):
     pass
 
 
+class _StructureVersion(object):
+    """Counter tracking structural changes to Pyomo models
+
+    The counter is incremented every time a component is added to (or
+    removed from) a block, a component data is removed from an indexed
+    component, or a component is activated or deactivated.  It is used
+    to invalidate cached block traversals (see
+    :py:meth:`_BlockData.enable_traversal_cache`).
+
+    """
+
+    __slots__ = ('value',)
+
+    def __init__(self):
+        self.value = 0
+
+
+structure_version = _StructureVersion()
+
+
+# The active ModelChangeLog objects (stored as lists of weak
+# references), keyed by the id() of the block that each log tracks.
+# The (common) case of no active logs is a single (fast) truth test in
+# the instrumented methods.
+_change_logs = {}
+
+
+def _log_change(event, obj):
+    """Record a change to `obj` in the active ModelChangeLog objects
+    tracking any of the blocks that contain `obj`"""
+    blk = obj
+    while blk is not None:
+        for log_ref in _change_logs.get(id(blk), ()):
+            log = log_ref()
+            if log is not None:
+                log.records.append((event, obj))
+        blk = blk.parent_block()
+
+
+def _remove_change_log(key, log_ref):
+    logs = _change_logs[key]
+    logs.remove(log_ref)
+    if not logs:
+        del _change_logs[key]
+
+
+class ModelChangeLog(object):
+    """An (opt-in) log of changes made to the components of a model
+
+    While a log is active (see :py:meth:`start`), changes to the
+    components on `block` (and its sub-blocks) are appended to
+    :py:attr:`records` as ``(event, obj)`` tuples, where `event` is
+    one of:
+
+    - ``'add'``: `obj` (a component) was added to a block, or `obj` (a
+      component data) was added to an indexed component after
+      construction
+    - ``'remove'``: `obj` was removed from a block or indexed component
+    - ``'activate'`` / ``'deactivate'``: `obj` was (de)activated
+    - ``'modify'``: an attribute of `obj` changed.  This is recorded
+      for changes to the bounds, domain, or fixed flag of a
+      :py:class:`_GeneralVarData` (and its value, if it is fixed), the
+      value of a mutable :py:class:`_ParamData`, the expression of a
+      constraint, named expression, or objective, and the sense of an
+      objective.
+
+    Records are not deduplicated, and the same object may appear in
+    multiple records.  Only changes made through the public component
+    APIs are recorded (direct assignment to private attributes is not).
+
+    Logs are held by weak references, so a log that is no longer
+    referenced is automatically stopped.
+
+    Parameters
+    ----------
+    block: _BlockData
+        The block (usually the model) whose changes are recorded
+
+    """
+
+    __slots__ = ('records', 'block', '_ref', '__weakref__')
+
+    def __init__(self, block):
+        self.records = []
+        self.block = block
+        self._ref = None
+
+    @property
+    def active(self):
+        """True if this log is currently recording changes"""
+        return self._ref is not None
+
+    def start(self):
+        """Start recording changes"""
+        if self._ref is None:
+            key = id(self.block)
+            self._ref = weakref_ref(
+                self, lambda ref, key=key: _remove_change_log(key, ref)
+            )
+            _change_logs.setdefault(key, []).append(self._ref)
+
+    def stop(self):
+        """Stop recording changes"""
+        if self._ref is not None:
+            _remove_change_log(id(self.block), self._ref)
+            self._ref = None
+
+    def pop_records(self):
+        """Return (and clear) the current list of records"""
+        ans, self.records = self.records, []
+        return ans
+
+
 class _ComponentBase(PyomoObject):
     """A base class for Component and ComponentData
 
@@ -222,9 +335,7 @@ class _ComponentBase(PyomoObject):
                 # Note: this implementation avoids deepcopying the
                 # temporary 'state' list, significantly speeding things
                 # up.
-                memo[id(comp)].__setstate__(
-                    [fast_deepcopy(field, memo) for field in comp.__getstate__()]
-                )
+                get_state_copier(comp.__class__)(comp, memo[id(comp)], memo)
             return memo[id(self)]
         except:
             pass
@@ -750,10 +861,16 @@ class ActiveComponent(Component):
     def activate(self):
         """Set the active attribute to True"""
         self._active = True
+        structure_version.value += 1
+        if _change_logs:
+            _log_change('activate', self)
 
     def deactivate(self):
         """Set the active attribute to False"""
         self._active = False
+        structure_version.value += 1
+        if _change_logs:
+            _log_change('deactivate', self)
 
 
 class ComponentData(_ComponentBase):
@@ -1030,7 +1147,13 @@ class ActiveComponentData(ComponentData):
     def activate(self):
         """Set the active attribute to True"""
         self._active = self.parent_component()._active = True
+        structure_version.value += 1
+        if _change_logs:
+            _log_change('activate', self)
 
     def deactivate(self):
         """Set the active attribute to False"""
         self._active = False
+        structure_version.value += 1
+        if _change_logs:
+            _log_change('deactivate', self)
@@ -45,7 +45,12 @@ from pyomo.core.expr.current import (
     InequalityExpression,
     RangedExpression,
 )
-from pyomo.core.base.component import ActiveComponentData, ModelComponentFactory
+from pyomo.core.base.component import (
+    ActiveComponentData,
+    ModelComponentFactory,
+    _change_logs,
+    _log_change,
+)
 from pyomo.core.base.global_set import UnindexedComponent_index
 from pyomo.core.base.indexed_component import (
     ActiveIndexedComponent,
@@ -688,6 +693,85 @@ class _GeneralConstraintData(_ConstraintData):
                         "Constraint '%s' created with an invalid non-finite "
                         "upper bound (%s)." % (self.name, self._upper)
                     )
+        if _change_logs:
+            _log_change('modify', self)
+
+
+class _LazyConstraintData(_GeneralConstraintData):
+    """A constraint whose expression is generated on demand by the rule.
+
+    The expression is generated by calling the parent component's rule
+    the first time the expression (or any part of it) is requested.  To
+    bound the memory used by the model, each component only retains the
+    expression for the most recently generated constraint: generating
+    the expression for another constraint in the same component
+    discards the previous expression.  Expressions explicitly set
+    through :py:meth:`set_value` are retained.
+
+    The rule is evaluated once for every index when the component is
+    constructed so that (as with eager construction) indices whose rule
+    returns :py:attr:`Constraint.Skip` are never added to the component;
+    the expressions generated during construction are discarded.
+    """
+
+    __slots__ = ()
+
+    def _generate(self):
+        comp = self.parent_component()
+        if comp is None or self._expr is not None or comp._lazy_data is self:
+            return
+        prev = comp._lazy_data
+        if prev is not None:
+            prev._lower = prev._upper = prev._body = prev._expr = None
+            comp._lazy_data = None
+        expr = comp.rule(comp.parent_block(), self._index)
+        if expr is Constraint.Skip:
+            # The rule no longer generates this constraint (it did
+            # when the component was constructed): report a trivial
+            # constraint
+            return
+        super().set_value(expr)
+        comp._lazy_data = self
+
+    @property
+    def body(self):
+        """Access the body of a constraint expression."""
+        self._generate()
+        if self._expr is None:
+            return as_numeric(0)
+        return super().body
+
+    def _lb(self):
+        self._generate()
+        return super()._lb()
+
+    def _ub(self):
+        self._generate()
+        return super()._ub()
+
+    @property
+    def equality(self):
+        """A boolean indicating whether this is an equality constraint."""
+        self._generate()
+        return super().equality
+
+    @property
+    def expr(self):
+        """Return the expression associated with this constraint."""
+        self._generate()
+        return self._expr
+
+    def get_value(self):
+        """Get the expression on this constraint."""
+        self._generate()
+        return self._expr
+
+    def set_value(self, expr):
+        """Set the expression on this constraint."""
+        comp = self.parent_component()
+        if comp is not None and comp._lazy_data is self:
+            comp._lazy_data = None
+        super().set_value(expr)
 
 
 @ModelComponentFactory.register("General constraint expressions.")
@@ -735,6 +819,8 @@ class Constraint(ActiveIndexedComponent):
     """
 
     _ComponentDataClass = _GeneralConstraintData
+    # The _LazyConstraintData whose expression is currently generated
+    _lazy_data = None
 
     class Infeasible(object):
         pass
@@ -807,6 +893,14 @@ class Constraint(ActiveIndexedComponent):
                 # assumption is that the user will trigger specific
                 # indices to be created at a later time).
                 pass
+            elif self.is_indexed() and self._lazy_construction():
+                # Only record which indices the rule generates: the
+                # expressions are regenerated when they are needed
+                for index in self.index_set():
+                    if rule(block, index) is Constraint.Skip:
+                        continue
+                    con = self._data[index] = _LazyConstraintData(component=self)
+                    con._index = index
             else:
                 # Bypass the index validation and create the member directly
                 for index in self.index_set():
@@ -822,6 +916,15 @@ class Constraint(ActiveIndexedComponent):
         finally:
             timer.report()
 
+    def _lazy_construction(self):
+        """Return True if an owning block requested lazy constraints"""
+        blk = self.parent_block()
+        while blk is not None:
+            if getattr(blk.parent_component(), '_lazy_constraints', False):
+                return True
+            blk = blk.parent_block()
+        return False
+
     def _getitem_when_not_present(self, idx):
         if self.rule is None:
             raise KeyError(idx)
@@ -29,7 +29,12 @@ from pyomo.common.numeric_types import (
 
 from pyomo.core.expr import current as EXPR
 import pyomo.core.expr.numeric_expr as numeric_expr
-from pyomo.core.base.component import ComponentData, ModelComponentFactory
+from pyomo.core.base.component import (
+    ComponentData,
+    ModelComponentFactory,
+    _change_logs,
+    _log_change,
+)
 from pyomo.core.base.global_set import UnindexedComponent_index
 from pyomo.core.base.indexed_component import IndexedComponent, UnindexedComponent_set
 from pyomo.core.base.misc import apply_indexed_rule
@@ -188,22 +193,20 @@ class _GeneralExpressionDataImpl(_ExpressionData):
 
     def set_value(self, expr):
         """Set the expression on this expression."""
-        if expr is None or expr.__class__ in native_numeric_types:
-            self._expr = expr
-            return
-        try:
-            if expr.is_numeric_type():
-                self._expr = expr
-                return
-        except AttributeError:
-            if check_if_numeric_type(expr):
-                self._expr = expr
-                return
-        raise ValueError(
-            f"Cannot assign {expr.__class__.__name__} to "
-            f"'{self.name}': {self.__class__.__name__} components only "
-            "allow numeric expression types."
-        )
+        if expr is not None and expr.__class__ not in native_numeric_types:
+            try:
+                is_numeric = expr.is_numeric_type()
+            except AttributeError:
+                is_numeric = check_if_numeric_type(expr)
+            if not is_numeric:
+                raise ValueError(
+                    f"Cannot assign {expr.__class__.__name__} to "
+                    f"'{self.name}': {self.__class__.__name__} components only "
+                    "allow numeric expression types."
+                )
+        self._expr = expr
+        if _change_logs:
+            _log_change('modify', self)
 
     def is_constant(self):
         """A boolean indicating whether this expression is constant."""
@@ -22,15 +22,21 @@ from copy import deepcopy
 from pyomo.core.expr import current as EXPR
 from pyomo.core.expr.numeric_expr import NumericNDArray
 from pyomo.core.expr.numvalue import native_types
-from pyomo.core.base.indexed_component_slice import IndexedComponent_slice
+from pyomo.core.base.indexed_component_slice import IndexedComponent_slice, _SliceIndex
 from pyomo.core.base.initializer import Initializer
-from pyomo.core.base.component import Component, ActiveComponent
+from pyomo.core.base.component import (
+    Component,
+    ActiveComponent,
+    structure_version,
+    _change_logs,
+    _log_change,
+)
 from pyomo.core.base.config import PyomoOptions
 from pyomo.core.base.enums import SortComponents
 from pyomo.core.base.global_set import UnindexedComponent_set
 from pyomo.core.pyomoobject import PyomoObject
 from pyomo.common import DeveloperError
-from pyomo.common.autoslots import fast_deepcopy
+from pyomo.common.autoslots import AutoSlots, fast_deepcopy
 from pyomo.common.dependencies import numpy as np, numpy_available
 from pyomo.common.deprecation import deprecated, deprecation_warning
 from pyomo.common.errors import DeveloperError, TemplateExpressionError
@@ -281,8 +287,13 @@ class IndexedComponent(Component):
         _index_set              The set of valid indices
         _implicit_subsets   A temporary data element that stores
                                 sets that are transferred to the model
+        _slice_index        The (lazily built) _SliceIndex used to
+                                resolve slices with fixed indices
     """
 
+    # The slice index is a cache: do not copy or pickle it
+    __autoslot_mappers__ = {'_slice_index': AutoSlots.encode_as_none}
+
     class Skip(object):
         pass
 
@@ -295,6 +306,16 @@ class IndexedComponent(Component):
     #
     _DEFAULT_INDEX_CHECKING_ENABLED = True
 
+    #
+    # Slices with fixed indices (e.g., m.x[:, 1]) are resolved using a
+    # secondary index of the component keys (see _SliceIndex), which
+    # is built the first time the component is sliced.  This flag
+    # disables the secondary index (falling back on scanning all the
+    # component keys for every slice).
+    #
+    _SLICE_INDEX_ENABLED = True
+    _slice_index = None
+
     def __init__(self, *args, **kwds):
         from pyomo.core.base.set import process_setarg
 
@@ -423,6 +444,24 @@ class IndexedComponent(Component):
         """Return an iterator of the component data keys"""
         return self.keys()
 
+    def _get_slice_index(self, fixed, index_len):
+        """Return the keys matching the fixed indices of a slice
+
+        Returns None if the slice cannot be resolved using the secondary
+        index (in which case the caller should scan all keys).
+
+        """
+        if self._data.__class__ is not dict or not normalize_index.flatten:
+            # References (and other non-dict storage) are not indexed
+            return None
+        if self._slice_index is None or not self._slice_index.is_current(self):
+            self._slice_index = _SliceIndex(self)
+        try:
+            return self._slice_index.lookup(self, fixed, index_len)
+        except TypeError:
+            # Unhashable fixed index values
+            return None
+
     def keys(self, sort=SortComponents.UNSORTED, ordered=NOTSET):
         """Return an iterator over the component data keys
 
@@ -657,7 +696,10 @@ You can silence this warning by one of three ways:
             # the default value
             #
             if obj is _NotFound:
-                return self._getitem_when_not_present(index)
+                obj = self._getitem_when_not_present(index)
+                self._slice_index = None
+                if _change_logs and self._constructed:
+                    _log_change('add', obj)
 
         return obj
 
@@ -713,7 +755,11 @@ You can silence this warning by one of three ways:
         else:
             obj = self._data.get(index, _NotFound)
             if obj is _NotFound:
-                return self._setitem_when_not_present(index, val)
+                obj = self._setitem_when_not_present(index, val)
+                self._slice_index = None
+                if _change_logs and self._constructed:
+                    _log_change('add', obj)
+                return obj
             else:
                 return self._setitem_impl(index, obj, val)
 
@@ -741,10 +787,16 @@ You can silence this warning by one of three ways:
                 del self[idx]
         else:
             # Handle the normal deletion operation
+            obj = self._data[index]
+            if _change_logs:
+                # (record the change while obj is still on the model)
+                _log_change('remove', obj)
             if self.is_indexed():
                 # Remove reference to this object
-                self._data[index]._component = None
+                obj._component = None
             del self._data[index]
+            self._slice_index = None
+            structure_version.value += 1
 
     def _pop_from_kwargs(self, name, kwargs, namelist, notset=None):
         args = [
@@ -1099,6 +1151,8 @@ value() function."""
         # If the value is "Skip" do not add anything
         if value is IndexedComponent.Skip:
             return None
+        # Any cached slice index is stale once the keys change
+        self._slice_index = None
         #
         # If we are a scalar, then idx will be None (_validate_index ensures
         # this)
@@ -14,6 +14,7 @@ import itertools
 
 from pyomo.common import DeveloperError
 from pyomo.common.collections import Sequence
+from pyomo.common.sorting import sorted_robust
 
 from pyomo.core.base.enums import SortComponents
 from pyomo.core.base.global_set import UnindexedComponent_index
@@ -382,6 +383,53 @@ def _freeze(info):
         return info
 
 
+class _SliceIndex(object):
+    """Secondary index mapping fixed slice positions to component keys
+
+    Slices with fixed positions (e.g., ``m.x[:, t, 'A']``) would
+    otherwise have to scan (and test) every key in the component.  This
+    index is built (lazily, the first time a component is sliced with a
+    particular pattern of fixed positions) by grouping the component
+    keys by the values in the fixed positions.  Each group preserves the
+    order of the keys in the component.
+
+    The index is stored on the component (see
+    :py:meth:`IndexedComponent._get_slice_index`) and is discarded
+    whenever data is added to or deleted from the component.  As a
+    safeguard against code that manipulates ``_data`` directly, the
+    index is also rebuilt if the ``_data`` dict is replaced or its
+    length changes.
+
+    """
+
+    __slots__ = ('_data', '_len', '_groups')
+
+    def __init__(self, component):
+        self._data = component._data
+        self._len = len(self._data)
+        self._groups = {}
+
+    def is_current(self, component):
+        return self._data is component._data and self._len == len(self._data)
+
+    def lookup(self, component, fixed, index_len):
+        """Return the keys in `component` that match the `fixed` positions"""
+        positions = tuple(sorted(fixed))
+        groups = self._groups.get((index_len, positions), None)
+        if groups is None:
+            groups = self._groups[index_len, positions] = {}
+            for index in component.keys():
+                _idx = index if index.__class__ is tuple else (index,)
+                if len(_idx) != index_len:
+                    continue
+                key = tuple(_idx[i] for i in positions)
+                if key in groups:
+                    groups[key].append(index)
+                else:
+                    groups[key] = [index]
+        return groups.get(tuple(fixed[i] for i in positions), ())
+
+
 class _slice_generator(object):
     """Utility (iterator) for generating the elements of one slice
 
@@ -426,6 +474,18 @@ class _slice_generator(object):
                 self.component_iter = component.index_set().ordered_iter()
             else:
                 self.component_iter = iter(component.index_set())
+        elif fixed and ellipsis is None and component._SLICE_INDEX_ENABLED:
+            # Only iterate over the keys that match the fixed indices
+            keys = component._get_slice_index(fixed, self.explicit_index_count)
+            if keys is None:
+                self.component_iter = component.keys(sort)
+            elif SortComponents.SORTED_INDICES in sort or (
+                SortComponents.ORDERED_INDICES in sort
+                and not component.index_set().isordered()
+            ):
+                self.component_iter = iter(sorted_robust(keys))
+            else:
+                self.component_iter = iter(keys)
         else:
             # The default behavior is to iterate over the component.
             self.component_iter = component.keys(sort)
@@ -229,6 +229,19 @@ class InitializerBase(object):
             "Initializer %s does not contain embedded indices" % (type(self).__name__,)
         )
 
+    def bulk_items(self):
+        """Return the embedded (indices, values) in bulk
+
+        Initializers that wrap array-like data (e.g., NumPy arrays and
+        pandas objects) can return all of their data at once, allowing
+        components to bypass the per-index calls to the initializer.
+        This returns a tuple of two equal-length sequences (the
+        indices and the values; the values may be a NumPy array), or
+        None if the initializer does not support bulk access.
+
+        """
+        return None
+
 
 class ConstantInitializer(InitializerBase):
     """Initializer for constant values"""
@@ -266,6 +279,18 @@ class ItemInitializer(InitializerBase):
         except AttributeError:
             return range(len(self._dict))
 
+    def bulk_items(self):
+        data = self._dict
+        if data.__class__ is dict:
+            return list(data.keys()), list(data.values())
+        if numpy_available and isinstance(data, numpy.ndarray):
+            if data.ndim != 1:
+                return None
+            return range(len(data)), data
+        if pandas_available and isinstance(data, pandas.Series):
+            return data.index.tolist(), data.to_numpy()
+        return None
+
 
 class DataFrameInitializer(InitializerBase):
     """Initializer for pandas DataFrame values"""
@@ -293,6 +318,9 @@ class DataFrameInitializer(InitializerBase):
     def indices(self):
         return self._df.index
 
+    def bulk_items(self):
+        return self._df.index.tolist(), self._df[self._column].to_numpy()
+
 
 class IndexedCallInitializer(InitializerBase):
     """Initializer for functions and callable objects"""
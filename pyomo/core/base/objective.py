@@ -31,7 +31,12 @@ from pyomo.common.formatting import tabular_writer
 from pyomo.common.timing import ConstructionTimer
 
 from pyomo.core.expr.numvalue import value
-from pyomo.core.base.component import ActiveComponentData, ModelComponentFactory
+from pyomo.core.base.component import (
+    ActiveComponentData,
+    ModelComponentFactory,
+    _change_logs,
+    _log_change,
+)
 from pyomo.core.base.global_set import UnindexedComponent_index
 from pyomo.core.base.indexed_component import (
     ActiveIndexedComponent,
@@ -200,6 +205,8 @@ class _GeneralObjectiveData(
                 "'minimize' (%s) or 'maximize' (%s). Invalid "
                 "value: %s'" % (minimize, maximize, sense)
             )
+        if _change_logs:
+            _log_change('modify', self)
 
 
 @ModelComponentFactory.register("Expressions that are minimized or maximized.")
@@ -14,17 +14,24 @@ __all__ = ['Param']
 import sys
 import types
 import logging
+from operator import attrgetter
 from weakref import ref as weakref_ref
 from pyomo.common.pyomo_typing import overload
 
 from pyomo.common.autoslots import AutoSlots
+from pyomo.common.dependencies import numpy as np, numpy_available
 from pyomo.common.deprecation import deprecation_warning, RenamedClass
 from pyomo.common.log import is_debug_set
 from pyomo.common.modeling import NOTSET
 from pyomo.common.numeric_types import native_types, value as expr_value
 from pyomo.common.timing import ConstructionTimer
 from pyomo.core.expr.numvalue import NumericValue
-from pyomo.core.base.component import ComponentData, ModelComponentFactory
+from pyomo.core.base.component import (
+    ComponentData,
+    ModelComponentFactory,
+    _change_logs,
+    _log_change,
+)
 from pyomo.core.base.global_set import UnindexedComponent_index
 from pyomo.core.base.indexed_component import (
     IndexedComponent,
@@ -33,12 +40,15 @@ from pyomo.core.base.indexed_component import (
 )
 from pyomo.core.base.initializer import Initializer
 from pyomo.core.base.misc import apply_indexed_rule, apply_parameterized_indexed_rule
-from pyomo.core.base.set import Reals, _AnySet
+from pyomo.core.base.range import NumericRange
+from pyomo.core.base.set import Reals, _AnySet, _InfiniteRangeSetData
 from pyomo.core.base.units_container import units
 from pyomo.core.expr.current import GetItemExpression
 
 logger = logging.getLogger('pyomo.core')
 
+_get_param_value = attrgetter('_value')
+
 
 def _raise_modifying_immutable_error(obj, index):
     if obj.is_indexed():
@@ -53,6 +63,58 @@ def _raise_modifying_immutable_error(obj, index):
     )
 
 
+# Index types that bulk initialization can store without normalization
+_bulk_index_types = {int, float, str, tuple}
+
+
+def _bulk_domain_check(domain, values):
+    """Vectorized check that all `values` (a numpy array) are in `domain`
+
+    Returns True if all values are in the domain.  Returns False if any
+    value is not in the domain, or if the check cannot be vectorized
+    (e.g., for non-numeric data or domains): the caller should then
+    fall back on checking the individual values.
+
+    """
+    if values.dtype.kind not in 'biuf':
+        return False
+    if domain.__class__ is _ImplicitAny:
+        # Only the (numeric) values that do not generate the
+        # deprecation warning can be processed in bulk
+        domain = Reals
+    elif isinstance(domain, _AnySet):
+        return True
+    if not isinstance(domain, _InfiniteRangeSetData):
+        return False
+    if values.dtype.kind == 'b':
+        values = values.astype(float)
+    valid = np.zeros(len(values), dtype=bool)
+    with np.errstate(invalid='ignore'):
+        for r in domain.ranges():
+            if r.__class__ is not NumericRange:
+                return False
+            if r.step:
+                # Discrete range (see NumericRange.__contains__)
+                delta = values - r.start
+                if r.step > 0:
+                    in_range = (delta >= 0) & (delta <= r.end - r.start)
+                else:
+                    in_range = (delta <= 0) & (delta >= r.end - r.start)
+                offset = np.abs(delta - r.step * np.round(delta / r.step))
+                valid |= in_range & (offset <= r._EPS)
+            else:
+                if r.closed[0]:
+                    in_range = values >= r.start
+                else:
+                    in_range = values > r.start
+                if r.closed[1]:
+                    in_range &= values <= r.end
+                else:
+                    in_range &= values < r.end
+                valid |= in_range
+    return bool(valid.all())
+
+
 class _ImplicitAny(_AnySet):
     """An Any that issues a deprecation warning for non-Real values.
 
@@ -181,6 +243,8 @@ class _ParamData(ComponentData, NumericValue):
         except:
             self._value = old_value
             raise
+        if _change_logs:
+            _log_change('modify', self)
 
     def __call__(self, exception=True):
         """
@@ -518,6 +582,64 @@ class Param(IndexedComponent, IndexedComponent_NDArrayMixin):
             # scalars have to be handled differently
             self[None] = new_values
 
+    def get_values_array(self):
+        """
+        A utility to extract the values of this parameter as a numpy
+        array.
+
+        The array contains one entry for each index in the index set,
+        in the index set order (indices without a value take the
+        default value; if there is no default, they are returned as
+        nan).
+        """
+        _data = self._data
+        if (
+            self.is_indexed()
+            and _data.__class__ is dict
+            and (len(_data) == len(self._index_set))
+        ):
+            # Dense parameter: look up the data directly (this avoids
+            # the overhead of __getitem__)
+            vals = list(map(_data.__getitem__, self._index_set))
+        else:
+            vals = [self[index] if index in self else None for index in self._index_set]
+        if self._mutable or not self.is_indexed():
+            vals = [None if v is None else _get_param_value(v) for v in vals]
+        try:
+            return np.array(vals, dtype=float)
+        except TypeError:
+            # Slow path: (mutable) parameters without a value or whose
+            # value is an expression
+            return np.array(
+                [
+                    None if v is None or v is Param.NoValue else expr_value(v)
+                    for v in vals
+                ],
+                dtype=float,
+            )
+
+    def set_values_array(self, values, check=True):
+        """
+        A utility to update a mutable Param from a numpy array.
+
+        This is the inverse of :py:meth:`get_values_array`: `values`
+        must contain one entry for each index in the index set, in the
+        index set order.  The values are stored using
+        :py:meth:`store_values`.
+        """
+        if len(values) != len(self._index_set):
+            raise ValueError(
+                "Cannot set the values of Param '%s': expected %s values "
+                "but received %s" % (self.name, len(self._index_set), len(values))
+            )
+        if hasattr(values, 'tolist'):
+            values = values.tolist()
+        if not self.is_indexed():
+            values = {None: values[0]}
+        else:
+            values = dict(zip(self._index_set, values))
+        self.store_values(values, check)
+
     def set_default(self, val):
         """
         Perform error checks and then set the default value for this parameter.
@@ -784,14 +906,26 @@ class Param(IndexedComponent, IndexedComponent_NDArrayMixin):
             #
             self._constructed = None
             #
-            # Step #1: initialize data from rule value
+            # Step #1: initialize data from rule value (in bulk if the
+            # rule wraps array-like data)
             #
-            self._construct_from_rule_using_setitem()
+            rule = self._rule
+            bulk = None
+            if rule is not None and self.is_indexed():
+                bulk = rule.bulk_items()
+            if bulk is None or not self._construct_from_bulk_data(*bulk):
+                self._construct_from_rule_using_setitem()
             #
             # Step #2: allow any user-specified (external) data to override
             # the initialization
             #
-            if data is not None:
+            if (
+                data.__class__ is dict
+                and self.is_indexed()
+                and self._construct_from_bulk_data(list(data), list(data.values()))
+            ):
+                data_items = iter(())
+            elif data is not None:
                 try:
                     data_items = data.items()
                 except AttributeError:
@@ -826,6 +960,59 @@ class Param(IndexedComponent, IndexedComponent_NDArrayMixin):
         finally:
             timer.report()
 
+    def _construct_from_bulk_data(self, indices, values):
+        """Store (indices, values) in the Param without per-index calls
+
+        The indices are validated against the index set and the values
+        are validated against the domain in bulk (vectorized) form.
+        Returns False (without modifying the Param) if the data cannot
+        be stored in bulk (e.g., there is a validation rule, the values
+        are not numeric, or an index or value fails validation): the
+        caller should then fall back on storing the individual values
+        (which will also generate the appropriate errors).
+
+        """
+        if self._validate is not None or not numpy_available:
+            return False
+        if len(indices) != len(values):
+            return False
+        if isinstance(values, np.ndarray):
+            array = values
+            values = values.tolist()
+        else:
+            array = np.asarray(values)
+        if array.ndim != 1 or not _bulk_domain_check(self.domain, array):
+            return False
+        #
+        # Validate the indices
+        #
+        if indices.__class__ is not range:
+            if not set(map(type, indices)).issubset(_bulk_index_types):
+                return False
+        index_set = self._index_set
+        if not index_set.isfinite():
+            return False
+        members = getattr(index_set, '_values', None)
+        if members is None:
+            members = set(index_set)
+        if not all(map(members.__contains__, indices)):
+            return False
+        #
+        # Store the data
+        #
+        if self._mutable:
+            _data = self._data
+            _new = _ParamData.__new__
+            _ref = weakref_ref(self)
+            for index, val in zip(indices, values):
+                obj = _data[index] = _new(_ParamData)
+                obj._component = _ref
+                obj._index = index
+                obj._value = val
+        else:
+            self._data.update(zip(indices, values))
+        return True
+
     def _pprint(self):
         """
         Return data that will be printed for this component.
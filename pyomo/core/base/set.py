@@ -1278,7 +1278,14 @@ class _FiniteSetMixin(object):
 class _FiniteSetData(_FiniteSetMixin, _SetData):
     """A general unordered iterable Set"""
 
-    __slots__ = ('_values', '_domain', '_validate', '_filter', '_dimen')
+    __slots__ = (
+        '_values',
+        '_domain',
+        '_validate',
+        '_filter',
+        '_dimen',
+        '_shared_values',
+    )
 
     def __init__(self, component):
         _SetData.__init__(self, component=component)
@@ -1286,6 +1293,10 @@ class _FiniteSetData(_FiniteSetMixin, _SetData):
         # storage
         if not hasattr(self, '_values'):
             self._values = set()
+        # True if the value storage may be shared with another Set (see
+        # _BlockData.instantiate_overlay()).  The storage is copied
+        # before it is first modified.
+        self._shared_values = False
         self._domain = Any
         self._validate = None
         self._filter = None
@@ -1424,15 +1435,23 @@ class _FiniteSetData(_FiniteSetMixin, _SetData):
         return count
 
     def _add_impl(self, value):
+        if self._shared_values:
+            self._unshare_values()
         self._values.add(value)
 
     def remove(self, val):
+        if self._shared_values:
+            self._unshare_values()
         self._values.remove(val)
 
     def discard(self, val):
+        if self._shared_values:
+            self._unshare_values()
         self._values.discard(val)
 
     def clear(self):
+        if self._shared_values:
+            self._unshare_values()
         self._values.clear()
 
     def set_value(self, val):
@@ -1446,8 +1465,14 @@ class _FiniteSetData(_FiniteSetMixin, _SetData):
                 self.add(v)
 
     def pop(self):
+        if self._shared_values:
+            self._unshare_values()
         return self._values.pop()
 
+    def _unshare_values(self):
+        self._values = set(self._values)
+        self._shared_values = False
+
 
 class _ScalarOrderedSetMixin(object):
     # This mixin is required because scalar ordered sets implement
@@ -1611,6 +1636,75 @@ class _OrderedSetMixin(object):
             )
 
 
+class _RemovedPositions(object):
+    """Track the positions removed from an ordered set's storage list
+
+    This is a Fenwick (binary indexed) tree over the positions in
+    :attr:`_OrderedSetData._ordered_values`, where each removed
+    position counts 1.  It supports marking a position as removed,
+    appending new positions, counting the removed positions before a
+    position, and finding the position of the k-th remaining entry all
+    in O(log n) time.
+
+    """
+
+    __slots__ = ('_tree', 'count')
+
+    def __init__(self, n):
+        self._tree = [0] * (n + 1)
+        self.count = 0
+
+    def copy(self):
+        ans = _RemovedPositions.__new__(_RemovedPositions)
+        ans._tree = list(self._tree)
+        ans.count = self.count
+        return ans
+
+    def append(self):
+        i = len(self._tree)
+        # The new node covers positions (i - lowbit(i), i], all of which
+        # precede the new (not removed) position
+        self._tree.append(self.before(i - 1) - self.before(i - (i & -i)))
+
+    def pop(self):
+        self._tree.pop()
+
+    def remove(self, pos):
+        tree = self._tree
+        n = len(tree)
+        i = pos + 1
+        while i < n:
+            tree[i] += 1
+            i += i & -i
+        self.count += 1
+
+    def before(self, pos):
+        """Return the number of removed positions in [0, pos)"""
+        tree = self._tree
+        ans = 0
+        while pos > 0:
+            ans += tree[pos]
+            pos -= pos & -pos
+        return ans
+
+    def find(self, k):
+        """Return the position of the k-th (0-based) remaining entry"""
+        tree = self._tree
+        n = len(tree) - 1
+        pos = 0
+        step = 1 << (n.bit_length() - 1) if n else 0
+        k += 1
+        while step:
+            nxt = pos + step
+            if nxt <= n:
+                remaining = step - tree[nxt]
+                if remaining < k:
+                    pos = nxt
+                    k -= remaining
+            step >>= 1
+        return pos
+
+
 class _OrderedSetData(_OrderedSetMixin, _FiniteSetData):
     """
     This class defines the base class for an ordered set of concrete data.
@@ -1628,31 +1722,56 @@ class _OrderedSetData(_OrderedSetMixin, _FiniteSetData):
     Public Class Attributes:
     """
 
-    __slots__ = ('_ordered_values',)
+    __slots__ = ('_ordered_values', '_removed')
 
     def __init__(self, component):
         self._values = {}
         self._ordered_values = []
+        # Removing a member leaves a hole in _ordered_values (so that
+        # removal does not have to renumber the following members).
+        # _removed tracks the holes (or is None if there are none).
+        # The holes are compacted once they make up half the list.
+        self._removed = None
         _FiniteSetData.__init__(self, component=component)
 
     def _iter_impl(self):
         """
         Return an iterator for the set.
         """
+        if self._removed is not None:
+            # Note: _values is always in the same order as _ordered_values
+            return iter(self._values)
         return iter(self._ordered_values)
 
     def __reversed__(self):
+        if self._removed is not None:
+            return reversed(list(self._values))
         return reversed(self._ordered_values)
 
     def _add_impl(self, value):
-        self._values[value] = len(self._values)
+        if self._shared_values:
+            self._unshare_values()
+        self._values[value] = len(self._ordered_values)
         self._ordered_values.append(value)
+        if self._removed is not None:
+            self._removed.append()
 
     def remove(self, val):
+        if self._shared_values:
+            self._unshare_values()
         idx = self._values.pop(val)
-        self._ordered_values.pop(idx)
-        for i in range(idx, len(self._ordered_values)):
-            self._values[self._ordered_values[i]] -= 1
+        if idx == len(self._ordered_values) - 1:
+            self._ordered_values.pop()
+            if self._removed is not None:
+                self._removed.pop()
+            return
+        # Leave a hole (releasing the reference to the removed member)
+        self._ordered_values[idx] = None
+        if self._removed is None:
+            self._removed = _RemovedPositions(len(self._ordered_values))
+        self._removed.remove(idx)
+        if 2 * self._removed.count > len(self._ordered_values):
+            self._compact()
 
     def discard(self, val):
         try:
@@ -1661,8 +1780,10 @@ class _OrderedSetData(_OrderedSetMixin, _FiniteSetData):
             pass
 
     def clear(self):
-        self._values.clear()
+        self._values = {}
         self._ordered_values = []
+        self._removed = None
+        self._shared_values = False
 
     def pop(self):
         try:
@@ -1682,6 +1803,10 @@ class _OrderedSetData(_OrderedSetMixin, _FiniteSetData):
         internal _lookup and _values are (pythonically) 0-based.
         """
         i = self._to_0_based_index(index)
+        if self._removed is not None:
+            if not 0 <= i < len(self._values):
+                raise IndexError("%s index out of range" % (self.name))
+            i = self._removed.find(i)
         try:
             return self._ordered_values[i]
         except IndexError:
@@ -1701,14 +1826,30 @@ class _OrderedSetData(_OrderedSetMixin, _FiniteSetData):
         # for the exact thing that the user sent us and then fall back
         # on the scalar.
         try:
-            return self._values[item] + 1
+            idx = self._values[item]
         except KeyError:
             if item.__class__ is not tuple or len(item) > 1:
                 raise ValueError("%s.ord(x): x not in %s" % (self.name, self.name))
-        try:
-            return self._values[item[0]] + 1
-        except KeyError:
-            raise ValueError("%s.ord(x): x not in %s" % (self.name, self.name))
+            try:
+                idx = self._values[item[0]]
+            except KeyError:
+                raise ValueError("%s.ord(x): x not in %s" % (self.name, self.name))
+        if self._removed is not None:
+            idx -= self._removed.before(idx)
+        return idx + 1
+
+    def _compact(self):
+        self._ordered_values = list(self._values)
+        self._values = {j: i for i, j in enumerate(self._ordered_values)}
+        self._removed = None
+        self._shared_values = False
+
+    def _unshare_values(self):
+        self._values = dict(self._values)
+        self._ordered_values = list(self._ordered_values)
+        if self._removed is not None:
+            self._removed = self._removed.copy()
+        self._shared_values = False
 
 
 class _InsertionOrderSetData(_OrderedSetData):
@@ -1790,8 +1931,7 @@ class _SortedSetData(_SortedSetMixin, _OrderedSetData):
     def _add_impl(self, value):
         # Note that the sorted status has no bearing on insertion,
         # so there is no reason to check if the data is correctly sorted
-        self._values[value] = len(self._values)
-        self._ordered_values.append(value)
+        super(_SortedSetData, self)._add_impl(value)
         self._is_sorted = False
 
     # Note: removing data does not affect the sorted flag
@@ -1829,10 +1969,10 @@ class _SortedSetData(_SortedSetMixin, _OrderedSetData):
         return self.data()
 
     def _sort(self):
-        self._ordered_values = list(
-            self.parent_component()._sort_fcn(self._ordered_values)
-        )
+        self._ordered_values = list(self.parent_component()._sort_fcn(self._values))
         self._values = {j: i for i, j in enumerate(self._ordered_values)}
+        self._removed = None
+        self._shared_values = False
         self._is_sorted = True
 
 
@@ -4097,18 +4237,33 @@ class SetProduct_InfiniteSet(SetProduct):
 class SetProduct_FiniteSet(_FiniteSetMixin, SetProduct_InfiniteSet):
     __slots__ = tuple()
 
-    def _iter_impl(self):
-        _iter = itertools.product(*self._sets)
-        # Note: if all the member sets are simple 1-d sets, then there
+    def _factors(self):
+        """Return the factor sets for iterating over this product
+
+        When set products are flattened, nested products (e.g., ``A*B*C``
+        is ``SetProduct(SetProduct(A, B), C)``) are treated as a single
+        product over all the leaf factor sets.  This avoids building
+        (and then flattening) intermediate tuples for each nested
+        product.  Returns the factors and a flag indicating if the
+        product members need to be flattened.
+
+        """
+        if not (FLATTEN_CROSS_PRODUCT and normalize_index.flatten):
+            return self._sets, False
+        factors = tuple(self.subsets(expand_all_set_operators=False))
+        return factors, any(s.dimen != 1 for s in factors)
+
+    def _product_iter(self, factors, flatten):
+        _iter = itertools.product(*factors)
+        # Note: if all the factors are simple 1-d sets, then there
         # is no need to call flatten_product.
-        if (
-            FLATTEN_CROSS_PRODUCT
-            and normalize_index.flatten
-            and self.dimen != len(self._sets)
-        ):
+        if flatten:
             return (self._flatten_product(_) for _ in _iter)
         return _iter
 
+    def _iter_impl(self):
+        return self._product_iter(*self._factors())
+
     def __len__(self):
         """
         Return the number of elements in the set.
@@ -4124,17 +4279,24 @@ class SetProduct_OrderedSet(
 ):
     __slots__ = tuple()
 
+    def __reversed__(self):
+        factors, flatten = self._factors()
+        return self._product_iter([reversed(s) for s in factors], flatten)
+
     def at(self, index):
+        # Note that the product is never materialized: the member is
+        # located using mixed-radix arithmetic over the factor lengths
         _idx = self._to_0_based_index(index)
-        _ord = list(len(_) for _ in self._sets)
+        factors, flatten = self._factors()
+        _ord = list(len(_) for _ in factors)
         i = len(_ord)
         while i:
             i -= 1
             _ord[i], _idx = _idx % _ord[i], _idx // _ord[i]
         if _idx:
             raise IndexError("%s index out of range" % (self.name,))
-        ans = tuple(s.at(i + 1) for s, i in zip(self._sets, _ord))
-        if FLATTEN_CROSS_PRODUCT and normalize_index.flatten and self.dimen != len(ans):
+        ans = tuple(s.at(i + 1) for s, i in zip(factors, _ord))
+        if flatten:
             return self._flatten_product(ans)
         return ans
 
@@ -4146,26 +4308,59 @@ class SetProduct_OrderedSet(
 
         If the search item is not in the Set, then an IndexError is raised.
         """
-        found = self._find_val(item)
-        if found is None:
+        factors, val = self._split_val(item)
+        ans = 0
+        if val is not None:
+            try:
+                for s, v in zip(factors, val):
+                    ans = ans * len(s) + s.ord(v) - 1
+            except (IndexError, ValueError, TypeError):
+                val = None
+        if val is None:
             raise IndexError(
                 "Cannot identify position of %s in Set %s: item not in Set"
                 % (item, self.name)
             )
-        val, cutPoints = found
-        if cutPoints is not None:
-            val = tuple(
-                val[cutPoints[i] : cutPoints[i + 1]] for i in range(len(self._sets))
-            )
-        _idx = tuple(s.ord(val[i]) - 1 for i, s in enumerate(self._sets))
-        _len = list(len(_) for _ in self._sets)
-        _len.append(1)
-        ans = 0
-        for pos, n in zip(_idx, _len[1:]):
-            ans += pos
-            ans *= n
         return ans + 1
 
+    def _split_val(self, item):
+        """Split item into the corresponding members of each factor
+
+        Returns the factors and the list of members (or None if the item
+        cannot be split).
+
+        """
+        factors = self._factors()[0]
+        if normalize_index.flatten:
+            dims = [s.dimen for s in factors]
+            if not all(d.__class__ is int and d >= 1 for d in dims):
+                # Products with non-dimensioned factors: fall back on
+                # searching for the item in the (nested) operands
+                factors = self._sets
+            else:
+                val = normalize_index(item)
+                if val.__class__ is not tuple:
+                    val = (val,)
+                if len(val) != sum(dims):
+                    return factors, None
+                ans = []
+                i = 0
+                for d in dims:
+                    ans.append(val[i] if d == 1 else val[i : i + d])
+                    i += d
+                return factors, ans
+        found = self._find_val(item)
+        if found is None:
+            return factors, None
+        val, cutPoints = found
+        if cutPoints is None:
+            return factors, val
+        ans = []
+        for i in range(len(factors)):
+            v = val[cutPoints[i] : cutPoints[i + 1]]
+            ans.append(v[0] if len(v) == 1 else v)
+        return factors, ans
+
 
 ############################################################################
 
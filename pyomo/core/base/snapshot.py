@@ -0,0 +1,542 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2022
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+"""Compact snapshots of constructed models
+
+This module provides :py:func:`save_model` and :py:func:`load_model`,
+which write (and read) a constructed model to a versioned binary
+snapshot file.  The snapshot is a pickle of the model in which the
+data for (dict-based) indexed Vars and mutable Params is replaced by
+struct-of-arrays tables that are stored as raw binary arrays ahead of
+the pickle stream.  Loading a snapshot rebuilds the component data
+objects directly from those tables (bypassing the per-object pickle
+machinery), which makes loading large models significantly faster
+than either constructing them or loading a standard pickle.
+
+The snapshot file layout is:
+
+  - a fixed header (magic string, format version, flags, and the
+    length of the table of contents)
+  - the table of contents (a small pickle describing the arrays and
+    the location of the model pickle)
+  - the raw (8-byte aligned) data arrays
+  - the model pickle
+
+"""
+
+import copyreg
+import io
+import mmap as _mmap
+import pickle
+import struct
+from array import array
+from types import FunctionType
+from weakref import ref as weakref_ref
+
+from pyomo.common.gc_manager import PauseGC
+from pyomo.core.expr.numeric_expr import NumericExpression, SumExpression
+from pyomo.core.staleflag import StaleFlagManager
+from pyomo.core.base.block import Block
+from pyomo.core.base.constraint import Constraint, _LazyConstraintData
+from pyomo.core.base.initializer import InitializerBase
+from pyomo.core.base.param import IndexedParam, Param, _ParamData
+from pyomo.core.base.set import Set
+from pyomo.core.base.var import IndexedVar, Var, _GeneralVarData
+
+SNAPSHOT_MAGIC = b'PYOMOSNP'
+SNAPSHOT_VERSION = 1
+
+_header = struct.Struct('<8sIIQ')
+_nan = float('nan')
+_NoneType = type(None)
+
+# Encoding of the "kind" of values stored in float64 arrays (so that
+# ints, bools and None round-trip exactly)
+_KIND_NONE = 0
+_KIND_FLOAT = 1
+_KIND_INT = 2
+_KIND_BOOL = 3
+_kind_map = {float: _KIND_FLOAT, int: _KIND_INT, bool: _KIND_BOOL}
+_decoders = (lambda x: None, float, int, bool)
+_max_exact_int = 2**53
+
+
+def _encode_values(vals):
+    """Encode a list of scalar values as (float64, kind) arrays
+
+    Returns None if any value cannot be represented exactly.
+
+    """
+    kinds = array('B')
+    data = array('d')
+    kinds_append = kinds.append
+    data_append = data.append
+    for v in vals:
+        if v is None:
+            kinds_append(_KIND_NONE)
+            data_append(_nan)
+            continue
+        kind = _kind_map.get(v.__class__, None)
+        if kind is None:
+            return None
+        if kind == _KIND_INT and not -_max_exact_int < v < _max_exact_int:
+            return None
+        kinds_append(kind)
+        data_append(v)
+    return data, kinds
+
+
+def _decode_values(data, kinds):
+    n = len(kinds)
+    if kinds.count(_KIND_FLOAT) == n:
+        return data.tolist()
+    if kinds.count(_KIND_NONE) == n:
+        return [None] * n
+    decode = _decoders
+    return [decode[k](v) for v, k in zip(data.tolist(), kinds)]
+
+
+def _is_local_function(obj):
+    qualname = obj.__qualname__
+    return '<lambda>' in qualname or '<locals>' in qualname
+
+
+def _local_rules(obj):
+    """Yield the local functions referenced by a rule (or Initializer)"""
+    if obj.__class__ is FunctionType:
+        if _is_local_function(obj):
+            yield obj
+    elif isinstance(obj, InitializerBase):
+        for val in obj.__getstate__().values():
+            yield from _local_rules(val)
+    elif obj.__class__ is tuple or obj.__class__ is list:
+        for val in obj:
+            yield from _local_rules(val)
+
+
+def _requires_rules(comp):
+    """Return True if `comp` may still call its construction rules"""
+    if not comp._constructed:
+        return True
+    if not comp.is_indexed() or comp.is_reference():
+        return False
+    data = comp._data
+    if data.__class__ is not dict:
+        # (e.g., dense Var storage)
+        return False
+    ctype = comp.ctype
+    if ctype is Constraint:
+        # Lazy constraints regenerate discarded expressions from the rule
+        return any(
+            obj.__class__ is _LazyConstraintData
+            and (obj._expr is None or obj is comp._lazy_data)
+            for obj in data.values()
+        )
+    if ctype is Var or ctype is Block:
+        # Missing (sparse) members are created by calling the rules
+        index = comp.index_set()
+        return not index.isfinite() or len(data) < len(index)
+    return False
+
+
+# Component attributes holding rules that are only called while the
+# component is constructed (or, see _requires_rules(), while missing
+# members are created)
+_construction_rules = frozenset(
+    (
+        'rule',
+        '_rule',
+        '_rule_init',
+        '_rule_domain',
+        '_rule_bounds',
+        '_init',
+        '_init_rule',
+        '_init_values',
+        '_init_domain',
+        '_init_dimen',
+        '_init_bounds',
+        '_init_sense',
+        '_initializer',
+        '_set',
+    )
+)
+
+
+def _callables(comp):
+    """Yield (name, value) for the attributes that may hold rules"""
+    yield from comp.__dict__.items()
+    if comp.ctype is Set:
+        # Set data validate / filter the values added to them
+        for obj in comp.values():
+            yield '_validate', getattr(obj, '_validate', None)
+            yield '_filter', getattr(obj, '_filter', None)
+
+
+def _check_rules(model):
+    for comp in model.component_objects(descend_into=True):
+        requires_rules = _requires_rules(comp)
+        for name, val in _callables(comp):
+            if name in _construction_rules and not requires_rules:
+                continue
+            if name == '_validate' and comp.ctype is Param and not comp.mutable:
+                # The values of immutable Params cannot be changed
+                continue
+            for rule in _local_rules(val):
+                if name in _construction_rules:
+                    raise ValueError(
+                        "Cannot save model '%s': component '%s' requires its "
+                        "construction rule ('%s') after the model is saved, "
+                        "but rules declared as lambdas or local functions "
+                        "cannot be saved.  Declare the rule as a module-level "
+                        "function or fully construct the component (e.g., "
+                        "Var(..., dense=True) or lazy_constraints=False) "
+                        "before saving." % (model.name, comp.name, rule.__qualname__)
+                    )
+                raise ValueError(
+                    "Cannot save model '%s': component '%s' uses the function "
+                    "'%s' (%s) after the model is saved, but lambdas and local "
+                    "functions cannot be saved.  Declare the function at "
+                    "module level before saving."
+                    % (
+                        model.name,
+                        comp.name,
+                        rule.__qualname__,
+                        name.replace('_init_', '').lstrip('_'),
+                    )
+                )
+
+
+class _TableBase(object):
+    """Base class for the struct-of-arrays encoding of a component's data"""
+
+    # The ComponentData class that this table stores
+    data_class = None
+    # The names of the arrays written for each table
+    fields = ()
+
+    def __init__(self, component):
+        self.component = component
+
+    @classmethod
+    def tabulate(cls, component):
+        """Return the table for `component`, or None if it cannot be tabulated"""
+        data = component._data
+        if data.__class__ is not dict or not data:
+            return None
+        data_class = cls.data_class
+        for obj in data.values():
+            if obj.__class__ is not data_class:
+                return None
+        table = cls(component)
+        arrays = table.encode()
+        if arrays is None:
+            return None
+        table.arrays = arrays
+        return table
+
+    def state(self):
+        # The (picklable) information needed to rebuild the table.
+        # This is stored in the model pickle (so that any referenced
+        # components, e.g., domains, are shared with the model).  The
+        # table rows are in the order of the component's _data dict.
+        return (self.component,)
+
+    def encode(self):
+        raise NotImplementedError()
+
+    @classmethod
+    def decode(cls, state, arrays):
+        """Restore the state of the component's data objects from the table"""
+        raise NotImplementedError()
+
+
+class _VarTable(_TableBase):
+    data_class = _GeneralVarData
+    fields = ('value', 'value_kind', 'lb', 'lb_kind', 'ub', 'ub_kind')
+    fields += ('fixed', 'stale', 'domain')
+
+    def encode(self):
+        data = list(self.component._data.values())
+        arrays = []
+        for field in ('_value', '_lb', '_ub'):
+            ans = _encode_values([getattr(v, field) for v in data])
+            if ans is None:
+                return None
+            arrays.extend(ans)
+        arrays.append(array('B', [bool(v._fixed) for v in data]))
+        is_stale = StaleFlagManager.is_stale
+        arrays.append(array('B', [is_stale(v._stale) for v in data]))
+        domain_codes = {}
+        self.domains = []
+        codes = array('H')
+        for v in data:
+            _id = id(v._domain)
+            if _id not in domain_codes:
+                if len(self.domains) >= 2**16:
+                    return None
+                domain_codes[_id] = len(self.domains)
+                self.domains.append(v._domain)
+            codes.append(domain_codes[_id])
+        arrays.append(codes)
+        return arrays
+
+    def state(self):
+        return super().state() + (self.domains,)
+
+    @classmethod
+    def decode(cls, state, arrays):
+        component, domains = state
+        value, value_kind, lb, lb_kind, ub, ub_kind, fixed, stale, domain = arrays
+        value = _decode_values(value, value_kind)
+        lb = _decode_values(lb, lb_kind)
+        ub = _decode_values(ub, ub_kind)
+        fresh = StaleFlagManager.get_flag(0)
+        stale = [0 if s else fresh for s in stale]
+        domain = [domains[i] for i in domain]
+        component_ref = weakref_ref(component)
+        for (idx, obj), v, l, u, f, s, d in zip(
+            component._data.items(), value, lb, ub, fixed, stale, domain
+        ):
+            obj._component = component_ref
+            obj._index = idx
+            obj._value = v
+            obj._lb = l
+            obj._ub = u
+            obj._fixed = f == 1
+            obj._stale = s
+            obj._domain = d
+
+
+class _ParamTable(_TableBase):
+    data_class = _ParamData
+    fields = ('value', 'value_kind')
+
+    @classmethod
+    def tabulate(cls, component):
+        if not component._mutable:
+            return None
+        return super().tabulate(component)
+
+    def encode(self):
+        ans = _encode_values([p._value for p in self.component._data.values()])
+        if ans is None:
+            return None
+        return list(ans)
+
+    @classmethod
+    def decode(cls, state, arrays):
+        (component,) = state
+        value = _decode_values(*arrays)
+        component_ref = weakref_ref(component)
+        for (idx, obj), v in zip(component._data.items(), value):
+            obj._component = component_ref
+            obj._index = idx
+            obj._value = v
+
+
+_table_types = {IndexedVar: _VarTable, IndexedParam: _ParamTable}
+
+
+def _expression_node_reducer(cls):
+    """Return True if expression nodes of type `cls` only store their args
+
+    Nodes of these types can be recreated by calling ``cls(args)``.
+    For SumExpression (which stores the number of args separately from
+    the (possibly shared) args list), this returns a 'sum' flag so
+    the caller can verify that the args list is not shared.
+
+    """
+    init = getattr(cls, '__init__', None)
+    if init is NumericExpression.__init__:
+        slots = ('_args_',)
+    elif init is SumExpression.__init__:
+        slots = ('_args_', '_nargs')
+    else:
+        return False
+    info = getattr(cls, '__auto_slots__', None)
+    if info is None or info.has_dict or info.slot_mappers:
+        return False
+    if tuple(s for s in info.slots if s != '__weakref__') != slots:
+        return False
+    return 'sum' if len(slots) == 2 else True
+
+
+_expression_node_types = {}
+
+
+class _SnapshotPickler(pickle.Pickler):
+    def __init__(self, file):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.tables = []
+        self._tabulated = set()
+
+    def tabulate(self, model):
+        for comp in model.component_objects(descend_into=True):
+            table_type = _table_types.get(comp.__class__, None)
+            if table_type is None:
+                continue
+            table = table_type.tabulate(comp)
+            if table is None:
+                continue
+            self.tables.append(table)
+            self._tabulated.update(map(id, comp._data.values()))
+        return self.tables
+
+    def reducer_override(self, obj):
+        if id(obj) in self._tabulated:
+            # Tabulated data objects are pickled as "empty" instances
+            # (this is a single NEWOBJ opcode that the unpickler
+            # processes without calling back into Python).  Their
+            # state is restored from the tables after the pickle is
+            # loaded.
+            return copyreg.__newobj__, (obj.__class__,)
+        cls = obj.__class__
+        try:
+            node_type = _expression_node_types[cls]
+        except KeyError:
+            node_type = _expression_node_types[cls] = _expression_node_reducer(cls)
+        if node_type:
+            if node_type is True or len(obj._args_) == obj._nargs:
+                # Expression nodes are pickled as a direct call to the
+                # node constructor, which is significantly faster to
+                # load than the generic AutoSlots state (and matches
+                # how the node was originally created).
+                return cls, (obj._args_,)
+        if cls is FunctionType and _is_local_function(obj):
+            # Construction rules declared as lambdas or local functions
+            # cannot be pickled (and are not needed once the model is
+            # constructed)
+            return _NoneType, ()
+        return NotImplemented
+
+
+def save_model(model, filename):
+    """Write a constructed model to a snapshot file
+
+    Parameters
+    ----------
+    model: Block
+        The (constructed) model to save
+
+    filename: str
+        The name of the snapshot file to write
+
+    Notes
+    -----
+    Construction rules that cannot be pickled (lambdas and functions
+    declared within other functions) are not saved: they are replaced
+    by None in the loaded model.  A ValueError is raised if a component
+    still requires such a rule (e.g., sparse Vars or Blocks, lazy
+    constraints, or components that have not been constructed), or
+    if the model uses any other such function after it is loaded
+    (e.g., the validate function of a mutable Param or the validate /
+    filter functions of a Set).
+
+    """
+    _check_rules(model)
+    buf = io.BytesIO()
+    pickler = _SnapshotPickler(buf)
+    tables = pickler.tabulate(model)
+    with PauseGC():
+        pickler.dump((model, [table.state() for table in tables]))
+    payload = buf.getvalue()
+
+    arrays = []
+    offset = 0
+    for table in tables:
+        for arr in table.arrays:
+            arrays.append((arr.typecode, offset, len(arr)))
+            offset += _aligned(arr.itemsize * len(arr))
+    toc = {
+        'tables': [(table.__class__, table.fields) for table in tables],
+        'arrays': arrays,
+        'payload': (offset, len(payload)),
+    }
+    toc = pickle.dumps(toc, protocol=pickle.HIGHEST_PROTOCOL)
+    toc += b'\0' * (_aligned(_header.size + len(toc)) - _header.size - len(toc))
+
+    with open(filename, 'wb') as FILE:
+        FILE.write(_header.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, 0, len(toc)))
+        FILE.write(toc)
+        for table in tables:
+            for arr in table.arrays:
+                n = arr.itemsize * len(arr)
+                FILE.write(arr.tobytes())
+                FILE.write(b'\0' * (_aligned(n) - n))
+        FILE.write(payload)
+
+
+def load_model(filename, mmap=False):
+    """Load a model from a snapshot file written by :py:func:`save_model`
+
+    Parameters
+    ----------
+    filename: str
+        The name of the snapshot file to read
+
+    mmap: bool
+        If True, the file is memory-mapped (copy-on-write) instead of
+        being read into memory
+
+    Returns
+    -------
+    Block
+        The model stored in the snapshot
+
+    """
+    with open(filename, 'rb') as FILE:
+        if mmap:
+            buf = _mmap.mmap(FILE.fileno(), 0, access=_mmap.ACCESS_COPY)
+        else:
+            buf = FILE.read()
+    try:
+        # Loading creates many (acyclic) objects: pausing the garbage
+        # collector avoids repeatedly scanning the partially loaded model
+        with PauseGC():
+            return _load(memoryview(buf), filename)
+    finally:
+        if mmap:
+            buf.close()
+
+
+def _load(buf, filename):
+    if len(buf) < _header.size:
+        raise ValueError("File '%s' is not a Pyomo model snapshot" % (filename,))
+    magic, version, flags, toc_len = _header.unpack_from(buf)
+    if magic != SNAPSHOT_MAGIC:
+        raise ValueError("File '%s' is not a Pyomo model snapshot" % (filename,))
+    if version != SNAPSHOT_VERSION:
+        raise ValueError(
+            "Model snapshot '%s' uses format version %s; this version of "
+            "Pyomo can only load format version %s"
+            % (filename, version, SNAPSHOT_VERSION)
+        )
+    start = _header.size
+    toc = pickle.loads(buf[start : start + toc_len])
+    start += toc_len
+
+    arrays = []
+    for typecode, offset, count in toc['arrays']:
+        arr = array(typecode)
+        offset += start
+        arr.frombytes(buf[offset : offset + arr.itemsize * count])
+        arrays.append(arr)
+    offset, length = toc['payload']
+    offset += start
+    model, states = pickle.loads(buf[offset : offset + length])
+
+    for (table_type, fields), state in zip(toc['tables'], states):
+        table_arrays, arrays = arrays[: len(fields)], arrays[len(fields) :]
+        table_type.decode(state, table_arrays)
+    return model
+
+
+def _aligned(n):
+    return (n + 7) & ~7
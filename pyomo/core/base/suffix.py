@@ -12,9 +12,12 @@
 __all__ = ('Suffix', 'active_export_suffix_generator', 'active_import_suffix_generator')
 
 import logging
+from itertools import repeat
+from operator import itemgetter
 from pyomo.common.pyomo_typing import overload
 
 from pyomo.common.collections import ComponentMap
+from pyomo.common.dependencies import numpy as np
 from pyomo.common.log import is_debug_set
 from pyomo.common.timing import ConstructionTimer
 from pyomo.core.base.component import ActiveComponent, ModelComponentFactory
@@ -316,6 +319,48 @@ class Suffix(ComponentMap, ActiveComponent):
             # As implemented by MutableMapping
             self.update(data)
 
+    def get_values_array(self, component):
+        """
+        Returns the suffix values for the data objects in an (indexed)
+        component as a numpy float array (in the order returned by
+        component.values()).  Data objects without a suffix value
+        are returned as nan.
+        """
+        missing = (None, None)
+        ids = map(id, component.values())
+        return np.array(
+            list(map(itemgetter(1), map(self._dict.get, ids, repeat(missing)))),
+            dtype=float,
+        )
+
+    def set_values_array(self, component, values):
+        """
+        Sets the suffix values for the data objects in an (indexed)
+        component from a numpy array (in the order returned by
+        component.values()).  nan values clear the suffix value for the
+        corresponding data object.  This is the inverse of
+        get_values_array().
+        """
+        data = list(component.values())
+        if len(values) != len(data):
+            raise ValueError(
+                "Cannot set the values of Suffix '%s' for '%s': expected %s "
+                "values but received %s"
+                % (self.name, component.name, len(data), len(values))
+            )
+        values = np.asarray(values)
+        has_nan = values.dtype.kind == 'f' and np.isnan(values).any()
+        values = values.tolist()
+        _dict = self._dict
+        if has_nan:
+            for obj, val in zip(data, values):
+                if val != val:
+                    _dict.pop(id(obj), None)
+                else:
+                    _dict[id(obj)] = (obj, val)
+        else:
+            _dict.update(zip(map(id, data), zip(data, values)))
+
     @deprecated(
         'Suffix.setValue is replaced with Suffix.set_value.', version='4.1.10486'
     )
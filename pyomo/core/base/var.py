@@ -13,9 +13,12 @@ __all__ = ['Var', '_VarData', '_GeneralVarData', 'VarList', 'SimpleVar', 'Scalar
 
 import logging
 import sys
+from operator import attrgetter, itemgetter
 from pyomo.common.pyomo_typing import overload
 from weakref import ref as weakref_ref
 
+from pyomo.common.autoslots import fast_deepcopy
+from pyomo.common.dependencies import numpy as np
 from pyomo.common.deprecation import RenamedClass
 from pyomo.common.log import is_debug_set
 from pyomo.common.modeling import NOTSET
@@ -31,7 +34,12 @@ from pyomo.core.expr.numvalue import (
     native_numeric_types,
     native_types,
 )
-from pyomo.core.base.component import ComponentData, ModelComponentFactory
+from pyomo.core.base.component import (
+    ComponentData,
+    ModelComponentFactory,
+    _change_logs,
+    _log_change,
+)
 from pyomo.core.base.global_set import UnindexedComponent_index
 from pyomo.core.base.disable_methods import disable_methods
 from pyomo.core.base.indexed_component import (
@@ -43,6 +51,7 @@ from pyomo.core.base.initializer import (
     Initializer,
     DefaultInitializer,
     BoundInitializer,
+    ItemInitializer,
 )
 from pyomo.core.base.misc import apply_indexed_rule
 from pyomo.core.base.set import (
@@ -60,6 +69,7 @@ logger = logging.getLogger('pyomo.core')
 
 _inf = float('inf')
 _ninf = -_inf
+_nan = float('nan')
 _no_lower_bound = {None, _ninf}
 _no_upper_bound = {None, _inf}
 _known_global_real_domains = dict(
@@ -91,6 +101,14 @@ _VARDATA_API = (
     'stale',
     'fixed',
 )
+# Attributes supported by Var.get_values_array() / set_values_array()
+_ARRAY_ATTRS = ('value', 'lb', 'ub', 'fixed', 'domain')
+_get_value = attrgetter('_value')
+_get_lb = attrgetter('_lb')
+_get_ub = attrgetter('_ub')
+_get_domain = attrgetter('_domain')
+_get_fixed = attrgetter('_fixed')
+_get_stale = attrgetter('_stale')
 
 
 class _VarData(ComponentData, NumericValue):
@@ -377,6 +395,8 @@ class _GeneralVarData(_VarData):
         if val is None:
             self._value = None
             self._stale = 0  # True
+            if _change_logs and self._fixed:
+                _log_change('modify', self)
             return
         # TODO: generate a warning/error:
         #
@@ -412,6 +432,8 @@ class _GeneralVarData(_VarData):
 
         self._value = val
         self._stale = StaleFlagManager.get_flag(self._stale)
+        if _change_logs and self._fixed:
+            _log_change('modify', self)
 
     @property
     def value(self):
@@ -436,6 +458,8 @@ class _GeneralVarData(_VarData):
                 extra={'id': 'E2001'},
             )
             raise
+        if _change_logs:
+            _log_change('modify', self)
 
     @_VarData.bounds.getter
     def bounds(self):
@@ -514,6 +538,8 @@ class _GeneralVarData(_VarData):
     @lower.setter
     def lower(self, val):
         self._lb = self._process_bound(val, 'lower')
+        if _change_logs:
+            _log_change('modify', self)
 
     @property
     def upper(self):
@@ -539,6 +565,8 @@ class _GeneralVarData(_VarData):
     @upper.setter
     def upper(self, val):
         self._ub = self._process_bound(val, 'upper')
+        if _change_logs:
+            _log_change('modify', self)
 
     def get_units(self):
         """Return the units for this variable entry."""
@@ -553,6 +581,8 @@ class _GeneralVarData(_VarData):
     @fixed.setter
     def fixed(self, val):
         self._fixed = bool(val)
+        if _change_logs:
+            _log_change('modify', self)
 
     @property
     def stale(self):
@@ -611,6 +641,11 @@ class Var(IndexedComponent, IndexedComponent_NDArrayMixin):
             :meth:`index_set` when constructing the Var (True) or just the
             variables returned by ``initialize``/``rule`` (False).  Defaults
             to ``True``.
+        storage (str, optional): The storage scheme for indexed
+            variables.  ``'dense'`` stores the variable values, bounds,
+            flags and domains in contiguous numpy arrays (see
+            :class:`DenseIndexedVar`).  Defaults to ``None`` (one
+            :class:`_GeneralVarData` object per index).
         units (pyomo units expression, optional): Set the units corresponding
             to the entries in this variable.
         name (str, optional): Name for this component.
@@ -624,6 +659,8 @@ class Var(IndexedComponent, IndexedComponent_NDArrayMixin):
             return super(Var, cls).__new__(cls)
         if not args or (args[0] is UnindexedComponent_set and len(args) == 1):
             return super(Var, cls).__new__(AbstractScalarVar)
+        elif kwargs.get('storage', None) == 'dense':
+            return super(Var, cls).__new__(DenseIndexedVar)
         else:
             return super(Var, cls).__new__(IndexedVar)
 
@@ -637,6 +674,7 @@ class Var(IndexedComponent, IndexedComponent_NDArrayMixin):
         initialize=None,
         rule=None,
         dense=True,
+        storage=None,
         units=None,
         name=None,
         doc=None
@@ -655,6 +693,12 @@ class Var(IndexedComponent, IndexedComponent_NDArrayMixin):
         )
         _bounds_arg = kwargs.pop('bounds', None)
         self._dense = kwargs.pop('dense', True)
+        _storage = kwargs.pop('storage', None)
+        if _storage not in (None, 'dense'):
+            raise ValueError(
+                "Unrecognized storage '%s' for Var: expected None or 'dense'"
+                % (_storage,)
+            )
         self._units = kwargs.pop('units', None)
         if self._units is not None:
             self._units = units.get_units(self._units)
@@ -672,6 +716,11 @@ class Var(IndexedComponent, IndexedComponent_NDArrayMixin):
                 "for scalar variables; converting to dense=True" % (self.name,)
             )
             self._dense = True
+        if not self.is_indexed() and _storage is not None:
+            logger.warning(
+                "ScalarVar object '%s': storage='%s' is only supported "
+                "for indexed variables; ignoring" % (self.name, _storage)
+            )
         self._rule_bounds = BoundInitializer(_bounds_arg, self)
 
     def flag_as_stale(self):
@@ -705,6 +754,180 @@ class Var(IndexedComponent, IndexedComponent_NDArrayMixin):
         for index, new_value in new_values.items():
             self[index].set_value(new_value, skip_validation)
 
+    def get_values_array(self, attr='value'):
+        """Return a variable attribute for all VarData as a numpy array
+
+        The array contains one entry for each VarData in this component,
+        in the order returned by :py:meth:`keys`.
+
+        Parameters
+        ----------
+        attr: str
+            The attribute to return.  One of ``'value'`` (float array;
+            variables without a value are returned as ``nan``),
+            ``'lb'`` or ``'ub'`` (float array of the effective bounds;
+            missing bounds are returned as ``-inf`` / ``inf``),
+            ``'fixed'`` (bool array) or ``'domain'`` (object array).
+
+        """
+        data = self._data_list()
+        if self._fast_data_access():
+            get_value, get_fixed, get_domain = _get_value, _get_fixed, _get_domain
+        else:
+            get_value = attrgetter('value')
+            get_fixed = attrgetter('fixed')
+            get_domain = attrgetter('domain')
+        if attr == 'value':
+            return np.array(list(map(get_value, data)), dtype=float)
+        elif attr == 'fixed':
+            return np.array(list(map(get_fixed, data)), dtype=bool)
+        elif attr == 'domain':
+            ans = np.empty(len(data), dtype=object)
+            ans[:] = list(map(get_domain, data))
+            return ans
+        elif attr == 'lb' or attr == 'ub':
+            if not self._fast_data_access():
+                ans = np.array(list(map(attrgetter(attr), data)), dtype=float)
+                ans[np.isnan(ans)] = -_inf if attr == 'lb' else _inf
+                return ans
+            return self._bounds_array(data, attr)
+        raise ValueError(
+            "Unrecognized Var attribute '%s': expected one of %s"
+            % (attr, ', '.join(_ARRAY_ATTRS))
+        )
+
+    def set_values_array(self, values, attr='value', skip_validation=False):
+        """Set a variable attribute for all VarData from a numpy array
+
+        This is the inverse of :py:meth:`get_values_array`: `values`
+        must contain one entry for each VarData in this component, in
+        the order returned by :py:meth:`keys`.  Values are assumed to
+        be expressed in the units of this Var.  ``nan`` values (and
+        ``-inf`` lower / ``inf`` upper bounds) are stored as ``None``.
+
+        Parameters
+        ----------
+        values: numpy.ndarray or sequence
+            The new attribute values
+
+        attr: str
+            The attribute to set (see :py:meth:`get_values_array`)
+
+        skip_validation: bool
+            If True, variable values are stored without checking them
+            against the variable domain and bounds (see
+            :py:meth:`_GeneralVarData.set_value`)
+
+        """
+        if attr not in _ARRAY_ATTRS:
+            raise ValueError(
+                "Unrecognized Var attribute '%s': expected one of %s"
+                % (attr, ', '.join(_ARRAY_ATTRS))
+            )
+        data = self._data_list()
+        if len(values) != len(data):
+            raise ValueError(
+                "Cannot set %s for Var '%s': expected %s values but received %s"
+                % (attr, self.name, len(data), len(values))
+            )
+        if attr == 'domain':
+            for vardata, domain in zip(data, values):
+                vardata.domain = domain
+            return
+        if attr == 'fixed':
+            values = np.asarray(values, dtype=bool).tolist()
+        else:
+            values = np.asarray(values, dtype=float)
+            if attr == 'value':
+                missing = np.isnan(values)
+            elif attr == 'lb':
+                missing = np.isnan(values) | (values == -_inf)
+            else:
+                missing = np.isnan(values) | (values == _inf)
+            values = np.where(missing, None, values).tolist()
+        fast = self._fast_data_access()
+        if attr == 'value':
+            if skip_validation and fast:
+                # Follow the same stale flag logic as set_value():
+                # updating any non-stale variable advances the flag
+                flag = StaleFlagManager.get_flag(0)
+                if flag in map(_get_stale, data):
+                    flag = StaleFlagManager.get_flag(flag)
+                for vardata, val in zip(data, values):
+                    vardata._value = val
+                    vardata._stale = 0 if val is None else flag
+                if _change_logs:
+                    for vardata in filter(_get_fixed, data):
+                        _log_change('modify', vardata)
+            else:
+                for vardata, val in zip(data, values):
+                    vardata.set_value(val, skip_validation)
+        elif attr == 'fixed':
+            if fast:
+                for vardata, val in zip(data, values):
+                    vardata._fixed = val
+                if _change_logs:
+                    for vardata in data:
+                        _log_change('modify', vardata)
+            else:
+                for vardata, val in zip(data, values):
+                    vardata.fixed = val
+        elif fast:
+            # Native numbers do not need any bound processing
+            if attr == 'lb':
+                for vardata, val in zip(data, values):
+                    vardata._lb = val
+            else:
+                for vardata, val in zip(data, values):
+                    vardata._ub = val
+            if _change_logs:
+                for vardata in data:
+                    _log_change('modify', vardata)
+        elif attr == 'lb':
+            for vardata, val in zip(data, values):
+                vardata.setlb(val)
+        else:
+            for vardata, val in zip(data, values):
+                vardata.setub(val)
+
+    def _data_list(self):
+        """Return the list of VarData in :py:meth:`keys` order"""
+        if self._data.__class__ is dict:
+            return list(map(self._data.__getitem__, self.keys()))
+        return list(self.values())
+
+    def _fast_data_access(self):
+        # The array methods access the _GeneralVarData slots directly
+        # (avoiding the property overhead) unless this is a Reference
+        # or uses a custom VarData class
+        return not self.is_reference() and issubclass(
+            self._ComponentDataClass, _GeneralVarData
+        )
+
+    def _bounds_array(self, data, attr):
+        if attr == 'lb':
+            bounds, missing, _best, domain_idx = map(_get_lb, data), -_inf, max, 0
+        else:
+            bounds, missing, _best, domain_idx = map(_get_ub, data), _inf, min, 1
+        # Domain bounds are cached, as most variables share a few domains
+        domain_bounds = {}
+        ans = []
+        for bnd, domain in zip(bounds, map(_get_domain, data)):
+            _id = id(domain)
+            if _id in domain_bounds:
+                dbnd = domain_bounds[_id]
+            else:
+                dbnd = domain_bounds[_id] = domain.bounds()[domain_idx]
+            if bnd is None:
+                bnd = dbnd
+            else:
+                if bnd.__class__ not in native_types:
+                    bnd = bnd()
+                if dbnd is not None:
+                    bnd = _best(bnd, dbnd)
+            ans.append(missing if bnd is None else bnd)
+        return np.array(ans, dtype=float)
+
     def get_units(self):
         """Return the units expression for this Var."""
         return self._units
@@ -748,6 +971,14 @@ class Var(IndexedComponent, IndexedComponent_NDArrayMixin):
                 self._dense = False
 
             if self._rule_init is not None and self._rule_init.contains_indices():
+                bulk = self._rule_init.bulk_items()
+                if bulk is not None and hasattr(bulk[1], 'tolist'):
+                    # Array-like initializers (numpy / pandas): extract
+                    # all the (native) values at once instead of
+                    # querying the array for each index
+                    self._rule_init = ItemInitializer(
+                        dict(zip(bulk[0], bulk[1].tolist()))
+                    )
                 # Historically we have allowed Vars to be initialized by
                 # a sparse map (i.e., a dict containing only some of the
                 # keys).  We will wrap the incoming initializer to map
@@ -994,6 +1225,513 @@ class IndexedVar(Var):
             raise
 
 
+def _get_dense_var_data(component, storage, index, pos):
+    """Return the (unique) _DenseVarData view of `storage` for `index`
+
+    This is also used to restore pickled _DenseVarData views, so it
+    must tolerate being called before the storage state is restored.
+
+    """
+    views = getattr(storage, '_views', None)
+    if views is None:
+        # The list of views is only allocated once the first view is
+        # requested (many models never reference individual variables)
+        views = storage._views = [None] * max(pos + 1, storage.size())
+    elif pos >= len(views):
+        views.extend([None] * (pos + 1 - len(views)))
+    obj = views[pos]
+    if obj is None:
+        obj = views[pos] = _DenseVarData.__new__(_DenseVarData)
+        obj._component = weakref_ref(component)
+        obj._storage = storage
+        obj._pos = pos
+    return obj
+
+
+def _dense_bound(vardata, val):
+    if val is None:
+        return _nan
+    if val.__class__ not in native_numeric_types:
+        raise ValueError(
+            "Var '%s' uses dense storage, which only supports constant "
+            "numeric bounds (received %s)" % (vardata.name, val)
+        )
+    return val
+
+
+class _DenseVarData(_VarData):
+    """A lightweight view of a single variable stored in a DenseIndexedVar
+
+    The variable data (value, bounds, domain, and the fixed / stale
+    flags) is held by the parent component's :class:`_DenseVarStorage`.
+    Views are created on demand and retained by the storage (in a list
+    indexed by position), so there is exactly one view for each index
+    (and views can be used in expressions and compared by identity
+    like any other VarData).
+
+    """
+
+    __slots__ = ('_storage', '_pos')
+
+    @property
+    def _index(self):
+        # The index is derived from the position (instead of storing it
+        # on every view)
+        comp = self.parent_component()
+        if comp is None:
+            return None
+        return comp._index_set.at(self._pos + 1)
+
+    #
+    # Map the _GeneralVarData "slots" to the storage arrays
+    #
+
+    @property
+    def _value(self):
+        ans = self._storage.value.item(self._pos)
+        return None if ans != ans else ans
+
+    @_value.setter
+    def _value(self, val):
+        self._storage.value[self._pos] = _nan if val is None else val
+
+    @property
+    def _lb(self):
+        ans = self._storage.lb.item(self._pos)
+        return None if ans != ans else ans
+
+    @_lb.setter
+    def _lb(self, val):
+        self._storage.writable('lb')[self._pos] = _dense_bound(self, val)
+
+    @property
+    def _ub(self):
+        ans = self._storage.ub.item(self._pos)
+        return None if ans != ans else ans
+
+    @_ub.setter
+    def _ub(self, val):
+        self._storage.writable('ub')[self._pos] = _dense_bound(self, val)
+
+    @property
+    def _domain(self):
+        storage = self._storage
+        return storage.domains[storage.domain.item(self._pos)]
+
+    @_domain.setter
+    def _domain(self, val):
+        storage = self._storage
+        storage.domain[self._pos] = storage.domain_code(val)
+
+    @property
+    def _fixed(self):
+        return self._storage.fixed.item(self._pos)
+
+    @_fixed.setter
+    def _fixed(self, val):
+        self._storage.fixed[self._pos] = val
+
+    @property
+    def _stale(self):
+        return self._storage.stale.item(self._pos)
+
+    @_stale.setter
+    def _stale(self, val):
+        self._storage.stale[self._pos] = val
+
+    #
+    # The remainder of the VarData API is shared with _GeneralVarData
+    #
+
+    set_value = _GeneralVarData.set_value
+    value = _GeneralVarData.value
+    domain = _GeneralVarData.domain
+    bounds = _GeneralVarData.bounds
+    lb = _GeneralVarData.lb
+    ub = _GeneralVarData.ub
+    lower = _GeneralVarData.lower
+    upper = _GeneralVarData.upper
+    get_units = _GeneralVarData.get_units
+    fixed = _GeneralVarData.fixed
+    stale = _GeneralVarData.stale
+    is_fixed = _GeneralVarData.is_fixed
+    _process_bound = _GeneralVarData._process_bound
+
+    def __reduce__(self):
+        return _get_dense_var_data, (
+            self.parent_component(),
+            self._storage,
+            self._index,
+            self._pos,
+        )
+
+    def __deepcopy__(self, memo):
+        comp = self.parent_component()
+        new_comp = fast_deepcopy(comp, memo)
+        if new_comp is comp:
+            # The component is out of scope (see Block.clone())
+            ans = self
+        else:
+            ans = _get_dense_var_data(
+                new_comp, fast_deepcopy(self._storage, memo), self._index, self._pos
+            )
+        memo[id(self)] = ans
+        return ans
+
+
+class _DenseVarStorage(object):
+    """Struct-of-arrays storage for the variables in a DenseIndexedVar
+
+    This implements the (read-only) mapping interface that
+    IndexedComponent expects for the ``_data`` dict, mapping each index
+    to a :class:`_DenseVarData` view.  Variables are stored in the
+    order of the (ordered) index set.  Values and bounds that are None
+    are stored as nan.  Bounds that are common to all variables are
+    stored as a single (broadcast) value until they are modified.
+    Domains are stored as an index into the list of distinct domains.
+    The views handed out for individual variables are kept in a list
+    (by position) that is only allocated when the first view is created.
+
+    """
+
+    __slots__ = (
+        '_component',
+        'value',
+        'lb',
+        'ub',
+        'fixed',
+        'stale',
+        'domain',
+        'domains',
+        '_domain_codes',
+        '_views',
+    )
+
+    def __init__(self, component, n):
+        self._component = weakref_ref(component)
+        self.value = np.full(n, _nan)
+        self.lb = np.broadcast_to(_nan, n)
+        self.ub = np.broadcast_to(_nan, n)
+        self.fixed = np.zeros(n, dtype=bool)
+        self.stale = np.zeros(n, dtype=np.uint32)
+        self.domain = np.zeros(n, dtype=np.uint16)
+        self.domains = []
+        self._domain_codes = {}
+        self._views = None
+
+    def writable(self, field):
+        # Bounds that are the same for all variables are stored as a
+        # (read-only) broadcast array and only expanded when modified
+        arr = getattr(self, field)
+        if not arr.flags.writeable:
+            arr = arr.copy()
+            setattr(self, field, arr)
+        return arr
+
+    def domain_code(self, domain):
+        _id = id(domain)
+        if _id not in self._domain_codes:
+            self._domain_codes[_id] = len(self.domains)
+            self.domains.append(domain)
+        return self._domain_codes[_id]
+
+    def size(self):
+        # (The number of variables, which is 0 while the storage state
+        # is being restored by pickle)
+        try:
+            return len(self.value)
+        except AttributeError:
+            return 0
+
+    def __len__(self):
+        return len(self.value)
+
+    def __contains__(self, index):
+        return index in self._component()._index_set
+
+    def __iter__(self):
+        return iter(self._component()._index_set)
+
+    def _index_set(self):
+        comp = self._component()
+        index_set = comp._index_set
+        if len(index_set) != len(self.value):
+            raise RuntimeError(
+                "The index set for Var '%s' (which uses dense storage) was "
+                "modified after the Var was constructed" % (comp.name,)
+            )
+        return comp, index_set
+
+    def __getitem__(self, index):
+        comp, index_set = self._index_set()
+        try:
+            pos = index_set.ord(index) - 1
+        except (IndexError, ValueError):
+            raise KeyError(index)
+        views = self._views
+        if views is not None and views[pos] is not None:
+            return views[pos]
+        return _get_dense_var_data(comp, self, index, pos)
+
+    def __setitem__(self, index, val):
+        raise TypeError(
+            "Cannot add VarData to Var '%s', which uses dense storage"
+            % (self._component().name,)
+        )
+
+    def __delitem__(self, index):
+        raise TypeError(
+            "Cannot remove VarData from Var '%s', which uses dense storage"
+            % (self._component().name,)
+        )
+
+    def get(self, index, default=None):
+        try:
+            return self[index]
+        except KeyError:
+            return default
+
+    def keys(self):
+        return self.__iter__()
+
+    def values(self):
+        return map(itemgetter(1), self.items())
+
+    def items(self):
+        # Iterate by position (avoiding the index set ord() lookups)
+        comp, index_set = self._index_set()
+        for pos, index in enumerate(index_set):
+            views = self._views
+            if views is None or views[pos] is None:
+                yield index, _get_dense_var_data(comp, self, index, pos)
+            else:
+                yield index, views[pos]
+
+    def __getstate__(self):
+        # Like _GeneralVarData, store the stale flags as booleans (the
+        # global stale flag will be different when the state is restored)
+        return (
+            self._component(),
+            self.value,
+            self.lb,
+            self.ub,
+            self.fixed,
+            self.stale != StaleFlagManager.get_flag(0),
+            self.domain,
+            self.domains,
+        )
+
+    def __setstate__(self, state):
+        (
+            component,
+            self.value,
+            self.lb,
+            self.ub,
+            self.fixed,
+            stale,
+            self.domain,
+            self.domains,
+        ) = state
+        self._component = weakref_ref(component)
+        self.stale = np.where(stale, 0, StaleFlagManager.get_flag(0)).astype(np.uint32)
+        self._domain_codes = {id(d): i for i, d in enumerate(self.domains)}
+        # Views may have been restored before the storage state
+        views = getattr(self, '_views', None)
+        if views is not None and len(views) < len(self.value):
+            views.extend([None] * (len(self.value) - len(views)))
+        self._views = views
+
+    def __deepcopy__(self, memo):
+        ans = memo[id(self)] = self.__class__.__new__(self.__class__)
+        ans.__setstate__(fast_deepcopy(self.__getstate__(), memo))
+        return ans
+
+
+class DenseIndexedVar(IndexedVar):
+    """An array of variables using struct-of-arrays storage
+
+    This IndexedVar stores the values, bounds, domains and fixed / stale
+    flags for all its variables in contiguous numpy arrays (see
+    :class:`_DenseVarStorage`) instead of one :class:`_GeneralVarData`
+    object per index.  The VarData objects returned by this component
+    are lightweight views (:class:`_DenseVarData`) that are created on
+    demand.
+
+    Dense storage requires a finite, ordered index set that is not
+    modified after the Var is constructed, and only supports constant
+    (numeric) bounds.  Declare a DenseIndexedVar with
+    ``Var(..., storage='dense')``.
+
+    """
+
+    _ComponentDataClass = _DenseVarData
+
+    def is_reference(self):
+        return False
+
+    def _create_objects_for_deepcopy(self, memo, component_list):
+        # The VarData views are not stored by this component (and will
+        # be regenerated from the copied storage as needed)
+        return super(IndexedComponent, self)._create_objects_for_deepcopy(
+            memo, component_list
+        )
+
+    def construct(self, data=None):
+        """Construct the storage for this variable"""
+        if self._constructed:
+            return
+        self._constructed = True
+
+        timer = ConstructionTimer(self)
+        if is_debug_set(logger):
+            logger.debug("Constructing Variable %s" % (self.name,))
+
+        index_set = self.index_set()
+        if not index_set.isfinite() or not index_set.isordered():
+            raise ValueError(
+                "Var '%s' uses dense storage, which requires a finite "
+                "ordered index set" % (self.name,)
+            )
+
+        index = None
+        try:
+            # We do not (currently) accept data for constructing Variables
+            assert data is None
+
+            if self._rule_init is not None and self._rule_init.contains_indices():
+                self._rule_init = DefaultInitializer(self._rule_init, None, KeyError)
+            storage = self._data = _DenseVarStorage(self, len(index_set))
+            if not len(storage):
+                return
+            # The variables are initialized through a transient view that
+            # is moved across the storage (so that construction does not
+            # create and retain a view for every variable).  Initialize
+            # the first variable and then use it as a template for all
+            # the others (as in Var.construct)
+            block = self.parent_block()
+            obj = _DenseVarData.__new__(_DenseVarData)
+            obj._component = weakref_ref(self)
+            obj._storage = storage
+            obj._pos = 0
+            index = next(iter(index_set))
+            obj._domain = self._rule_domain(block, index)
+            if self._rule_bounds is not None:
+                lb, ub = self._rule_bounds(block, index)
+                obj._lb = obj._process_bound(lb, 'lower')
+                obj._ub = obj._process_bound(ub, 'upper')
+            if self._rule_init is not None:
+                obj.set_value(self._rule_init(block, index))
+            for field in (storage.value, storage.stale):
+                field[:] = field[0]
+            storage.lb = np.broadcast_to(storage.lb[0], len(storage))
+            storage.ub = np.broadcast_to(storage.ub[0], len(storage))
+
+            call_domain_rule = not self._rule_domain.constant()
+            call_bounds_rule = (
+                self._rule_bounds is not None and not self._rule_bounds.constant()
+            )
+            call_init_rule = self._rule_init is not None and (
+                not self._rule_init.constant() or call_domain_rule or call_bounds_rule
+            )
+            if call_domain_rule:
+                for obj._pos, index in enumerate(index_set):
+                    obj._domain = self._rule_domain(block, index)
+            if call_bounds_rule:
+                for obj._pos, index in enumerate(index_set):
+                    lb, ub = self._rule_bounds(block, index)
+                    obj._lb = obj._process_bound(lb, 'lower')
+                    obj._ub = obj._process_bound(ub, 'upper')
+            if call_init_rule:
+                for obj._pos, index in enumerate(index_set):
+                    obj.set_value(self._rule_init(block, index))
+        except Exception:
+            err = sys.exc_info()[1]
+            logger.error(
+                "Rule failed when initializing variable for "
+                "Var %s with index %s:\n%s: %s"
+                % (self.name, str(index), type(err).__name__, err)
+            )
+            raise
+        finally:
+            timer.report()
+
+    def flag_as_stale(self):
+        self._data.stale[:] = 0
+
+    def fix(self, value=NOTSET, skip_validation=False):
+        if value is NOTSET:
+            self._data.fixed[:] = True
+            self._log_changes()
+        else:
+            super().fix(value, skip_validation)
+
+    def unfix(self):
+        self._data.fixed[:] = False
+        self._log_changes()
+
+    def get_values_array(self, attr='value'):
+        storage = self._data
+        if attr == 'value':
+            return storage.value.copy()
+        elif attr == 'fixed':
+            return storage.fixed.copy()
+        elif attr == 'domain':
+            domains = np.empty(len(storage.domains), dtype=object)
+            domains[:] = storage.domains
+            return domains[storage.domain]
+        elif attr == 'lb':
+            dlb = [d.bounds()[0] for d in storage.domains]
+            dlb = np.array([_ninf if b is None else b for b in dlb], dtype=float)
+            return np.fmax(storage.lb, dlb[storage.domain])
+        elif attr == 'ub':
+            dub = [d.bounds()[1] for d in storage.domains]
+            dub = np.array([_inf if b is None else b for b in dub], dtype=float)
+            return np.fmin(storage.ub, dub[storage.domain])
+        return super().get_values_array(attr)
+
+    def set_values_array(self, values, attr='value', skip_validation=False):
+        storage = self._data
+        if len(values) != len(storage) or attr == 'domain':
+            return super().set_values_array(values, attr, skip_validation)
+        if attr == 'fixed':
+            storage.fixed[:] = values
+            self._log_changes()
+        elif attr == 'lb' or attr == 'ub':
+            # Missing bounds are stored as nan
+            values = np.array(values, dtype=float)
+            values[values == (-_inf if attr == 'lb' else _inf)] = _nan
+            setattr(storage, attr, values)
+            self._log_changes()
+        elif attr == 'value' and skip_validation:
+            values = np.array(values, dtype=float)
+            flag = StaleFlagManager.get_flag(0)
+            if (storage.stale == flag).any():
+                flag = StaleFlagManager.get_flag(flag)
+            storage.value[:] = values
+            storage.stale[:] = np.where(np.isnan(values), 0, flag)
+            # Values are only recorded for fixed variables
+            self._log_changes(storage.fixed)
+        else:
+            super().set_values_array(values, attr, skip_validation)
+
+    def _log_changes(self, mask=None):
+        # Record a modification of (the masked) variables in the active
+        # change logs (the bulk updates bypass the VarData API)
+        if not _change_logs:
+            return
+        data = self._data_list()
+        if mask is not None:
+            data = (vardata for vardata, flag in zip(data, mask) if flag)
+        for vardata in data:
+            _log_change('modify', vardata)
+
+    def _data_list(self):
+        return list(self._data.values())
+
+    def _fast_data_access(self):
+        return False
+
+
 @ModelComponentFactory.register("List of decision variables.")
 class VarList(IndexedVar):
     """
@@ -0,0 +1,86 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2022
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+"""Build the compiled expression walker (``pyomo_walker_loop``)
+
+The walker source (:py:mod:`pyomo.core.expr.walker_loop`) is compiled
+with Cython and the resulting extension module is installed into the
+Pyomo configuration directory (``PYOMO_CONFIG_DIR``), where it is
+found by :py:mod:`pyomo.core.expr.visitor`.
+
+"""
+
+import glob
+import os
+import shutil
+import sys
+import tempfile
+
+WALKER_MODULE = 'pyomo_walker_loop'
+
+
+def get_walker_target_dir():
+    from pyomo.common.envvar import PYOMO_CONFIG_DIR
+
+    return os.path.join(
+        PYOMO_CONFIG_DIR, 'lib', 'python%s.%s' % sys.version_info[:2], 'site-packages'
+    )
+
+
+def build_walker(args=[]):
+    print('\n\n**** Building the compiled expression walker ****')
+    import setuptools
+    from distutils.dist import Distribution
+    from setuptools.command.build_ext import build_ext
+    from Cython.Build import cythonize
+    from pyomo.common.fileutils import this_file_dir
+
+    basedir = os.path.abspath(os.path.curdir)
+    tmpdir = os.path.abspath(tempfile.mkdtemp())
+    print("Building in '%s'" % tmpdir)
+    os.chdir(tmpdir)
+    try:
+        # Cython names the extension module after the source file, so
+        # compile a (top-level) copy of the walker source
+        source = WALKER_MODULE + '.py'
+        for ext in ('.py', '.pxd'):
+            shutil.copy(
+                os.path.join(this_file_dir(), 'walker_loop' + ext), WALKER_MODULE + ext
+            )
+        package_config = {
+            'name': WALKER_MODULE,
+            'packages': [],
+            'ext_modules': cythonize(
+                [source], compiler_directives={"language_level": 3}
+            ),
+            'cmdclass': {'build_ext': build_ext},
+        }
+        dist = Distribution(package_config)
+        dist.script_args = ['build_ext'] + args
+        dist.parse_command_line()
+        dist.run_command('build_ext')
+
+        library = glob.glob("build/*/%s.*" % (WALKER_MODULE,))[0]
+        target = get_walker_target_dir()
+        if not os.path.exists(target):
+            os.makedirs(target)
+        shutil.copy(library, target)
+    finally:
+        os.chdir(basedir)
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+
+class WalkerBuilder(object):
+    def __call__(self, parallel):
+        return build_walker()
+
+
+if __name__ == '__main__':
+    build_walker(sys.argv[1:])
@@ -19,6 +19,7 @@ from collections import deque
 
 logger = logging.getLogger('pyomo.core')
 
+from pyomo.common.dependencies import attempt_import
 from pyomo.common.deprecation import deprecated, deprecation_warning
 from pyomo.common.errors import DeveloperError, TemplateExpressionError
 from pyomo.common.numeric_types import (
@@ -65,6 +66,34 @@ class RevertToNonrecursive(Exception):
     pass
 
 
+def _walker_importer():
+    import os
+    from pyomo.common.envvar import PYOMO_CONFIG_DIR
+
+    pyomo_config_dir = os.path.join(
+        PYOMO_CONFIG_DIR, 'lib', 'python%s.%s' % sys.version_info[:2], 'site-packages'
+    )
+    sys.path.insert(0, pyomo_config_dir)
+    try:
+        import pyomo_walker_loop
+    finally:
+        assert sys.path[0] == pyomo_config_dir
+        sys.path.pop(0)
+    return pyomo_walker_loop
+
+
+# The (optional) compiled walker is built by the "pyomo build-extensions"
+# command (see pyomo.core.expr.build).  When it is available,
+# StreamBasedExpressionVisitor uses it in place of the Python walkers.
+compiled_walker, compiled_walker_available = attempt_import(
+    'pyomo_walker_loop',
+    error_message='The compiled expression walker has not been built.  '
+    'Please use the "pyomo build-extensions" command',
+    importer=_walker_importer,
+    defer_check=False,
+)
+
+
 # NOTE: This module also has dependencies on numeric_expr; however, to
 # avoid circular dependencies, we will NOT import them here.  Instead,
 # until we can resolve the circular dependencies, they will be injected
@@ -255,6 +284,8 @@ class StreamBasedExpressionVisitor(object):
 
     def walk_expression(self, expr):
         """Walk an expression, calling registered callbacks."""
+        if compiled_walker_available:
+            return compiled_walker.walk_expression(self, expr)
         if self.initializeWalker is not None:
             walk, root = self.initializeWalker(expr)
             if not walk:
@@ -543,6 +574,8 @@ class StreamBasedExpressionVisitor(object):
         )
 
     def _nonrecursive_walker_loop(self, ptr):
+        if compiled_walker_available:
+            return compiled_walker.walker_loop(self, ptr)
         _, node, args, _, data, child_idx = ptr
         try:
             while 1:
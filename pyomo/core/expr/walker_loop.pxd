@@ -0,0 +1,17 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2022
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+#
+# Cython declarations (augmenting pxd) for the compiled walker_loop
+
+cimport cython
+
+@cython.locals(args=object, last_idx=Py_ssize_t, child_idx=Py_ssize_t)
+cpdef walker_loop(visitor, tuple ptr)
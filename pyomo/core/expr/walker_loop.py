@@ -0,0 +1,182 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2022
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+"""Source for the compiled StreamBasedExpressionVisitor walker
+
+This module is a standalone (pure Python) implementation of the
+nonrecursive walker used by
+:py:class:`~pyomo.core.expr.visitor.StreamBasedExpressionVisitor`.  It
+is compiled by Cython into the ``pyomo_walker_loop`` extension module
+by the ``pyomo build-extensions`` command (see
+:py:mod:`pyomo.core.expr.build`).  When the compiled extension is
+available, :py:meth:`StreamBasedExpressionVisitor.walk_expression` uses
+it in place of the (recursive) Python implementation.
+
+The module intentionally only depends on the Python standard library
+and :py:mod:`pyomo.common.numeric_types` so that it can be compiled and
+loaded independently of the rest of Pyomo.
+
+"""
+
+from pyomo.common.numeric_types import nonpyomo_leaf_types
+
+# Argument types that are known not to be context managers (this avoids
+# the relatively expensive hasattr() checks for the most common cases)
+_sequence_types = {tuple, list}
+
+
+def walk_expression(visitor, expr):
+    """Walk an expression, calling the callbacks registered on `visitor`
+
+    This implements the same event stream (and callback API) as
+    :py:meth:`StreamBasedExpressionVisitor.walk_expression_nonrecursive`.
+
+    """
+    if visitor.initializeWalker is not None:
+        walk, result = visitor.initializeWalker(expr)
+        if not walk:
+            return result
+        elif result is not None:
+            expr = result
+    if visitor.enterNode is not None:
+        tmp = visitor.enterNode(expr)
+        if tmp is None:
+            args = data = None
+        else:
+            args, data = tmp
+    else:
+        args = None
+        data = []
+    if args is None:
+        if type(expr) in nonpyomo_leaf_types or not expr.is_expression_type():
+            args = ()
+        else:
+            args = expr.args
+    if args.__class__ not in _sequence_types:
+        if hasattr(args, '__enter__'):
+            args.__enter__()
+        elif not hasattr(args, '__len__'):
+            # e.g., generators returned by enterNode()
+            args = list(args)
+    # Note that because we increment child_idx just before fetching
+    # the child node, it must be initialized to -1, and ptr[3] must
+    # always be *one less than* the number of arguments
+    return walker_loop(visitor, (None, expr, args, len(args) - 1, data, -1))
+
+
+def walker_loop(visitor, ptr):
+    """Process the (linked list) walker stack `ptr` for `visitor`
+
+    This implements
+    :py:meth:`StreamBasedExpressionVisitor._nonrecursive_walker_loop`.
+    The stack is a linked list of 6-member tuples (see
+    :py:meth:`StreamBasedExpressionVisitor.walk_expression_nonrecursive`).
+
+    """
+    enterNode = visitor.enterNode
+    exitNode = visitor.exitNode
+    beforeChild = visitor.beforeChild
+    acceptChildResult = visitor.acceptChildResult
+    afterChild = visitor.afterChild
+    finalizeResult = visitor.finalizeResult
+    leaf_types = nonpyomo_leaf_types
+
+    _, node, args, last_idx, data, child_idx = ptr
+    try:
+        while 1:
+            if child_idx < last_idx:
+                child_idx += 1
+                # This node still has children to process
+                child = args[child_idx]
+
+                if beforeChild is not None:
+                    tmp = beforeChild(node, child, child_idx)
+                    if tmp is None:
+                        descend = True
+                        child_result = None
+                    else:
+                        descend, child_result = tmp
+                    if not descend:
+                        # We are aborting processing of this child node.
+                        if acceptChildResult is not None:
+                            data = acceptChildResult(
+                                node, data, child_result, child_idx
+                            )
+                        elif data is not None:
+                            data.append(child_result)
+                        if afterChild is not None:
+                            afterChild(node, child, child_idx)
+                        continue
+
+                # Update the child argument counter in the stack and
+                # descend into the child
+                ptr = (ptr[0], node, args, last_idx, data, child_idx)
+
+                if enterNode is not None:
+                    tmp = enterNode(child)
+                    if tmp is None:
+                        args = data = None
+                    else:
+                        args, data = tmp
+                else:
+                    args = None
+                    data = []
+                if args is None:
+                    if type(child) in leaf_types or not child.is_expression_type():
+                        args = ()
+                    else:
+                        args = child.args
+                if args.__class__ not in _sequence_types:
+                    if hasattr(args, '__enter__'):
+                        args.__enter__()
+                    elif not hasattr(args, '__len__'):
+                        # e.g., generators returned by enterNode()
+                        args = list(args)
+                node = child
+                child_idx = -1
+                last_idx = len(args) - 1
+                ptr = (ptr, node, args, last_idx, data, child_idx)
+
+            else:
+                # We are done with this node.  Call exitNode to compute
+                # any result
+                if args.__class__ not in _sequence_types and hasattr(args, '__exit__'):
+                    args.__exit__(None, None, None)
+                if exitNode is not None:
+                    node_result = exitNode(node, data)
+                else:
+                    node_result = data
+
+                # Pop the node off the linked list
+                ptr = ptr[0]
+                if ptr is None:
+                    if finalizeResult is not None:
+                        return finalizeResult(node_result)
+                    else:
+                        return node_result
+                node, child = ptr[1], node
+                args = ptr[2]
+                last_idx = ptr[3]
+                data = ptr[4]
+                child_idx = ptr[5]
+
+                if acceptChildResult is not None:
+                    data = acceptChildResult(node, data, node_result, child_idx)
+                elif data is not None:
+                    data.append(node_result)
+
+                if afterChild is not None:
+                    afterChild(node, child, child_idx)
+
+    finally:
+        while ptr is not None:
+            if hasattr(ptr[2], '__exit__'):
+                ptr[2].__exit__(None, None, None)
+            ptr = ptr[0]
@@ -12,3 +12,8 @@
 
 def load():
     import pyomo.core.plugins.transform
+
+    from pyomo.common.extensions import ExtensionBuilderFactory
+    from pyomo.core.expr.build import WalkerBuilder
+
+    ExtensionBuilderFactory.register('walker')(WalkerBuilder)
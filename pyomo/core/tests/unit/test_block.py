@@ -29,6 +29,7 @@ from pyomo.environ import (
     AbstractModel,
     ConcreteModel,
     Var,
+    VarList,
     Set,
     Param,
     Block,
@@ -1139,6 +1140,66 @@ class TestBlock(unittest.TestCase):
         ]
         self.assertEqual(HM.BFS_sort, result)
 
+    def test_traversal_cache(self):
+        HM = HierarchicalModel()
+        m = HM.model
+        m.enable_traversal_cache()
+        for order, ref in (
+            (TraversalStrategy.PrefixDepthFirstSearch, HM.PrefixDFS),
+            (TraversalStrategy.BreadthFirstSearch, HM.BFS),
+        ):
+            for i in range(2):
+                result = [x.name for x in m.block_data_objects(descent_order=order)]
+                self.assertEqual(ref, result)
+
+        m.x = Var([1, 2])
+        m.b.y = Var()
+        m.b.c = Constraint(expr=m.b.y >= 0)
+
+        def names(**kwds):
+            return [v.name for v in m.component_data_objects(**kwds)]
+
+        self.assertEqual(names(ctype=Var), ['x[1]', 'x[2]', 'b.y'])
+        self.assertEqual(names(ctype=Var), ['x[1]', 'x[2]', 'b.y'])
+        self.assertEqual(names(ctype=[Constraint, Var]), ['x[1]', 'x[2]', 'b.y', 'b.c'])
+
+        # Adding / removing components
+        m.b.z = Var()
+        self.assertEqual(names(ctype=Var), ['x[1]', 'x[2]', 'b.y', 'b.z'])
+        m.b.del_component(m.b.y)
+        self.assertEqual(names(ctype=Var), ['x[1]', 'x[2]', 'b.z'])
+        # Adding / removing component data
+        m.l = VarList()
+        m.l.add()
+        self.assertEqual(names(ctype=Var), ['x[1]', 'x[2]', 'l[1]', 'b.z'])
+        del m.l[1]
+        m.l.add()
+        self.assertEqual(names(ctype=Var), ['x[1]', 'x[2]', 'l[2]', 'b.z'])
+        # (De)activation
+        self.assertEqual(names(ctype=Constraint, active=True), ['b.c'])
+        m.b.c.deactivate()
+        self.assertEqual(names(ctype=Constraint, active=True), [])
+        m.b.c.activate()
+        m.b.deactivate()
+        self.assertEqual(names(ctype=Constraint, active=True), [])
+        m.b.activate()
+        self.assertEqual(names(ctype=Constraint, active=True), ['b.c'])
+
+        # Changes during the traversal are picked up
+        result = []
+        for v in m.component_data_objects(Var):
+            result.append(v.name)
+            if v is m.x[1]:
+                m.b.w = Var()
+        self.assertEqual(result, ['x[1]', 'x[2]', 'l[2]', 'b.z', 'b.w'])
+
+        # The cache is enabled (but empty) on clones
+        n = m.clone()
+        self.assertEqual(n._traversal_cache, {})
+        m.enable_traversal_cache(False)
+        self.assertIsNone(m._traversal_cache)
+        self.assertEqual(names(ctype=Var), ['x[1]', 'x[2]', 'l[2]', 'b.z', 'b.w'])
+
     def test_iterate_mixed_hierarchy_PrefixDFS_block(self):
         HM = MixedHierarchicalModel()
         m = HM.model
@@ -2499,6 +2560,108 @@ class TestBlock(unittest.TestCase):
             self.assertIs(m.d[i].parent_component(), m.d)
             self.assertIs(m.d[i].parent_block(), m)
 
+    def test_clone_component_state(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2], bounds=(0, 5), initialize=1)
+        m.x[2].fix(3)
+        m.p = Param([1, 2], mutable=True, initialize={1: 10, 2: 20})
+        m.b = Block()
+        m.b.c = Constraint(expr=m.x[1] * m.p[1] <= m.p[2])
+        m.b.data = {'a': [1, 2], 'b': (m.x[1], 'c')}
+        m.b.deactivate()
+
+        n = m.clone()
+        self.assertEqual(n.x[1].value, 1)
+        self.assertEqual(n.x[1].bounds, (0, 5))
+        self.assertFalse(n.x[1].fixed)
+        self.assertTrue(n.x[2].fixed)
+        self.assertEqual(n.x[2].value, 3)
+        self.assertEqual(n.p[2].value, 20)
+        self.assertFalse(n.b.active)
+        self.assertTrue(n.b.c.active)
+        self.assertEqual(
+            sorted(id(v) for v in EXPR.identify_variables(n.b.c.body)), [id(n.x[1])]
+        )
+        self.assertEqual(n.b.data, {'a': [1, 2], 'b': (n.x[1], 'c')})
+        self.assertIsNot(n.b.data, m.b.data)
+        self.assertIsNot(n.b.data['a'], m.b.data['a'])
+
+        # The clone is independent of the original
+        n.x[1].value = 4
+        n.x[1].setub(10)
+        n.p[2] = 25
+        n.b.data['a'].append(3)
+        self.assertEqual(m.x[1].value, 1)
+        self.assertEqual(m.x[1].ub, 5)
+        self.assertEqual(m.p[2].value, 20)
+        self.assertEqual(m.b.data['a'], [1, 2])
+
+        # Components outside the block scope are shared, not copied
+        nb = m.b.clone()
+        self.assertIs(nb.data['b'][0], m.x[1])
+        self.assertEqual(
+            sorted(id(v) for v in EXPR.identify_variables(nb.c.body)), [id(m.x[1])]
+        )
+
+    def test_instantiate_overlay(self):
+        m = ConcreteModel()
+        m.b = Block()
+        m.b.I = Set(initialize=[3, 1, 2])
+        m.b.J = Set(initialize=[3, 1, 2], ordered=Set.SortedOrder)
+        m.b.K = Set(initialize=['a', 'b'], ordered=False)
+        m.b.c = Param(m.b.I, initialize={1: 10, 2: 20, 3: 30})
+        m.b.d = Param(m.b.I, mutable=True, initialize=1)
+        m.b.e = Param(initialize=5, mutable=True)
+        m.b.x = Var(m.b.I)
+        m.b.con = Constraint(m.b.I, rule=lambda b, i: b.c[i] * b.x[i] >= b.d[i] * b.e)
+
+        s = m.b.instantiate_overlay({m.b.d: {2: 4}, 'e': 6})
+        self.assertIsNone(s.parent_block())
+        self.assertIsNot(s.x, m.b.x)
+        self.assertIsNot(s.d[1], m.b.d[1])
+        # Set members and immutable Param values are shared
+        self.assertIs(s.I._values, m.b.I._values)
+        self.assertIs(s.I._ordered_values, m.b.I._ordered_values)
+        self.assertIs(s.J._values, m.b.J._values)
+        self.assertIs(s.K._values, m.b.K._values)
+        self.assertIs(s.c._data, m.b.c._data)
+        self.assertIs(s.x.index_set(), s.I)
+        # Mutable Params are owned
+        self.assertEqual({k: value(v) for k, v in s.d.items()}, {1: 1, 2: 4, 3: 1})
+        self.assertEqual({k: value(v) for k, v in m.b.d.items()}, {1: 1, 2: 1, 3: 1})
+        self.assertEqual(value(s.e), 6)
+        self.assertEqual(value(m.b.e), 5)
+        self.assertEqual(str(s.con[2].expr), "d[2]*e  <=  20*x[2]")
+        self.assertEqual(value(s.con[2].lower), 24)
+        self.assertEqual(
+            sorted(id(v) for v in EXPR.identify_variables(s.con[2].body)), [id(s.x[2])]
+        )
+
+        # The shared storage is copied on write
+        s.I.add(0)
+        s.J.add(0)
+        s.K.remove('a')
+        self.assertEqual(list(s.I), [3, 1, 2, 0])
+        self.assertEqual(list(m.b.I), [3, 1, 2])
+        self.assertEqual(list(s.J), [0, 1, 2, 3])
+        self.assertEqual(list(m.b.J), [1, 2, 3])
+        self.assertEqual(set(s.K), {'b'})
+        self.assertEqual(set(m.b.K), {'a', 'b'})
+        t = m.b.instantiate_overlay()
+        m.b.I.remove(1)
+        self.assertEqual(list(m.b.I), [3, 2])
+        self.assertEqual(list(t.I), [3, 1, 2])
+        self.assertEqual(t.I.ord(2), 3)
+
+        with self.assertRaisesRegex(
+            ValueError, "Cannot set the value of immutable Param 'b.c'"
+        ):
+            m.b.instantiate_overlay({m.b.c: 1})
+        with self.assertRaisesRegex(
+            ValueError, "Cannot set the value of 'x' .* not a Param on the block"
+        ):
+            m.b.instantiate_overlay({'x': 1})
+
     def test_clone_unclonable_attribute(self):
         class foo(object):
             def __deepcopy__(bogus):
@@ -22,7 +22,12 @@ from pyomo.environ import (
     Var,
     Set,
     ModelComponentFactory,
+    Param,
+    Constraint,
+    Objective,
+    maximize,
 )
+from pyomo.core.base.component import ModelChangeLog, _change_logs
 from pyomo.core.base.set import GlobalSets
 
 
@@ -125,5 +130,95 @@ class TestEnviron(unittest.TestCase):
         self.assertGreaterEqual(set(GlobalSets), set(['Reals', 'Integers', 'Boolean']))
 
 
+class TestModelChangeLog(unittest.TestCase):
+    def test_records(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2], dense=False)
+        m.p = Param(mutable=True, initialize=1)
+        m.o = Objective(expr=m.x[1])
+
+        log = ModelChangeLog(m)
+        self.assertFalse(log.active)
+        m.y = Var()
+        self.assertEqual(log.records, [])
+
+        log.start()
+        self.assertTrue(log.active)
+        m.c = Constraint(expr=m.x[1] >= 0)
+        m.x[1].setlb(0)
+        x2 = m.x[2]
+        x2.fix(1)
+        x2.value = 2
+        m.y.value = 2
+        m.p = 3
+        m.c.deactivate()
+        m.o.sense = maximize
+        y = m.y
+        del m.x[2]
+        m.del_component(m.y)
+        records = log.pop_records()
+        self.assertEqual(log.records, [])
+        expected = [
+            ('add', m.c),
+            ('modify', m.c),
+            ('modify', m.x[1]),
+            ('add', x2),
+            ('modify', x2),
+            ('modify', x2),
+            ('modify', x2),
+            ('modify', m.p),
+            ('deactivate', m.c),
+            ('modify', m.o),
+            ('remove', x2),
+            ('remove', y),
+        ]
+        self.assertEqual(len(records), len(expected))
+        for (event, obj), (ref_event, ref_obj) in zip(records, expected):
+            self.assertEqual(event, ref_event)
+            self.assertIs(obj, ref_obj)
+
+        log.stop()
+        self.assertFalse(log.active)
+        m.x[1].setub(1)
+        self.assertEqual(log.records, [])
+
+        # Logs are held by weak references
+        log.start()
+        self.assertIn(id(m), _change_logs)
+        del log
+        self.assertNotIn(id(m), _change_logs)
+
+    def test_model_scope(self):
+        m1 = ConcreteModel()
+        m1.b = Block()
+        m1.b.x = Var()
+        m2 = ConcreteModel()
+        m2.x = Var()
+        log1 = ModelChangeLog(m1)
+        log1.start()
+        log2 = ModelChangeLog(m2)
+        log2.start()
+        sub = ModelChangeLog(m1.b)
+        sub.start()
+
+        # Each log only records changes to its own block
+        m2.x.setlb(0)
+        m1.b.x.setlb(0)
+        m1.y = Var()
+        self.assertEqual(log1.records, [('modify', m1.b.x), ('add', m1.y)])
+        self.assertEqual(log2.records, [('modify', m2.x)])
+        self.assertEqual(sub.records, [('modify', m1.b.x)])
+
+        # Removals are recorded
+        x = m1.b.x
+        m1.b.del_component(x)
+        self.assertEqual(sub.records[-1], ('remove', x))
+        self.assertEqual(log1.records[-1], ('remove', x))
+        sub.stop()
+        log1.stop()
+        log2.stop()
+        self.assertNotIn(id(m1), _change_logs)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -26,6 +26,7 @@ import pyomo.common.unittest as unittest
 from pyomo.environ import (
     ConcreteModel,
     AbstractModel,
+    Block,
     Var,
     Constraint,
     ConstraintList,
@@ -44,7 +45,11 @@ from pyomo.core.expr.current import (
     InequalityExpression,
     RangedExpression,
 )
-from pyomo.core.base.constraint import _GeneralConstraintData
+from pyomo.core.base.constraint import (
+    _GeneralConstraintData,
+    _LazyConstraintData,
+    ScalarConstraint,
+)
 
 
 class TestConstraintCreation(unittest.TestCase):
@@ -1902,6 +1907,68 @@ class MiscConTests(unittest.TestCase):
         ):
             m.c = EqualityExpression((m.x, None))
 
+    def test_lazy_constraints(self):
+        calls = []
+
+        def rule(m, i):
+            calls.append(i)
+            if i == 1:
+                return Constraint.Skip
+            m = m.model()
+            return (0, m.x[i] + m.y, i)
+
+        m = ConcreteModel(lazy_constraints=True)
+        m.I = RangeSet(3)
+        m.x = Var(m.I)
+        m.y = Var()
+        m.b = Block()
+        m.b.c = Constraint(m.I, rule=rule)
+        m.s = Constraint(expr=m.y >= 0)
+        # The rules are evaluated to find the skipped constraints, which
+        # are never added to the component
+        self.assertEqual(calls, [1, 2, 3])
+        self.assertEqual(len(m.b.c), 2)
+        self.assertEqual(list(m.b.c.keys()), [2, 3])
+        self.assertNotIn(1, m.b.c)
+        self.assertIs(type(m.b.c[2]), _LazyConstraintData)
+        self.assertIs(type(m.s), ScalarConstraint)
+        # ... but the expressions are not retained
+        self.assertIsNone(m.b.c[2]._expr)
+        self.assertIsNone(m.b.c[3]._expr)
+        del calls[:]
+
+        # Expressions are generated on demand
+        self.assertEqual(m.b.c[2].ub, 2)
+        self.assertEqual(str(m.b.c[2].body), "x[2] + y")
+        self.assertEqual(m.b.c[2].lb, 0)
+        self.assertEqual(calls, [2])
+        # ... and only one expression per component is retained
+        self.assertEqual(m.b.c[3].ub, 3)
+        self.assertEqual(calls, [2, 3])
+        self.assertIsNone(m.b.c[2]._expr)
+        self.assertEqual(str(m.b.c[2].expr), "0  <=  x[2] + y  <=  2")
+        self.assertEqual(calls, [2, 3, 2])
+        self.assertIsNone(m.b.c[3]._expr)
+        # Generating expressions does not change the component
+        self.assertEqual(list(m.b.c.keys()), [2, 3])
+
+        # Explicitly set expressions are retained
+        m.b.c[3] = m.x[3] == 5
+        self.assertEqual(m.b.c[2].ub, 2)
+        self.assertEqual(str(m.b.c[3].expr), "x[3]  ==  5")
+        self.assertEqual(calls, [2, 3, 2])
+        with self.assertRaises(KeyError):
+            m.b.c[1]
+        self.assertEqual(calls, [2, 3, 2, 1])
+
+        # Blocks do not generate lazy constraints by default
+        m = ConcreteModel()
+        m.I = RangeSet(3)
+        m.x = Var(m.I)
+        m.y = Var()
+        m.c = Constraint(m.I, rule=rule)
+        self.assertIs(type(m.c[2]), _GeneralConstraintData)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -16,8 +16,10 @@ import pickle
 
 import pyomo.common.unittest as unittest
 
-from pyomo.environ import Var, Block, ConcreteModel, RangeSet, Set, Any
+from pyomo.environ import Var, Block, ConcreteModel, RangeSet, Set, Any, Param
 from pyomo.core.base.block import _BlockData
+from pyomo.core.base.enums import SortComponents
+from pyomo.core.base.indexed_component import IndexedComponent
 from pyomo.core.base.indexed_component_slice import IndexedComponent_slice
 from pyomo.core.base.set import normalize_index
 
@@ -843,6 +845,71 @@ class TestComponentSlices(unittest.TestCase):
         i = IndexedComponent_slice(m.x, None, None, None)[2]
         self.assertEqual(list(i), [m.x[2]])
 
+    def test_slice_index(self):
+        m = ConcreteModel()
+        m.x = Var([(1, 'a', 3), (2, 'a', 4), (1, 'b', 3), (2, 'b', 3)], dense=True)
+        m.y = Var(Any, dense=False)
+
+        self.assertIsNone(m.x._slice_index)
+        self.assertEqual(list(m.x[:, 'a', :]), [m.x[1, 'a', 3], m.x[2, 'a', 4]])
+        idx = m.x._slice_index
+        self.assertIsNotNone(idx)
+        self.assertEqual(list(m.x[:, 'b', 3]), [m.x[1, 'b', 3], m.x[2, 'b', 3]])
+        self.assertEqual(list(m.x[1, :, 3]), [m.x[1, 'a', 3], m.x[1, 'b', 3]])
+        self.assertEqual(list(m.x[:, 'c', :]), [])
+        self.assertEqual(
+            list(m.x[:, :, 3].wildcard_keys()), [(1, 'a'), (1, 'b'), (2, 'b')]
+        )
+        self.assertIs(m.x._slice_index, idx)
+        # Sorted iteration sorts the matching keys
+        self.assertEqual(
+            list(m.x[:, 'b', :].wildcard_keys(SortComponents.SORTED_INDICES)),
+            [(1, 3), (2, 3)],
+        )
+
+        # The index is discarded when data is removed...
+        del m.x[1, 'a', 3]
+        self.assertIsNone(m.x._slice_index)
+        self.assertEqual(list(m.x[:, 'a', :]), [m.x[2, 'a', 4]])
+        # ... and rebuilt when the component data is added
+        self.assertEqual(list(m.y[:, 1]), [])
+        m.y[5, 1] = 1
+        m.y[6, 2] = 1
+        self.assertEqual(list(m.y[:, 1]), [m.y[5, 1]])
+        m.y[7, 1] = 1
+        self.assertEqual(list(m.y[:, 1]), [m.y[5, 1], m.y[7, 1]])
+        m.y.clear()
+        self.assertEqual(list(m.y[:, 1]), [])
+
+        # Adding data discards the index, even if the length is unchanged
+        # because a key was removed directly from _data
+        m.y[5, 1] = 1
+        m.y[6, 2] = 1
+        self.assertEqual(list(m.y[:, 1]), [m.y[5, 1]])
+        m.y._data.pop((6, 2))
+        m.y[8, 1] = 1
+        self.assertIsNone(m.y._slice_index)
+        self.assertEqual(list(m.y[:, 1]), [m.y[5, 1], m.y[8, 1]])
+        m.z = Param(Any, mutable=True)
+        m.z[5, 1] = 1
+        self.assertEqual(list(m.z[:, 1]), [m.z[5, 1]])
+        m.z._data.pop((5, 1))
+        m.z[9, 1] = 1
+        self.assertEqual(list(m.z[:, 1]), [m.z[9, 1]])
+        m.y.clear()
+
+        # The index is not copied or pickled
+        for i in (m.clone(), pickle.loads(pickle.dumps(m))):
+            self.assertIsNone(i.x._slice_index)
+            self.assertEqual(list(i.x[:, 'b', 3]), [i.x[1, 'b', 3], i.x[2, 'b', 3]])
+
+        # Slices can still fall back on scanning the component
+        try:
+            IndexedComponent._SLICE_INDEX_ENABLED = False
+            self.assertEqual(list(m.x[:, 'b', 3]), [m.x[1, 'b', 3], m.x[2, 'b', 3]])
+        finally:
+            IndexedComponent._SLICE_INDEX_ENABLED = True
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -78,6 +78,7 @@ class Test_Initializer(unittest.TestCase):
         self.assertTrue(a.contains_indices())
         self.assertEqual(list(a.indices()), [1])
         self.assertEqual(a(None, 1), 5)
+        self.assertEqual(a.bulk_items(), ([1], [5]))
 
     def test_sequence(self):
         a = Initializer([0, 5])
@@ -636,6 +637,9 @@ class Test_Initializer(unittest.TestCase):
         self.assertEqual(a(None, (0, 1)), 20)
         self.assertEqual(a(None, (1, 0)), 30)
         self.assertEqual(a(None, (1, 1)), 40)
+        idx, val = a.bulk_items()
+        self.assertEqual(idx, [(0, 0), (0, 1), (1, 0), (1, 1)])
+        self.assertEqual(val.tolist(), [10, 20, 30, 40])
 
     @unittest.skipUnless(pandas_available, "Pandas is not installed")
     def test_series(self):
@@ -649,6 +653,9 @@ class Test_Initializer(unittest.TestCase):
         self.assertEqual(a(None, 0), 1)
         self.assertEqual(a(None, 1), 2)
         self.assertEqual(a(None, 2), 4)
+        idx, val = a.bulk_items()
+        self.assertEqual(idx, [0, 1, 2])
+        self.assertEqual(val.tolist(), [1, 2, 4])
 
     @unittest.skipUnless(numpy_available, "Numpy is not installed")
     def test_ndarray(self):
@@ -662,6 +669,11 @@ class Test_Initializer(unittest.TestCase):
         self.assertEqual(a(None, 0), 1)
         self.assertEqual(a(None, 1), 2)
         self.assertEqual(a(None, 2), 4)
+        idx, val = a.bulk_items()
+        self.assertEqual(list(idx), [0, 1, 2])
+        self.assertIs(val, d)
+
+        self.assertIsNone(Initializer(np.array([[1, 2], [4, 6]])).bulk_items())
 
         # TODO: How should we handle ndarray matrices?
         # d = np.array([[1,2],[4,6]])
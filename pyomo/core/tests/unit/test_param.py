@@ -24,9 +24,17 @@ import os
 import sys
 
 import pyomo.common.unittest as unittest
+from pyomo.common.dependencies import (
+    numpy as np,
+    numpy_available,
+    pandas as pd,
+    pandas_available,
+)
 
 from pyomo.environ import (
     Set,
+    Binary,
+    PercentFraction,
     RangeSet,
     Param,
     ConcreteModel,
@@ -65,7 +73,7 @@ from pyomo.environ import (
 from pyomo.common.errors import PyomoException
 from pyomo.common.log import LoggingIntercept
 from pyomo.common.tempfiles import TempfileManager
-from pyomo.core.base.param import _ParamData
+from pyomo.core.base.param import _ParamData, _bulk_domain_check
 from pyomo.core.base.units_container import units, pint_available, UnitsError
 
 from io import StringIO
@@ -1534,6 +1542,127 @@ q : Size=0, Index=None, Domain=Any, Default=None, Mutable=False
         m.p = 20
         self.assertEqual(m.x_p.bounds, (0, 20))
 
+    @unittest.skipUnless(numpy_available, "Numpy is not installed")
+    def test_values_array(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=[3, 1, 2])
+        m.p = Param(m.I, initialize={1: 5}, default=2)
+        m.q = Param(m.I, initialize={1: 5, 2: 1, 3: 0}, mutable=True)
+        m.r = Param(m.I, mutable=True)
+        m.s = Param(initialize=4)
+        m.t = Param(m.I, initialize={1: 5})
+        m.u = Param(m.I, initialize={1: 5}, default=1, mutable=True)
+
+        self.assertEqual(m.p.get_values_array().tolist(), [2, 5, 2])
+        self.assertEqual(m.q.get_values_array().tolist(), [0, 5, 1])
+        self.assertEqual(str(m.r.get_values_array()), '[nan nan nan]')
+        self.assertEqual(m.s.get_values_array().tolist(), [4])
+        self.assertEqual(str(m.t.get_values_array()), '[nan  5. nan]')
+        self.assertEqual(m.u.get_values_array().tolist(), [1, 5, 1])
+
+        m.q.set_values_array(np.array([1, 2, 3]))
+        self.assertEqual(m.q.extract_values(), {3: 1, 1: 2, 2: 3})
+        m.r.set_values_array([1.5, 2.5, 3.5], check=False)
+        self.assertEqual(m.r.extract_values(), {3: 1.5, 1: 2.5, 2: 3.5})
+        m.v = Param(mutable=True)
+        m.v.set_values_array([3])
+        self.assertEqual(m.v.value, 3)
+
+        with self.assertRaisesRegex(
+            TypeError, "Attempting to set the value of the immutable parameter"
+        ):
+            m.p.set_values_array([1, 2, 3])
+        with self.assertRaisesRegex(
+            ValueError, "Cannot set the values of Param 'q': expected 3 values"
+        ):
+            m.q.set_values_array([1, 2])
+
+    @unittest.skipUnless(numpy_available, "Numpy is not installed")
+    def test_bulk_domain_check(self):
+        vals = [0, 1, 2, -1, 0.5, -2.5, 1 + 1e-16, float('inf'), float('nan')]
+        for domain in (
+            Reals,
+            NonNegativeReals,
+            Integers,
+            NonNegativeIntegers,
+            Binary,
+            PercentFraction,
+            RangeSet(0, 1, 0.5),
+        ):
+            for v in vals:
+                try:
+                    ref = v in domain
+                except ValueError:
+                    # e.g., inf is not comparable to discrete ranges
+                    ref = False
+                self.assertEqual(
+                    _bulk_domain_check(domain, np.array([v])),
+                    ref,
+                    msg="%s in %s" % (v, domain),
+                )
+            self.assertFalse(_bulk_domain_check(domain, np.array(['a'])))
+        self.assertTrue(_bulk_domain_check(Any, np.array(vals)))
+        self.assertFalse(_bulk_domain_check(Any, np.array(['a'])))
+        self.assertFalse(_bulk_domain_check(Set(initialize=[1]), np.array([1])))
+
+    @unittest.skipUnless(numpy_available, "Numpy is not installed")
+    def test_bulk_initialization(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=[3, 1, 2])
+        m.p = Param(RangeSet(0, 2), initialize=np.array([1.5, 2, 3]), within=Reals)
+        self.assertEqual(m.p.extract_values(), {0: 1.5, 1: 2, 2: 3})
+        self.assertIs(type(m.p[1]), float)
+        m.q = Param(m.I, initialize={1: 5, 2: 1.5, 3: True}, mutable=True)
+        self.assertEqual(m.q.extract_values(), {1: 5, 2: 1.5, 3: True})
+        self.assertIs(type(m.q[3].value), bool)
+        self.assertIs(m.q[3].parent_component(), m.q)
+        self.assertEqual(m.q[3].index(), 3)
+        self.assertEqual(list(m.q.keys()), [3, 1, 2])
+
+        # Values outside the domain generate the standard error
+        with self.assertRaisesRegex(
+            ValueError, r"Invalid parameter value: r\[1\] = '-1'"
+        ):
+            m.r = Param(m.I, initialize={1: -1}, within=NonNegativeReals)
+        # ...as do invalid indices
+        with self.assertRaisesRegex(KeyError, r"Index '4' is not valid for indexed"):
+            m.s = Param(m.I, initialize={4: 1}, within=Reals)
+        # Validation rules are still called for each value
+        m.t = Param(
+            m.I, initialize={1: 1, 2: 2}, within=Reals, validate=lambda m, v, i: v < 4
+        )
+        self.assertEqual(m.t.extract_values(), {1: 1, 2: 2})
+        with self.assertRaisesRegex(
+            ValueError, "Value failed parameter validation rule"
+        ):
+            m.u = Param(
+                m.I, initialize={1: 4}, within=Reals, validate=lambda m, v, i: v < 4
+            )
+        # Non-numeric data falls back on the standard processing
+        m.v = Param(m.I, initialize={1: 'a', 2: 'b'}, within=Any)
+        self.assertEqual(m.v.extract_values(), {1: 'a', 2: 'b'})
+
+    @unittest.skipUnless(pandas_available, "Pandas is not installed")
+    def test_bulk_initialization_pandas(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=[1, 2])
+        m.J = Set(initialize=['a', 'b'])
+        idx = pd.MultiIndex.from_product([[1, 2], ['a', 'b']])
+        df = pd.DataFrame({'c1': [1, 2, 3, 4], 'c2': [1.5, 2.5, 3.5, 4.5]}, index=idx)
+        m.p = Param(m.I, m.J, initialize=df['c2'], within=Reals)
+        self.assertEqual(
+            m.p.extract_values(),
+            {(1, 'a'): 1.5, (1, 'b'): 2.5, (2, 'a'): 3.5, (2, 'b'): 4.5},
+        )
+        m.q = Param(m.I * m.J, initialize=df[['c1']], mutable=True, within=Integers)
+        self.assertEqual(
+            m.q.extract_values(), {(1, 'a'): 1, (1, 'b'): 2, (2, 'a'): 3, (2, 'b'): 4}
+        )
+        self.assertIs(type(m.q[1, 'a'].value), int)
+        m.x = Var(m.I, m.J, initialize=df['c1'])
+        self.assertEqual(m.x[2, 'b'].value, 4)
+        self.assertIs(type(m.x[2, 'b'].value), int)
+
 
 def createNonIndexedParamMethod(func, init_xy, new_xy, tol=1e-10):
     def testMethod(self):
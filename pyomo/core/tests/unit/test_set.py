@@ -3254,6 +3254,48 @@ J : Size=1, Index=None, Ordered=False
         self.assertIn((1, 2, 5, 6), x)
         self.assertNotIn((5, 6, 1, 2), x)
 
+    def test_ordered_nested_setproduct(self):
+        m = ConcreteModel()
+        m.T = RangeSet(3)
+        m.S = Set(initialize=['a', 'b'])
+        m.U = Set(initialize=[(1, 'u'), (2, 'v')])
+        m.K = RangeSet(2)
+        m.NonDim = Set(initialize=[2, (2, 3)], dimen=None)
+        for x in (
+            m.T * m.S * m.K * m.T,
+            m.T * m.S * m.U * m.K,
+            m.K * (m.U * m.S),
+            m.T * m.NonDim * m.S,
+        ):
+            ref = [
+                sum((v if v.__class__ is tuple else (v,) for v in i), ())
+                for i in itertools.product(*x.subsets())
+            ]
+            self.assertEqual(list(x), ref)
+            self.assertEqual(list(reversed(x)), ref[::-1])
+            self.assertEqual(len(x), len(ref))
+            for i, v in enumerate(ref):
+                self.assertEqual(x.at(i + 1), v)
+                self.assertEqual(x.ord(v), i + 1)
+            with self.assertRaisesRegex(IndexError, "index out of range"):
+                x.at(len(ref) + 1)
+            with self.assertRaisesRegex(IndexError, "item not in Set"):
+                x.ord((4,) * len(ref[0]))
+
+        # Unflattened products are still located by their operands
+        x = m.T * m.U * m.K
+        try:
+            origFlattenCross = SetModule.FLATTEN_CROSS_PRODUCT
+            SetModule.FLATTEN_CROSS_PRODUCT = False
+            self.assertEqual(x.at(4), ((1, (2, 'v')), 2))
+            self.assertEqual(x.ord(((1, (2, 'v')), 2)), 4)
+            self.assertEqual(next(reversed(x)), ((3, (2, 'v')), 2))
+        finally:
+            SetModule.FLATTEN_CROSS_PRODUCT = origFlattenCross
+        self.assertEqual(x.at(4), (1, 2, 'v', 2))
+        self.assertEqual(x.ord((1, 2, 'v', 2)), 4)
+        self.assertEqual(x.ord(((1, (2, 'v')), 2)), 4)
+
     def test_ordered_nondim_setproduct(self):
         NonDim = Set(initialize=[2, (2, 3)], dimen=None)
         NonDim.construct()
@@ -3794,6 +3836,60 @@ class TestSet(unittest.TestCase):
         self.assertEqual(list(m.I.values()), [m.I])
         self.assertEqual(list(m.I.items()), [(None, m.I)])
 
+    def test_insertion_deletion_holes(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=range(10))
+        ref = list(range(10))
+        # Remove from the front, middle and back of the Set, interleaved
+        # with additions (and enough removals to trigger compaction)
+        for v in (0, 5, 9, 3, 10, 1, 11, 12, 2, 4):
+            if v in ref:
+                m.I.remove(v)
+                ref.remove(v)
+            else:
+                m.I.add(v)
+                ref.append(v)
+            self.assertEqual(list(m.I), ref)
+            self.assertEqual(list(reversed(m.I)), ref[::-1])
+            self.assertEqual(len(m.I), len(ref))
+            for i, v in enumerate(ref):
+                self.assertEqual(m.I.at(i + 1), v)
+                self.assertEqual(m.I.at(i - len(ref)), v)
+                self.assertEqual(m.I.ord(v), i + 1)
+            with self.assertRaisesRegex(IndexError, "I index out of range"):
+                m.I.at(len(ref) + 1)
+        self.assertEqual(m.I.first(), 6)
+        self.assertEqual(m.I.next(6), 7)
+        self.assertEqual(m.I.prev(10), 8)
+        self.assertEqual(m.I.last(), 12)
+
+        m.J = Set(initialize=[5, 3, 1, 4, 2], ordered=Set.SortedOrder)
+        m.J.remove(3)
+        m.J.add(0)
+        self.assertEqual(list(m.J), [0, 1, 2, 4, 5])
+        self.assertEqual(m.J.ord(4), 4)
+        self.assertEqual(m.J.at(2), 1)
+
+    def _rolling_horizon(self, N):
+        m = ConcreteModel()
+        m.T = Set(initialize=range(N))
+        for t in range(N, 2 * N):
+            m.T.remove(m.T.first())
+            m.T.add(t)
+            self.assertEqual(m.T.ord(t), N)
+            self.assertEqual(m.T.next(m.T.first()), t - N + 2)
+        self.assertEqual(list(m.T), list(range(N, 2 * N)))
+
+    def test_insertion_deletion_rolling(self):
+        self._rolling_horizon(100)
+
+    @unittest.pytest.mark.performance
+    @unittest.timeout(10, timeout_raises=unittest.SkipTest)
+    def test_insertion_deletion_scaling(self):
+        # Rolling horizon: removing the first element of a large ordered
+        # Set (and adding a new last element) should not be O(n)
+        self._rolling_horizon(100000)
+
     def test_insertion_deletion(self):
         def _verify(_s, _l):
             self.assertTrue(_s.isordered())
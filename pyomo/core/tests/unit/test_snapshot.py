@@ -0,0 +1,252 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2022
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+#
+# Unit Tests for model snapshots
+#
+
+import io
+
+import pyomo.common.unittest as unittest
+from pyomo.common.tempfiles import TempfileManager
+from pyomo.core.base.snapshot import SNAPSHOT_MAGIC, _header
+from pyomo.environ import (
+    Any,
+    ConcreteModel,
+    Block,
+    Set,
+    Param,
+    Var,
+    Constraint,
+    Objective,
+    Binary,
+    NonNegativeReals,
+    Reals,
+    save_model,
+    load_model,
+)
+from pyomo.repn.plugins.lp_writer import LPWriter
+
+
+def _c_init(m, i):
+    return sum(m.p[i, j] * m.x[i, j] for j in m.J) + m.y[i] ** 2 >= m.q[i]
+
+
+def _d_init(m, i):
+    return m.x[i] <= 2 * i
+
+
+def _lp(m):
+    OUT = io.StringIO()
+    LPWriter().write(m, OUT)
+    return OUT.getvalue()
+
+
+class TestSnapshot(unittest.TestCase):
+    def _model(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=[1, 2, 3])
+        m.J = Set(initialize=['a', 'b'])
+        m.p = Param(m.I, m.J, initialize=lambda m, i, j: i * len(j) + 0.5)
+        m.q = Param(m.I, mutable=True, initialize={1: 1, 2: 2.5, 3: True})
+        m.x = Var(m.I, m.J, bounds=(0, 10))
+        m.y = Var(m.I, domain=Reals, initialize=lambda m, i: 2 * i)
+        m.c = Constraint(m.I, rule=_c_init)
+        m.o = Objective(expr=sum(m.y[i] for i in m.I))
+        m.b = Block()
+        m.b.z = Var(m.I, within=Binary)
+        m.b.c = Constraint(expr=m.b.z[1] + m.x[1, 'a'] <= 1)
+        m.x[2, 'b'].fix(1.5)
+        m.y[3].setub(7)
+        m.y[1].value = 3
+        m.b.z[2].domain = NonNegativeReals
+        return m
+
+    def test_round_trip(self):
+        m = self._model()
+        m.x[1, 'a'].stale = False
+        with TempfileManager.new_context() as TMP:
+            fname = TMP.create_tempfile(suffix='.snp')
+            save_model(m, fname)
+            i = load_model(fname)
+
+        self.assertIsNot(i, m)
+        self.assertEqual(_lp(i), _lp(m))
+        self.assertEqual(list(i.x.keys()), list(m.x.keys()))
+        for v in i.component_data_objects(Var):
+            ref = m.find_component(v)
+            self.assertIs(v.parent_component().parent_block(), v.parent_block())
+            self.assertEqual(v.index(), ref.index())
+            self.assertEqual(type(v.value), type(ref.value))
+            self.assertEqual(v.value, ref.value)
+            self.assertEqual(v.bounds, ref.bounds)
+            self.assertEqual(v.fixed, ref.fixed)
+            self.assertEqual(v.stale, ref.stale)
+            self.assertEqual(str(v.domain), str(ref.domain))
+        self.assertIs(i.x[1, 'a'].parent_component(), i.x)
+        self.assertFalse(i.x[1, 'a'].stale)
+        self.assertTrue(i.x[1, 'b'].stale)
+        self.assertIs(i.b.z[1].domain, Binary)
+        self.assertIs(i.b.z[2].domain, NonNegativeReals)
+        self.assertEqual(i.y[1].value, 3)
+        self.assertIs(type(i.y[1].value), int)
+        self.assertEqual(i.y[3].ub, 7)
+        self.assertTrue(i.x[2, 'b'].fixed)
+        self.assertEqual([type(i.q[k].value) for k in i.I], [int, float, bool])
+        self.assertIs(i.q[2].parent_component(), i.q)
+
+        # The loaded model is independent of the original
+        i.q[1] = 5
+        i.x[1, 'a'].value = 4
+        self.assertEqual(m.q[1].value, 1)
+        self.assertIsNone(m.x[1, 'a'].value)
+        # ...and the expressions reference the loaded data objects
+        self.assertIs(i.c[1].body.args[-1].args[0], i.y[1])
+        self.assertEqual(i.c[1].upper, None)
+        self.assertIs(i.c[1].lower, i.q[1])
+
+    def test_mmap(self):
+        m = self._model()
+        with TempfileManager.new_context() as TMP:
+            fname = TMP.create_tempfile(suffix='.snp')
+            save_model(m, fname)
+            i = load_model(fname, mmap=True)
+        self.assertEqual(_lp(i), _lp(m))
+
+    def test_unsupported_values(self):
+        # Values that cannot be stored exactly in the tables fall back
+        # on the standard pickle of the component data
+        m = ConcreteModel()
+        m.x = Var([1, 2], initialize={1: 2**60, 2: 1})
+        m.p = Param([1, 2], mutable=True, initialize={1: 'a', 2: 1})
+        with TempfileManager.new_context() as TMP:
+            fname = TMP.create_tempfile(suffix='.snp')
+            save_model(m, fname)
+            i = load_model(fname)
+        self.assertEqual(i.x[1].value, 2**60)
+        self.assertEqual(i.p[1].value, 'a')
+        self.assertIs(i.x[2].parent_component(), i.x)
+
+    def test_local_rules(self):
+        def rule(m, i):
+            return m.x[i] >= i
+
+        m = ConcreteModel()
+        m.x = Var([1, 2])
+        m.c = Constraint([1, 2], rule=rule)
+        m.d = Constraint([1, 2], rule=_d_init)
+        with TempfileManager.new_context() as TMP:
+            fname = TMP.create_tempfile(suffix='.snp')
+            save_model(m, fname)
+            i = load_model(fname)
+        self.assertIsNone(i.c.rule._fcn)
+        self.assertIs(i.d.rule._fcn, _d_init)
+        self.assertEqual(str(i.c[2].expr), '2  <=  x[2]')
+
+    def test_local_rules_still_required(self):
+        def rule(m, i):
+            return m.x[i] >= i
+
+        def build(**kwds):
+            m = ConcreteModel(**kwds)
+            m.x = Var(range(4), dense=False, bounds=lambda m, i: (0, i))
+            m.x[1]
+            m.c = Constraint([1, 2], rule=rule)
+            return m
+
+        with TempfileManager.new_context() as TMP:
+            fname = TMP.create_tempfile(suffix='.snp')
+            m = build()
+            with self.assertRaisesRegex(
+                ValueError,
+                r"component 'x' requires its construction rule \('.*<lambda>'\)",
+            ):
+                save_model(m, fname)
+            # Fully constructed components do not need their rules
+            for idx in m.x.index_set():
+                m.x[idx]
+            save_model(m, fname)
+            i = load_model(fname)
+            self.assertEqual(i.x[2].bounds, (0, 2))
+
+            m = build(lazy_constraints=True)
+            for idx in m.x.index_set():
+                m.x[idx]
+            with self.assertRaisesRegex(
+                ValueError, r"component 'c' requires its construction rule"
+            ):
+                save_model(m, fname)
+            # Lazy constraints with module-level rules are saved
+            m.c.rule._fcn = _d_init
+            save_model(m, fname)
+            i = load_model(fname)
+            self.assertEqual(str(i.c[2].expr), 'x[2]  <=  4')
+
+            m = ConcreteModel()
+            m.b = Block(Any, rule=lambda b, i: None)
+            with self.assertRaisesRegex(
+                ValueError, r"component 'b' requires its construction rule"
+            ):
+                save_model(m, fname)
+
+    def test_local_validate_and_filter(self):
+        def positive(m, val, *idx):
+            return val > 0
+
+        with TempfileManager.new_context() as TMP:
+            fname = TMP.create_tempfile(suffix='.snp')
+
+            m = ConcreteModel()
+            m.p = Param([1, 2], initialize=1, mutable=True, validate=positive)
+            with self.assertRaisesRegex(
+                ValueError, r"component 'p' uses the function '.*positive' \(validate\)"
+            ):
+                save_model(m, fname)
+            # Immutable Params never call validate after construction
+            m = ConcreteModel()
+            m.p = Param([1, 2], initialize=1, validate=positive)
+            save_model(m, fname)
+            self.assertEqual(load_model(fname).p[2], 1)
+
+            m = ConcreteModel()
+            m.s = Set(initialize=[1, 2], validate=lambda m, val: val > 0)
+            with self.assertRaisesRegex(
+                ValueError, r"component 's' uses the function '.*<lambda>' \(validate\)"
+            ):
+                save_model(m, fname)
+            m = ConcreteModel()
+            m.s = Set([1, 2], initialize=[3], filter=positive)
+            with self.assertRaisesRegex(
+                ValueError, r"component 's' uses the function '.*positive' \(filter\)"
+            ):
+                save_model(m, fname)
+
+    def test_bad_file(self):
+        with TempfileManager.new_context() as TMP:
+            fname = TMP.create_tempfile(suffix='.snp')
+            with open(fname, 'wb') as FILE:
+                FILE.write(b'not a snapshot file')
+            with self.assertRaisesRegex(ValueError, "is not a Pyomo model snapshot"):
+                load_model(fname)
+
+            save_model(ConcreteModel(), fname)
+            with open(fname, 'r+b') as FILE:
+                magic, version, flags, n = _header.unpack(FILE.read(_header.size))
+                self.assertEqual(magic, SNAPSHOT_MAGIC)
+                FILE.seek(0)
+                FILE.write(_header.pack(magic, version + 1, flags, n))
+            with self.assertRaisesRegex(
+                ValueError, "uses format version 2; this version of Pyomo can "
+            ):
+                load_model(fname)
+
+
+if __name__ == "__main__":
+    unittest.main()
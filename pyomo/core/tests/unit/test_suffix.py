@@ -20,6 +20,7 @@ from os.path import abspath, dirname
 currdir = dirname(abspath(__file__)) + os.sep
 
 import pyomo.common.unittest as unittest
+from pyomo.common.dependencies import numpy as np, numpy_available
 from pyomo.core.base.suffix import (
     active_export_suffix_generator,
     export_suffix_generator,
@@ -787,6 +788,29 @@ class TestSuffixMethods(unittest.TestCase):
         self.assertEqual(model.junk.get(model.y), 2.0)
         self.assertEqual(model.junk.get(model.z), 3.0)
 
+    @unittest.skipUnless(numpy_available, "Numpy is not installed")
+    def test_values_array(self):
+        model = ConcreteModel()
+        model.junk = Suffix()
+        model.x = Var([3, 1, 2], dense=True)
+        model.junk.set_value(model.x[1], 4)
+        self.assertEqual(str(model.junk.get_values_array(model.x)), '[nan  4. nan]')
+
+        model.junk.set_values_array(model.x, np.array([1, np.nan, 3]))
+        self.assertEqual(model.junk.get(model.x[3]), 1)
+        self.assertEqual(model.junk.get(model.x[1]), None)
+        self.assertEqual(model.junk.get(model.x[2]), 3)
+        self.assertEqual(len(model.junk), 2)
+
+        model.junk.set_values_array(model.x, [5, 6, 7])
+        self.assertEqual(model.junk.get_values_array(model.x).tolist(), [5, 6, 7])
+        self.assertEqual(len(model.junk), 3)
+
+        with self.assertRaisesRegex(
+            ValueError, "Cannot set the values of Suffix 'junk' for 'x'"
+        ):
+            model.junk.set_values_array(model.x, [1, 2])
+
     # test clear_value
     def test_clear_value(self):
         model = ConcreteModel()
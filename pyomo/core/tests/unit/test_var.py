@@ -20,12 +20,16 @@ from os.path import abspath, dirname
 
 currdir = dirname(abspath(__file__)) + os.sep
 
+import pickle
+import tracemalloc
 from io import StringIO
 
 import pyomo.common.unittest as unittest
+from pyomo.common.dependencies import numpy as np, numpy_available
 from pyomo.common.log import LoggingIntercept
 
 from pyomo.core.base import IntegerSet
+from pyomo.core.base.component import ModelChangeLog
 from pyomo.core.expr.numeric_expr import (
     NPV_ProductExpression,
     NPV_MaxExpression,
@@ -49,9 +53,14 @@ from pyomo.environ import (
     NonNegativeReals,
     Integers,
     Binary,
+    Reference,
+    Constraint,
+    Objective,
     value,
 )
 from pyomo.core.base.units_container import units, pint_available, UnitsError
+from pyomo.core.base.var import DenseIndexedVar, IndexedVar, _DenseVarData
+from pyomo.repn.plugins.lp_writer import LPWriter
 
 
 class TestVarData(unittest.TestCase):
@@ -1678,6 +1687,242 @@ class MiscVarTests(unittest.TestCase):
         self.assertTrue(i.y.stale)
         self.assertFalse(i.z.stale)
 
+    @unittest.skipUnless(numpy_available, "Numpy is not installed")
+    def test_values_array(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=[3, 1, 2])
+        m.x = Var(m.I, bounds=(0, 10), initialize={1: 5})
+        m.x[2].domain = Binary
+        m.p = Param(initialize=4, mutable=True)
+        m.x[3].setub(m.p)
+
+        self.assertEqual(str(m.x.get_values_array()), '[nan  5. nan]')
+        self.assertEqual(m.x.get_values_array('lb').tolist(), [0, 0, 0])
+        self.assertEqual(m.x.get_values_array('ub').tolist(), [4, 10, 1])
+        self.assertEqual(m.x.get_values_array('fixed').tolist(), [False] * 3)
+        self.assertEqual(
+            m.x.get_values_array('domain').tolist(), [Reals, Reals, Binary]
+        )
+        with self.assertRaisesRegex(ValueError, "Unrecognized Var attribute 'foo'"):
+            m.x.get_values_array('foo')
+
+        StaleFlagManager.mark_all_as_stale()
+        m.x.set_values_array(np.array([1, np.nan, 0]))
+        self.assertEqual([v.value for v in m.x.values()], [1, None, 0])
+        self.assertEqual([v.stale for v in m.x.values()], [False, True, False])
+
+        with LoggingIntercept() as LOG:
+            m.x.set_values_array([7, 2, 3], skip_validation=True)
+        self.assertEqual(LOG.getvalue(), "")
+        self.assertEqual(m.x.extract_values(), {3: 7, 1: 2, 2: 3})
+        self.assertEqual([v.stale for v in m.x.values()], [False] * 3)
+
+        m.x.set_values_array([-np.inf, 1, 2], 'lb')
+        self.assertEqual([v.lb for v in m.x.values()], [None, 1, 2])
+        m.x.set_values_array([5, np.inf, 20], 'ub')
+        self.assertEqual([v.ub for v in m.x.values()], [5, None, 1])
+        # Only "missing" infinite bounds are stored as None
+        m.x.set_values_array([np.inf, np.nan, 2], 'lb')
+        self.assertEqual([v.lb for v in m.x.values()], [np.inf, None, 2])
+        m.x.set_values_array([-np.inf, np.nan, 20], 'ub')
+        self.assertEqual([v.ub for v in m.x.values()], [-np.inf, None, 1])
+        m.x.set_values_array([-np.inf, 1, 2], 'lb')
+        m.x.set_values_array([5, np.inf, 20], 'ub')
+
+        # Bulk updates are recorded in the change logs
+        log = ModelChangeLog(m)
+        log.start()
+        m.x.set_values_array([-1, 1, 2], 'lb')
+        self.assertEqual(
+            [(e, v.index()) for e, v in log.pop_records()],
+            [('modify', 3), ('modify', 1), ('modify', 2)],
+        )
+        m.x[1].fix()
+        log.pop_records()
+        m.x.set_values_array([7, 2, 3], skip_validation=True)
+        self.assertEqual(
+            [(e, v.index()) for e, v in log.pop_records()], [('modify', 1)]
+        )
+        m.x[1].unfix()
+        m.x.set_values_array([-np.inf, 1, 2], 'lb')
+        log.stop()
+
+        m.x.set_values_array([True, False, True], 'fixed')
+        self.assertEqual([v.fixed for v in m.x.values()], [True, False, True])
+        m.x.set_values_array([Integers] * 3, 'domain')
+        self.assertEqual([v.domain for v in m.x.values()], [Integers] * 3)
+
+        with self.assertRaisesRegex(
+            ValueError, "Cannot set value for Var 'x': expected 3 values"
+        ):
+            m.x.set_values_array([1, 2])
+
+        # References use the public VarData API
+        m.r = Reference(m.x)
+        self.assertEqual(m.r.get_values_array().tolist(), [7, 2, 3])
+        self.assertEqual(m.r.get_values_array('ub').tolist(), [5, np.inf, 20])
+        m.r.set_values_array([1, 2, 3])
+        self.assertEqual(m.x.extract_values(), {3: 1, 1: 2, 2: 3})
+
+
+def _dense_bounds(m, i):
+    return (i - 10.0, float(i))
+
+
+def _dense_init(m, i):
+    return i - 2.0
+
+
+def _dense_con(m, i):
+    return 2 * m.x[i] + m.y[i] >= i
+
+
+@unittest.skipUnless(numpy_available, "dense Var storage requires numpy")
+class TestDenseVar(unittest.TestCase):
+    def _model(self, storage):
+        # Note: dense storage holds all values and bounds as floats
+        m = ConcreteModel()
+        m.I = RangeSet(4)
+        m.x = Var(m.I, storage=storage, bounds=_dense_bounds, initialize=_dense_init)
+        m.y = Var(m.I, storage=storage, domain=NonNegativeReals, initialize=1.0)
+        m.c = Constraint(m.I, rule=_dense_con)
+        m.o = Objective(expr=sum(m.x[i] - m.y[i] for i in m.I))
+        return m
+
+    def test_construct(self):
+        m = self._model('dense')
+        self.assertIs(type(m.x), DenseIndexedVar)
+        self.assertIs(type(m.x[1]), _DenseVarData)
+        self.assertIs(m.x[1], m.x[1])
+        self.assertEqual(len(m.x), 4)
+        self.assertEqual(list(m.x.keys()), [1, 2, 3, 4])
+        self.assertEqual(m.x.extract_values(), {1: -1, 2: 0, 3: 1, 4: 2})
+        self.assertEqual(
+            [v.bounds for v in m.x.values()], [(-9, 1), (-8, 2), (-7, 3), (-6, 4)]
+        )
+        self.assertEqual([v.bounds for v in m.y.values()], [(0, None)] * 4)
+        self.assertEqual([v.domain for v in m.y.values()], [NonNegativeReals] * 4)
+        self.assertIn(3, m.x)
+        self.assertNotIn(5, m.x)
+        with self.assertRaisesRegex(KeyError, "Index '5' is not valid"):
+            m.x[5]
+
+        m.x[2].value = None
+        m.x[2].domain = Binary
+        m.x[3].fix(5)
+        self.assertEqual(m.x[2].value, None)
+        self.assertEqual(m.x[2].bounds, (0, 1))
+        self.assertTrue(m.x[3].fixed)
+        m.x.unfix()
+        self.assertFalse(m.x[3].fixed)
+        self.assertEqual(m.x[3].value, 5)
+
+        m.p = Param(mutable=True, initialize=1)
+        with self.assertRaisesRegex(
+            ValueError, "only supports constant numeric bounds"
+        ):
+            m.x[1].setlb(m.p)
+        with self.assertRaisesRegex(TypeError, "uses dense storage"):
+            del m.x[1]
+
+    def test_construct_errors(self):
+        m = ConcreteModel()
+        with self.assertRaisesRegex(ValueError, "Unrecognized storage 'sparse'"):
+            m.x = Var([1, 2], storage='sparse')
+        m.I = Set(initialize=[1, 2], ordered=False)
+        with self.assertRaisesRegex(ValueError, "requires a finite ordered index set"):
+            m.y = Var(m.I, storage='dense')
+
+    def test_lp_writer(self):
+        ref = StringIO()
+        LPWriter().write(self._model(None), ref)
+        test = StringIO()
+        LPWriter().write(self._model('dense'), test)
+        self.assertEqual(ref.getvalue(), test.getvalue())
+
+    def test_clone_and_pickle(self):
+        m = self._model('dense')
+        m.x[3].fix()
+        for i in (m.clone(), pickle.loads(pickle.dumps(m))):
+            self.assertIs(type(i.x), DenseIndexedVar)
+            self.assertIsNot(i.x[1], m.x[1])
+            self.assertIs(i.x[1].parent_component(), i.x)
+            self.assertEqual(i.x.extract_values(), m.x.extract_values())
+            self.assertTrue(i.x[3].fixed)
+            # Expressions reference the (unique) view in the new model
+            self.assertIs(i.c[2].body.args[0].args[1], i.x[2])
+
+    def test_values_array(self):
+        m = self._model('dense')
+        self.assertEqual(m.x.get_values_array().tolist(), [-1, 0, 1, 2])
+        self.assertEqual(m.y.get_values_array('ub').tolist(), [np.inf] * 4)
+        self.assertEqual(m.y.get_values_array('lb').tolist(), [0] * 4)
+        m.x.set_values_array([1, 2, np.nan, 4], skip_validation=True)
+        self.assertEqual(m.x.extract_values(), {1: 1, 2: 2, 3: None, 4: 4})
+        self.assertTrue(m.x[3].stale)
+        self.assertFalse(m.x[1].stale)
+        m.x.set_values_array([0, -np.inf, 0, 0], 'lb')
+        self.assertEqual(m.x[2].lb, None)
+        # Only "missing" infinite bounds are stored as None
+        m.x.set_values_array([np.inf, np.nan, 0, 0], 'lb')
+        self.assertEqual([v.lb for v in m.x.values()], [np.inf, None, 0, 0])
+        m.x.set_values_array([-np.inf, np.inf, 5, 5], 'ub')
+        self.assertEqual([v.ub for v in m.x.values()], [-np.inf, None, 5, 5])
+
+        log = ModelChangeLog(m)
+        log.start()
+        m.x.set_values_array([True, False, False, True], 'fixed')
+        self.assertEqual([v.fixed for v in m.x.values()], [True, False, False, True])
+        self.assertEqual(
+            [(e, v.index()) for e, v in log.pop_records()],
+            [('modify', 1), ('modify', 2), ('modify', 3), ('modify', 4)],
+        )
+        m.x.set_values_array([1, 2, 3, 4], skip_validation=True)
+        self.assertEqual(
+            [(e, v.index()) for e, v in log.pop_records()],
+            [('modify', 1), ('modify', 4)],
+        )
+        m.x.set_values_array([0, 0, 0, 0], 'ub')
+        m.y.unfix()
+        m.y.fix()
+        self.assertEqual(
+            [(e, v.index()) for e, v in log.pop_records()],
+            [('modify', i) for i in (1, 2, 3, 4)] * 3,
+        )
+        self.assertTrue(all(v.fixed for v in m.y.values()))
+        log.stop()
+
+    def test_memory(self):
+        def measure(storage):
+            m = ConcreteModel()
+            m.I = RangeSet(100000)
+            tracemalloc.start()
+            try:
+                m.x = Var(m.I, storage=storage, bounds=(0, 1), initialize=0)
+                return tracemalloc.get_traced_memory()[0]
+            finally:
+                tracemalloc.stop()
+
+        self.assertLess(10 * measure('dense'), measure(None))
+
+    def test_memory_referenced(self):
+        # The views created for variables used in expressions should not
+        # make dense storage more expensive than the default storage
+        def measure(storage):
+            m = ConcreteModel()
+            m.I = RangeSet(10000)
+            tracemalloc.start()
+            try:
+                m.x = Var(m.I, storage=storage, bounds=(0, 1), initialize=0)
+                m.c = Constraint(m.I, rule=lambda m, i: m.x[i] >= 0.5)
+                return tracemalloc.get_traced_memory()[0]
+            finally:
+                tracemalloc.stop()
+
+        dense = measure('dense')
+        default = measure(None)
+        self.assertLess(dense, default)
+
 
 if __name__ == "__main__":
     unittest.main()
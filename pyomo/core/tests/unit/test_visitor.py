@@ -71,7 +71,10 @@ from pyomo.core.expr.visitor import (
     identify_mutable_parameters,
     RECURSION_LIMIT,
     get_stack_depth,
+    compiled_walker,
+    compiled_walker_available,
 )
+from pyomo.core.expr import walker_loop
 from pyomo.core.base.param import _ParamData, ScalarParam
 from pyomo.core.expr.template_expr import IndexTemplate
 from pyomo.common.collections import ComponentSet
@@ -1716,6 +1719,22 @@ class TestStreamBasedExpressionVisitor_NonRecursive(
         return walker.walk_expression_nonrecursive(expr)
 
 
+class TestStreamBasedExpressionVisitor_WalkerLoop(
+    BaseStreamBasedVisitorTests, unittest.TestCase
+):
+    # Test the source for the compiled walker
+    def walk(self, walker, expr):
+        return walker_loop.walk_expression(walker, expr)
+
+
+@unittest.skipUnless(compiled_walker_available, "Compiled walker is not available")
+class TestStreamBasedExpressionVisitor_Compiled(
+    BaseStreamBasedVisitorTests, unittest.TestCase
+):
+    def walk(self, walker, expr):
+        return compiled_walker.walk_expression(walker, expr)
+
+
 def fill_stack(n, fcn, *args):
     if n:
         return fill_stack(n - 1, fcn, *args)
@@ -1824,6 +1843,9 @@ class TestStreamBasedExpressionVisitor_Deep(unittest.TestCase):
             # 3 sufficed through Python 3.10, but appeared to need to be
             # raised to 5 for recent 3.11 builds (3.11.2)
             cases = [(0, ""), (5, warn_msg)]
+        if compiled_walker_available:
+            # The compiled walker is not recursive
+            cases = [(n, "") for n, msg in cases]
 
         head_room = sys.getrecursionlimit() - get_stack_depth()
         for n, msg in cases:
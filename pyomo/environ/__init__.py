@@ -240,6 +240,8 @@ from pyomo.core import (
     Transformation,
     TransformationFactory,
     instance2dat,
+    save_model,
+    load_model,
     set_options,
     RealSet,
     IntegerSet,
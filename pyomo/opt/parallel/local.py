@@ -12,17 +12,26 @@
 
 __all__ = ()
 
+import concurrent.futures
+import copy
+import logging
+import os
 import time
 
-from pyomo.common.collections import OrderedDict
+from pyomo.common.collections import Bunch, OrderedDict
+from pyomo.common.errors import ApplicationError
+from pyomo.common.tempfiles import TempfileManager
 
 import pyomo.opt
+from pyomo.opt.solver.shellcmd import SystemCallSolver
 from pyomo.opt.parallel.manager import ActionManagerError, ActionStatus, ActionHandle
 from pyomo.opt.parallel.async_solver import (
     AsynchronousSolverManager,
     SolverManagerFactory,
 )
 
+logger = logging.getLogger('pyomo.opt')
+
 
 @SolverManagerFactory.register("serial", doc="Synchronously execute solvers locally")
 class SolverManager_Serial(AsynchronousSolverManager):
@@ -80,3 +89,216 @@ class SolverManager_Serial(AsynchronousSolverManager):
                 "executes solvers synchronously"
             ),
         )
+
+
+def _run_solver(opt):
+    """Run the solver executable for a job (called in a worker thread)"""
+    start = time.time()
+    status = opt._apply_solver()
+    return status, start, time.time()
+
+
+@SolverManagerFactory.register(
+    "local", doc="Asynchronously execute solvers in parallel local subprocesses"
+)
+class SolverManager_Local(AsynchronousSolverManager):
+    """Execute system call (shell) solvers in parallel on the local machine
+
+    Writing the problem files and processing / loading the results is
+    performed in the calling thread (when the action is queued and
+    waited on, respectively), while the solver executables run in a
+    pool of up to `max_workers` worker threads (defaults to the number
+    of CPUs).  This overlaps the file I/O and result loading for some
+    instances with the solver execution for others.
+
+    Each ActionHandle records the time spent in each phase of the job
+    in its `timing` attribute (a Bunch with `write`, `wait`, `solve`,
+    and `load` entries).
+
+    Solvers that are not system call solvers (e.g., direct or
+    persistent interfaces) are executed synchronously when queued.
+    """
+
+    def __init__(self, **kwds):
+        max_workers = kwds.pop('max_workers', None)
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        self.max_workers = max_workers
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers)
+        super(SolverManager_Local, self).__init__(**kwds)
+
+    def clear(self):
+        """
+        Clear manager state
+        """
+        super(SolverManager_Local, self).clear()
+        self.results = OrderedDict()
+        # Map of worker future to (ah, opt, model, tempfile context,
+        # queue time)
+        self._jobs = {}
+        # ActionHandles for synchronously executed jobs
+        self._done = []
+
+    def _perform_queue(self, ah, *args, **kwds):
+        """
+        Perform the queue operation.  This method returns the ActionHandle,
+        and the ActionHandle status indicates whether the queue was successful.
+        """
+        from pyomo.core.base.block import _BlockData
+        from pyomo.core.base.suffix import active_import_suffix_generator
+
+        opt = kwds.pop('solver', kwds.pop('opt', None))
+        if opt is None:
+            raise ActionManagerError(
+                "No solver passed to %s, use keyword option 'solver'"
+                % (type(self).__name__)
+            )
+        if isinstance(opt, str):
+            opt = pyomo.opt.SolverFactory(opt)
+        elif isinstance(opt, SystemCallSolver):
+            # The solver plugins hold the state of the solve, so each
+            # concurrent job needs its own copy of the solver
+            opt = copy.copy(opt)
+
+        ah.timing = Bunch(write=0, wait=0, solve=0, load=0)
+        time_start = time.time()
+        if not isinstance(opt, SystemCallSolver):
+            results = opt.solve(*args, **kwds)
+            ah.timing.solve = time.time() - time_start
+            results.pyomo_solve_time = ah.timing.solve
+            self.results[ah.id] = results
+            ah.status = ActionStatus.done
+            self._done.append(ah)
+            return ah
+
+        #
+        # Replicate OptSolver.solve() up through the call to the
+        # solver executable
+        #
+        opt.available(exception_flag=True)
+        model = None
+        for arg in args:
+            if isinstance(arg, _BlockData):
+                if not arg.is_constructed():
+                    raise RuntimeError(
+                        "Attempting to solve model=%s with unconstructed "
+                        "component(s)" % (arg.name,)
+                    )
+                model = arg
+                kwds_suffixes = kwds.setdefault('suffixes', [])
+                for name, comp in active_import_suffix_generator(arg):
+                    if name not in kwds_suffixes:
+                        kwds_suffixes.append(name)
+        options = Bunch()
+        options.update(opt.options)
+        options.update(kwds.pop('options', {}))
+        options.update(opt._options_string_to_dict(kwds.pop('options_string', '')))
+        opt.options = options
+
+        opt._presolve(*args, **kwds)
+        if model is not None:
+            opt._initialize_callbacks(model)
+        # SystemCallSolver._presolve() pushes a new tempfile context
+        # that _postsolve() pops.  As jobs can complete in any order,
+        # the context is removed from the (global) TempfileManager stack
+        # while the solver runs and restored when the job is processed.
+        tempfiles = TempfileManager._context_stack.pop()
+        queue_time = time.time()
+        ah.timing.write = queue_time - time_start
+
+        future = self._executor.submit(_run_solver, opt)
+        self._jobs[future] = (ah, opt, model, tempfiles, queue_time)
+        return ah
+
+    def _perform_wait_any(self):
+        """
+        Perform the wait_any operation.  This method returns an
+        ActionHandle with the results of waiting.  If None is returned
+        then the ActionManager assumes that it can call this method again.
+        Note that an ActionHandle can be returned with a dummy value,
+        to indicate an error.
+        """
+        if self._done:
+            return self._done.pop(0)
+        if not self._jobs:
+            return ActionHandle(
+                error=True,
+                explanation=(
+                    "No queued evaluations available in the 'local' solver manager"
+                ),
+            )
+        done, not_done = concurrent.futures.wait(
+            self._jobs, return_when=concurrent.futures.FIRST_COMPLETED
+        )
+        # Process completed jobs in the order that they were queued
+        future = min(done, key=lambda f: self._jobs[f][0].id)
+        ah, opt, model, tempfiles, queue_time = self._jobs.pop(future)
+
+        TempfileManager._context_stack.append(tempfiles)
+        try:
+            _status, solve_start, solve_end = future.result()
+            if hasattr(opt, '_transformation_data'):
+                del opt._transformation_data
+            if _status.rc:
+                logger.error(
+                    "Solver (%s) returned non-zero return code (%s)"
+                    % (opt.name, _status.rc)
+                )
+                if opt._tee:
+                    logger.error("See the solver log above for diagnostic information.")
+                elif _status.log:
+                    logger.error("Solver log:\n" + str(_status.log))
+                raise ApplicationError("Solver (%s) did not exit normally" % opt.name)
+            load_start = time.time()
+            results = opt._postsolve()
+        except:
+            ah.status = ActionStatus.error
+            stack = TempfileManager._context_stack
+            if stack and stack[-1] is tempfiles:
+                TempfileManager.pop(remove=not opt._keepfiles)
+            raise
+
+        results._smap_id = opt._smap_id
+        results._smap = None
+        if model is not None:
+            if opt._load_solutions:
+                model.solutions.load_from(
+                    results,
+                    select=opt._select_index,
+                    default_variable_value=opt._default_variable_value,
+                )
+                results._smap_id = None
+                results.solution.clear()
+            else:
+                results._smap = model.solutions.symbol_map[opt._smap_id]
+                model.solutions.delete_symbol_map(opt._smap_id)
+
+        timing = ah.timing
+        timing.wait = solve_start - queue_time
+        timing.solve = solve_end - solve_start
+        timing.load = time.time() - load_start
+        results.pyomo_solve_time = timing.write + timing.solve + timing.load
+
+        self.results[ah.id] = results
+        ah.status = ActionStatus.done
+        return ah
+
+    def shutdown(self):
+        """Shut down the worker pool and abandon any outstanding jobs
+
+        Jobs that were queued but never waited on are cancelled (or, if
+        the solver is already running, allowed to finish), and their
+        temporary files and symbol maps are released.
+        """
+        for future in self._jobs:
+            future.cancel()
+        self._executor.shutdown(wait=True)
+        for ah, opt, model, tempfiles, queue_time in self._jobs.values():
+            ah.status = ActionStatus.error
+            tempfiles.release(remove=not opt._keepfiles)
+            if model is not None:
+                model.solutions.symbol_map.pop(opt._smap_id, None)
+        self._jobs.clear()
+
+    def __exit__(self, t, v, traceback):
+        self.shutdown()
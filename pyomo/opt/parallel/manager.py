@@ -164,7 +164,10 @@ class AsynchronousActionManager(object):
                 if ah.status == ActionStatus.queued
             )
         else:
-            ahs = self._flatten(*args)
+            # Skip actions that have already completed
+            ahs = set(
+                ah for ah in self._flatten(*args) if ah.status == ActionStatus.queued
+            )
         #
         # Iterate until all ah's have completed
         #
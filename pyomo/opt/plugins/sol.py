@@ -14,12 +14,364 @@
 #
 
 import re
+import warnings
+from array import array
 
+from pyomo.common.dependencies import numpy as np, numpy_available
 from pyomo.opt.base import results
 from pyomo.opt.base.formats import ResultsFormat
 from pyomo.opt import SolverResults, SolutionStatus, SolverStatus, TerminationCondition
 
 
+class SolFileData(object):
+    """The raw contents of an AMPL *.sol file
+
+    Values are stored in the order that the variables / constraints
+    were written to the NL file (see
+    :py:class:`pyomo.repn.plugins.nl_writer.NLWriterInfo`), so they can
+    be mapped back to the model without going through the row / column
+    labels.  All value arrays are :py:class:`numpy.ndarray` objects (or
+    :py:class:`array.array` objects if numpy is not available).
+
+    Attributes
+    ----------
+    message: str
+
+        The solver message (the non-blank lines before the 'Options'
+        line)
+
+    options: List[int]
+
+        The solver options block
+
+    objno: List[int]
+
+        The objective number and the solve result number
+
+    duals: array
+
+        The constraint duals (in NL row order)
+
+    primals: array
+
+        The variable values (in NL column order)
+
+    var_suffixes, con_suffixes, obj_suffixes: Dict[str, Tuple[array, array]]
+
+        Map of the suffix name to a tuple of (component index, value)
+        arrays for the variable, constraint, and objective suffixes
+
+    problem_suffixes: Dict[str, int | float]
+
+        Map of the suffix name to the value for the problem suffixes
+
+    remaining: List[str]
+
+        Any trailing (non-suffix) lines in the file
+
+    """
+
+    def __init__(self):
+        self.message = ''
+        self.options = []
+        self.objno = [0, 0]
+        self.duals = None
+        self.primals = None
+        self.var_suffixes = {}
+        self.con_suffixes = {}
+        self.obj_suffixes = {}
+        self.problem_suffixes = {}
+        self.remaining = []
+
+
+class DirectSolution(object):
+    """A solution read from a *.sol file that is loaded directly into
+    the model
+
+    The values are held in the arrays parsed from the *.sol file and are
+    mapped to the model components through the positions recorded by
+    the NL writer, bypassing the (label-keyed) :py:class:`Solution`
+    objects and the :py:class:`SymbolMap`.  See
+    :py:meth:`ModelSolutions.load_from`.
+
+    Attributes
+    ----------
+    nl_info: NLWriterInfo
+
+        The information returned by the NL writer when the NL file was
+        written
+
+    sol: SolFileData
+
+        The parsed contents of the *.sol file
+
+    """
+
+    def __init__(self, nl_info, sol):
+        self.nl_info = nl_info
+        self.sol = sol
+
+
+class _SolFileLines(object):
+    """Line-oriented reader over the (bytes) contents of a *.sol file
+
+    Blocks of lines are located using a (vectorized) index of the
+    newline characters so that they can be parsed in bulk.
+    """
+
+    def __init__(self, data):
+        self.data = data
+        self.pos = 0
+        self._newlines = None
+
+    def readline(self):
+        """Return the next line (without the trailing newline), or None
+        at the end of the file"""
+        data = self.data
+        if self.pos >= len(data):
+            return None
+        end = data.find(b'\n', self.pos)
+        if end < 0:
+            end = len(data)
+        line = data[self.pos : end]
+        self.pos = end + 1
+        return line.decode(errors='replace')
+
+    def read_block(self, nlines):
+        """Return the next `nlines` lines as a single bytes object"""
+        if nlines <= 0:
+            return b''
+        data = self.data
+        start = self.pos
+        if numpy_available:
+            if self._newlines is None:
+                self._newlines = np.flatnonzero(
+                    np.frombuffer(data, dtype=np.uint8) == ord('\n')
+                )
+            i = np.searchsorted(self._newlines, start) + nlines - 1
+            if i < len(self._newlines):
+                end = int(self._newlines[i])
+            else:
+                end = len(data)
+        else:
+            end = start - 1
+            for i in range(nlines):
+                end = data.find(b'\n', end + 1)
+                if end < 0:
+                    end = len(data)
+                    break
+        self.pos = end + 1
+        return data[start:end]
+
+    def read_values(self, nlines, ncols=1, dtype=float):
+        """Parse the next `nlines` lines of `ncols` numbers each into a
+        flat array"""
+        block = self.read_block(nlines)
+        count = nlines * ncols
+        if numpy_available:
+            with warnings.catch_warnings():
+                # numpy signals malformed content with a DeprecationWarning
+                warnings.simplefilter('error', DeprecationWarning)
+                try:
+                    ans = np.fromstring(block, dtype=float, sep=' ')
+                except DeprecationWarning:
+                    ans = None
+            if ans is not None and dtype is not float:
+                ans = ans.astype(dtype)
+        else:
+            try:
+                ans = array('d', map(float, block.split()))
+            except ValueError:
+                ans = None
+            if ans is not None and dtype is not float:
+                ans = array('l', map(dtype, ans))
+        if ans is None or len(ans) != count:
+            raise ValueError(
+                "expected %s numeric values, but found '%s'"
+                % (count, block.decode(errors='replace'))
+            )
+        return ans
+
+
+def _split_columns(values):
+    if numpy_available:
+        return values[0::2].astype(np.int64), values[1::2]
+    return array('l', map(int, values[0::2])), values[1::2]
+
+
+def parse_sol_file(fin):
+    """Parse an AMPL *.sol file
+
+    The primal and dual blocks (and the suffix values) are parsed in
+    bulk into arrays ordered by the NL file column / row order.
+
+    Parameters
+    ----------
+    fin: file
+
+        The open *.sol file (in either text or binary mode)
+
+    Returns
+    -------
+    SolFileData
+
+    """
+    data = fin.read()
+    if isinstance(data, str):
+        data = data.encode()
+    lines = _SolFileLines(data)
+    ans = SolFileData()
+    #
+    # Some solvers (minto) do not write a message.  We will assume
+    # all non-blank lines up the 'Options' line is the message.
+    msg = []
+    while True:
+        line = lines.readline()
+        if line is None:
+            # EOF
+            break
+        line = line.strip()
+        if line == 'Options':
+            break
+        if line:
+            msg.append(line)
+    ans.message = '\n'.join(msg)
+    z = ans.options
+    if line is None or line[:7] != "Options":
+        raise ValueError("no Options line found")
+    nopts = int(lines.readline())
+    need_vbtol = False
+    if nopts > 4:  # WEH - when is this true?
+        nopts -= 2
+        need_vbtol = True
+    for i in range(nopts + 4):
+        z.append(int(lines.readline()))
+    if need_vbtol:  # WEH - when is this true?
+        z.append(float(lines.readline()))
+    n = z[nopts + 3]  # variables
+    m = z[nopts + 1]  # constraints
+    ans.duals = lines.read_values(m)
+    ans.primals = lines.read_values(n)
+    line = lines.readline()
+    if line is None:
+        return ans
+    if line[:5] != "objno":  # pragma:nocover
+        raise ValueError("expected 'objno', found '%s'" % (line))
+    t = line.split()
+    if len(t) != 3:
+        raise ValueError("expected two numbers in objno line, but found '%s'" % (line))
+    ans.objno = [int(t[1]), int(t[2])]
+
+    suffixes = (
+        ans.var_suffixes,
+        ans.con_suffixes,
+        ans.obj_suffixes,
+        ans.problem_suffixes,
+    )
+    while True:
+        line = lines.readline()
+        if line is None:
+            break
+        line = line.split()
+        if not line:
+            continue
+        if line[0] != 'suffix':
+            # We assume this is the start of a section like
+            # kestrel_option, which comes after all suffixes.
+            remaining = ans.remaining
+            remaining.append(' '.join(line))
+            line = lines.readline()
+            while line is not None:
+                remaining.append(line.strip())
+                line = lines.readline()
+            break
+        unmasked_kind = int(line[1])
+        kind = unmasked_kind & 3  # 0-var, 1-con, 2-obj, 3-prob
+        dtype = float if unmasked_kind & 4 else int
+        nvalues = int(line[2])
+        # namelen = int(line[3])
+        # tablen = int(line[4])
+        tabline = int(line[5])
+        suffix_name = lines.readline().strip()
+        # ignore translation of the table number to string value for now,
+        # this information can be obtained from the solver documentation
+        lines.read_block(tabline)
+        if kind == 3:  # Prob
+            for cnt in range(nvalues):
+                suffixes[kind][suffix_name] = dtype(lines.readline().split()[1])
+        else:
+            suffixes[kind][suffix_name] = _split_columns(
+                lines.read_values(nvalues, 2, dtype)
+            )
+    return ans
+
+
+# Termination conditions for which the *.sol file holds a solution
+_solution_conditions = {
+    TerminationCondition.unknown,
+    TerminationCondition.maxIterations,
+    TerminationCondition.minFunctionValue,
+    TerminationCondition.minStepLength,
+    TerminationCondition.globallyOptimal,
+    TerminationCondition.locallyOptimal,
+    TerminationCondition.optimal,
+    TerminationCondition.maxEvaluations,
+    TerminationCondition.other,
+    TerminationCondition.infeasible,
+}
+
+
+def _set_solver_status(res, objno):
+    """Set the solver status / termination condition in `res` from the
+    solve result number in the *.sol file objno line
+
+    Returns the corresponding (solution status, status description)
+    """
+    objno_message = None
+    res.solver.status = SolverStatus.ok
+    soln_status = SolutionStatus.unknown
+    if (objno[1] >= 0) and (objno[1] <= 99):
+        objno_message = "OPTIMAL SOLUTION FOUND!"
+        res.solver.termination_condition = TerminationCondition.optimal
+        res.solver.status = SolverStatus.ok
+        soln_status = SolutionStatus.optimal
+    elif (objno[1] >= 100) and (objno[1] <= 199):
+        objno_message = "Optimal solution indicated, but ERROR LIKELY!"
+        res.solver.termination_condition = TerminationCondition.optimal
+        res.solver.status = SolverStatus.warning
+        soln_status = SolutionStatus.optimal
+    elif (objno[1] >= 200) and (objno[1] <= 299):
+        objno_message = "INFEASIBLE SOLUTION: constraints cannot be satisfied!"
+        res.solver.termination_condition = TerminationCondition.infeasible
+        res.solver.status = SolverStatus.warning
+        soln_status = SolutionStatus.infeasible
+    elif (objno[1] >= 300) and (objno[1] <= 399):
+        objno_message = (
+            "UNBOUNDED PROBLEM: the objective can be improved without limit!"
+        )
+        res.solver.termination_condition = TerminationCondition.unbounded
+        res.solver.status = SolverStatus.warning
+        soln_status = SolutionStatus.unbounded
+    elif (objno[1] >= 400) and (objno[1] <= 499):
+        objno_message = (
+            "EXCEEDED MAXIMUM NUMBER OF ITERATIONS: the solver "
+            "was stopped by a limit that you set!"
+        )
+        res.solver.termination_condition = TerminationCondition.maxIterations
+        res.solver.status = SolverStatus.warning
+        soln_status = SolutionStatus.stoppedByLimit
+    elif (objno[1] >= 500) and (objno[1] <= 599):
+        objno_message = (
+            "FAILURE: the solver stopped by an error condition "
+            "in the solver routines!"
+        )
+        res.solver.termination_condition = TerminationCondition.internalSolverError
+        res.solver.status = SolverStatus.error
+        soln_status = SolutionStatus.error
+    res.solver.id = objno[1]
+    return soln_status, objno_message
+
+
 @results.ReaderFactory.register(str(ResultsFormat.sol))
 class ResultsReader_sol(results.AbstractResultsReader):
     """
@@ -32,13 +384,19 @@ class ResultsReader_sol(results.AbstractResultsReader):
         if not name is None:
             self.name = name
 
-    def __call__(self, filename, res=None, soln=None, suffixes=[]):
+    def __call__(self, filename, res=None, soln=None, suffixes=[], nl_info=None):
         """
         Parse a *.sol file
+
+        If `nl_info` (the :py:class:`NLWriterInfo` returned when the NL
+        file was written) is provided, the solution is not added to the
+        SolverResults as a :py:class:`Solution`; instead, the parsed
+        values are attached as a :py:class:`DirectSolution` that is
+        loaded straight into the model components.
         """
         try:
-            with open(filename, "r") as f:
-                return self._load(f, res, soln, suffixes)
+            with open(filename, "rb") as f:
+                return self._load(f, res, soln, suffixes, nl_info)
         except ValueError as e:
             with open(filename, "r") as f:
                 fdata = f.read()
@@ -47,125 +405,28 @@ class ResultsReader_sol(results.AbstractResultsReader):
                 "SOL File Output:\n%s" % (filename, str(e), fdata)
             )
 
-    def _load(self, fin, res, soln, suffixes):
+    def _load(self, fin, res, soln, suffixes, nl_info=None):
         if res is None:
             res = SolverResults()
-        #
-        # Some solvers (minto) do not write a message.  We will assume
-        # all non-blank lines up the 'Options' line is the message.
-        msg = []
-        while True:
-            line = fin.readline()
-            if not line:
-                # EOF
-                break
-            line = line.strip()
-            if line == 'Options':
-                break
-            if line:
-                msg.append(line)
-        msg = '\n'.join(msg)
-        z = []
-        if line[:7] == "Options":
-            line = fin.readline()
-            nopts = int(line)
-            need_vbtol = False
-            if nopts > 4:  # WEH - when is this true?
-                nopts -= 2
-                need_vbtol = True
-            for i in range(nopts + 4):
-                line = fin.readline()
-                z += [int(line)]
-            if need_vbtol:  # WEH - when is this true?
-                line = fin.readline()
-                z += [float(line)]
-        else:
-            raise ValueError("no Options line found")
-        n = z[nopts + 3]  # variables
-        m = z[nopts + 1]  # constraints
-        x = []
-        y = []
-        i = 0
-        while i < m:
-            line = fin.readline()
-            y.append(float(line))
-            i += 1
-        i = 0
-        while i < n:
-            line = fin.readline()
-            x.append(float(line))
-            i += 1
-        objno = [0, 0]
-        line = fin.readline()
-        if line:  # WEH - when is this true?
-            if line[:5] != "objno":  # pragma:nocover
-                raise ValueError("expected 'objno', found '%s'" % (line))
-            t = line.split()
-            if len(t) != 3:
-                raise ValueError(
-                    "expected two numbers in objno line, but found '%s'" % (line)
-                )
-            objno = [int(t[1]), int(t[2])]
+        sol = parse_sol_file(fin)
+        msg = sol.message
+        objno = sol.objno
+        n = len(sol.primals)
+        m = len(sol.duals)
         res.solver.message = msg.strip()
         res.solver.message = res.solver.message.replace("\n", "; ")
         if isinstance(res.solver.message, str):
             res.solver.message = res.solver.message.replace(':', '\\x3a')
         ##res.solver.instanceName = osrl.header.instanceName
         ##res.solver.systime = osrl.header.time
-        res.solver.status = SolverStatus.ok
-        soln_status = SolutionStatus.unknown
-        if (objno[1] >= 0) and (objno[1] <= 99):
-            objno_message = "OPTIMAL SOLUTION FOUND!"
-            res.solver.termination_condition = TerminationCondition.optimal
-            res.solver.status = SolverStatus.ok
-            soln_status = SolutionStatus.optimal
-        elif (objno[1] >= 100) and (objno[1] <= 199):
-            objno_message = "Optimal solution indicated, but ERROR LIKELY!"
-            res.solver.termination_condition = TerminationCondition.optimal
-            res.solver.status = SolverStatus.warning
-            soln_status = SolutionStatus.optimal
-        elif (objno[1] >= 200) and (objno[1] <= 299):
-            objno_message = "INFEASIBLE SOLUTION: constraints cannot be satisfied!"
-            res.solver.termination_condition = TerminationCondition.infeasible
-            res.solver.status = SolverStatus.warning
-            soln_status = SolutionStatus.infeasible
-        elif (objno[1] >= 300) and (objno[1] <= 399):
-            objno_message = (
-                "UNBOUNDED PROBLEM: the objective can be improved without limit!"
-            )
-            res.solver.termination_condition = TerminationCondition.unbounded
-            res.solver.status = SolverStatus.warning
-            soln_status = SolutionStatus.unbounded
-        elif (objno[1] >= 400) and (objno[1] <= 499):
-            objno_message = (
-                "EXCEEDED MAXIMUM NUMBER OF ITERATIONS: the solver "
-                "was stopped by a limit that you set!"
-            )
-            res.solver.termination_condition = TerminationCondition.maxIterations
-            res.solver.status = SolverStatus.warning
-            soln_status = SolutionStatus.stoppedByLimit
-        elif (objno[1] >= 500) and (objno[1] <= 599):
-            objno_message = (
-                "FAILURE: the solver stopped by an error condition "
-                "in the solver routines!"
-            )
-            res.solver.termination_condition = TerminationCondition.internalSolverError
-            res.solver.status = SolverStatus.error
-            soln_status = SolutionStatus.error
-        res.solver.id = objno[1]
+        soln_status, objno_message = _set_solver_status(res, objno)
         ##res.problem.name = osrl.header.instanceName
-        if res.solver.termination_condition in [
-            TerminationCondition.unknown,
-            TerminationCondition.maxIterations,
-            TerminationCondition.minFunctionValue,
-            TerminationCondition.minStepLength,
-            TerminationCondition.globallyOptimal,
-            TerminationCondition.locallyOptimal,
-            TerminationCondition.optimal,
-            TerminationCondition.maxEvaluations,
-            TerminationCondition.other,
-            TerminationCondition.infeasible,
-        ]:
+        if nl_info is not None:
+            # Keep the solution values in the parsed arrays (in NL file
+            # order) and skip building the label-keyed Solution
+            if res.solver.termination_condition in _solution_conditions:
+                res._direct_solution = DirectSolution(nl_info, sol)
+        elif res.solver.termination_condition in _solution_conditions:
             if soln is None:
                 soln = res.solution.add()
             res.solution.status = soln_status
@@ -174,93 +435,61 @@ class ResultsReader_sol(results.AbstractResultsReader):
             soln.message = res.solver.message.replace("\n", "; ")
             soln_variable = soln.variable
             i = 0
-            for var_value in x:
+            for var_value in sol.primals.tolist():
                 soln_variable["v" + str(i)] = {"Value": var_value}
                 i = i + 1
             soln_constraint = soln.constraint
             if any(re.match(suf, "dual") for suf in suffixes):
-                for i in range(0, len(y)):
-                    soln_constraint["c" + str(i)] = {"Dual": y[i]}
-
-            ### Read suffixes ###
-            line = fin.readline()
-            while line:
-                line = line.strip()
-                if line == "":
-                    continue
-                line = line.split()
-                if line[0] != 'suffix':
-                    # We assume this is the start of a
-                    # section like kestrel_option, which
-                    # comes after all suffixes.
-                    remaining = ""
-                    line = fin.readline()
-                    while line:
-                        remaining += line.strip() + "; "
-                        line = fin.readline()
-                    res.solver.message += remaining
-                    break
-                unmasked_kind = int(line[1])
-                kind = unmasked_kind & 3  # 0-var, 1-con, 2-obj, 3-prob
-                convert_function = int
-                if (unmasked_kind & 4) == 4:
-                    convert_function = float
-                nvalues = int(line[2])
-                # namelen = int(line[3])
-                # tablen = int(line[4])
-                tabline = int(line[5])
-                suffix_name = fin.readline().strip()
-                if any(re.match(suf, suffix_name) for suf in suffixes):
-                    # ignore translation of the table number to string value for now,
-                    # this information can be obtained from the solver documentation
-                    for n in range(tabline):
-                        fin.readline()
+                i = 0
+                for dual in sol.duals.tolist():
+                    soln_constraint["c" + str(i)] = {"Dual": dual}
+                    i = i + 1
+
+            ### Load suffixes ###
+            for kind, suffix_data in enumerate(
+                (sol.var_suffixes, sol.con_suffixes, sol.obj_suffixes)
+            ):
+                for suffix_name, (idx, vals) in suffix_data.items():
+                    if not any(re.match(suf, suffix_name) for suf in suffixes):
+                        # do not store the suffix in the solution object
+                        continue
                     if kind == 0:  # Var
-                        for cnt in range(nvalues):
-                            suf_line = fin.readline().split()
-                            key = "v" + suf_line[0]
+                        for i, val in zip(idx.tolist(), vals.tolist()):
+                            key = "v" + str(i)
                             if key not in soln_variable:
                                 soln_variable[key] = {}
-                            soln_variable[key][suffix_name] = convert_function(
-                                suf_line[1]
-                            )
+                            soln_variable[key][suffix_name] = val
                     elif kind == 1:  # Con
-                        for cnt in range(nvalues):
-                            suf_line = fin.readline().split()
-                            key = "c" + suf_line[0]
+                        # GH: About the comment below: This makes for a
+                        # confusing results object and more confusing tests.
+                        # We should not muck with the names of suffixes
+                        # coming out of the sol file.
+                        #
+                        #   convert the first letter of the suffix name to upper case,
+                        #   mainly for pretty-print / output purposes. these are lower-cased
+                        #   when loaded into real suffixes, so it is largely redundant.
+                        translated_suffix_name = (
+                            suffix_name[0].upper() + suffix_name[1:]
+                        )
+                        for i, val in zip(idx.tolist(), vals.tolist()):
+                            key = "c" + str(i)
                             if key not in soln_constraint:
                                 soln_constraint[key] = {}
-                            # GH: About the comment below: This makes for a
-                            # confusing results object and more confusing tests.
-                            # We should not muck with the names of suffixes
-                            # coming out of the sol file.
-                            #
-                            #   convert the first letter of the suffix name to upper case,
-                            #   mainly for pretty-print / output purposes. these are lower-cased
-                            #   when loaded into real suffixes, so it is largely redundant.
-                            translated_suffix_name = (
-                                suffix_name[0].upper() + suffix_name[1:]
-                            )
-                            soln_constraint[key][
-                                translated_suffix_name
-                            ] = convert_function(suf_line[1])
+                            soln_constraint[key][translated_suffix_name] = val
                     elif kind == 2:  # Obj
-                        for cnt in range(nvalues):
-                            suf_line = fin.readline().split()
-                            soln.objective.setdefault("o" + suf_line[0], {})[
+                        for i, val in zip(idx.tolist(), vals.tolist()):
+                            soln.objective.setdefault("o" + str(i), {})[
                                 suffix_name
-                            ] = convert_function(suf_line[1])
-                    elif kind == 3:  # Prob
-                        # Skip problem kind suffixes for now. Not sure the
-                        # best place to put them in the results object
-                        for cnt in range(nvalues):
-                            suf_line = fin.readline().split()
-                            soln.problem[suffix_name] = convert_function(suf_line[1])
-                else:
-                    # do not store the suffix in the solution object
-                    for cnt in range(nvalues):
-                        fin.readline()
-                line = fin.readline()
+                            ] = val
+            for suffix_name, val in sol.problem_suffixes.items():
+                # Skip problem kind suffixes for now. Not sure the
+                # best place to put them in the results object
+                if any(re.match(suf, suffix_name) for suf in suffixes):
+                    soln.problem[suffix_name] = val
+            if sol.remaining:
+                # The first line is the section header (e.g.,
+                # kestrel_option)
+                res.solver.message += ''.join(line + "; " for line in sol.remaining[1:])
 
         #
         # This is a bit of a hack to accommodate PICO.  If
@@ -22,11 +22,11 @@ from pyomo.common.backports import nullcontext
 from pyomo.common.errors import ApplicationError
 from pyomo.common.collections import Bunch
 from pyomo.common.log import is_debug_set, LoggingIntercept
-from pyomo.common.tempfiles import TempfileManager
+from pyomo.common.tempfiles import TempfileManager, memory_tempdir
 from pyomo.common.tee import TeeStream
 
 import pyomo.common
-from pyomo.opt.base import ResultsFormat
+from pyomo.opt.base import ProblemFormat, ResultsFormat
 from pyomo.opt.base.solvers import OptSolver
 from pyomo.opt.results import SolverStatus, SolverResults
 
@@ -62,6 +62,10 @@ class SystemCallSolver(OptSolver):
         # a solver plugin may not report execution time.
         self._last_solve_time = None
         self._define_signal_handlers = None
+        # The NLWriterInfo used to load solutions directly into the
+        # model (see the `direct_load` solve() option)
+        self._direct_load = False
+        self._nl_info = None
 
         if executable is not None:
             self.set_executable(name=executable, validate=validate)
@@ -216,13 +220,52 @@ class SystemCallSolver(OptSolver):
         """
         Perform presolves.
         """
-        TempfileManager.push()
+        tempfiles = TempfileManager.push()
+        if kwds.pop("memory_tempfiles", False):
+            # Write the problem, solution, and log files to a
+            # memory-backed filesystem (falling back on the default
+            # temporary directory if one is not available)
+            tempfiles.tempdir = memory_tempdir()
 
         self._keepfiles = kwds.pop("keepfiles", False)
         self._define_signal_handlers = kwds.pop('use_signal_handling', None)
+        self._direct_load = kwds.pop("direct_load", False)
+        from pyomo.core.base.block import _BlockData
+
+        model = None
+        if self._direct_load and self._problem_format == ProblemFormat.nl:
+            for arg in args:
+                if isinstance(arg, _BlockData):
+                    model = arg
+                    # Ask the NL writer to keep its NLWriterInfo on the
+                    # generated symbol map
+                    kwds['_keep_nl_info'] = True
+                    break
 
         OptSolver._presolve(self, *args, **kwds)
 
+        #
+        # When requested (and the problem was written by the NL writer),
+        # the *.sol file values are kept in arrays (in NL file order) and
+        # loaded straight into the model components instead of being
+        # translated into a SolverResults Solution keyed by the symbol
+        # map labels.  Other problem / results formats fall back on the
+        # standard SolverResults.
+        #
+        self._nl_info = None
+        if model is not None and self._results_format == ResultsFormat.sol:
+            smap = model.solutions.symbol_map.get(self._smap_id, None)
+            self._nl_info = getattr(smap, 'nl_info', None)
+        if self._direct_load and self._nl_info is None:
+            logger.warning(
+                "The direct_load option is not supported by solver '%s' "
+                "(problem format: %s, results format: %s): it requires a "
+                "model written by the NL writer (version 2) and a SOL "
+                "results file.  The solution will be loaded through the "
+                "SolverResults object."
+                % (self.name, self._problem_format, self._results_format)
+            )
+
         #
         # Verify that the input problems exists
         #
@@ -385,7 +428,15 @@ class SystemCallSolver(OptSolver):
             # information, but perhaps also in a results file.
             # For now, if there is a single solution, then we assume that
             # the results file is going to add more data to it.
-            if len(results.solution) == 1:
+            if self._nl_info is not None:
+                results = self._results_reader(
+                    self._results_file,
+                    res=results,
+                    suffixes=self._suffixes,
+                    nl_info=self._nl_info,
+                )
+                self._nl_info = None
+            elif len(results.solution) == 1:
                 results = self._results_reader(
                     self._results_file,
                     res=results,
@@ -12,6 +12,7 @@
 # Unit Tests for pyomo.opt.base.OS
 #
 
+import io
 import json
 import os
 from os.path import join
@@ -29,6 +30,7 @@ from pyomo.opt import (
     check_optimal_termination,
     assert_optimal_termination,
 )
+from pyomo.opt.plugins.sol import parse_sol_file
 
 currdir = this_file_dir()
 deleteFiles = True
@@ -153,6 +155,41 @@ class Test(unittest.TestCase):
             self.assertEqual(m.iis[m.v1], 1)
             self.assertEqual(m.iis[m.c0], 4)
 
+    def test_parse_sol_file(self):
+        with open(join(currdir, "iis_no_variable_values.sol"), 'rb') as f:
+            sol = parse_sol_file(f)
+        self.assertTrue(sol.message.startswith("CPLEX 12.8.0.0: integer infeasible."))
+        self.assertEqual(sol.options, [1, 1, 0, 1, 0, 2, 0])
+        self.assertEqual(sol.objno, [0, 220])
+        self.assertEqual(list(sol.duals), [])
+        self.assertEqual(list(sol.primals), [])
+        idx, vals = sol.var_suffixes['iis']
+        self.assertEqual(list(idx), [0, 1])
+        self.assertEqual(list(vals), [1, 1])
+        idx, vals = sol.con_suffixes['iis']
+        self.assertEqual(list(idx), [0])
+        self.assertEqual(list(vals), [4])
+        self.assertEqual(sol.obj_suffixes, {})
+        self.assertEqual(sol.problem_suffixes, {})
+
+        with open(join(currdir, "test4_sol.sol"), 'r') as f:
+            sol = parse_sol_file(f)
+        self.assertEqual(len(sol.duals), 24)
+        self.assertEqual(len(sol.primals), 32)
+        self.assertAlmostEqual(sol.duals[2], 0.126)
+        self.assertEqual(sol.primals.tolist()[-3:], [100, 0, 100])
+
+    def test_parse_sol_file_bad_values(self):
+        sol = "msg\nOptions\n3\n1\n1\n0\n1\n1\n2\n2\n1\n2\nx\n"
+        with self.assertRaisesRegex(
+            ValueError, "expected 2 numeric values, but found '2\nx'"
+        ):
+            parse_sol_file(io.StringIO(sol))
+        with self.assertRaisesRegex(
+            ValueError, "expected 2 numeric values, but found '2'"
+        ):
+            parse_sol_file(io.StringIO(sol[:-3]))
+
 
 if __name__ == "__main__":
     deleteFiles = False
@@ -941,3 +941,9 @@ class LinearRepnVisitor(StreamBasedExpressionVisitor):
         assert result[0] is _CONSTANT
         ans.constant = result[1]
         return ans
+
+    def validate_parallel_repns(self, repns):
+        # Nonlinear terms are stored as Pyomo expressions, which cannot
+        # be returned from worker processes (see
+        # pyomo.repn.util.compile_repns_in_parallel)
+        return all(repn.nonlinear is None for repn in repns)
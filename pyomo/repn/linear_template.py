@@ -0,0 +1,286 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2022
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+"""Compile the rule of an IndexedConstraint into a linear template
+
+Large indexed constraints (e.g., the discretized dynamics of a
+time-indexed model) generate one expression tree for every index, all
+of which have the same structure.  This module "templatizes" the rule
+once (see :py:func:`templatize_constraint`), compiles the linear body
+of the template into a Python function, and then generates the
+:py:class:`LinearRepn` for each constraint by calling that function
+with the constraint index (instead of walking the constraint body).
+
+"""
+
+import logging
+
+from pyomo.common.numeric_types import native_numeric_types, value
+from pyomo.core.base.constraint import _GeneralConstraintData
+from pyomo.core.base.param import Param
+from pyomo.core.base.var import Var
+from pyomo.core.expr.numeric_expr import (
+    NegationExpression,
+    ProductExpression,
+    DivisionExpression,
+    PowExpression,
+    MonomialTermExpression,
+    LinearExpression,
+    SumExpression,
+    NPV_SumExpression,
+)
+from pyomo.core.expr.template_expr import (
+    GetItemExpression,
+    IndexTemplate,
+    templatize_constraint,
+)
+
+logger = logging.getLogger(__name__)
+
+_SumLikeExpression = {SumExpression, LinearExpression, NPV_SumExpression}
+
+
+class _NotTemplatizable(Exception):
+    pass
+
+
+class _TemplateCodeGenerator(object):
+    """Generate the source for a function that instantiates a template
+
+    Fixed (non-variable) subexpressions are compiled to Python source;
+    numeric constants are folded directly into the generated code.  The
+    Pyomo components referenced by the template are passed into the
+    generated function through its globals.
+
+    """
+
+    def __init__(self, indices):
+        self.namespace = {'_value': value}
+        self.names = {}
+        for i, idx in enumerate(indices):
+            self.names[id(idx)] = f'_i{i}'
+
+    def name(self, obj):
+        _id = id(obj)
+        if _id not in self.names:
+            name = self.names[_id] = f'_c{len(self.names)}'
+            self.namespace[name] = obj
+        return self.names[_id]
+
+    def index(self, args):
+        idx = [self.fixed(arg) for arg in args]
+        if len(idx) == 1:
+            return idx[0]
+        return '(' + ', '.join(map(str, idx)) + ')'
+
+    def fixed(self, expr):
+        """Return the source for a fixed (non-variable) expression
+
+        Returns a native number if the expression is a constant
+        """
+        if expr.__class__ in native_numeric_types:
+            return expr
+        if expr.__class__ is IndexTemplate:
+            if id(expr) not in self.names:
+                # Local index (e.g., from a templatized sum())
+                raise _NotTemplatizable()
+            return self.names[id(expr)]
+        if not expr.is_expression_type():
+            if expr.is_constant():
+                return value(expr)
+            # e.g., (mutable) Params
+            return f'_value({self.name(expr)})'
+        if isinstance(expr, GetItemExpression):
+            base = expr.arg(0)
+            if getattr(base, 'ctype', None) is not Param:
+                raise _NotTemplatizable()
+            return f'_value({self.name(base)}[{self.index(expr.args[1:])}])'
+        args = [self.fixed(arg) for arg in expr.args]
+        if all(arg.__class__ in native_numeric_types for arg in args):
+            return value(expr.create_node_with_local_data(tuple(args)))
+        args = [f'({arg})' for arg in args]
+        if expr.__class__ in _SumLikeExpression:
+            return ' + '.join(args)
+        elif isinstance(expr, NegationExpression):
+            return '- ' + args[0]
+        elif isinstance(expr, ProductExpression):
+            return ' * '.join(args)
+        elif isinstance(expr, DivisionExpression):
+            return ' / '.join(args)
+        elif isinstance(expr, PowExpression):
+            return ' ** '.join(args)
+        raise _NotTemplatizable()
+
+    def linear(self, expr):
+        """Return the (terms, constant) for a (linear) template expression
+
+        `terms` is a list of (coefficient, variable) source tuples
+        """
+        if expr.__class__ in native_numeric_types or not expr.is_potentially_variable():
+            return [], [self.fixed(expr)]
+        if expr.is_variable_type():
+            return [(1, self.name(expr))], []
+        if not expr.is_expression_type():
+            # e.g., named Expressions
+            raise _NotTemplatizable()
+        if expr.__class__ in _SumLikeExpression:
+            terms = []
+            const = []
+            for arg in expr.args:
+                _terms, _const = self.linear(arg)
+                terms.extend(_terms)
+                const.extend(_const)
+            return terms, const
+        if isinstance(expr, GetItemExpression):
+            base = expr.arg(0)
+            if getattr(base, 'ctype', None) is not Var:
+                raise _NotTemplatizable()
+            return [(1, f'{self.name(base)}[{self.index(expr.args[1:])}]')], []
+        if isinstance(expr, NegationExpression):
+            return self._scale(-1, self.linear(expr.arg(0)))
+        if isinstance(expr, (ProductExpression, MonomialTermExpression)):
+            lhs, rhs = expr.args
+            if lhs.__class__ in native_numeric_types or not (
+                lhs.is_potentially_variable()
+            ):
+                return self._scale(self.fixed(lhs), self.linear(rhs))
+            if rhs.__class__ in native_numeric_types or not (
+                rhs.is_potentially_variable()
+            ):
+                return self._scale(self.fixed(rhs), self.linear(lhs))
+        if isinstance(expr, DivisionExpression):
+            num, den = expr.args
+            if den.__class__ in native_numeric_types or not (
+                den.is_potentially_variable()
+            ):
+                den = self.fixed(den)
+                if den.__class__ in native_numeric_types:
+                    return self._scale(1 / den, self.linear(num))
+                return self._scale(f'1 / ({den})', self.linear(num))
+        raise _NotTemplatizable()
+
+    def _scale(self, mult, linear):
+        terms, const = linear
+        return (
+            [(self._mul(mult, coef), var) for coef, var in terms],
+            [self._mul(mult, c) for c in const],
+        )
+
+    def _mul(self, a, b):
+        if a.__class__ in native_numeric_types:
+            if b.__class__ in native_numeric_types:
+                return a * b
+            if a == 1:
+                return b
+        elif b.__class__ in native_numeric_types and b == 1:
+            return a
+        return f'({a}) * ({b})'
+
+
+def compile_linear_template(con):
+    """Compile the rule for an IndexedConstraint into a linear template
+
+    Returns a function that, given a constraint index, returns a tuple
+    ``(constant, terms)`` for the body of the corresponding constraint,
+    where `terms` is a list of ``(coefficient, VarData)`` tuples.
+    Returns None if the rule cannot be compiled into a linear template
+    (in which case the constraint bodies should be walked directly).
+
+    """
+    if not con.is_indexed() or con.rule is None or con.rule.contains_indices():
+        return None
+    try:
+        template, indices = templatize_constraint(con)
+        # Normalize the template into lower <= body <= upper using the
+        # same logic used by the constraint data objects
+        body = _GeneralConstraintData(template, None).body
+        gen = _TemplateCodeGenerator(indices)
+        terms, const = gen.linear(body)
+    except Exception:
+        # Any failure (either templatizing the rule or compiling the
+        # template) means we will fall back on walking the expressions
+        return None
+
+    args = ', '.join(gen.names[id(idx)] for idx in indices)
+    if len(indices) == 1:
+        unpack = f'{args} = index'
+    else:
+        unpack = f'{args}, = index'
+    const = ' + '.join(f'({c})' for c in const) or '0'
+    terms = ', '.join(f'({coef}, {var})' for coef, var in terms)
+    src = f"def _instantiate(index):\n    {unpack}\n    return {const}, [{terms}]\n"
+    try:
+        exec(src, gen.namespace)
+    except SyntaxError:  # pragma: no cover
+        logger.warning(f"Error compiling the template for {con.name}:\n{src}")
+        return None
+    return gen.namespace['_instantiate']
+
+
+class LinearTemplateCompiler(object):
+    """Generate LinearRepn objects for constraints using compiled templates
+
+    Constraints whose parent component has a rule that can be compiled
+    into a linear template (see :py:func:`compile_linear_template`) are
+    generated by instantiating the template.  All other constraints are
+    compiled by walking the constraint body with `visitor`.
+
+    Note that this assumes that the expression for each constraint
+    generated by a templatizable rule has not been changed since the
+    constraint was constructed.
+
+    """
+
+    def __init__(self, visitor):
+        self.visitor = visitor
+        self.templates = {}
+
+    def walk_constraint(self, con):
+        comp = con.parent_component()
+        _id = id(comp)
+        if _id in self.templates:
+            template = self.templates[_id][1]
+        else:
+            template = compile_linear_template(comp)
+            # Hold on to the component so the id is not reused
+            self.templates[_id] = comp, template
+        if template is None:
+            return self.visitor.walk_expression(con.body)
+
+        try:
+            const, terms = template(con.index())
+        except Exception:
+            # Errors evaluating the coefficients (e.g., division by
+            # zero) are handled (and reported) by the visitor
+            return self.visitor.walk_expression(con.body)
+        visitor = self.visitor
+        var_map = visitor.var_map
+        var_order = visitor.var_order
+        ans = visitor.Result()
+        linear = ans.linear
+        for coef, var in terms:
+            if not coef:
+                # The visitor does not descend into terms multiplied by 0
+                continue
+            _id = id(var)
+            if _id not in var_map:
+                if var.fixed:
+                    const += coef * var.value
+                    continue
+                var_map[_id] = var
+                var_order[_id] = len(var_order)
+            if _id in linear:
+                linear[_id] += coef
+            else:
+                linear[_id] = coef
+        for _id in [_id for _id, coef in linear.items() if not coef]:
+            del linear[_id]
+        ans.constant = const
+        return ans
@@ -17,7 +17,9 @@ def load():
     import pyomo.repn.plugins.mps
     import pyomo.repn.plugins.gams_writer
     import pyomo.repn.plugins.lp_writer
+    import pyomo.repn.plugins.mps_writer
     import pyomo.repn.plugins.nl_writer
+    import pyomo.repn.plugins.standard_form
 
     from pyomo.opt import WriterFactory
 
@@ -390,6 +390,10 @@ class ProblemWriter_nl(AbstractProblemWriter):
         _column_order = io_options.pop("column_order", True)
         assert _column_order in {True}
 
+        # The SystemCallSolver direct_load option is only supported by
+        # the nl writer v2 (the solver falls back on the symbol map)
+        io_options.pop("_keep_nl_info", None)
+
         if len(io_options):
             raise ValueError(
                 "ProblemWriter_nl passed unrecognized io_options:\n\t"
@@ -17,6 +17,7 @@ from pyomo.common.config import (
     ConfigBlock,
     ConfigValue,
     InEnum,
+    PositiveInt,
     document_kwargs_from_configdict,
 )
 from pyomo.common.gc_manager import PauseGC
@@ -39,11 +40,13 @@ from pyomo.core.base.component import ActiveComponent
 from pyomo.core.base.label import LPFileLabeler, NumericLabeler
 from pyomo.opt import WriterFactory
 from pyomo.repn.linear import LinearRepnVisitor
+from pyomo.repn.linear_template import LinearTemplateCompiler
 from pyomo.repn.quadratic import QuadraticRepnVisitor
 from pyomo.repn.util import (
     FileDeterminism,
     FileDeterminism_to_SortComponents,
     categorize_valid_components,
+    compile_repns_in_parallel,
     initialize_var_map_from_column_order,
     ordered_active_constraints,
 )
@@ -185,6 +188,37 @@ class LPWriter(object):
             description='If True, allow quadratic terms in the model constraints',
         ),
     )
+    CONFIG.declare(
+        'compile_processes',
+        ConfigValue(
+            default=1,
+            domain=PositiveInt,
+            description='Number of processes used to compile constraints',
+            doc="""
+            If greater than 1, the constraint expressions are partitioned
+            into shards that are compiled in parallel by worker processes
+            forked from the current process (on platforms that support
+            'fork').  The results are merged so that the LP file is
+            identical to the file generated by serial compilation.""",
+        ),
+    )
+
+    CONFIG.declare(
+        'use_templates',
+        ConfigValue(
+            default=False,
+            domain=bool,
+            description='Generate indexed constraints from their rule templates',
+            doc="""
+            If True, the writer will attempt to "templatize" the rule for
+            each IndexedConstraint and generate the linear representation
+            of each constraint by instantiating the compiled template
+            (falling back on walking the constraint expression for
+            rules that cannot be templatized).  This assumes that the
+            constraint expressions have not been modified since they
+            were generated by the rule.""",
+        ),
+    )
 
     def __init__(self):
         self.config = self.CONFIG()
@@ -316,6 +350,10 @@ class _LPWriter_impl(object):
             var_map,
             self.var_order,
         )
+        if self.config.use_templates:
+            templates = LinearTemplateCompiler(constraint_visitor)
+        else:
+            templates = None
 
         timer.toc('Initialized column order', level=logging.DEBUG)
 
@@ -378,7 +416,24 @@ class _LPWriter_impl(object):
         skip_trivial_constraints = self.config.skip_trivial_constraints
         have_nontrivial = False
         last_parent = None
-        for con in ordered_active_constraints(model, self.config):
+        all_constraints = ordered_active_constraints(model, self.config)
+        compiled = None
+        if self.config.compile_processes > 1 and templates is None:
+            all_constraints = [
+                con
+                for con in all_constraints
+                if con.lb is not None or con.ub is not None
+            ]
+            compiled = compile_repns_in_parallel(
+                model,
+                constraint_visitor,
+                [con.body for con in all_constraints],
+                self.config.compile_processes,
+            )
+            if compiled is not None:
+                compiled = iter(compiled)
+            timer.toc('Compiled constraints in parallel', level=logging.DEBUG)
+        for con in all_constraints:
             if with_debug_timing and con.parent_component() is not last_parent:
                 timer.toc('Constraint %s', last_parent, level=logging.DEBUG)
                 last_parent = con.parent_component()
@@ -390,7 +445,12 @@ class _LPWriter_impl(object):
                 # slack variable if skip_trivial_constraints is False,
                 # but that seems rather silly.
                 continue
-            repn = constraint_visitor.walk_expression(con.body)
+            if compiled is not None:
+                repn = next(compiled)
+            elif templates is not None:
+                repn = templates.walk_constraint(con)
+            else:
+                repn = constraint_visitor.walk_expression(con.body)
             if repn.nonlinear is not None:
                 raise ValueError(
                     f"Model constraint ({con.name}) contains nonlinear terms that "
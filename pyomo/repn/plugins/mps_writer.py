@@ -0,0 +1,765 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2022
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import logging
+from operator import attrgetter, itemgetter
+
+from pyomo.common.collections import ComponentMap
+from pyomo.common.config import (
+    ConfigBlock,
+    ConfigValue,
+    In,
+    InEnum,
+    document_kwargs_from_configdict,
+)
+from pyomo.common.gc_manager import PauseGC
+from pyomo.common.timing import TicTocTimer
+
+from pyomo.core.base import (
+    Block,
+    Objective,
+    Constraint,
+    Var,
+    Param,
+    Expression,
+    SOSConstraint,
+    Suffix,
+    SymbolMap,
+    minimize,
+)
+from pyomo.core.base.label import NumericLabeler, TextLabeler
+from pyomo.opt import WriterFactory
+from pyomo.repn.linear import LinearRepnVisitor
+from pyomo.repn.linear_template import LinearTemplateCompiler
+from pyomo.repn.quadratic import QuadraticRepnVisitor
+from pyomo.repn.plugins.lp_writer import LPWriterInfo
+from pyomo.repn.util import (
+    FileDeterminism,
+    FileDeterminism_to_SortComponents,
+    categorize_valid_components,
+    initialize_var_map_from_column_order,
+    ordered_active_constraints,
+)
+
+### FIXME: Remove the following as soon as non-active components no
+### longer report active==True
+from pyomo.core.base import Set, RangeSet, ExternalFunction
+from pyomo.network import Port
+
+logger = logging.getLogger(__name__)
+inf = float('inf')
+neg_inf = float('-inf')
+
+# Integer variables are declared through the BOUNDS section (and not
+# with INTORG / INTEND markers), so unbounded integer variables are
+# given these (effectively infinite) bounds
+_integer_neg_inf = '-10E20'
+_integer_inf = '10E20'
+
+
+def _fixed_format_number(val):
+    # Fixed MPS numeric fields are 12 characters wide: use the shortest
+    # round-trip representation if it fits, otherwise reduce the
+    # precision until it does.
+    ans = repr(val)
+    if len(ans) <= 12:
+        return ans
+    for precision in range(12, 0, -1):
+        ans = '%.*g' % (precision, val)
+        if len(ans) <= 12:
+            return ans
+    raise ValueError(f"Cannot represent {val!r} in a fixed-format MPS field")
+
+
+class _FixedFormatRowLabeler(object):
+    """Generate sequential 4-character row ids (e.g., '0001')
+
+    The ids are numbered in base 36 and are appended to the 4-character
+    row type prefixes ('c_e_', 'c_l_', 'c_u_', 'r_l_', 'r_u_') used by
+    the LP writer, which the solver interfaces rely on to map the
+    solution back to the model constraints.
+    """
+
+    _digits = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
+    def __init__(self):
+        self.id = 0
+
+    def __call__(self, obj=None):
+        self.id += 1
+        n = self.id
+        ans = ''
+        while n:
+            n, r = divmod(n, 36)
+            ans = self._digits[r] + ans
+        return ans.rjust(4, '0')
+
+
+class _FixedFormatLabeler(object):
+    """Generate sequential 8-character names (e.g., 'C0000001')"""
+
+    def __init__(self, prefix):
+        self.prefix = prefix
+        self.id = 0
+
+    def __call__(self, obj=None):
+        self.id += 1
+        return '%s%07d' % (self.prefix, self.id)
+
+
+@WriterFactory.register('mps_v2', 'Generate the corresponding MPS file (version 2).')
+class MPSWriter(object):
+    CONFIG = ConfigBlock('mpswriter')
+    CONFIG.declare(
+        'show_section_timing',
+        ConfigValue(
+            default=False,
+            domain=bool,
+            description='Print timing after writing each section of the MPS file',
+        ),
+    )
+    CONFIG.declare(
+        'skip_trivial_constraints',
+        ConfigValue(
+            default=False,
+            domain=bool,
+            description='Skip writing constraints whose body is constant',
+        ),
+    )
+    CONFIG.declare(
+        'file_determinism',
+        ConfigValue(
+            default=FileDeterminism.ORDERED,
+            domain=InEnum(FileDeterminism),
+            description='How much effort to ensure file is deterministic',
+            doc="""
+            How much effort do we want to put into ensuring the
+            MPS file is written deterministically for a Pyomo model:
+                NONE (0) : None
+                ORDERED (10): rely on underlying component ordering (default)
+                SORT_INDICES (20) : sort keys of indexed components
+                SORT_SYMBOLS (30) : sort keys AND sort names (not declaration order)
+            """,
+        ),
+    )
+    CONFIG.declare(
+        'symbolic_solver_labels',
+        ConfigValue(
+            default=False,
+            domain=bool,
+            description='Write variables/constraints using model names',
+            doc="""
+            Export variables and constraints to the MPS file using
+            human-readable text names derived from the corresponding
+            Pyomo component names.
+            """,
+        ),
+    )
+    CONFIG.declare(
+        'row_order',
+        ConfigValue(
+            default=None,
+            description='Preferred constraint ordering',
+            doc="""
+            List of constraints in the order that they should appear in the
+            MPS file.  Unspecified constraints will appear at the end.""",
+        ),
+    )
+    CONFIG.declare(
+        'column_order',
+        ConfigValue(
+            default=None,
+            description='Preferred variable ordering',
+            doc="""
+            List of variables in the order that they should appear in
+            the MPS file.  Unspecified variables will appear at the end
+            (in the order in which they are first encountered in the
+            objective followed by each constraint).""",
+        ),
+    )
+    CONFIG.declare(
+        'labeler',
+        ConfigValue(
+            default=None,
+            description='Callable to use to generate symbol names in MPS file',
+        ),
+    )
+    CONFIG.declare(
+        'mps_format',
+        ConfigValue(
+            default='free',
+            domain=In(['free', 'fixed']),
+            description='Write the file in "free" or "fixed" MPS format',
+            doc="""
+            Fixed MPS files place each field in fixed character columns,
+            limiting row and column names to 8 characters and numbers to
+            12 characters.  Unless symbolic_solver_labels or a labeler
+            is specified, the writer generates compact 8-character row
+            (e.g., ``c_l_0001``), column (``C0000001``), and SOS
+            (``S0000001``) names.  Row names keep the row type prefixes
+            used by the solver interfaces followed by a base-36 row
+            number, which limits the model to 1679615 rows.  A
+            ValueError is raised if a name generated for the model does
+            not fit in a fixed MPS field.""",
+        ),
+    )
+    CONFIG.declare(
+        'skip_objective_sense',
+        ConfigValue(
+            default=False,
+            domain=bool,
+            description='Omit the OBJSENSE section',
+            doc="""
+            Omit the OBJSENSE section (which is not supported by all
+            MPS readers).  Note that MPS readers assume minimization if
+            the objective sense is not specified.""",
+        ),
+    )
+    CONFIG.declare(
+        'allow_quadratic_objective',
+        ConfigValue(
+            default=True,
+            domain=bool,
+            description='If True, allow quadratic terms in the model objective',
+        ),
+    )
+    CONFIG.declare(
+        'allow_quadratic_constraint',
+        ConfigValue(
+            default=True,
+            domain=bool,
+            description='If True, allow quadratic terms in the model constraints',
+        ),
+    )
+
+    CONFIG.declare(
+        'use_templates',
+        ConfigValue(
+            default=False,
+            domain=bool,
+            description='Generate indexed constraints from their rule templates',
+            doc="""
+            If True, the writer will attempt to "templatize" the rule for
+            each IndexedConstraint and generate the linear representation
+            of each constraint by instantiating the compiled template
+            (falling back on walking the constraint expression for
+            rules that cannot be templatized).  This assumes that the
+            constraint expressions have not been modified since they
+            were generated by the rule.""",
+        ),
+    )
+
+    def __init__(self):
+        self.config = self.CONFIG()
+
+    def __call__(self, model, filename, solver_capability, io_options):
+        if filename is None:
+            filename = model.name + ".mps"
+
+        # Duplicate io_options to avoid side-effects
+        io_options = dict(io_options)
+        # Map old solver capabilities to new writer options
+        qp = solver_capability('quadratic_objective')
+        if 'allow_quadratic_objective' not in io_options:
+            io_options['allow_quadratic_objective'] = qp
+        qc = solver_capability('quadratic_constraint')
+        if 'allow_quadratic_constraint' not in io_options:
+            io_options['allow_quadratic_constraint'] = qc
+
+        with open(filename, 'w', newline='') as FILE:
+            info = self.write(model, FILE, **io_options)
+        return filename, info.symbol_map
+
+    @document_kwargs_from_configdict(CONFIG)
+    def write(self, model, ostream, **options):
+        """Write a model in MPS format.
+
+        Returns
+        -------
+        LPWriterInfo
+
+        Parameters
+        ----------
+        model: ConcreteModel
+            The concrete Pyomo model to write out.
+
+        ostream: io.TextIOBase
+            The text output stream where the MPS "file" will be written.
+            Could be an opened file or a io.StringIO.
+
+        """
+        config = self.config(options)
+
+        # Pause the GC, as the walker that generates the compiled MPS
+        # representation generates (and disposes of) a large number of
+        # small objects.
+        with PauseGC():
+            return _MPSWriter_impl(ostream, config).write(model)
+
+
+class _MPSWriter_impl(object):
+    def __init__(self, ostream, config):
+        self.ostream = ostream
+        self.config = config
+        self.symbol_map = None
+        self.row_labeler = None
+        self.sos_labeler = None
+        if config.mps_format == 'fixed':
+            self.entry_template = "    {:<8}  {:<8}  {:>12}\n"
+            self.bound_template = " {:<2} {:<8}  {:<8}  {:>12}\n"
+            self.free_bound_template = " {:<2} {:<8}  {}\n"
+            self.sos_template = "    {:<8}  {:>12}\n"
+            self.format_number = _fixed_format_number
+        else:
+            self.entry_template = "    {} {} {}\n"
+            self.bound_template = " {} {} {} {}\n"
+            self.free_bound_template = " {} {} {}\n"
+            self.sos_template = "    {} {}\n"
+            self.format_number = repr
+
+    def write(self, model):
+        timing_logger = logging.getLogger('pyomo.common.timing.writer')
+        timer = TicTocTimer(logger=timing_logger)
+        with_debug_timing = (
+            timing_logger.isEnabledFor(logging.DEBUG) and timing_logger.hasHandlers()
+        )
+
+        labeler = self.config.labeler
+        if labeler is None:
+            if self.config.symbolic_solver_labels:
+                labeler = TextLabeler()
+            elif self.config.mps_format == 'fixed':
+                # The prefixed numeric labels (e.g., 'c_l_x123_') quickly
+                # overflow the 8-character fixed MPS fields: generate
+                # compact row, column, and SOS names.  The symbol map
+                # still maps the names back to the model components.
+                labeler = _FixedFormatLabeler('C')
+                self.row_labeler = _FixedFormatRowLabeler()
+                self.sos_labeler = _FixedFormatLabeler('S')
+            else:
+                labeler = NumericLabeler('x')
+        row_labeler = self.row_labeler
+        self.symbol_map = SymbolMap(labeler)
+        addSymbol = self.symbol_map.addSymbol
+        aliasSymbol = self.symbol_map.alias
+        getSymbol = self.symbol_map.getSymbol
+
+        sorter = FileDeterminism_to_SortComponents(self.config.file_determinism)
+        component_map, unknown = categorize_valid_components(
+            model,
+            active=True,
+            sort=sorter,
+            valid={
+                Block,
+                Constraint,
+                Var,
+                Param,
+                Expression,
+                # FIXME: Non-active components should not report as Active
+                ExternalFunction,
+                Set,
+                RangeSet,
+                Port,
+                # TODO: Piecewise, Complementarity
+            },
+            targets={Suffix, SOSConstraint, Objective},
+        )
+        if unknown:
+            raise ValueError(
+                "The model ('%s') contains the following active components "
+                "that the MPS writer does not know how to process:\n\t%s"
+                % (
+                    model.name,
+                    "\n\t".join(
+                        "%s:\n\t\t%s" % (k, "\n\t\t".join(map(attrgetter('name'), v)))
+                        for k, v in unknown.items()
+                    ),
+                )
+            )
+
+        ONE_VAR_CONSTANT = Var(name='ONE_VAR_CONSTANT', bounds=(1, 1))
+        ONE_VAR_CONSTANT.construct()
+
+        self.var_map = var_map = {id(ONE_VAR_CONSTANT): ONE_VAR_CONSTANT}
+        initialize_var_map_from_column_order(model, self.config, var_map)
+        self.var_order = var_order = {_id: i for i, _id in enumerate(var_map)}
+
+        _qp = self.config.allow_quadratic_objective
+        _qc = self.config.allow_quadratic_constraint
+        objective_visitor = (QuadraticRepnVisitor if _qp else LinearRepnVisitor)(
+            {}, var_map, var_order
+        )
+        constraint_visitor = (QuadraticRepnVisitor if _qc else LinearRepnVisitor)(
+            objective_visitor.subexpression_cache if _qp == _qc else {},
+            var_map,
+            var_order,
+        )
+        if self.config.use_templates:
+            templates = LinearTemplateCompiler(constraint_visitor)
+        else:
+            templates = None
+
+        timer.toc('Initialized column order', level=logging.DEBUG)
+
+        # MPS is a column-major format: we will collect the rows (as
+        # (type, label, rhs) tuples) and the sparse columns (as lists of
+        # (row label, coef) tuples, keyed by variable id) before writing
+        # anything to the file.
+        rows = []
+        columns = {}
+        quadratic_rows = []
+
+        def _add_row(row_type, label, repn, rhs):
+            rows.append((row_type, label, rhs))
+            for vid, coef in repn.linear.items():
+                if vid in columns:
+                    columns[vid].append((label, coef))
+                else:
+                    columns[vid] = [(label, coef)]
+            quadratic = getattr(repn, 'quadratic', None)
+            if quadratic:
+                quadratic_rows.append((label, quadratic))
+
+        #
+        # Process objective
+        #
+        if not component_map[Objective]:
+            objectives = [Objective(expr=1)]
+            objectives[0].construct()
+        else:
+            objectives = []
+            for blk in component_map[Objective]:
+                objectives.extend(
+                    blk.component_data_objects(
+                        Objective, active=True, descend_into=False, sort=sorter
+                    )
+                )
+        if len(objectives) > 1:
+            raise ValueError(
+                "More than one active objective defined for input model '%s'; "
+                "Cannot write legal MPS file\nObjectives: %s"
+                % (model.name, ' '.join(obj.name for obj in objectives))
+            )
+
+        obj = objectives[0]
+        if row_labeler is None:
+            obj_label = getSymbol(obj, labeler)
+        else:
+            obj_label = getSymbol(obj, lambda obj: 'obj_' + row_labeler())
+        aliasSymbol(obj, '__default_objective__')
+        repn = objective_visitor.walk_expression(obj.expr)
+        if repn.nonlinear is not None:
+            raise ValueError(
+                f"Model objective ({obj.name}) contains nonlinear terms that "
+                "cannot be written to MPS format"
+            )
+        if repn.constant or not (repn.linear or getattr(repn, 'quadratic', None)):
+            # As with the LP writer, we move the objective constant
+            # (and guarantee that the objective is not empty) using a
+            # "variable" constrained to the value 1.
+            repn.linear[id(ONE_VAR_CONSTANT)] = repn.constant
+            repn.constant = 0
+        _add_row('N', obj_label, repn, None)
+        objective_quadratic = quadratic_rows.pop()[1] if quadratic_rows else None
+        if with_debug_timing:
+            timer.toc('Objective %s', obj, level=logging.DEBUG)
+
+        #
+        # Tabulate constraints
+        #
+        skip_trivial_constraints = self.config.skip_trivial_constraints
+        have_nontrivial = False
+        last_parent = None
+        for con in ordered_active_constraints(model, self.config):
+            if with_debug_timing and con.parent_component() is not last_parent:
+                timer.toc('Constraint %s', last_parent, level=logging.DEBUG)
+                last_parent = con.parent_component()
+            lb = con.lb
+            ub = con.ub
+            if lb is None and ub is None:
+                # Skip trivial (unbounded) constraints (for consistency
+                # with the LP writer)
+                continue
+            if templates is None:
+                repn = constraint_visitor.walk_expression(con.body)
+            else:
+                repn = templates.walk_constraint(con)
+            if repn.nonlinear is not None:
+                raise ValueError(
+                    f"Model constraint ({con.name}) contains nonlinear terms that "
+                    "cannot be written to MPS format"
+                )
+
+            # Pull out the constant: we will move it to the bounds
+            offset = repn.constant
+            repn.constant = 0
+
+            if repn.linear or getattr(repn, 'quadratic', None):
+                have_nontrivial = True
+            else:
+                if (
+                    skip_trivial_constraints
+                    and (lb is None or lb <= offset)
+                    and (ub is None or ub >= offset)
+                ):
+                    continue
+                # This is a trivially infeasible model.  As with the LP
+                # writer, defer to the solver (adding a dummy fixed
+                # variable so the row is not empty).
+                repn.linear[id(ONE_VAR_CONSTANT)] = 0
+
+            # Range constraints are written as two rows (and not using
+            # the RANGES section) so that the row labels are consistent
+            # with the LP writer (the solver interfaces rely on the
+            # c_e_ / c_l_ / c_u_ / r_l_ / r_u_ prefixes)
+            if row_labeler is None:
+                symbol = labeler(con)
+                row_label = lambda prefix: f'{prefix}{symbol}_'
+            else:
+                symbol = row_labeler(con)
+                row_label = lambda prefix: prefix + symbol
+            if lb == ub and lb is not None:
+                label = row_label('c_e_')
+                addSymbol(con, label)
+                _add_row('E', label, repn, lb - offset)
+            elif lb is not None and lb != neg_inf:
+                if ub is not None and ub != inf:
+                    label = row_label('r_l_')
+                    addSymbol(con, label)
+                    _add_row('G', label, repn, lb - offset)
+                    label = row_label('r_u_')
+                    aliasSymbol(con, label)
+                    _add_row('L', label, repn, ub - offset)
+                else:
+                    label = row_label('c_l_')
+                    addSymbol(con, label)
+                    _add_row('G', label, repn, lb - offset)
+            elif ub is not None and ub != inf:
+                label = row_label('c_u_')
+                addSymbol(con, label)
+                _add_row('L', label, repn, ub - offset)
+
+        if with_debug_timing:
+            # report the last constraint
+            timer.toc('Constraint %s', last_parent, level=logging.DEBUG)
+        if not have_nontrivial:
+            # Mirror the LP writer and add a dummy constraint for
+            # solvers that cannot handle models without constraints
+            repn = constraint_visitor.Result()
+            repn.linear[id(ONE_VAR_CONSTANT)] = 1
+            _add_row(
+                'E',
+                'c_e_ONE_VAR_CONSTANT'
+                if row_labeler is None
+                else 'c_e_' + row_labeler(),
+                repn,
+                1,
+            )
+
+        # Every column must appear in the COLUMNS section: add an
+        # explicit 0 objective coefficient for any variables that only
+        # appear in quadratic terms
+        for quadratic in filter(
+            None, (objective_quadratic, *map(itemgetter(1), quadratic_rows))
+        ):
+            for vids in quadratic:
+                for vid in vids:
+                    if vid not in columns:
+                        columns[vid] = [(obj_label, 0)]
+
+        #
+        # Tabulate SOS constraints
+        #
+        sos = []
+        if component_map[SOSConstraint]:
+            for blk in component_map[SOSConstraint]:
+                sos.extend(
+                    blk.component_data_objects(
+                        SOSConstraint, active=True, descend_into=False, sort=sorter
+                    )
+                )
+            row_order = self.config.row_order
+            if row_order:
+                if not isinstance(row_order, ComponentMap):
+                    row_order = ComponentMap((c, i) for i, c in enumerate(row_order))
+                # sort() is stable (per Python docs), so we can let
+                # all unspecified rows have a row number one bigger than
+                # the number of rows specified by the user ordering.
+                _n = len(row_order)
+                sos.sort(key=lambda x: row_order.get(x, _n))
+            for soscon in sos:
+                for v, w in getattr(soscon, 'get_items', soscon.items)():
+                    vid = id(v)
+                    if vid not in columns:
+                        # (see above)
+                        columns[vid] = [(obj_label, 0)]
+                    if vid not in var_map:
+                        var_map[vid] = v
+                        var_order[vid] = len(var_order)
+
+        timer.toc('Tabulated rows and columns', level=logging.DEBUG)
+
+        #
+        # Generate the column labels (in column order)
+        #
+        column_labels = {}
+        for vid, v in var_map.items():
+            # Some variables in the var_map may not actually appear in
+            # the MPS file (e.g., added from col_order, or multiplied by
+            # 0 in the expressions).
+            if vid in columns:
+                column_labels[vid] = getSymbol(v, labeler)
+        if self.config.mps_format == 'fixed':
+            for label in self.symbol_map.bySymbol:
+                if len(label) > 8:
+                    raise ValueError(
+                        f"Cannot write fixed-format MPS file: the label '{label}' "
+                        "is longer than 8 characters.  Consider providing a "
+                        "labeler that generates shorter names or writing the "
+                        "model using mps_format='free'"
+                    )
+
+        self._write_file(
+            model,
+            obj,
+            rows,
+            columns,
+            column_labels,
+            objective_quadratic,
+            quadratic_rows,
+            sos,
+        )
+
+        info = LPWriterInfo(self.symbol_map)
+        timer.toc("Generated MPS representation", delta=False)
+        return info
+
+    def _write_file(
+        self,
+        model,
+        obj,
+        rows,
+        columns,
+        column_labels,
+        objective_quadratic,
+        quadratic_rows,
+        sos,
+    ):
+        ostream = self.ostream
+        entry = self.entry_template.format
+        bound = self.bound_template.format
+        free_bound = self.free_bound_template.format
+        sos_entry = self.sos_template.format
+        fmt = self.format_number
+        getSymbol = self.symbol_map.getSymbol
+        var_map = self.var_map
+
+        ostream.write("* Source:     Pyomo MPS Writer\n")
+        ostream.write(f"* Format:     {self.config.mps_format.capitalize()} MPS\n")
+        ostream.write("*\n")
+        ostream.write(f"NAME          {model.name}\n")
+        if not self.config.skip_objective_sense:
+            ostream.write(
+                "OBJSENSE\n    MIN\n"
+                if obj.sense == minimize
+                else "OBJSENSE\n    MAX\n"
+            )
+
+        ostream.write("ROWS\n")
+        ostream.write(''.join(f" {row_type}  {label}\n" for row_type, label, _ in rows))
+
+        ostream.write("COLUMNS\n")
+        for vid, label in column_labels.items():
+            ostream.write(
+                ''.join(entry(label, row, fmt(coef)) for row, coef in columns[vid])
+            )
+
+        ostream.write("RHS\n")
+        for row_type, label, rhs in rows:
+            if rhs:
+                ostream.write(entry('RHS', label, fmt(rhs)))
+
+        ostream.write("BOUNDS\n")
+        for vid, v_label in column_labels.items():
+            v = var_map[vid]
+            lb, ub = v.bounds
+            if lb == neg_inf:
+                lb = None
+            if ub == inf:
+                ub = None
+            if v.is_binary() and lb == 0 and ub == 1:
+                ostream.write(free_bound('BV', 'BOUND', v_label))
+            elif v.is_integer():
+                # Integer variables are identified through the LI / UI
+                # bound types
+                lb = _integer_neg_inf if lb is None else fmt(lb)
+                ub = _integer_inf if ub is None else fmt(ub)
+                ostream.write(bound('LI', 'BOUND', v_label, lb))
+                ostream.write(bound('UI', 'BOUND', v_label, ub))
+            elif lb is not None and lb == ub:
+                ostream.write(bound('FX', 'BOUND', v_label, fmt(lb)))
+            elif lb is None and ub is None:
+                ostream.write(free_bound('FR', 'BOUND', v_label))
+            else:
+                if lb is None:
+                    ostream.write(free_bound('MI', 'BOUND', v_label))
+                else:
+                    ostream.write(bound('LO', 'BOUND', v_label, fmt(lb)))
+                if ub is not None:
+                    ostream.write(bound('UP', 'BOUND', v_label, fmt(ub)))
+
+        if sos:
+            ostream.write("SOS\n")
+            for soscon in sos:
+                ostream.write(
+                    f" S{soscon.level} SOS {getSymbol(soscon, self.sos_labeler)}\n"
+                )
+                for v, w in getattr(soscon, 'get_items', soscon.items)():
+                    ostream.write(sos_entry(column_labels[id(v)], fmt(w)))
+
+        # The objective Hessian is specified (by convention) as
+        # 0.5 x'Qx, listing only the upper triangle of Q.  The
+        # constraint Hessians (QCMATRIX) are specified as x'Qx, listing
+        # the full (symmetric) Q matrix.
+        if objective_quadratic:
+            ostream.write("QUADOBJ\n")
+            for (vid1, vid2), coef in self._sorted_quadratic(objective_quadratic):
+                if vid1 == vid2:
+                    coef *= 2
+                ostream.write(
+                    entry(column_labels[vid1], column_labels[vid2], fmt(coef))
+                )
+
+        for label, quadratic in quadratic_rows:
+            ostream.write(f"QCMATRIX    {label}\n")
+            for (vid1, vid2), coef in self._sorted_quadratic(quadratic):
+                lbl1 = column_labels[vid1]
+                lbl2 = column_labels[vid2]
+                if vid1 == vid2:
+                    ostream.write(entry(lbl1, lbl2, fmt(coef)))
+                else:
+                    coef = fmt(coef / 2)
+                    ostream.write(entry(lbl1, lbl2, coef))
+                    ostream.write(entry(lbl2, lbl1, coef))
+
+        ostream.write("ENDATA\n")
+
+    def _sorted_quadratic(self, quadratic):
+        # Return the quadratic terms (with the variables in each term
+        # in column order) sorted by column order
+        getVarOrder = self.var_order.__getitem__
+        terms = []
+        for (vid1, vid2), coef in quadratic.items():
+            if getVarOrder(vid2) < getVarOrder(vid1):
+                vid1, vid2 = vid2, vid1
+            terms.append(((getVarOrder(vid1), getVarOrder(vid2)), (vid1, vid2), coef))
+        terms.sort(key=itemgetter(0))
+        return [term[1:] for term in terms]
@@ -11,18 +11,21 @@
 
 import logging
 import os
-from collections import deque
+from collections import deque, defaultdict, namedtuple
+from math import log10 as _log10
 from operator import itemgetter, attrgetter, setitem
 
 from pyomo.common.backports import nullcontext
+from pyomo.common.collections import ComponentMap
 from pyomo.common.config import (
     ConfigBlock,
     ConfigValue,
     InEnum,
+    PositiveInt,
     document_kwargs_from_configdict,
 )
 from pyomo.common.deprecation import deprecation_warning
-from pyomo.common.errors import DeveloperError
+from pyomo.common.errors import DeveloperError, InfeasibleConstraintException
 from pyomo.common.gc_manager import PauseGC
 from pyomo.common.timing import TicTocTimer
 
@@ -43,9 +46,14 @@ from pyomo.core.expr.current import (
     ExternalFunctionExpression,
     native_types,
     native_numeric_types,
+    nonpyomo_leaf_types,
     value,
 )
-from pyomo.core.expr.visitor import StreamBasedExpressionVisitor, _EvaluationVisitor
+from pyomo.core.expr.visitor import (
+    StreamBasedExpressionVisitor,
+    SimpleExpressionVisitor,
+    _EvaluationVisitor,
+)
 from pyomo.core.base import (
     Block,
     Objective,
@@ -74,11 +82,13 @@ from pyomo.repn.util import (
     FileDeterminism_to_SortComponents,
     apply_node_operation,
     categorize_valid_components,
+    compile_repns_in_parallel,
     complex_number_error,
     initialize_var_map_from_column_order,
     ordered_active_constraints,
 )
 from pyomo.repn.plugins.ampl.ampl_ import set_pyomo_amplfunc_env
+from pyomo.repn.standard_repn import generate_standard_repn
 
 ### FIXME: Remove the following as soon as non-active components no
 ### longer report active==True
@@ -99,6 +109,10 @@ _CONSTANT = ExprType.CONSTANT
 _MONOMIAL = ExprType.MONOMIAL
 _GENERAL = ExprType.GENERAL
 
+ScalingFactors = namedtuple(
+    'ScalingFactors', ['variables', 'constraints', 'objectives']
+)
+
 
 # TODO: make a proper base class
 class NLWriterInfo(object):
@@ -139,15 +153,114 @@ class NLWriterInfo(object):
         file in the same order as the :py:attr:`variables` and generated
         .col file.
 
+    eliminated_vars: List[Tuple[_VarData, NumericExpression]]
+
+        The list of variables in the model that were eliminated by the
+        linear presolve.  Each entry is a 2-tuple of
+        (:py:class:`_VarData`, :py:class:`NumericExpression` | `float`).
+        The expressions only reference variables that were written to
+        the NL file, so after loading a solution the values of the
+        eliminated variables can be recovered by evaluating each
+        expression.
+
+    scaling: ScalingFactors or None
+
+        namedtuple holding 3 lists of (variables, constraints,
+        objectives) scaling factors in the same order (and size) as the
+        :py:attr:`variables`, :py:attr:`constraints`, and
+        :py:attr:`objectives` attributes above.  None if the model was
+        not scaled.  Values returned by the solver are in the scaled
+        space: primal values are recovered by dividing by the variable
+        scaling factor, and constraint duals by multiplying by the
+        constraint scaling factor (and dividing by the objective scaling
+        factor).
+
     """
 
-    def __init__(self, var, con, obj, extlib, row_lbl, col_lbl):
+    def __init__(
+        self,
+        var,
+        con,
+        obj,
+        extlib,
+        row_lbl,
+        col_lbl,
+        eliminated_vars=None,
+        scaling=None,
+    ):
         self.variables = var
         self.constraints = con
         self.objectives = obj
         self.external_function_libraries = extlib
         self.row_labels = row_lbl
         self.column_labels = col_lbl
+        self.eliminated_vars = [] if eliminated_vars is None else eliminated_vars
+        self.scaling = scaling
+
+    def load_vars(self, primals):
+        """Load the variable values returned by the solver into the model
+
+        The values are unscaled (if the model was scaled) and the values
+        of any variables eliminated by the presolve are recovered.
+
+        Parameters
+        ----------
+        primals: numpy.ndarray | array.array | List[float]
+
+            The variable values in the order of :py:attr:`variables`
+            (e.g., :py:attr:`pyomo.opt.plugins.sol.SolFileData.primals`)
+
+        """
+        if len(primals) != len(self.variables):
+            raise ValueError(
+                "Expected %s primal values, but received %s"
+                % (len(self.variables), len(primals))
+            )
+        if hasattr(primals, 'tolist'):
+            primals = primals.tolist()
+        if self.scaling is not None:
+            primals = [
+                val / scale for val, scale in zip(primals, self.scaling.variables)
+            ]
+        for var_info, val in zip(self.variables, primals):
+            var_info[0].set_value(val, skip_validation=True)
+        for var, expr in self.eliminated_vars:
+            var.set_value(value(expr), skip_validation=True)
+
+    def get_duals(self, duals):
+        """Map the constraint duals returned by the solver to the model
+        constraints
+
+        Parameters
+        ----------
+        duals: numpy.ndarray | array.array | List[float]
+
+            The constraint duals in the order of :py:attr:`constraints`
+            (e.g., :py:attr:`pyomo.opt.plugins.sol.SolFileData.duals`)
+
+        Returns
+        -------
+        ComponentMap
+
+            Map of constraint to the (unscaled) dual value
+
+        """
+        if len(duals) != len(self.constraints):
+            raise ValueError(
+                "Expected %s dual values, but received %s"
+                % (len(self.constraints), len(duals))
+            )
+        if hasattr(duals, 'tolist'):
+            duals = duals.tolist()
+        if self.scaling is not None:
+            obj_scale = self.scaling.objectives[0] if self.scaling.objectives else 1
+            duals = [
+                val * scale / obj_scale
+                for val, scale in zip(duals, self.scaling.constraints)
+            ]
+        return ComponentMap(
+            (con_info[0], val) for con_info, val in zip(self.constraints, duals)
+        )
 
 
 @WriterFactory.register('nl_v2', 'Generate the corresponding AMPL NL file (version 2).')
@@ -244,6 +357,74 @@ class NLWriter(object):
         variables'.""",
         ),
     )
+    CONFIG.declare(
+        'detect_common_subexpressions',
+        ConfigValue(
+            default=False,
+            domain=bool,
+            description='Export repeated subexpressions as defined variables',
+            doc="""
+        If True, the writer will identify structurally identical
+        nonlinear subexpressions that appear more than once in the
+        model's objectives and constraints (by hash-consing the
+        expression trees) and export them to the NL file as shared
+        'defined variables' (V lines).  This reduces the size of the NL
+        file and the number of function evaluations performed by the
+        solver.  Ignored if export_defined_variables is False.""",
+        ),
+    )
+    CONFIG.declare(
+        'compile_processes',
+        ConfigValue(
+            default=1,
+            domain=PositiveInt,
+            description='Number of processes used to compile constraints',
+            doc="""
+        If greater than 1, the constraint expressions are partitioned
+        into shards that are compiled in parallel by worker processes
+        forked from the current process (on platforms that support
+        'fork').  The results are merged so that the NL file is
+        identical to the file generated by serial compilation.  Models
+        that use named Expressions or ExternalFunctions are compiled
+        serially.""",
+        ),
+    )
+    CONFIG.declare(
+        'linear_presolve',
+        ConfigValue(
+            default=False,
+            domain=bool,
+            description='Perform linear presolve',
+            doc="""
+        If True, we will perform a basic linear presolve by performing
+        variable elimination (without fill-in): variables fixed by their
+        bounds, variables fixed by linear equality constraints with a
+        single variable (singletons), and variables defined by linear
+        equality constraints with two variables (doubletons) are
+        substituted out of the problem.  The eliminated variables (and
+        the expressions needed to recover their values) are returned in
+        :py:attr:`NLWriterInfo.eliminated_vars`.  Only continuous
+        variables that appear linearly (and do not appear in named
+        Expressions, SOS constraints, or complementarity conditions) are
+        eliminated.""",
+        ),
+    )
+    CONFIG.declare(
+        'scale_model',
+        ConfigValue(
+            default=False,
+            domain=bool,
+            description="Write variables and constraints in scaled space",
+            doc="""
+        If True, then the writer will output the model constraints and
+        variables in 'scaled space' using the scaling from the
+        'scaling_factor' Suffix, if provided.  The model is not modified
+        (or cloned): the scaling factors are applied as the linear
+        coefficients and nonlinear expressions are emitted, and are
+        returned in :py:attr:`NLWriterInfo.scaling` so that the solution
+        can be unscaled.""",
+        ),
+    )
 
     def __init__(self):
         self.config = self.CONFIG()
@@ -255,7 +436,22 @@ class NLWriter(object):
         row_fname = filename_base + '.row'
         col_fname = filename_base + '.col'
 
+        # The SystemCallSolver `direct_load` option requests the writer
+        # info (through this private option) so that it can map the
+        # solution values back to the model by position
+        io_options = dict(io_options)
+        keep_info = io_options.pop('_keep_nl_info', False)
         config = self.config(io_options)
+
+        # There is no (convenient) way to pass the information about
+        # presolved variables back to the solver through the old "call"
+        # interface (the symbol map only knows about variables that were
+        # written to the NL file), nor the scaling factors.  We will play
+        # it safe and disable presolve / scaling when called through this
+        # interface.
+        config.linear_presolve = False
+        config.scale_model = False
+
         if config.symbolic_solver_labels:
             _open = lambda fname: open(fname, 'w')
         else:
@@ -270,6 +466,8 @@ class NLWriter(object):
         set_pyomo_amplfunc_env(info.external_function_libraries)
         # Generate the symbol map expected by the old readers
         symbol_map = self._generate_symbol_map(info)
+        if keep_info:
+            symbol_map.nl_info = info
         # The ProblemWriter callable interface returns the filename that
         # was generated and the symbol_map
         return filename, symbol_map
@@ -324,6 +522,214 @@ class NLWriter(object):
         return symbol_map
 
 
+class PersistentNLWriter(NLWriter):
+    """An NL writer that reuses compiled expressions across writes
+
+    This writer caches the compiled representation of every
+    constraint / objective expression (keyed on the component and the
+    identity of its expression).  Subsequent calls to :py:meth:`write`
+    only re-walk expressions that were replaced, or that reference
+    mutable Params or fixed Vars whose values have changed (or Vars
+    whose fixed status has changed) since the previous write.  For
+    linear expressions, new mutable Param / fixed Var values only
+    re-evaluate the cached (parametric) coefficients and constant; the
+    expression is re-walked only if the set of nonzero coefficients
+    changes.  This is intended for workflows (e.g., rolling horizon
+    loops) that repeatedly write the same model with minor changes.
+
+    Expressions that reference named Expressions or ExternalFunctions
+    are always re-walked.
+
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._repn_cache = {}
+
+    @document_kwargs_from_configdict(NLWriter.CONFIG)
+    def write(self, model, ostream, rowstream=None, colstream=None, **options):
+        """Write a model in NL format, reusing previously compiled expressions
+
+        See :py:meth:`NLWriter.write`.
+
+        """
+        config = options.pop('config', self.config)(options)
+        with _NLWriter_impl(
+            ostream, rowstream, colstream, config, self._repn_cache
+        ) as impl:
+            info = impl.write(model)
+        # Only retain the expressions that were part of this model
+        self._repn_cache = impl.next_repn_cache
+        return info
+
+    def reset(self):
+        """Discard all cached compiled expressions"""
+        self._repn_cache = {}
+
+
+class _RepnDependencyVisitor(SimpleExpressionVisitor):
+    """Collect the (mutable) leaves that a compiled AMPLRepn depends on
+
+    Records the fixed Vars and mutable Params (along with their current
+    values) that were folded into constants by the AMPLRepnVisitor.
+    Sets `cacheable` to False if the expression contains named
+    subexpressions or external functions (which generate writer state
+    beyond the compiled AMPLRepn).
+
+    """
+
+    def __init__(self):
+        self.seen = set()
+        self.fixed_vars = []
+        self.params = []
+        self.cacheable = True
+
+    def visit(self, node):
+        if node.__class__ in nonpyomo_leaf_types:
+            return
+        if node.is_expression_type():
+            if node.is_named_expression_type() or isinstance(
+                node, ExternalFunctionExpression
+            ):
+                self.cacheable = False
+            return
+        _id = id(node)
+        if _id in self.seen:
+            return
+        self.seen.add(_id)
+        if node.is_variable_type():
+            if node.fixed:
+                self.fixed_vars.append((node, node.value))
+        elif not node.is_constant():
+            self.params.append((node, node.value))
+
+    def collect(self, expr):
+        if expr.__class__ in nonpyomo_leaf_types:
+            pass
+        elif expr.is_expression_type():
+            if expr.is_named_expression_type():
+                self.cacheable = False
+            else:
+                self.xbfs(expr)
+        else:
+            self.visit(expr)
+        return self.cacheable
+
+
+def _parametric_linear_terms(expr):
+    """Return the constant and linear coefficients of a linear
+    expression as expressions of its fixed Vars and mutable Params
+
+    Returns a tuple (constant, [(id(var), coefficient), ...]), or None
+    if the expression is not linear in the free variables.
+
+    """
+    repn = generate_standard_repn(expr, compute_values=False, quadratic=False)
+    if repn.nonlinear_expr is not None or repn.quadratic_vars:
+        return None
+    return repn.constant, [
+        (id(v), coef) for v, coef in zip(repn.linear_vars, repn.linear_coefs)
+    ]
+
+
+# Expression types that always generate linear AMPLRepn objects (and
+# are therefore never exported as common subexpressions)
+_linear_expression_types = {MonomialTermExpression, LinearExpression}
+
+
+class _CommonSubexpressionCollector(StreamBasedExpressionVisitor):
+    """Identify repeated subexpressions by hash-consing expression trees
+
+    Each expression node is mapped to an integer that uniquely
+    identifies its structure: the node type, the operator name, and the
+    identifiers of its arguments.  Leaves (Vars, named Expressions, and
+    external functions) are identified by their id(); constants and
+    fixed (non-variable) subexpressions are identified by their value.
+
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.keys = {}
+        # For each structure: the expression nodes with that structure
+        self.occurrences = []
+        # For each structure: the structure ids of its arguments
+        self.arguments = []
+        # The number of times each structure appears as a root
+        self.roots = defaultdict(int)
+
+    def collect(self, expr):
+        ans = self.walk_expression(expr)
+        if ans.__class__ is int:
+            self.roots[ans] += 1
+
+    def initializeWalker(self, expr):
+        walk, result = self.beforeChild(None, expr, 0)
+        if not walk:
+            return False, result
+        return True, expr
+
+    def beforeChild(self, node, child, child_idx):
+        if child.__class__ in nonpyomo_leaf_types:
+            return False, (child.__class__, child)
+        if (
+            not child.is_expression_type()
+            or child.is_named_expression_type()
+            or isinstance(child, ExternalFunctionExpression)
+        ):
+            return False, (None, id(child))
+        if not child.is_potentially_variable():
+            try:
+                return False, (float, value(child))
+            except Exception:
+                return False, (None, id(child))
+        return True, None
+
+    def exitNode(self, node, data):
+        key = (node.__class__, node.getname(), getattr(node, 'strict', None), *data)
+        ans = self.keys.get(key, None)
+        if ans is None:
+            ans = self.keys[key] = len(self.occurrences)
+            self.occurrences.append([node])
+            self.arguments.append([arg for arg in data if arg.__class__ is int])
+        else:
+            self.occurrences[ans].append(node)
+        return ans
+
+    def common_subexpressions(self):
+        """Return a dict mapping the id() of repeated subexpressions to a
+        :py:class:`CommonSubexpression` shared by all occurrences
+
+        Subexpressions are only reported if they will be compiled more
+        than once (i.e., subexpressions that only appear within a single
+        repeated subexpression are not reported).  As the structure ids
+        are assigned in postorder, we can determine how many times each
+        structure will be compiled by processing them in reverse order.
+
+        """
+        ans = {}
+        found = []
+        n_compiled = [0] * len(self.occurrences)
+        for _id, n in self.roots.items():
+            n_compiled[_id] = n
+        for _id in reversed(range(len(self.occurrences))):
+            n = n_compiled[_id]
+            nodes = self.occurrences[_id]
+            if n > 1 and nodes[0].__class__ not in _linear_expression_types:
+                cse = CommonSubexpression(nodes)
+                found.append(cse)
+                for node in nodes:
+                    ans[id(node)] = cse
+                # The arguments are only compiled for the first occurrence
+                n = 1
+            for arg in self.arguments[_id]:
+                n_compiled[arg] += n
+        # Number the subexpressions in the order they were encountered
+        for i, cse in enumerate(reversed(found)):
+            cse._index = i
+        return ans
+
+
 def _RANGE_TYPE(lb, ub):
     if lb == ub:
         if lb is None:
@@ -424,7 +830,7 @@ class _SuffixData(object):
 
 
 class _NLWriter_impl(object):
-    def __init__(self, ostream, rowstream, colstream, config):
+    def __init__(self, ostream, rowstream, colstream, config, repn_cache=None):
         self.ostream = ostream
         self.rowstream = rowstream
         self.colstream = colstream
@@ -439,7 +845,11 @@ class _NLWriter_impl(object):
         self.external_functions = {}
         self.used_named_expressions = set()
         self.var_map = {}
-        self.visitor = AMPLRepnVisitor(
+        if config.detect_common_subexpressions and config.export_defined_variables:
+            visitor_class = _CSEAMPLRepnVisitor
+        else:
+            visitor_class = AMPLRepnVisitor
+        self.visitor = visitor_class(
             self.template,
             self.subexpression_cache,
             self.subexpression_order,
@@ -451,6 +861,11 @@ class _NLWriter_impl(object):
         )
         self.next_V_line_id = 0
         self.pause_gc = None
+        # Compiled expressions from a previous write (see
+        # PersistentNLWriter).  Entries used in this write are moved to
+        # next_repn_cache.
+        self.repn_cache = repn_cache
+        self.next_repn_cache = None if repn_cache is None else {}
 
     def __enter__(self):
         assert AMPLRepn.ActiveVisitor is None
@@ -482,15 +897,15 @@ class _NLWriter_impl(object):
                 Constraint,
                 Var,
                 Param,
-                Expression,
-                # FIXME: Non-active components should not report as Active
-                ExternalFunction,
                 Set,
                 RangeSet,
                 Port,
                 # TODO: Piecewise, Complementarity
             },
-            targets={Suffix, SOSConstraint},
+            # Expression and ExternalFunction are collected so that we
+            # can decide if the constraints can be compiled in parallel.
+            # FIXME: Non-active components should not report as Active
+            targets={Suffix, SOSConstraint, Expression, ExternalFunction},
         )
         if unknown:
             raise ValueError(
@@ -514,6 +929,21 @@ class _NLWriter_impl(object):
         initialize_var_map_from_column_order(model, self.config, var_map)
         timer.toc('Initialized column order', level=logging.DEBUG)
 
+        if visitor.__class__ is _CSEAMPLRepnVisitor:
+            collector = _CommonSubexpressionCollector()
+            for obj in model.component_data_objects(
+                Objective, active=True, sort=sorter
+            ):
+                collector.collect(obj.expr)
+            for con in ordered_active_constraints(model, self.config):
+                collector.collect(con.body)
+            visitor.common_subexpressions = collector.common_subexpressions()
+            timer.toc(
+                'Found %s common subexpressions',
+                len(set(visitor.common_subexpressions.values())),
+                level=logging.DEBUG,
+            )
+
         #
         # Tabulate the model expressions
         #
@@ -524,7 +954,7 @@ class _NLWriter_impl(object):
             if with_debug_timing and obj.parent_component() is not last_parent:
                 timer.toc('Objective %s', last_parent, level=logging.DEBUG)
                 last_parent = obj.parent_component()
-            expr = visitor.walk_expression((obj.expr, obj, 1))
+            expr = self._compile_expression(obj.expr, obj, 1)
             if expr.named_exprs:
                 self._record_named_expression_usage(expr.named_exprs, obj, 1)
             if expr.nonlinear:
@@ -552,11 +982,35 @@ class _NLWriter_impl(object):
         # required for solvers like PATH.
         n_complementarity_range = 0
         n_complementarity_nz_var_lb = 0
-        for con in ordered_active_constraints(model, self.config):
+        all_constraints = ordered_active_constraints(model, self.config)
+        compiled = None
+        if (
+            self.config.compile_processes > 1
+            and self.repn_cache is None
+            # Named Expressions and ExternalFunctions (the only source of
+            # string arguments) generate visitor state that is not
+            # returned by the worker processes: do not bother forking
+            # workers whose results would be discarded
+            and not component_map[Expression]
+            and not component_map[ExternalFunction]
+            and visitor.validate_parallel_repns(())
+        ):
+            all_constraints = list(all_constraints)
+            compiled = compile_repns_in_parallel(
+                model,
+                visitor,
+                [(con.body, con, 0) for con in all_constraints],
+                self.config.compile_processes,
+            )
+            timer.toc('Compiled constraints in parallel', level=logging.DEBUG)
+        for con_idx, con in enumerate(all_constraints):
             if with_debug_timing and con.parent_component() is not last_parent:
                 timer.toc('Constraint %s', last_parent, level=logging.DEBUG)
                 last_parent = con.parent_component()
-            expr = visitor.walk_expression((con.body, con, 0))
+            if compiled is None:
+                expr = self._compile_expression(con.body, con, 0)
+            else:
+                expr = compiled[con_idx]
             if expr.named_exprs:
                 self._record_named_expression_usage(expr.named_exprs, con, 0)
             lb = con.lb
@@ -641,6 +1095,23 @@ class _NLWriter_impl(object):
             filter(self.used_named_expressions.__contains__, self.subexpression_order)
         )
 
+        # Eliminate variables defined by linear singleton / doubleton
+        # equality constraints
+        if self.config.linear_presolve:
+            constraints, eliminated_vars, var_bounds = self._linear_presolve(
+                component_map, constraints, objectives, n_nonlinear_cons
+            )
+            n_cons = len(constraints)
+            n_equality = sum(1 for info in constraints if info[2] == 4)
+            n_ranges = sum(1 for info in constraints if info[2] == 0)
+            timer.toc(
+                'Linear presolve: eliminated %s variables',
+                len(eliminated_vars),
+                level=logging.DEBUG,
+            )
+        else:
+            eliminated_vars = var_bounds = {}
+
         # linear contribution by (constraint, objective) component.
         # Keys are component id(), Values are dicts mapping variable
         # id() to linear coefficient.  All nonzeros in the component
@@ -804,9 +1275,30 @@ class _NLWriter_impl(object):
         # column_order to *just* contain the variables that we are
         # sending to the NL.
         self.column_order = column_order = {_id: i for i, _id in enumerate(variables)}
+
+        # Collect the scaling factors for the model components
+        if self.config.scale_model and component_map[Suffix]:
+            scaling_factors = self._collect_scaling_factors(
+                component_map, sorter, variables, constraints, objectives
+            )
+        else:
+            scaling_factors = None
+        if scaling_factors is not None:
+            var_scale = scaling_factors.variables
         for idx, _id in enumerate(variables):
             v = var_map[_id]
-            lb, ub = v.bounds
+            if _id in var_bounds:
+                lb, ub = var_bounds[_id]
+            else:
+                lb, ub = v.bounds
+            if scaling_factors is not None and var_scale[idx] != 1:
+                scale = var_scale[idx]
+                if lb is not None:
+                    lb *= scale
+                if ub is not None:
+                    ub *= scale
+                if scale < 0:
+                    lb, ub = ub, lb
             if lb == minus_inf:
                 lb = None
             elif lb is not None:
@@ -834,6 +1326,9 @@ class _NLWriter_impl(object):
                     if not (suffix.direction & Suffix.EXPORT):
                         continue
                     name = suffix.local_name
+                    if name == 'scaling_factor' and scaling_factors is not None:
+                        # The scaling factors were applied by the writer
+                        continue
                     if name not in suffix_data:
                         suffix_data[name] = _SuffixData(
                             name, column_order, row_order, obj_order, model_id
@@ -899,6 +1394,15 @@ class _NLWriter_impl(object):
                         sosno.store(v, tag)
                         ref.store(v, r)
 
+        # Apply the scaling factors to the compiled representations
+        if scaling_factors is not None:
+            scaled_nonlinear_vars = self._apply_scaling(
+                scaling_factors, constraints, objectives, nonlinear_vars
+            )
+            n_subexpressions[0] += len(scaled_nonlinear_vars)
+        else:
+            scaled_nonlinear_vars = []
+
         if symbolic_solver_labels:
             labeler = NameLabeler()
             row_labels = [labeler(info[0]) for info in constraints] + [
@@ -924,6 +1428,11 @@ class _NLWriter_impl(object):
             self.var_id_to_nl = {
                 info[1]: var_idx for var_idx, info in enumerate(variables)
             }
+        # Nonlinear references to scaled variables are written as
+        # (linear) defined variables that map the scaled column back to
+        # the original variable: x = x_scaled / scale
+        for k, _id in enumerate(scaled_nonlinear_vars):
+            self.var_id_to_nl[_id] = f'{n_vars + k}{col_comments[column_order[_id]]}'
         timer.toc("Generated row/col labels & comments", level=logging.DEBUG)
 
         #
@@ -1131,6 +1640,14 @@ class _NLWriter_impl(object):
         # before the C/O line that references it.
         single_use_subexpressions = {}
         self.next_V_line_id = n_vars
+        for _id in scaled_nonlinear_vars:
+            var_idx = column_order[_id]
+            ostream.write(
+                f'V{self.next_V_line_id} 1 0{col_comments[var_idx]}\n'
+                f'{var_idx} {1 / var_scale[var_idx]!r}\n'
+            )
+            ostream.write(self.template.const % 0)
+            self.next_V_line_id += 1
         for _id in self.subexpression_order:
             _con_id, _obj_id, _sub = self.subexpression_cache[_id][2]
             if _sub:
@@ -1191,6 +1708,8 @@ class _NLWriter_impl(object):
                     self._write_v_line(_id, n_cons + n_lcons + obj_idx + 1)
             lbl = row_comments[n_cons + obj_idx]
             sense = 0 if info[0].sense == minimize else 1
+            if scaling_factors is not None and scaling_factors.objectives[obj_idx] < 0:
+                sense = 1 - sense
             ostream.write(f'O{obj_idx} {sense}{lbl}\n')
             self._write_nl_expression(info[1], True)
 
@@ -1206,6 +1725,10 @@ class _NLWriter_impl(object):
             if _data.prob:
                 logger.warning("ignoring 'dual' suffix for Model")
             if _data.con:
+                if scaling_factors is not None:
+                    con_scale = scaling_factors.constraints
+                    for _id in _data.con:
+                        _data.con[_id] /= con_scale[_id]
                 ostream.write(f"d{len(_data.con)}\n")
                 ostream.write(
                     ''.join(f"{_id} {_data.con[_id]!r}\n" for _id in sorted(_data.con))
@@ -1214,11 +1737,19 @@ class _NLWriter_impl(object):
         #
         # "x" lines (variable initialization)
         #
-        _init_lines = [
-            f'{var_idx} {info[0].value!r}{col_comments[var_idx]}\n'
-            for var_idx, info in enumerate(variables)
-            if info[0].value is not None
-        ]
+        if scaling_factors is None:
+            _init_lines = [
+                f'{var_idx} {info[0].value!r}{col_comments[var_idx]}\n'
+                for var_idx, info in enumerate(variables)
+                if info[0].value is not None
+            ]
+        else:
+            _init_lines = [
+                f'{var_idx} {info[0].value * var_scale[var_idx]!r}'
+                f'{col_comments[var_idx]}\n'
+                for var_idx, info in enumerate(variables)
+                if info[0].value is not None
+            ]
         ostream.write(
             'x%d%s\n'
             % (len(_init_lines), "\t# initial guess" if symbolic_solver_labels else '')
@@ -1323,6 +1854,20 @@ class _NLWriter_impl(object):
             for _id in sorted(linear.keys(), key=column_order.__getitem__):
                 ostream.write(f'{column_order[_id]} {linear[_id]!r}\n')
 
+        # Map the eliminated variables back to expressions in terms of
+        # the variables sent to the solver
+        eliminated_var_exprs = []
+        for _id, expr_info in eliminated_vars.items():
+            if expr_info.linear:
+                expr = LinearExpression(
+                    constant=expr_info.const,
+                    linear_coefs=list(expr_info.linear.values()),
+                    linear_vars=list(map(var_map.__getitem__, expr_info.linear)),
+                )
+            else:
+                expr = expr_info.const
+            eliminated_var_exprs.append((var_map[_id], expr))
+
         # Generate the return information
         info = NLWriterInfo(
             variables,
@@ -1331,11 +1876,518 @@ class _NLWriter_impl(object):
             sorted(amplfunc_libraries),
             row_labels,
             col_labels,
+            eliminated_var_exprs,
+            scaling_factors,
         )
         timer.toc("Wrote NL stream", level=logging.DEBUG)
         timer.toc("Generated NL representation", delta=False)
         return info
 
+    def _compile_expression(self, expr, src, src_idx):
+        """Compile an expression into an AMPLRepn
+
+        If a repn cache is available, reuse the cached AMPLRepn for
+        `src` if its expression has not been replaced and none of the
+        fixed Vars / mutable Params folded into the representation have
+        changed.
+
+        """
+        if self.repn_cache is None:
+            return self.visitor.walk_expression((expr, src, src_idx))
+        _id = id(src)
+        entry = self.repn_cache.get(_id, None)
+        if entry is not None and entry[0] is src and entry[1] is expr:
+            for v in entry[3].values():
+                if v.fixed:
+                    break
+            else:
+                changed = False
+                for v, val in entry[4]:
+                    if not v.fixed:
+                        break
+                    if v.value != val:
+                        changed = True
+                else:
+                    if not changed:
+                        for p, val in entry[5]:
+                            if p.value != val:
+                                changed = True
+                                break
+                    if not changed:
+                        self._reuse_cached_vars(entry[3])
+                        self.next_repn_cache[_id] = entry
+                        return entry[2].duplicate()
+                    if entry[6] is not None:
+                        # Only re-evaluate the (linear) coefficients and
+                        # constant that depend on the changed values
+                        repn = self._evaluate_parametric_repn(entry)
+                        if repn is not None:
+                            return repn
+
+        repn = self.visitor.walk_expression((expr, src, src_idx))
+        if repn.named_exprs:
+            return repn
+        deps = _RepnDependencyVisitor()
+        if not deps.collect(expr):
+            return repn
+        var_map = self.var_map
+        used_vars = {v_id: var_map[v_id] for v_id in repn.linear}
+        if repn.nonlinear:
+            for v_id in repn.nonlinear[1]:
+                used_vars[v_id] = var_map[v_id]
+        parametric = None
+        if (deps.fixed_vars or deps.params) and not repn.nonlinear:
+            parametric = _parametric_linear_terms(expr)
+        self.next_repn_cache[_id] = (
+            src,
+            expr,
+            repn.duplicate(),
+            used_vars,
+            deps.fixed_vars,
+            deps.params,
+            parametric,
+        )
+        return repn
+
+    def _reuse_cached_vars(self, used_vars):
+        var_map = self.var_map
+        for v_id, v in used_vars.items():
+            if v_id not in var_map:
+                var_map[v_id] = v
+
+    def _evaluate_parametric_repn(self, entry):
+        """Update a cached linear AMPLRepn for new fixed Var / mutable
+        Param values by re-evaluating its parametric coefficients
+
+        Returns None if the new values change the structure of the
+        representation (e.g., a coefficient changed to / from 0), in
+        which case the expression must be re-walked.
+
+        """
+        src, expr, cached, used_vars, fixed_vars, params, parametric = entry
+        const, terms = parametric
+        try:
+            linear = {}
+            for v_id, coef in terms:
+                linear[v_id] = linear.get(v_id, 0) + value(coef)
+            const = value(const)
+        except (ValueError, ArithmeticError):
+            return None
+        linear = {v_id: coef for v_id, coef in linear.items() if coef}
+        if linear.keys() != cached.linear.keys():
+            return None
+        repn = cached.duplicate()
+        repn.mult = 1
+        repn.const = const
+        repn.linear = linear
+        self._reuse_cached_vars(used_vars)
+        self.next_repn_cache[id(src)] = (
+            src,
+            expr,
+            repn.duplicate(),
+            used_vars,
+            [(v, v.value) for v, val in fixed_vars],
+            [(p, p.value) for p, val in params],
+            parametric,
+        )
+        return repn
+
+    def _linear_presolve(self, component_map, constraints, objectives, n_nonlinear):
+        """Eliminate variables defined by simple linear equality constraints
+
+        This performs variable elimination without fill-in: variables
+        fixed by their bounds, variables fixed by linear equality
+        constraints with a single (nonzero) term, and variables that are
+        defined in terms of a second variable by linear equality
+        constraints with two terms are substituted out of all
+        constraints, objectives, and previously eliminated variables.
+
+        Only continuous variables that appear in the linear portion of
+        constraints / objectives are candidates for elimination:
+        variables appearing in nonlinear fragments, named Expressions,
+        SOS constraints, complementarity conditions, or the
+        `export_nonlinear_variables` list are never removed.
+
+        Returns
+        -------
+        constraints: list
+            The (filtered) list of constraint infos to write to the NL file
+
+        eliminated_vars: dict
+            Map of eliminated variable id() to the AMPLRepn (constant +
+            linear terms) defining the variable
+
+        var_bounds: dict
+            Map of variable id() to (lb, ub) for variables whose bounds
+            were tightened by the presolve
+
+        """
+        var_map = self.var_map
+        config = self.config
+
+        # Collect the variables that cannot be substituted out of the model
+        protected = set()
+        for info in constraints[:n_nonlinear]:
+            protected.update(info[1].nonlinear[1])
+        for info in objectives:
+            if info[1].nonlinear:
+                protected.update(info[1].nonlinear[1])
+        for _id in self.subexpression_order:
+            expr_info = self.subexpression_cache[_id][1]
+            if expr_info.linear:
+                protected.update(expr_info.linear)
+            if expr_info.nonlinear:
+                protected.update(expr_info.nonlinear[1])
+        for info in constraints:
+            if info[2] == 5:
+                # complementarity: the "ub" is the complemented var id
+                protected.add(info[4])
+        if config.export_nonlinear_variables:
+            for v in config.export_nonlinear_variables:
+                protected.update(map(id, v.values() if v.is_indexed() else (v,)))
+        for block in component_map[SOSConstraint]:
+            for sos in block.component_data_objects(
+                SOSConstraint, active=True, descend_into=False
+            ):
+                protected.update(map(id, sos.variables))
+
+        # Index the linear portion of every constraint / objective
+        comp_by_linear_var = defaultdict(list)
+        lcon_by_linear_nnz = defaultdict(dict)
+        for row_idx, info in enumerate(constraints):
+            expr_info = info[1]
+            for _id in expr_info.linear:
+                comp_by_linear_var[_id].append((row_idx, expr_info))
+            if info[2] == 4 and not expr_info.nonlinear and expr_info.linear:
+                lcon_by_linear_nnz[len(expr_info.linear)][row_idx] = expr_info
+        for info in objectives:
+            for _id in info[1].linear:
+                comp_by_linear_var[_id].append((None, info[1]))
+
+        var_bounds = {}
+        for _id in comp_by_linear_var:
+            if _id in protected or not var_map[_id].is_continuous():
+                protected.add(_id)
+                continue
+            lb, ub = var_map[_id].bounds
+            var_bounds[_id] = (
+                None if lb == minus_inf else lb,
+                None if ub == inf else ub,
+            )
+        fixed_vars = [
+            _id for _id, (lb, ub) in var_bounds.items() if lb == ub and lb is not None
+        ]
+
+        eliminated_vars = {}
+        eliminated_cons = set()
+        modified_cons = set()
+        one_var = lcon_by_linear_nnz[1]
+        two_var = lcon_by_linear_nnz[2]
+        while 1:
+            if fixed_vars:
+                _id = fixed_vars.pop()
+                if _id in eliminated_vars:
+                    continue
+                # substituting _id with the constant b
+                a = x = None
+                b = var_bounds[_id][0]
+                logger.debug("NL presolve: bounds fixed %s := %s", var_map[_id], b)
+            elif one_var:
+                row_idx, expr_info = one_var.popitem()
+                _id, coef = next(iter(expr_info.linear.items()))
+                if _id in protected or not coef:
+                    continue
+                # substituting _id with the constant b
+                a = x = None
+                b = (constraints[row_idx][0].lb - expr_info.const) / coef
+                logger.debug("NL presolve: substituting %s := %s", var_map[_id], b)
+                lb, ub = var_bounds[_id]
+                if (lb is not None and lb - b > TOL) or (
+                    ub is not None and ub - b < -TOL
+                ):
+                    raise InfeasibleConstraintException(
+                        "model contains a trivially infeasible variable "
+                        f"'{var_map[_id].name}' (presolved to a value of "
+                        f"{b} outside bounds [{lb}, {ub}])."
+                    )
+                eliminated_cons.add(row_idx)
+            elif two_var:
+                row_idx, expr_info = two_var.popitem()
+                (_id, coef), (x, coef2) = expr_info.linear.items()
+                if not coef or not coef2:
+                    continue
+                if x in protected:
+                    if _id in protected:
+                        continue
+                elif _id in protected:
+                    _id, x = x, _id
+                    coef, coef2 = coef2, coef
+                else:
+                    # In an attempt to improve numerical stability, we
+                    # will solve for (and substitute out) the variable
+                    # with the coefficient closer to +/-1
+                    log_coef = abs(_log10(abs(coef)))
+                    log_coef2 = abs(_log10(abs(coef2)))
+                    if log_coef2 < log_coef:
+                        _id, x = x, _id
+                        coef, coef2 = coef2, coef
+                # substituting _id with a*x + b
+                a = -coef2 / coef
+                b = (constraints[row_idx][0].lb - expr_info.const) / coef
+                logger.debug(
+                    "NL presolve: substituting %s := %s*%s + %s",
+                    var_map[_id],
+                    a,
+                    var_map[x],
+                    b,
+                )
+                eliminated_cons.add(row_idx)
+                # Project the bounds on _id onto x
+                lb, ub = var_bounds[_id]
+                if lb is not None:
+                    lb = (lb - b) / a
+                if ub is not None:
+                    ub = (ub - b) / a
+                if a < 0:
+                    lb, ub = ub, lb
+                x_lb, x_ub = var_bounds[x] if x in var_bounds else var_map[x].bounds
+                if x_lb == minus_inf:
+                    x_lb = None
+                if x_ub == inf:
+                    x_ub = None
+                if x_lb is None or (lb is not None and lb > x_lb):
+                    x_lb = lb
+                if x_ub is None or (ub is not None and ub < x_ub):
+                    x_ub = ub
+                if x_lb is not None and x_ub is not None:
+                    if x_lb - x_ub > TOL:
+                        raise InfeasibleConstraintException(
+                            "model contains a trivially infeasible variable "
+                            f"'{var_map[x].name}' (presolved bounds "
+                            f"[{x_lb}, {x_ub}] are empty)."
+                        )
+                    if x_lb == x_ub and x not in protected:
+                        fixed_vars.append(x)
+                var_bounds[x] = x_lb, x_ub
+            else:
+                break
+
+            if x is None:
+                eliminated_vars[_id] = AMPLRepn(b, {}, None)
+            else:
+                eliminated_vars[_id] = AMPLRepn(b, {x: a}, None)
+                comp_by_linear_var[x].append((None, eliminated_vars[_id]))
+
+            # Substitute _id out of every constraint, objective, and
+            # previously eliminated variable that references it
+            for row_idx, expr_info in comp_by_linear_var.pop(_id, ()):
+                if row_idx in eliminated_cons:
+                    continue
+                linear = expr_info.linear
+                nnz = len(linear)
+                c = linear.pop(_id, None)
+                if c is None:
+                    continue
+                expr_info.const += c * b
+                if x is not None:
+                    if x in linear:
+                        coef = linear[x] + c * a
+                        if coef:
+                            linear[x] = coef
+                        else:
+                            del linear[x]
+                    else:
+                        linear[x] = c * a
+                        comp_by_linear_var[x].append((row_idx, expr_info))
+                if row_idx is None:
+                    continue
+                modified_cons.add(row_idx)
+                if row_idx in lcon_by_linear_nnz[nnz]:
+                    del lcon_by_linear_nnz[nnz][row_idx]
+                    if linear:
+                        lcon_by_linear_nnz[len(linear)][row_idx] = expr_info
+
+        # Update the constraint bounds for the modified constraints, and
+        # remove any constraints that are now trivial.
+        for row_idx in sorted(modified_cons - eliminated_cons):
+            con, expr_info, _type, lb, ub = constraints[row_idx]
+            if _type == 5:
+                continue
+            lb = con.lb
+            if lb == minus_inf:
+                lb = None
+            ub = con.ub
+            if ub == inf:
+                ub = None
+            if not expr_info.linear and not expr_info.nonlinear:
+                if (lb is not None and lb - expr_info.const > TOL) or (
+                    ub is not None and ub - expr_info.const < -TOL
+                ):
+                    raise InfeasibleConstraintException(
+                        "model contains a trivially infeasible constraint "
+                        f"'{con.name}' (after linear presolve, the body "
+                        f"evaluates to {expr_info.const} outside bounds "
+                        f"[{lb}, {ub}])."
+                    )
+                eliminated_cons.add(row_idx)
+                continue
+            if lb is not None:
+                lb = repr(lb - expr_info.const)
+            if ub is not None:
+                ub = repr(ub - expr_info.const)
+            constraints[row_idx] = (con, expr_info, _type, lb, ub)
+
+        if eliminated_cons:
+            constraints = [
+                info
+                for row_idx, info in enumerate(constraints)
+                if row_idx not in eliminated_cons
+            ]
+        return constraints, eliminated_vars, var_bounds
+
+    def _collect_scaling_factors(
+        self, component_map, sorter, variables, constraints, objectives
+    ):
+        """Collect the 'scaling_factor' Suffix values for the written components
+
+        Suffixes declared on higher-level blocks override suffixes
+        declared on lower-level blocks.  Scaling factors declared for
+        indexed components apply to all of the component data.
+
+        Returns
+        -------
+        ScalingFactors or None
+            The scaling factors for the variables, constraints, and
+            objectives (in the order they will be written to the NL
+            file), or None if no components are scaled.
+
+        """
+        column_order = self.column_order
+        row_order = {id(info[0]): i for i, info in enumerate(constraints)}
+        obj_order = {id(info[0]): i for i, info in enumerate(objectives)}
+        scaling = ScalingFactors(
+            variables=[1] * len(variables),
+            constraints=[1] * len(constraints),
+            objectives=[1] * len(objectives),
+        )
+        found = False
+        for block in reversed(component_map[Suffix]):
+            for suffix in block.component_objects(
+                Suffix, active=True, descend_into=False, sort=sorter
+            ):
+                if suffix.local_name != 'scaling_factor':
+                    continue
+                for obj, val in suffix.items():
+                    if obj.is_indexed():
+                        _iter = obj.values()
+                    else:
+                        _iter = (obj,)
+                    for obj in _iter:
+                        _id = id(obj)
+                        if _id in column_order:
+                            target = scaling.variables
+                            idx = column_order[_id]
+                        elif _id in row_order:
+                            if constraints[row_order[_id]][2] == 5:
+                                # Do not scale complementarity conditions
+                                continue
+                            target = scaling.constraints
+                            idx = row_order[_id]
+                        elif _id in obj_order:
+                            target = scaling.objectives
+                            idx = obj_order[_id]
+                        else:
+                            continue
+                        if not val or val != val or val in (inf, minus_inf):
+                            raise ValueError(
+                                f"Invalid scaling factor ({val!r}) for "
+                                f"component '{obj.name}': scaling factors "
+                                "must be finite and nonzero."
+                            )
+                        target[idx] = val
+                        found = True
+        if not found:
+            return None
+        return scaling
+
+    def _apply_scaling(self, scaling_factors, constraints, objectives, nonlinear_vars):
+        """Apply the scaling factors to the compiled component expressions
+
+        Variables are scaled as `x_scaled = x * scale`, so linear
+        coefficients are divided by the variable scaling factor, and
+        constraint / objective bodies (linear coefficients, constant,
+        and nonlinear fragments) are multiplied by the component scaling
+        factor.  Constraint bounds in `constraints` are updated in place.
+
+        Returns
+        -------
+        list
+            The ids of the scaled variables that appear in nonlinear
+            fragments (these must be written as defined variables)
+
+        """
+        template = self.template
+        column_order = self.column_order
+        var_scale = scaling_factors.variables
+        scaled_vars = {
+            _id: var_scale[idx]
+            for _id, idx in column_order.items()
+            if var_scale[idx] != 1
+        }
+
+        def _scale_linear(linear, scale):
+            for _id in linear:
+                if not linear[_id]:
+                    continue
+                if _id in scaled_vars:
+                    linear[_id] = linear[_id] * scale / scaled_vars[_id]
+                elif scale != 1:
+                    linear[_id] *= scale
+
+        if scaled_vars:
+            for _id in self.subexpression_order:
+                expr_info = self.subexpression_cache[_id][1]
+                if expr_info.linear:
+                    _scale_linear(expr_info.linear, 1)
+
+        for row_idx, scale in enumerate(scaling_factors.constraints):
+            con, expr_info, _type, lb, ub = constraints[row_idx]
+            if scaled_vars or scale != 1:
+                _scale_linear(expr_info.linear, scale)
+            if scale == 1:
+                continue
+            if expr_info.nonlinear:
+                expr_info.nonlinear = (
+                    template.multiplier % scale + expr_info.nonlinear[0],
+                    expr_info.nonlinear[1],
+                )
+            if lb is not None:
+                lb = repr(float(lb) * scale)
+            if ub is not None:
+                ub = repr(float(ub) * scale)
+            if scale < 0:
+                lb, ub = ub, lb
+                _type = _RANGE_TYPE(lb, ub)
+            constraints[row_idx] = (con, expr_info, _type, lb, ub)
+
+        for obj_idx, scale in enumerate(scaling_factors.objectives):
+            expr_info = objectives[obj_idx][1]
+            if scaled_vars or scale != 1:
+                _scale_linear(expr_info.linear, scale)
+            if scale == 1:
+                continue
+            expr_info.const *= scale
+            if expr_info.nonlinear:
+                expr_info.nonlinear = (
+                    template.multiplier % scale + expr_info.nonlinear[0],
+                    expr_info.nonlinear[1],
+                )
+
+        return sorted(
+            filter(nonlinear_vars.__contains__, scaled_vars),
+            key=column_order.__getitem__,
+        )
+
     def _categorize_vars(self, comp_list, linear_by_comp):
         """Categorize compiled expression vars into linear and nonlinear
 
@@ -1526,6 +2578,28 @@ class NLFragment(object):
         return 'nl(' + self._node.name + ')'
 
 
+class CommonSubexpression(object):
+    """This is a mock "component" for repeated subexpressions.
+
+    It is used internally by the writer (when detecting common
+    subexpressions) to record the set of structurally identical
+    expression nodes that are exported as a single defined variable.
+    Holding on to the nodes also guarantees that their id()s are not
+    reused while the model is being written.
+
+    """
+
+    __slots__ = ('_nodes', '_index')
+
+    def __init__(self, nodes):
+        self._nodes = nodes
+        self._index = None
+
+    @property
+    def name(self):
+        return 'cse[%s]' % (self._index,)
+
+
 class AMPLRepn(object):
     __slots__ = ('nl', 'mult', 'const', 'linear', 'nonlinear', 'named_exprs')
 
@@ -2430,6 +3504,18 @@ class AMPLRepnVisitor(StreamBasedExpressionVisitor):
             return complex_number_error(ans, self, expr)
         return ans
 
+    def validate_parallel_repns(self, repns):
+        # Named subexpressions, external functions, and string arguments
+        # are recorded in visitor state that is not returned from the
+        # worker processes (see pyomo.repn.util.compile_repns_in_parallel).
+        # The writer checks the model before compiling in parallel; this
+        # catches components that are not declared on the model.
+        return not (
+            self.subexpression_cache
+            or self.external_functions
+            or self.encountered_string_arguments
+        )
+
     def initializeWalker(self, expr):
         expr, src, src_idx = expr
         self.active_expression_source = (src_idx, id(src))
@@ -2565,3 +3651,38 @@ class AMPLRepnVisitor(StreamBasedExpressionVisitor):
             _operator_handles[child_type] = handle_named_expression_node
         else:
             handlers[child_type] = _before_general_expression
+
+
+class _CSEAMPLRepnVisitor(AMPLRepnVisitor):
+    """An AMPLRepnVisitor that exports common subexpressions
+
+    Nonlinear subexpressions identified by the
+    :py:class:`_CommonSubexpressionCollector` are processed like named
+    Expression components: the first occurrence is compiled and
+    recorded as a defined variable, and all subsequent occurrences
+    reference that defined variable.
+
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # map of id(node) to the CommonSubexpression for that node
+        self.common_subexpressions = {}
+
+    def beforeChild(self, node, child, child_idx):
+        cse = self.common_subexpressions.get(id(child), None)
+        if cse is not None and id(cse) in self.subexpression_cache:
+            return _before_named_expression(self, cse)
+        return super().beforeChild(node, child, child_idx)
+
+    def exitNode(self, node, data):
+        ans = super().exitNode(node, data)
+        cse = self.common_subexpressions.get(id(node), None)
+        if cse is not None and ans[0] is _GENERAL:
+            # Only export subexpressions that are purely nonlinear:
+            # exporting linear terms would recharacterize the linear
+            # variables as nonlinear.
+            repn = ans[1]
+            if repn.nl is None and repn.nonlinear and not repn.linear:
+                return handle_named_expression_node(self, cse, ans)
+        return ans
@@ -0,0 +1,518 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2022
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import logging
+from operator import attrgetter
+
+from pyomo.common.config import (
+    ConfigBlock,
+    ConfigValue,
+    In,
+    InEnum,
+    document_kwargs_from_configdict,
+)
+from pyomo.common.dependencies import scipy, numpy as np
+from pyomo.common.errors import InfeasibleConstraintException
+from pyomo.common.gc_manager import PauseGC
+from pyomo.common.timing import TicTocTimer
+
+from pyomo.core.base import (
+    Block,
+    Objective,
+    Constraint,
+    Var,
+    Param,
+    Expression,
+    Suffix,
+    minimize,
+    maximize,
+)
+from pyomo.opt import WriterFactory
+from pyomo.repn.linear import LinearRepnVisitor
+from pyomo.repn.linear_template import LinearTemplateCompiler
+from pyomo.repn.quadratic import QuadraticRepnVisitor
+from pyomo.repn.util import (
+    FileDeterminism,
+    FileDeterminism_to_SortComponents,
+    categorize_valid_components,
+    initialize_var_map_from_column_order,
+    ordered_active_constraints,
+)
+
+### FIXME: Remove the following as soon as non-active components no
+### longer report active==True
+from pyomo.core.base import Set, RangeSet, ExternalFunction
+from pyomo.network import Port
+
+logger = logging.getLogger(__name__)
+inf = float('inf')
+neg_inf = float('-inf')
+
+
+class LinearStandardFormInfo(object):
+    """Return type for LinearStandardFormCompiler.write()
+
+    The compiled model is
+
+    .. math::
+
+        \\min_x\\ & c^T x + \\frac{1}{2} x^T Q x + c_0 \\\\
+        s.t.\\ & A x \\le b \\\\
+        & lb \\le x \\le ub
+
+    (see the ``mixed_form`` option for the alternative representation
+    of the constraint rows).
+
+    Attributes
+    ----------
+    c: numpy.ndarray
+
+        The (dense) objective coefficient vector
+
+    c0: float
+
+        The objective constant
+
+    Q: scipy.sparse.csr_matrix or scipy.sparse.csc_matrix or None
+
+        The (symmetric) objective Hessian, or None if the objective
+        is linear
+
+    A: scipy.sparse.csr_matrix or scipy.sparse.csc_matrix
+
+        The constraint coefficient matrix
+
+    b: numpy.ndarray
+
+        The constraint right-hand sides
+
+    col_lb: numpy.ndarray
+
+        The variable lower bounds (``-inf`` for unbounded variables)
+
+    col_ub: numpy.ndarray
+
+        The variable upper bounds (``inf`` for unbounded variables)
+
+    rows: List[Tuple[ConstraintData, int]]
+
+        The list of Pyomo constraint objects corresponding to the rows
+        in `A`.  Each element in the list is a 2-tuple of
+        (ConstraintData, row_multiplier).  The `row_multiplier` will be
+        +/- 1 indicating if the row was multiplied by -1 (corresponding
+        to a constraint lower bound).  If ``mixed_form`` was requested,
+        the second element is instead the row sense (-1 for ``>=``, 0
+        for ``==``, and 1 for ``<=``).
+
+    columns: List[VarData]
+
+        The list of Pyomo variable objects corresponding to columns in
+        the `A` and `c` matrices.
+
+    objective: ObjectiveData or None
+
+        The objective that was compiled into `c`, `c0`, and `Q`
+
+    """
+
+    def __init__(self, c, c0, Q, A, b, col_lb, col_ub, rows, columns, objective):
+        self.c = c
+        self.c0 = c0
+        self.Q = Q
+        self.A = A
+        self.b = b
+        self.col_lb = col_lb
+        self.col_ub = col_ub
+        self.rows = rows
+        self.columns = columns
+        self.objective = objective
+
+
+@WriterFactory.register(
+    'compile_standard_form', 'Compile an LP to standard form (`min cTx s.t. Ax <= b`)'
+)
+class LinearStandardFormCompiler(object):
+    CONFIG = ConfigBlock('compile_standard_form')
+    CONFIG.declare(
+        'mixed_form',
+        ConfigValue(
+            default=False,
+            domain=bool,
+            description='Return A in mixed form (preserving the constraint sense)',
+            doc="""
+            If True, equality constraints and (single-sided) inequality
+            constraints are not transformed to ``<=`` rows.  Instead,
+            each row keeps the sense of the original constraint (range
+            constraints still generate two rows), and the row sense is
+            returned in the second element of each `rows` entry.""",
+        ),
+    )
+    CONFIG.declare(
+        'set_sense',
+        ConfigValue(
+            default=minimize,
+            domain=In([minimize, maximize, None]),
+            description='If not None, map all objectives to the specified sense.',
+        ),
+    )
+    CONFIG.declare(
+        'allow_quadratic_objective',
+        ConfigValue(
+            default=True,
+            domain=bool,
+            description='If True, return the objective Hessian in Q',
+        ),
+    )
+    CONFIG.declare(
+        'matrix_format',
+        ConfigValue(
+            default='csr',
+            domain=In(['csr', 'csc']),
+            description='The scipy.sparse format used for A and Q',
+        ),
+    )
+    CONFIG.declare(
+        'show_section_timing',
+        ConfigValue(
+            default=False,
+            domain=bool,
+            description='Print timing after each stage of the compilation process',
+        ),
+    )
+    CONFIG.declare(
+        'file_determinism',
+        ConfigValue(
+            default=FileDeterminism.ORDERED,
+            domain=InEnum(FileDeterminism),
+            description='How much effort to ensure result is deterministic',
+            doc="""
+            How much effort do we want to put into ensuring the
+            resulting matrices are produced deterministically:
+                NONE (0) : None
+                ORDERED (10): rely on underlying component ordering (default)
+                SORT_INDICES (20) : sort keys of indexed components
+                SORT_SYMBOLS (30) : sort keys AND sort names (not declaration order)
+            """,
+        ),
+    )
+    CONFIG.declare(
+        'row_order',
+        ConfigValue(
+            default=None,
+            description='Preferred constraint ordering',
+            doc="""
+            List of constraints in the order that they should appear in
+            the resulting `A` matrix.  Unspecified constraints will
+            appear at the end.""",
+        ),
+    )
+    CONFIG.declare(
+        'column_order',
+        ConfigValue(
+            default=None,
+            description='Preferred variable ordering',
+            doc="""
+            List of variables in the order that they should appear in
+            the compiled representation.  Unspecified variables will be
+            appended to the end of this list (in the order in which they
+            are first encountered in the objective followed by each
+            constraint).  Note that all variables in this list are
+            included in the result (even if they do not appear in any
+            objective or constraint).""",
+        ),
+    )
+
+    CONFIG.declare(
+        'use_templates',
+        ConfigValue(
+            default=False,
+            domain=bool,
+            description='Generate indexed constraints from their rule templates',
+            doc="""
+            If True, the writer will attempt to "templatize" the rule for
+            each IndexedConstraint and generate the linear representation
+            of each constraint by instantiating the compiled template
+            (falling back on walking the constraint expression for
+            rules that cannot be templatized).  This assumes that the
+            constraint expressions have not been modified since they
+            were generated by the rule.""",
+        ),
+    )
+
+    def __init__(self):
+        self.config = self.CONFIG()
+
+    @document_kwargs_from_configdict(CONFIG)
+    def write(self, model, ostream=None, **options):
+        """Convert a model to standard form (`min cTx s.t. Ax <= b`)
+
+        Returns
+        -------
+        LinearStandardFormInfo
+
+        Parameters
+        ----------
+        model: ConcreteModel
+            The concrete Pyomo model to write out.
+
+        ostream: None
+            This is provided for API compatibility with other writers
+            and is ignored here.
+
+        """
+        config = self.config(options)
+
+        # Pause the GC, as the walker that generates the compiled LP
+        # representation generates (and disposes of) a large number of
+        # small objects.
+        with PauseGC():
+            return _LinearStandardFormCompiler_impl(config).write(model)
+
+
+class _LinearStandardFormCompiler_impl(object):
+    def __init__(self, config):
+        self.config = config
+
+    def write(self, model):
+        timing_logger = logging.getLogger('pyomo.common.timing.writer')
+        timer = TicTocTimer(logger=timing_logger)
+        with_debug_timing = (
+            timing_logger.isEnabledFor(logging.DEBUG) and timing_logger.hasHandlers()
+        )
+
+        sorter = FileDeterminism_to_SortComponents(self.config.file_determinism)
+        component_map, unknown = categorize_valid_components(
+            model,
+            active=True,
+            sort=sorter,
+            valid={
+                Block,
+                Constraint,
+                Var,
+                Param,
+                Expression,
+                # FIXME: Non-active components should not report as Active
+                ExternalFunction,
+                Set,
+                RangeSet,
+                Port,
+                # TODO: Piecewise, Complementarity
+            },
+            targets={Suffix, Objective},
+        )
+        if unknown:
+            raise ValueError(
+                "The model ('%s') contains the following active components "
+                "that the Linear Standard Form compiler does not know how to "
+                "process:\n\t%s"
+                % (
+                    model.name,
+                    "\n\t".join(
+                        "%s:\n\t\t%s" % (k, "\n\t\t".join(map(attrgetter('name'), v)))
+                        for k, v in unknown.items()
+                    ),
+                )
+            )
+
+        self.var_map = var_map = {}
+        initialize_var_map_from_column_order(model, self.config, var_map)
+        var_order = {_id: i for i, _id in enumerate(var_map)}
+
+        _qp = self.config.allow_quadratic_objective
+        objective_visitor = (QuadraticRepnVisitor if _qp else LinearRepnVisitor)(
+            {}, var_map, var_order
+        )
+        constraint_visitor = LinearRepnVisitor(
+            objective_visitor.subexpression_cache if not _qp else {}, var_map, var_order
+        )
+        if self.config.use_templates:
+            templates = LinearTemplateCompiler(constraint_visitor)
+        else:
+            templates = None
+
+        timer.toc('Initialized column order', level=logging.DEBUG)
+
+        #
+        # Process objective
+        #
+        objectives = []
+        for blk in component_map[Objective]:
+            objectives.extend(
+                blk.component_data_objects(
+                    Objective, active=True, descend_into=False, sort=sorter
+                )
+            )
+        if len(objectives) > 1:
+            raise ValueError(
+                "More than one active objective defined for input model '%s'; "
+                "Cannot compile the model to standard form\nObjectives: %s"
+                % (model.name, ' '.join(obj.name for obj in objectives))
+            )
+
+        c0 = 0
+        obj_linear = {}
+        obj_quadratic = None
+        obj = objectives[0] if objectives else None
+        if obj is not None:
+            repn = objective_visitor.walk_expression(obj.expr)
+            if repn.nonlinear is not None:
+                raise ValueError(
+                    f"Model objective ({obj.name}) contains nonlinear terms that "
+                    "cannot be compiled to standard form"
+                )
+            c0 = repn.constant
+            obj_linear = repn.linear
+            obj_quadratic = getattr(repn, 'quadratic', None)
+            set_sense = self.config.set_sense
+            if set_sense is not None and set_sense != obj.sense:
+                c0 = -c0
+                obj_linear = {vid: -coef for vid, coef in obj_linear.items()}
+                if obj_quadratic:
+                    obj_quadratic = {
+                        vids: -coef for vids, coef in obj_quadratic.items()
+                    }
+            if with_debug_timing:
+                timer.toc('Objective %s', obj, level=logging.DEBUG)
+
+        #
+        # Tabulate constraints
+        #
+        mixed_form = self.config.mixed_form
+        rows = []
+        rhs = []
+        # The A matrix is assembled in CSR form (with column indices
+        # relative to var_order).  As var_order is only appended to,
+        # the indices remain valid as new variables are encountered.
+        A_data = []
+        A_indices = []
+        A_indptr = [0]
+        last_parent = None
+        for con in ordered_active_constraints(model, self.config):
+            if with_debug_timing and con.parent_component() is not last_parent:
+                timer.toc('Constraint %s', last_parent, level=logging.DEBUG)
+                last_parent = con.parent_component()
+            lb = con.lb
+            ub = con.ub
+            if lb == neg_inf:
+                lb = None
+            if ub == inf:
+                ub = None
+            if lb is None and ub is None:
+                # Note: you *cannot* output trivial (unbounded)
+                # constraints in matrix format.
+                continue
+            if templates is None:
+                repn = constraint_visitor.walk_expression(con.body)
+            else:
+                repn = templates.walk_constraint(con)
+            if repn.nonlinear is not None:
+                raise ValueError(
+                    f"Model constraint ({con.name}) contains nonlinear terms that "
+                    "cannot be compiled to standard form"
+                )
+
+            # Pull out the constant: we will move it to the bounds
+            offset = repn.constant
+            if not repn.linear:
+                if (lb is None or lb <= offset) and (ub is None or ub >= offset):
+                    continue
+                raise InfeasibleConstraintException(
+                    "Model contains a trivially infeasible constraint "
+                    f"'{con.name}' (fixed body value {offset} outside bounds "
+                    f"[{lb}, {ub}])."
+                )
+
+            N = len(repn.linear)
+            indices = [var_order[vid] for vid in repn.linear]
+            data = list(repn.linear.values())
+            if mixed_form:
+                if lb == ub:
+                    rows.append((con, 0))
+                    rhs.append(ub - offset)
+                    A_indices.extend(indices)
+                    A_data.extend(data)
+                    A_indptr.append(A_indptr[-1] + N)
+                    continue
+                if lb is not None:
+                    rows.append((con, -1))
+                    rhs.append(lb - offset)
+                    A_indices.extend(indices)
+                    A_data.extend(data)
+                    A_indptr.append(A_indptr[-1] + N)
+            elif lb is not None:
+                rows.append((con, -1))
+                rhs.append(offset - lb)
+                A_indices.extend(indices)
+                A_data.extend(-coef for coef in data)
+                A_indptr.append(A_indptr[-1] + N)
+            if ub is not None:
+                rows.append((con, 1))
+                rhs.append(ub - offset)
+                A_indices.extend(indices)
+                A_data.extend(data)
+                A_indptr.append(A_indptr[-1] + N)
+
+        if with_debug_timing:
+            # report the last constraint
+            timer.toc('Constraint %s', last_parent, level=logging.DEBUG)
+
+        #
+        # Assemble the arrays
+        #
+        columns = list(var_map.values())
+        n_cols = len(columns)
+
+        c = np.zeros(n_cols)
+        if obj_linear:
+            c[[var_order[vid] for vid in obj_linear]] = list(obj_linear.values())
+
+        if obj_quadratic:
+            # Q is symmetric, with the objective including 0.5 x'Qx
+            Q_data = []
+            Q_rows = []
+            Q_cols = []
+            for (vid1, vid2), coef in obj_quadratic.items():
+                i = var_order[vid1]
+                j = var_order[vid2]
+                if i == j:
+                    Q_rows.append(i)
+                    Q_cols.append(i)
+                    Q_data.append(2 * coef)
+                else:
+                    Q_rows.extend((i, j))
+                    Q_cols.extend((j, i))
+                    Q_data.extend((coef, coef))
+            # Note that coo_matrix.asformat() sums any duplicate entries
+            Q = scipy.sparse.coo_matrix(
+                (Q_data, (Q_rows, Q_cols)), shape=(n_cols, n_cols)
+            ).asformat(self.config.matrix_format)
+        else:
+            Q = None
+
+        A = scipy.sparse.csr_matrix(
+            (A_data, A_indices, A_indptr), shape=(len(rows), n_cols)
+        )
+        A.sort_indices()
+        if self.config.matrix_format == 'csc':
+            A = A.tocsc()
+
+        col_lb = np.empty(n_cols)
+        col_ub = np.empty(n_cols)
+        for i, v in enumerate(columns):
+            lb, ub = v.bounds
+            col_lb[i] = neg_inf if lb is None else lb
+            col_ub[i] = inf if ub is None else ub
+
+        info = LinearStandardFormInfo(
+            c, c0, Q, A, np.array(rhs, dtype=float), col_lb, col_ub, rows, columns, obj
+        )
+        timer.toc("Generated standard form representation", delta=False)
+        return info
@@ -20,8 +20,10 @@ import pyomo.repn.util as repn_util
 import pyomo.repn.plugins.nl_writer as nl_writer
 from pyomo.repn.tests.nl_diff import nl_diff
 
+from pyomo.common.errors import InfeasibleConstraintException
 from pyomo.common.log import LoggingIntercept
 from pyomo.common.tempfiles import TempfileManager
+from pyomo.opt.plugins.sol import parse_sol_file
 from pyomo.core.expr.current import Expr_if, inequality, LinearExpression
 from pyomo.core.base.expression import ScalarExpression
 from pyomo.environ import (
@@ -1030,3 +1032,527 @@ G0 4    #OBJ
                 OUT.getvalue(),
             )
         )
+
+    def test_linear_presolve(self):
+        m = ConcreteModel()
+        m.x = Var(range(5), bounds=(0, 10))
+        m.z = Var(bounds=(1, 1))
+        m.c1 = Constraint(expr=2 * m.x[0] == 4)
+        m.c2 = Constraint(expr=m.x[1] == 3 * m.x[2] + 1)
+        m.c3 = Constraint(expr=m.x[1] + m.x[3] + m.x[0] >= 2)
+        m.c4 = Constraint(expr=m.x[4] ** 2 + m.x[3] + m.z <= 20)
+        m.o = Objective(expr=m.x[1] + m.x[2] + m.x[4])
+
+        OUT = io.StringIO()
+        with LoggingIntercept() as LOG:
+            info = nl_writer.NLWriter().write(
+                m, OUT, symbolic_solver_labels=True, linear_presolve=True
+            )
+        self.assertEqual(LOG.getvalue(), "")
+
+        self.assertEqual(
+            [(v.name, str(e)) for v, e in info.eliminated_vars],
+            [('z', '1'), ('x[0]', '2.0'), ('x[1]', '1.0 + 3.0*x[2]')],
+        )
+        self.assertEqual([v[0].name for v in info.variables], ['x[4]', 'x[2]', 'x[3]'])
+        self.assertEqual([c[0].name for c in info.constraints], ['c4', 'c3'])
+        self.assertEqual(
+            *nl_diff(
+                """g3 1 1 0	# problem unknown
+ 3 2 1 0 0 	# vars, constraints, objectives, ranges, eqns
+ 1 0 0 0 0 0	# nonlinear constrs, objs; ccons: lin, nonlin, nd, nzlb
+ 0 0	# network constraints: nonlinear, linear
+ 1 0 0 	# nonlinear vars in constraints, objectives, both
+ 0 0 0 1	# linear network variables; functions; arith, flags
+ 0 0 0 0 0 	# discrete variables: binary, integer, nonlinear (b,c,o)
+ 4 2 	# nonzeros in Jacobian, obj. gradient
+ 2 4	# max name lengths: constraints, variables
+ 0 0 0 0 0	# common exprs: b,c,o,c1,o1
+C0	#c4
+o5	#^
+v0	#x[4]
+n2
+C1	#c3
+n0
+O0 0	#o
+n1.0
+x0	# initial guess
+r	#2 ranges (rhs's)
+1 19	#c4
+2 -1.0	#c3
+b	#3 bounds (on variables)
+0 0 10	#x[4]
+0 0 3.0	#x[2]
+0 0 10	#x[3]
+k2	#intermediate Jacobian column lengths
+1
+2
+J0 2	#c4
+0 0
+2 1
+J1 2	#c3
+1 3.0
+2 1
+G0 2	#o
+0 1
+1 4.0
+""",
+                OUT.getvalue(),
+            )
+        )
+
+    def test_linear_presolve_chained_substitution(self):
+        m = ConcreteModel()
+        m.x = Var(range(4))
+        m.c1 = Constraint(expr=m.x[0] == 2 * m.x[1])
+        m.c2 = Constraint(expr=m.x[1] == m.x[2] - 1)
+        m.c3 = Constraint(expr=m.x[2] == 5)
+        m.c4 = Constraint(expr=m.x[0] + m.x[3] <= 10)
+        m.o = Objective(expr=m.x[3])
+
+        OUT = io.StringIO()
+        info = nl_writer.NLWriter().write(m, OUT, linear_presolve=True)
+        self.assertEqual([v[0].name for v in info.variables], ['x[3]'])
+        self.assertEqual([c[0].name for c in info.constraints], ['c4'])
+        self.assertEqual(
+            {v.name: pyo.value(e) for v, e in info.eliminated_vars},
+            {'x[0]': 8, 'x[1]': 4, 'x[2]': 5},
+        )
+        # x[0] + x[3] <= 10  ->  x[3] <= 2
+        self.assertIn("r\n1 2.0\n", OUT.getvalue())
+
+    def test_linear_presolve_protected_vars(self):
+        m = ConcreteModel()
+        m.x = Var()
+        m.y = Var()
+        m.i = Var(domain=pyo.Integers)
+        m.c1 = Constraint(expr=m.x == 2 * m.y + 1)
+        m.c2 = Constraint(expr=m.i == 3)
+        m.c3 = Constraint(expr=m.x**2 + m.i <= 10)
+        m.o = Objective(expr=m.y)
+
+        OUT = io.StringIO()
+        info = nl_writer.NLWriter().write(m, OUT, linear_presolve=True)
+        # x appears nonlinearly and i is discrete: only y can be removed
+        self.assertEqual(
+            [(v.name, str(e)) for v, e in info.eliminated_vars], [('y', '-0.5 + 0.5*x')]
+        )
+        self.assertEqual([v[0].name for v in info.variables], ['x', 'i'])
+        self.assertEqual([c[0].name for c in info.constraints], ['c3', 'c2'])
+
+    def test_linear_presolve_infeasible(self):
+        m = ConcreteModel()
+        m.x = Var(bounds=(0, 1))
+        m.y = Var()
+        m.c1 = Constraint(expr=m.x == 2)
+        m.c2 = Constraint(expr=m.x + m.y >= 0)
+        m.o = Objective(expr=m.y)
+
+        with self.assertRaisesRegex(
+            InfeasibleConstraintException,
+            r"model contains a trivially infeasible variable 'x' "
+            r"\(presolved to a value of 2.0 outside bounds \[0, 1\]\).",
+        ):
+            nl_writer.NLWriter().write(m, io.StringIO(), linear_presolve=True)
+
+        m.c1.set_value(m.x == 1)
+        m.c3 = Constraint(expr=m.x + 1 <= 1)
+        with self.assertRaisesRegex(
+            InfeasibleConstraintException,
+            r"model contains a trivially infeasible constraint 'c3'",
+        ):
+            nl_writer.NLWriter().write(m, io.StringIO(), linear_presolve=True)
+
+    def test_scale_model(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2], bounds=(-5, 5), initialize=1.0)
+        m.y = Var(bounds=(0, 1), initialize=1.0)
+        m.obj = Objective(expr=1e8 * m.x[1] + 1e6 * m.y + m.x[2] ** 2)
+        m.con = Constraint(expr=m.x[1] + m.y == 1.0)
+        m.c2 = Constraint(expr=pyo.exp(m.x[1]) + 2 * m.x[2] <= 4)
+        m.scaling_factor = Suffix(direction=Suffix.EXPORT)
+        m.scaling_factor[m.obj] = 1e-6
+        m.scaling_factor[m.con] = 2.0
+        m.scaling_factor[m.c2] = -0.5
+        m.scaling_factor[m.x] = 0.2
+
+        OUT = io.StringIO()
+        with LoggingIntercept() as LOG:
+            info = nl_writer.NLWriter().write(
+                m, OUT, symbolic_solver_labels=True, scale_model=True
+            )
+        self.assertEqual(LOG.getvalue(), "")
+        self.assertEqual(info.scaling.variables, [0.2, 0.2, 1])
+        self.assertEqual(info.scaling.constraints, [-0.5, 2.0])
+        self.assertEqual(info.scaling.objectives, [1e-6])
+        # The scaling_factor suffix is applied by the writer (and not
+        # exported), and nonlinear references to scaled variables are
+        # written through defined variables
+        self.assertEqual(
+            *nl_diff(
+                """g3 1 1 0	# problem unknown
+ 3 2 1 0 1 	# vars, constraints, objectives, ranges, eqns
+ 1 1 0 0 0 0	# nonlinear constrs, objs; ccons: lin, nonlin, nd, nzlb
+ 0 0	# network constraints: nonlinear, linear
+ 1 2 0 	# nonlinear vars in constraints, objectives, both
+ 0 0 0 1	# linear network variables; functions; arith, flags
+ 0 0 0 0 0 	# discrete variables: binary, integer, nonlinear (b,c,o)
+ 4 3 	# nonzeros in Jacobian, obj. gradient
+ 3 4	# max name lengths: constraints, variables
+ 2 0 0 0 0	# common exprs: b,c,o,c1,o1
+V3 1 0	#x[1]
+0 5.0
+n0
+V4 1 0	#x[2]
+1 5.0
+n0
+C0	#c2
+o2	#*
+n-0.5
+o44	#exp
+v3	#x[1]
+C1	#con
+n0
+O0 0	#obj
+o2	#*
+n1e-06
+o5	#^
+v4	#x[2]
+n2
+x3	# initial guess
+0 0.2	#x[1]
+1 0.2	#x[2]
+2 1.0	#y
+r	#2 ranges (rhs's)
+2 -2.0	#c2
+4 2.0	#con
+b	#3 bounds (on variables)
+0 -1.0 1.0	#x[1]
+0 -1.0 1.0	#x[2]
+0 0 1	#y
+k2	#intermediate Jacobian column lengths
+2
+3
+J0 2	#c2
+0 0
+1 -5.0
+J1 2	#con
+0 10.0
+2 2.0
+G0 3	#obj
+0 500.0
+1 0.0
+2 1.0
+""",
+                OUT.getvalue(),
+            )
+        )
+
+        # Without scale_model, the suffix is exported and the model is
+        # written unscaled
+        OUT = io.StringIO()
+        info = nl_writer.NLWriter().write(m, OUT)
+        self.assertIsNone(info.scaling)
+        self.assertIn("S4 2 scaling_factor\n0 0.2\n1 0.2\n", OUT.getvalue())
+
+    def test_load_solution(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2], bounds=(-5, 5))
+        m.y = Var(bounds=(0, 1))
+        m.z = Var()
+        m.obj = Objective(expr=m.x[1] + m.x[2] ** 2 + m.y)
+        m.con = Constraint(expr=m.x[1] + m.y <= 1.0)
+        m.c2 = Constraint(expr=pyo.exp(m.x[1]) + 2 * m.x[2] <= 4)
+        m.c3 = Constraint(expr=m.z == 2 * m.y + 1)
+        m.scaling_factor = Suffix(direction=Suffix.EXPORT)
+        m.scaling_factor[m.obj] = 0.5
+        m.scaling_factor[m.con] = 2.0
+        m.scaling_factor[m.c2] = -0.5
+        m.scaling_factor[m.x] = 0.2
+
+        info = nl_writer.NLWriter().write(
+            m, io.StringIO(), scale_model=True, linear_presolve=True
+        )
+        self.assertEqual([v[0].name for v in info.variables], ['x[1]', 'x[2]', 'y'])
+        self.assertEqual([c[0].name for c in info.constraints], ['c2', 'con'])
+        sol = parse_sol_file(
+            io.StringIO(
+                "\nSolver message\n\nOptions\n3\n1\n1\n0\n2\n2\n3\n3\n"
+                "1\n-3\n0.4\n0.2\n0.5\nobjno 0 0\n"
+            )
+        )
+        info.load_vars(sol.primals)
+        self.assertEqual(m.x[1].value, 2)
+        self.assertEqual(m.x[2].value, 1)
+        self.assertEqual(m.y.value, 0.5)
+        # z was eliminated by the presolve
+        self.assertEqual(m.z.value, 2)
+
+        duals = info.get_duals(sol.duals)
+        self.assertEqual(len(duals), 2)
+        self.assertEqual(duals[m.c2], -1)
+        self.assertEqual(duals[m.con], -12)
+
+        with self.assertRaisesRegex(
+            ValueError, "Expected 3 primal values, but received 2"
+        ):
+            info.load_vars(sol.duals)
+
+    def test_scale_model_invalid_factor(self):
+        m = ConcreteModel()
+        m.x = Var()
+        m.c = Constraint(expr=m.x >= 1)
+        m.o = Objective(expr=m.x)
+        m.scaling_factor = Suffix(direction=Suffix.EXPORT)
+        m.scaling_factor[m.x] = 0
+        with self.assertRaisesRegex(
+            ValueError, r"Invalid scaling factor \(0\) for component 'x'"
+        ):
+            nl_writer.NLWriter().write(m, io.StringIO(), scale_model=True)
+
+    def test_persistent_writer_reuses_repns(self):
+        m = ConcreteModel()
+        m.p = Param(initialize=2, mutable=True)
+        m.x = Var([1, 2, 3])
+        m.e = Expression(expr=m.x[1] ** 2)
+        m.c1 = Constraint(expr=m.p * m.x[1] + m.x[2] ** 2 >= 1)
+        m.c2 = Constraint(expr=m.x[2] + m.x[3] == 3)
+        m.c3 = Constraint(expr=m.x[3] + m.e <= 5)
+        m.o = Objective(expr=m.x[1] + m.x[3])
+
+        writer = nl_writer.PersistentNLWriter()
+
+        def _write():
+            OUT = io.StringIO()
+            writer.write(m, OUT, symbolic_solver_labels=True)
+            REF = io.StringIO()
+            nl_writer.NLWriter().write(m, REF, symbolic_solver_labels=True)
+            self.assertEqual(*nl_diff(REF.getvalue(), OUT.getvalue()))
+            return {entry[0].name: entry[2] for entry in writer._repn_cache.values()}
+
+        first = _write()
+        # Expressions referencing named Expressions are not cached
+        self.assertEqual(sorted(first), ['c1', 'c2', 'o'])
+
+        second = _write()
+        for name in first:
+            self.assertIs(first[name], second[name])
+
+        # Changing a mutable Param only recompiles c1
+        m.p = 3
+        third = _write()
+        self.assertIsNot(second['c1'], third['c1'])
+        self.assertIs(second['c2'], third['c2'])
+        self.assertIs(second['o'], third['o'])
+
+        # Fixing a variable recompiles everything referencing it
+        m.x[3].fix(1)
+        fourth = _write()
+        self.assertIs(third['c1'], fourth['c1'])
+        self.assertIsNot(third['c2'], fourth['c2'])
+        self.assertIsNot(third['o'], fourth['o'])
+        m.x[3].value = 2
+        fifth = _write()
+        self.assertIsNot(fourth['c2'], fifth['c2'])
+        self.assertIs(fourth['c1'], fifth['c1'])
+
+        # Replacing the expression recompiles the constraint
+        m.c2.set_value(m.x[2] == 3)
+        sixth = _write()
+        self.assertIsNot(fifth['c2'], sixth['c2'])
+        self.assertIs(fifth['c1'], sixth['c1'])
+
+        # Inactive components are dropped from the cache
+        m.c2.deactivate()
+        self.assertEqual(sorted(_write()), ['c1', 'o'])
+
+        writer.reset()
+        self.assertEqual(writer._repn_cache, {})
+
+    def test_persistent_writer_updates_parametric_coefficients(self):
+        m = ConcreteModel()
+        m.p = Param(initialize=2, mutable=True)
+        m.q = Param(initialize=1, mutable=True)
+        m.x = Var([1, 2, 3])
+        m.y = Var()
+        m.c1 = Constraint(expr=m.p * m.x[1] + m.q * m.x[2] - 3 * m.x[1] >= m.p)
+        m.c2 = Constraint(expr=-(m.p * (m.x[1] + m.y) - m.q**2) <= 0)
+        m.c3 = Constraint(expr=m.p * m.x[3] ** 2 + m.x[2] <= 4)
+        m.o = Objective(expr=m.q * m.x[1] + m.x[3])
+
+        writer = nl_writer.PersistentNLWriter()
+        walked = []
+        walk_expression = nl_writer.AMPLRepnVisitor.walk_expression
+
+        def _walk(visitor, args):
+            walked.append(args[1].name)
+            return walk_expression(visitor, args)
+
+        def _write():
+            walked.clear()
+            OUT = io.StringIO()
+            with unittest.mock.patch.object(
+                nl_writer.AMPLRepnVisitor, 'walk_expression', _walk
+            ):
+                writer.write(m, OUT, symbolic_solver_labels=True)
+            REF = io.StringIO()
+            nl_writer.NLWriter().write(m, REF, symbolic_solver_labels=True)
+            self.assertEqual(*nl_diff(REF.getvalue(), OUT.getvalue()))
+            return sorted(walked)
+
+        self.assertEqual(_write(), ['c1', 'c2', 'c3', 'o'])
+        # Linear expressions only re-evaluate their coefficients
+        m.p = 5
+        m.q = 3
+        self.assertEqual(_write(), ['c3'])
+        m.q = 0.5
+        self.assertEqual(_write(), [])
+        # ...unless a coefficient becomes 0
+        m.p = 3
+        self.assertEqual(_write(), ['c1', 'c3'])
+        m.p = 4
+        self.assertEqual(_write(), ['c3'])
+        m.p = 0
+        self.assertEqual(_write(), ['c2', 'c3'])
+
+    def test_detect_common_subexpressions(self):
+        m = ConcreteModel()
+        m.x = Var(bounds=(0, 1))
+        m.y = Var([1, 2])
+        m.c1 = Constraint(expr=pyo.exp(m.y[1] ** 2) + m.x >= 1)
+        m.c2 = Constraint(expr=m.x * pyo.exp(m.y[1] ** 2) <= 4)
+        m.c3 = Constraint(expr=m.y[1] ** 2 + 2 * m.y[2] + 3 * m.x <= 2)
+        m.c4 = Constraint(expr=2 * m.y[2] + 3 * m.x >= 0)
+        m.o = Objective(expr=pyo.sin(m.y[2]) + m.x * pyo.sin(m.y[2]))
+
+        OUT = io.StringIO()
+        nl_writer.NLWriter().write(
+            m, OUT, symbolic_solver_labels=True, detect_common_subexpressions=True
+        )
+        # Repeated nonlinear subexpressions are exported as defined
+        # variables (repeated linear subexpressions are not)
+        self.assertEqual(
+            *nl_diff(
+                """g3 1 1 0	# problem unknown
+ 3 4 1 0 0 	# vars, constraints, objectives, ranges, eqns
+ 3 1 0 0 0 0	# nonlinear constrs, objs; ccons: lin, nonlin, nd, nzlb
+ 0 0	# network constraints: nonlinear, linear
+ 2 3 1 	# nonlinear vars in constraints, objectives, both
+ 0 0 0 1	# linear network variables; functions; arith, flags
+ 0 0 0 0 0 	# discrete variables: binary, integer, nonlinear (b,c,o)
+ 9 2 	# nonzeros in Jacobian, obj. gradient
+ 2 4	# max name lengths: constraints, variables
+ 0 2 0 0 1	# common exprs: b,c,o,c1,o1
+V3 0 0	#cse[1]
+o5	#^
+v1	#y[1]
+n2
+V4 0 0	#cse[2]
+o44	#exp
+v3	#cse[1]
+C0	#c1
+v4	#cse[2]
+C1	#c2
+o2	#*
+v0	#x
+v4	#cse[2]
+C2	#c3
+v3	#cse[1]
+C3	#c4
+n0
+V5 0 5	#cse[0]
+o41	#sin
+v2	#y[2]
+O0 0	#o
+o0	#+
+v5	#cse[0]
+o2	#*
+v0	#x
+v5	#cse[0]
+x0	# initial guess
+r	#4 ranges (rhs's)
+2 1	#c1
+1 4	#c2
+1 2	#c3
+2 0	#c4
+b	#3 bounds (on variables)
+0 0 1	#x
+3	#y[1]
+3	#y[2]
+k2	#intermediate Jacobian column lengths
+4
+7
+J0 2	#c1
+0 1
+1 0
+J1 2	#c2
+0 0
+1 0
+J2 3	#c3
+0 3
+1 0
+2 2
+J3 2	#c4
+0 3
+2 2
+G0 2	#o
+0 0
+2 0
+""",
+                OUT.getvalue(),
+            )
+        )
+
+        # The option is ignored when not exporting defined variables
+        REF = io.StringIO()
+        nl_writer.NLWriter().write(m, REF, export_defined_variables=False)
+        OUT = io.StringIO()
+        nl_writer.NLWriter().write(
+            m, OUT, export_defined_variables=False, detect_common_subexpressions=True
+        )
+        self.assertEqual(REF.getvalue(), OUT.getvalue())
+
+    def test_compile_processes(self):
+        m = ConcreteModel()
+        m.x = Var(range(20), bounds=(-1, 1))
+        m.p = Param(initialize=3, mutable=True)
+        m.c = Constraint(
+            range(19), rule=lambda m, i: m.x[19 - i] + m.p * m.x[i] ** (i % 3) >= i
+        )
+        m.d = Constraint(expr=pyo.exp(m.x[5] * m.x[6]) <= 4)
+        m.o = Objective(expr=sum(m.x.values()))
+
+        def _write(**options):
+            OUT = io.StringIO()
+            ROW = io.StringIO()
+            COL = io.StringIO()
+            nl_writer.NLWriter().write(
+                m, OUT, ROW, COL, symbolic_solver_labels=True, **options
+            )
+            return OUT.getvalue(), ROW.getvalue(), COL.getvalue()
+
+        self.assertEqual(_write(), _write(compile_processes=4))
+
+        # Named expressions and external functions force serial
+        # compilation (without forking the worker processes)
+        compile_repns_in_parallel = nl_writer.compile_repns_in_parallel
+        calls = []
+
+        def _compile(*args):
+            calls.append(len(args[2]))
+            return compile_repns_in_parallel(*args)
+
+        with unittest.mock.patch.object(
+            nl_writer, 'compile_repns_in_parallel', _compile
+        ):
+            self.assertEqual(_write(), _write(compile_processes=4))
+            self.assertEqual(calls, [20])
+            m.e = Expression(expr=m.x[1] * m.x[2])
+            m.f = Constraint(expr=m.e + m.x[3] <= 1)
+            self.assertEqual(_write(), _write(compile_processes=4))
+            del m.f
+            del m.e
+            m.b = pyo.Block()
+            m.b.ef = ExternalFunction(library='unknown_library', function='f')
+            self.assertEqual(_write(), _write(compile_processes=4))
+            self.assertEqual(calls, [20])
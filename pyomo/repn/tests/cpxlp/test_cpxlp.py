@@ -19,6 +19,8 @@ from ..lp_diff import load_and_compare_lp_baseline
 
 import pyomo.common.unittest as unittest
 
+from io import StringIO
+
 from pyomo.common.log import LoggingIntercept
 from pyomo.common.fileutils import this_file_dir
 from pyomo.common.tempfiles import TempfileManager
@@ -405,6 +407,61 @@ class TestCPXLP_writer(unittest.TestCase):
                 lp_test = FILE.read()
             self.assertEqual(lp_ref, lp_test)
 
+    def test_compile_processes(self):
+        from pyomo.repn.plugins.lp_writer import LPWriter
+
+        model = ConcreteModel()
+        model.x = Var(range(20))
+        model.y = Var()
+        model.c = Constraint(
+            range(19), rule=lambda m, i: m.x[19 - i] + (i + 1) * m.x[i] >= i
+        )
+        model.q = Constraint(expr=model.y**2 + model.x[3] * model.x[4] <= 5)
+        model.e = Constraint(expr=model.y - model.x[0] == 0)
+        model.obj = Objective(expr=sum(model.x.values()))
+
+        ref = StringIO()
+        LPWriter().write(model, ref, symbolic_solver_labels=True)
+        test = StringIO()
+        LPWriter().write(model, test, symbolic_solver_labels=True, compile_processes=3)
+        self.assertEqual(ref.getvalue(), test.getvalue())
+
+        # Purely linear models are compiled in parallel
+        model.q.deactivate()
+        ref = StringIO()
+        LPWriter().write(model, ref, symbolic_solver_labels=True)
+        test = StringIO()
+        LPWriter().write(model, test, symbolic_solver_labels=True, compile_processes=3)
+        self.assertEqual(ref.getvalue(), test.getvalue())
+
+    def test_lazy_constraints(self):
+        from pyomo.repn.plugins.lp_writer import LPWriter
+
+        def build(lazy_constraints):
+            model = ConcreteModel(lazy_constraints=lazy_constraints)
+            model.x = Var(range(20))
+            model.c = Constraint(
+                range(20),
+                rule=lambda m, i: m.x[19 - i] + (i + 1) * m.x[i] >= i
+                if i
+                else Constraint.Skip,
+            )
+            model.obj = Objective(expr=sum(model.x.values()))
+            return model
+
+        ref = StringIO()
+        LPWriter().write(build(False), ref, symbolic_solver_labels=True)
+        model = build(True)
+        test = StringIO()
+        LPWriter().write(model, test, symbolic_solver_labels=True)
+        self.assertEqual(ref.getvalue(), test.getvalue())
+        # The skipped constraint was not added (as with eager construction)
+        self.assertEqual(list(model.c), list(build(False).c))
+        # Only the last constraint expression is retained
+        self.assertEqual(
+            [i for i, con in model.c.items() if con._expr is not None], [19]
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -16,9 +16,23 @@ import os
 import random
 
 from filecmp import cmp
+from io import StringIO
+
 import pyomo.common.unittest as unittest
 
-from pyomo.environ import ConcreteModel, Var, Objective, Constraint, ComponentMap
+from pyomo.environ import (
+    ConcreteModel,
+    Var,
+    Objective,
+    Constraint,
+    ComponentMap,
+    SOSConstraint,
+    Binary,
+    Integers,
+    RangeSet,
+    maximize,
+)
+from pyomo.repn.plugins.mps_writer import MPSWriter, _FixedFormatRowLabeler
 
 thisdir = os.path.dirname(os.path.abspath(__file__))
 
@@ -186,5 +200,235 @@ class TestMPSOrdering(unittest.TestCase):
         self._check_baseline(model, row_order=row_order)
 
 
+class TestMPSOrdering_v2(TestMPSOrdering):
+    def _get_fnames(self):
+        class_name, test_name = self.id().split('.')[-2:]
+        prefix = os.path.join(thisdir, test_name.replace("test_", "", 1))
+        return prefix + ".mps_v2.baseline", prefix + ".mps_v2.out"
+
+    def _check_baseline(self, model, **kwds):
+        baseline_fname, test_fname = self._get_fnames()
+        self._cleanup(test_fname)
+        io_options = {"symbolic_solver_labels": True}
+        io_options.update(kwds)
+        model.write(test_fname, format="mps_v2", io_options=io_options)
+        self.assertTrue(
+            cmp(test_fname, baseline_fname),
+            msg="Files %s and %s differ" % (test_fname, baseline_fname),
+        )
+        self._cleanup(test_fname)
+
+    # The default column order in the v2 writer is the order in which
+    # variables are encountered when walking the expressions, so we do
+    # not randomize the expression terms.
+    def _gen_expression(self, terms):
+        expr = 0.0
+        for term in terms:
+            if type(term) is tuple:
+                prodexpr = 1.0
+                for x in term:
+                    prodexpr *= x
+                expr += prodexpr
+            else:
+                expr += term
+        return expr
+
+
+class TestMPSWriter(unittest.TestCase):
+    def _model(self):
+        m = ConcreteModel()
+        m.x = Var(bounds=(0, 4))
+        m.y = Var(within=Integers)
+        m.z = Var(within=Binary)
+        m.v = Var([1, 2], bounds=(0, 1))
+        m.obj = Objective(expr=m.x + 2 * m.y + 3, sense=maximize)
+        m.c = Constraint(expr=m.x + m.y >= 1)
+        m.r = Constraint(expr=(0, m.x - m.z + 1, 5))
+        m.e = Constraint(expr=m.x + m.y == 2.123456789012345)
+        m.s = SOSConstraint(var=m.v, sos=1)
+        return m
+
+    def test_free_format(self):
+        m = self._model()
+        OUT = StringIO()
+        MPSWriter().write(m, OUT, symbolic_solver_labels=True)
+        self.assertEqual(
+            OUT.getvalue(),
+            """* Source:     Pyomo MPS Writer
+* Format:     Free MPS
+*
+NAME          unknown
+OBJSENSE
+    MAX
+ROWS
+ N  obj
+ G  c_l_c_
+ G  r_l_r_
+ L  r_u_r_
+ E  c_e_e_
+COLUMNS
+    ONE_VAR_CONSTANT obj 3
+    x obj 1
+    x c_l_c_ 1
+    x r_l_r_ 1
+    x r_u_r_ 1
+    x c_e_e_ 1
+    y obj 2
+    y c_l_c_ 1
+    y c_e_e_ 1
+    z r_l_r_ -1
+    z r_u_r_ -1
+    v(1) obj 0
+    v(2) obj 0
+RHS
+    RHS c_l_c_ 1
+    RHS r_l_r_ -1
+    RHS r_u_r_ 4
+    RHS c_e_e_ 2.123456789012345
+BOUNDS
+ FX BOUND ONE_VAR_CONSTANT 1
+ LO BOUND x 0
+ UP BOUND x 4
+ LI BOUND y -10E20
+ UI BOUND y 10E20
+ BV BOUND z
+ LO BOUND v(1) 0
+ UP BOUND v(1) 1
+ LO BOUND v(2) 0
+ UP BOUND v(2) 1
+SOS
+ S1 SOS s
+    v(1) 1
+    v(2) 2
+ENDATA
+""",
+        )
+
+    def test_fixed_format(self):
+        m = self._model()
+        OUT = StringIO()
+        MPSWriter().write(m, OUT, mps_format='fixed')
+        self.assertEqual(
+            OUT.getvalue(),
+            """* Source:     Pyomo MPS Writer
+* Format:     Fixed MPS
+*
+NAME          unknown
+OBJSENSE
+    MAX
+ROWS
+ N  obj_0001
+ G  c_l_0002
+ G  r_l_0003
+ L  r_u_0003
+ E  c_e_0004
+COLUMNS
+    C0000001  obj_0001             3
+    C0000002  obj_0001             1
+    C0000002  c_l_0002             1
+    C0000002  r_l_0003             1
+    C0000002  r_u_0003             1
+    C0000002  c_e_0004             1
+    C0000003  obj_0001             2
+    C0000003  c_l_0002             1
+    C0000003  c_e_0004             1
+    C0000004  r_l_0003            -1
+    C0000004  r_u_0003            -1
+    C0000005  obj_0001             0
+    C0000006  obj_0001             0
+RHS
+    RHS       c_l_0002             1
+    RHS       r_l_0003            -1
+    RHS       r_u_0003             4
+    RHS       c_e_0004   2.123456789
+BOUNDS
+ FX BOUND     C0000001             1
+ LO BOUND     C0000002             0
+ UP BOUND     C0000002             4
+ LI BOUND     C0000003        -10E20
+ UI BOUND     C0000003         10E20
+ BV BOUND     C0000004
+ LO BOUND     C0000005             0
+ UP BOUND     C0000005             1
+ LO BOUND     C0000006             0
+ UP BOUND     C0000006             1
+SOS
+ S1 SOS S0000001
+    C0000005             1
+    C0000006             2
+ENDATA
+""",
+        )
+
+        with self.assertRaisesRegex(
+            ValueError, "the label 'c_l_c_long_name_' is longer than 8 characters"
+        ):
+            m.c_long_name = Constraint(expr=m.x >= 0)
+            MPSWriter().write(
+                m, StringIO(), mps_format='fixed', symbolic_solver_labels=True
+            )
+
+    def test_fixed_format_large_model(self):
+        m = ConcreteModel()
+        m.I = RangeSet(150)
+        m.x = Var(m.I, bounds=(0, 1))
+        m.c = Constraint(m.I, rule=lambda m, i: m.x[i] >= 0.5)
+        m.r = Constraint(expr=(-1, m.x[1] + m.x[2], 1))
+        m.o = Objective(expr=sum(m.x.values()))
+        OUT = StringIO()
+        info = MPSWriter().write(m, OUT, mps_format='fixed')
+        lines = OUT.getvalue().splitlines()
+        # Row names keep the row type prefix followed by a base-36 id
+        self.assertIn(" N  obj_0001", lines)
+        self.assertIn(" G  c_l_0047", lines)
+        self.assertIn(" G  r_l_0048", lines)
+        self.assertIn(" L  r_u_0048", lines)
+        self.assertIn(" UP BOUND     C0000150             1", lines)
+        # The symbol map maps the compact names back to the model
+        smap = info.symbol_map
+        self.assertIs(smap.getObject('obj_0001'), m.o)
+        self.assertIs(smap.getObject('c_l_0047'), m.c[150])
+        self.assertIs(smap.getObject('r_l_0048'), m.r)
+        self.assertIs(smap.getObject('r_u_0048'), m.r)
+        self.assertIs(smap.getObject('C0000150'), m.x[150])
+        self.assertEqual(smap.getSymbol(m.c[100]), 'c_l_002T')
+
+    def test_fixed_format_row_limit(self):
+        labeler = _FixedFormatRowLabeler()
+        self.assertEqual(labeler(), '0001')
+        labeler.id = 36**4 - 2
+        self.assertEqual(labeler(), 'ZZZZ')
+        # Row ids past the limit no longer fit in the 8-character names
+        self.assertEqual(labeler(), '10000')
+
+    def test_quadratic(self):
+        m = ConcreteModel()
+        m.x = Var()
+        m.y = Var()
+        m.obj = Objective(expr=m.x**2 + 3 * m.x * m.y + m.y)
+        m.c = Constraint(expr=m.y**2 - m.x * m.y <= 4)
+        OUT = StringIO()
+        MPSWriter().write(m, OUT, symbolic_solver_labels=True)
+        self.assertIn(
+            """QUADOBJ
+    x x 2
+    x y 3
+QCMATRIX    c_u_c_
+    x y -0.5
+    y x -0.5
+    y y 1
+ENDATA
+""",
+            OUT.getvalue(),
+        )
+
+        with self.assertRaisesRegex(
+            ValueError,
+            r"Model constraint \(c\) contains nonlinear terms that "
+            "cannot be written to MPS format",
+        ):
+            MPSWriter().write(m, StringIO(), allow_quadratic_constraint=False)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,119 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2022
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+from io import StringIO
+
+import pyomo.common.unittest as unittest
+
+from pyomo.environ import ConcreteModel, Var, Param, Objective, Constraint, RangeSet
+from pyomo.repn.linear import LinearRepnVisitor
+from pyomo.repn.linear_template import LinearTemplateCompiler, compile_linear_template
+from pyomo.repn.plugins.lp_writer import LPWriter
+from pyomo.repn.plugins.mps_writer import MPSWriter
+
+
+class TestLinearTemplate(unittest.TestCase):
+    def _model(self):
+        m = ConcreteModel()
+        m.T = RangeSet(0, 5)
+        m.x = Var(m.T)
+        m.u = Var(m.T, bounds=(0, 1))
+        m.dt = Param(initialize=0.5, mutable=True)
+        m.p = Param(m.T, initialize=lambda m, t: t + 1, mutable=True)
+        m.q = Param(m.T, initialize=lambda m, t: 2 * t)
+        m.obj = Objective(expr=sum(m.x[t] for t in m.T))
+        m.dyn = Constraint(
+            RangeSet(0, 4),
+            rule=lambda m, t: m.x[t + 1] == m.x[t] + m.dt * m.u[t] * m.p[t] - m.q[t],
+        )
+        m.rng = Constraint(
+            m.T, m.T, rule=lambda m, i, j: (0, m.x[i] - 2 * m.u[j] / m.p[i], m.q[j])
+        )
+        return m
+
+    def test_compile(self):
+        m = self._model()
+        f = compile_linear_template(m.dyn)
+        self.assertIsNotNone(f)
+        const, terms = f(2)
+        self.assertEqual(const, 4)
+        self.assertEqual(
+            [(coef, var.name) for coef, var in terms],
+            [(1, 'x[3]'), (-1, 'x[2]'), (-1.5, 'u[2]')],
+        )
+
+        f = compile_linear_template(m.rng)
+        self.assertIsNotNone(f)
+        const, terms = f((1, 2))
+        self.assertEqual(const, 0)
+        self.assertEqual(
+            [(coef, var.name) for coef, var in terms], [(1, 'x[1]'), (-1, 'u[2]')]
+        )
+
+        # Mutable Params are evaluated when the template is instantiated
+        m.dt = 2
+        const, terms = compile_linear_template(m.dyn)(2)
+        self.assertEqual(
+            [(coef, var.name) for coef, var in terms],
+            [(1, 'x[3]'), (-1, 'x[2]'), (-6, 'u[2]')],
+        )
+
+    def test_not_templatizable(self):
+        m = self._model()
+        # Scalar constraints
+        m.c = Constraint(expr=m.x[0] >= 1)
+        self.assertIsNone(compile_linear_template(m.c))
+        # Nonlinear rules
+        m.nl = Constraint(m.T, rule=lambda m, t: m.x[t] ** 2 >= t)
+        self.assertIsNone(compile_linear_template(m.nl))
+        # Rules with embedded sums over a set
+        m.s = Constraint(m.T, rule=lambda m, t: sum(m.x[i] for i in m.T) >= t)
+        self.assertIsNone(compile_linear_template(m.s))
+        # Rules that cannot be evaluated with template indices
+        m.skip = Constraint(
+            m.T, rule=lambda m, t: m.x[t] >= 0 if t else Constraint.Skip
+        )
+        self.assertIsNone(compile_linear_template(m.skip))
+        # Explicit (dict) initialization
+        m.d = Constraint([1, 2], rule={1: m.x[1] >= 0, 2: m.x[2] >= 0})
+        self.assertIsNone(compile_linear_template(m.d))
+
+    def test_walk_constraint(self):
+        m = self._model()
+        m.nl = Constraint(m.T, rule=lambda m, t: m.x[t] ** 2 >= t)
+        m.x[3].fix(4)
+        m.p[2] = 0
+
+        compiler = LinearTemplateCompiler(LinearRepnVisitor({}, {}, {}))
+        visitor = LinearRepnVisitor({}, {}, {})
+        for con in m.component_data_objects(Constraint):
+            repn = compiler.walk_constraint(con)
+            ref = visitor.walk_expression(con.body)
+            self.assertEqual(repn.constant, ref.constant)
+            # Note: compare the string representations, as nan != nan
+            self.assertEqual(str(repn.linear), str(ref.linear))
+            self.assertEqual(repn.nonlinear is None, ref.nonlinear is None)
+        self.assertEqual(compiler.visitor.var_order, visitor.var_order)
+
+    def test_writers(self):
+        m = self._model()
+        m.x[3].fix(4)
+        m.s = Constraint(m.T, rule=lambda m, t: sum(m.x[i] for i in m.T) >= t)
+        for writer in (LPWriter, MPSWriter):
+            ref = StringIO()
+            writer().write(m, ref, symbolic_solver_labels=True)
+            OUT = StringIO()
+            writer().write(m, OUT, symbolic_solver_labels=True, use_templates=True)
+            self.assertEqual(ref.getvalue(), OUT.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
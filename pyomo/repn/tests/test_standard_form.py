@@ -0,0 +1,148 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2022
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+#
+
+import pyomo.common.unittest as unittest
+
+from pyomo.common.dependencies import numpy as np, scipy_available, numpy_available
+from pyomo.common.errors import InfeasibleConstraintException
+
+import pyomo.environ as pyo
+
+from pyomo.repn.plugins.standard_form import LinearStandardFormCompiler
+
+
+@unittest.skipUnless(
+    scipy_available & numpy_available, "standard_form requires scipy and numpy"
+)
+class TestLinearStandardFormCompiler(unittest.TestCase):
+    def _model(self):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var(bounds=(0, None))
+        m.y = pyo.Var(bounds=(-2, 3))
+        m.z = pyo.Var()
+        m.p = pyo.Param(initialize=3, mutable=True)
+        m.c = pyo.Constraint(expr=m.x + 2 * m.y >= 1)
+        m.d = pyo.Constraint(expr=m.p * m.z - m.y + 1 <= 4)
+        m.e = pyo.Constraint(expr=m.x + m.y + m.z == 2)
+        m.r = pyo.Constraint(expr=(-1, m.x - m.z, 1))
+        m.o = pyo.Objective(expr=m.x + 2 * m.z + 5)
+        return m
+
+    def test_linear_model(self):
+        m = self._model()
+        repn = LinearStandardFormCompiler().write(m)
+
+        # Columns appear in the order they are encountered
+        self.assertEqual(repn.columns, [m.x, m.z, m.y])
+        self.assertEqual(
+            repn.rows, [(m.c, -1), (m.d, 1), (m.e, -1), (m.e, 1), (m.r, -1), (m.r, 1)]
+        )
+        self.assertIs(repn.objective, m.o)
+        self.assertTrue(np.all(repn.c == np.array([1, 2, 0])))
+        self.assertEqual(repn.c0, 5)
+        self.assertIsNone(repn.Q)
+        self.assertEqual(repn.A.format, 'csr')
+        self.assertTrue(
+            np.all(
+                repn.A.toarray()
+                == np.array(
+                    [
+                        [-1, 0, -2],
+                        [0, 3, -1],
+                        [-1, -1, -1],
+                        [1, 1, 1],
+                        [-1, 1, 0],
+                        [1, -1, 0],
+                    ]
+                )
+            )
+        )
+        self.assertTrue(np.all(repn.b == np.array([-1, 3, -2, 2, 1, 1])))
+        self.assertTrue(np.all(repn.col_lb == np.array([0, -np.inf, -2])))
+        self.assertTrue(np.all(repn.col_ub == np.array([np.inf, np.inf, 3])))
+
+        # Mutable Params are evaluated when the model is compiled
+        m.p = 5
+        repn = LinearStandardFormCompiler().write(m)
+        self.assertEqual(repn.A[1, 1], 5)
+
+    def test_mixed_form(self):
+        m = self._model()
+        repn = LinearStandardFormCompiler().write(m, mixed_form=True)
+
+        self.assertEqual(
+            repn.rows, [(m.c, -1), (m.d, 1), (m.e, 0), (m.r, -1), (m.r, 1)]
+        )
+        self.assertTrue(
+            np.all(
+                repn.A.toarray()
+                == np.array([[1, 0, 2], [0, 3, -1], [1, 1, 1], [1, -1, 0], [1, -1, 0]])
+            )
+        )
+        self.assertTrue(np.all(repn.b == np.array([1, 3, 2, -1, 1])))
+
+    def test_ordering_and_format(self):
+        m = self._model()
+        m.unused = pyo.Var()
+        repn = LinearStandardFormCompiler().write(
+            m, column_order=[m.z, m.unused], row_order=[m.e, m.d], matrix_format='csc'
+        )
+        self.assertEqual(repn.columns, [m.z, m.unused, m.x, m.y])
+        self.assertEqual(
+            repn.rows, [(m.e, -1), (m.e, 1), (m.d, 1), (m.c, -1), (m.r, -1), (m.r, 1)]
+        )
+        self.assertEqual(repn.A.format, 'csc')
+        self.assertTrue(np.all(repn.c == np.array([2, 0, 1, 0])))
+        self.assertTrue(np.all(repn.A.toarray()[:, 1] == 0))
+
+    def test_quadratic_objective(self):
+        m = self._model()
+        m.o.expr = m.x**2 + 3 * m.x * m.y - m.z
+        m.o.sense = pyo.maximize
+        repn = LinearStandardFormCompiler().write(m)
+        # The objective is converted to minimization
+        self.assertTrue(np.all(repn.c == np.array([0, 0, 1])))
+        self.assertEqual(repn.Q.format, 'csr')
+        self.assertTrue(
+            np.all(repn.Q.toarray() == np.array([[-2, -3, 0], [-3, 0, 0], [0, 0, 0]]))
+        )
+
+        repn = LinearStandardFormCompiler().write(m, set_sense=None)
+        self.assertTrue(np.all(repn.c == np.array([0, 0, -1])))
+        self.assertTrue(
+            np.all(repn.Q.toarray() == np.array([[2, 3, 0], [3, 0, 0], [0, 0, 0]]))
+        )
+
+        with self.assertRaisesRegex(
+            ValueError, r"Model objective \(o\) contains nonlinear terms"
+        ):
+            LinearStandardFormCompiler().write(m, allow_quadratic_objective=False)
+
+        m.c.set_value(m.x * m.y >= 1)
+        with self.assertRaisesRegex(
+            ValueError, r"Model constraint \(c\) contains nonlinear terms"
+        ):
+            LinearStandardFormCompiler().write(m)
+
+    def test_trivial_constraints(self):
+        m = self._model()
+        m.z.fix(1)
+        m.t = pyo.Constraint(expr=m.z <= 4)
+        repn = LinearStandardFormCompiler().write(m)
+        self.assertEqual(repn.columns, [m.x, m.y])
+        self.assertNotIn(m.t, [row[0] for row in repn.rows])
+
+        m.t.set_value(m.z >= 4)
+        with self.assertRaisesRegex(
+            InfeasibleConstraintException, "trivially infeasible constraint 't'"
+        ):
+            LinearStandardFormCompiler().write(m)
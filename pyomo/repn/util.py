@@ -12,7 +12,9 @@
 import enum
 import itertools
 import logging
+import multiprocessing
 import sys
+from operator import itemgetter
 
 from pyomo.common.collections import Sequence, ComponentMap
 from pyomo.common.deprecation import deprecation_warning
@@ -402,6 +404,125 @@ def ordered_active_constraints(model, config):
     return sorted(constraints, key=lambda x: _row_getter(id(x), _n))
 
 
+# State shared with the forked worker processes used by
+# compile_repns_in_parallel()
+_parallel_compile_state = None
+
+
+def _compile_shard(shard):
+    visitor, exprs, bounds, validate = _parallel_compile_state
+    var_map = visitor.var_map
+    n_vars = len(var_map)
+    start, end = bounds[shard]
+    repns = list(map(visitor.walk_expression, exprs[start:end]))
+    if validate is not None and not validate(visitor, repns):
+        return None
+    return repns, list(itertools.islice(var_map, n_vars, None))
+
+
+def compile_repns_in_parallel(model, visitor, exprs, processes):
+    """Compile a list of expressions using a pool of forked processes
+
+    The expressions are partitioned into contiguous shards that are
+    walked (using `visitor`) by worker processes forked from the
+    current process.  Because the workers are forked, the variable ids
+    in the returned representations refer to the variables in this
+    process.  The variables first encountered by each shard are merged
+    into ``visitor.var_map`` (and ``visitor.var_order``, if present) in
+    shard order, so the resulting variable ordering (and therefore the
+    file written) is identical to compiling the expressions serially.
+
+    If the visitor defines a ``validate_parallel_repns(repns)`` method,
+    it is called in the worker after compiling each shard: if it
+    returns False (e.g., because the walk generated additional visitor
+    state that cannot be communicated back to this process), the
+    parallel compilation is abandoned.  As the work done by the workers
+    is then wasted, callers should avoid calling this function when it
+    is known in advance that the validation will fail.
+
+    Parameters
+    ----------
+    model: BlockData
+        The model being written (used to map variable ids back to Var
+        objects)
+
+    visitor: StreamBasedExpressionVisitor
+        The (repn-generating) visitor used to compile the expressions
+
+    exprs: list
+        The arguments to pass to ``visitor.walk_expression()``
+
+    processes: int
+        The number of worker processes
+
+    Returns
+    -------
+    list or None
+        The compiled representations (in the same order as `exprs`), or
+        None if the expressions could not be compiled in parallel (in
+        which case the visitor is left unchanged and the caller should
+        fall back on compiling the expressions serially).
+
+    """
+    global _parallel_compile_state
+    if processes < 2 or len(exprs) < 2:
+        return None
+    try:
+        ctx = multiprocessing.get_context('fork')
+    except ValueError:
+        # 'fork' is not available on this platform
+        return None
+    # Use several shards per process to balance the load across
+    # workers (constraint complexity is often not uniform)
+    n_shards = min(len(exprs), 4 * processes)
+    shard_size, remainder = divmod(len(exprs), n_shards)
+    bounds = []
+    start = 0
+    for i in range(n_shards):
+        end = start + shard_size + (1 if i < remainder else 0)
+        bounds.append((start, end))
+        start = end
+
+    _parallel_compile_state = (
+        visitor,
+        exprs,
+        bounds,
+        getattr(visitor.__class__, 'validate_parallel_repns', None),
+    )
+    try:
+        with ctx.Pool(min(processes, n_shards)) as pool:
+            results = pool.map(_compile_shard, range(n_shards))
+    finally:
+        _parallel_compile_state = None
+    if any(result is None for result in results):
+        return None
+
+    # Map the newly-encountered variable ids back to the Var objects
+    # (the ids are valid in this process because the workers were
+    # forked from it)
+    var_map = visitor.var_map
+    new_vars = {}
+    for repns, var_ids in results:
+        for vid in var_ids:
+            if vid not in var_map:
+                new_vars[vid] = None
+    if new_vars:
+        for v in model.component_data_objects(Var, descend_into=True):
+            vid = id(v)
+            if vid in new_vars:
+                new_vars[vid] = v
+        if any(v is None for v in new_vars.values()):
+            # Some expressions reference variables that are not part
+            # of this model.
+            return None
+        var_order = getattr(visitor, 'var_order', None)
+        for vid, v in new_vars.items():
+            var_map[vid] = v
+            if var_order is not None:
+                var_order[vid] = len(var_order)
+    return list(itertools.chain.from_iterable(map(itemgetter(0), results)))
+
+
 # Copied from cpxlp.py:
 # Keven Hunter made a nice point about using %.16g in his attachment
 # to ticket #4319. I am adjusting this to %.17g as this mocks the
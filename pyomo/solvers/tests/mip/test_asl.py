@@ -17,11 +17,13 @@ from filecmp import cmp
 import pyomo.common.unittest as unittest
 
 import pyomo.common
+from pyomo.common.log import LoggingIntercept
 from pyomo.common.fileutils import this_file_dir
-from pyomo.common.tempfiles import TempfileManager
+from pyomo.common.tempfiles import TempfileManager, memory_tempdir
 
-from pyomo.core import ConcreteModel
+from pyomo.core import ConcreteModel, Var, Constraint, Objective, Suffix
 from pyomo.opt import ResultsFormat, SolverResults, SolverFactory
+from pyomo.solvers.plugins.solvers.ASL import MockASL
 
 currdir = this_file_dir()
 deleteFiles = True
@@ -135,6 +137,142 @@ class mock_all(unittest.TestCase):
             pass
 
 
+class _SolWritingMockASL(MockASL):
+    """Mock ASL solver that returns a fixed *.sol file"""
+
+    def __init__(self, sol, **kwds):
+        MockASL.__init__(self, **kwds)
+        self._mock_sol = sol
+
+    def _execute_command(self, cmd):
+        with open(self._soln_file, 'w') as FILE:
+            FILE.write(self._mock_sol)
+        return [0, ""]
+
+
+class TestDirectLoad(unittest.TestCase):
+    sol = (
+        "mock solver: optimal solution\n\nOptions\n3\n1\n1\n0\n"
+        "2\n2\n3\n3\n"
+        "0.5\n-1.5\n"  # duals
+        "1\n2\n3\n"  # primals
+        "objno 0 0\n"
+        "suffix 4 2 5 0 0\nurc\n0 0.25\n2 -4\n"
+        "suffix 1 1 8 0 0\nsstatus\n1 3\n"
+    )
+
+    def _model(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2, 3], bounds=(0, 10))
+        m.c = Constraint(expr=m.x[1] + m.x[2] >= 1)
+        m.d = Constraint(expr=m.x[2] + 2 * m.x[3] <= 5)
+        m.o = Objective(expr=m.x[1] + m.x[2] + m.x[3])
+        m.dual = Suffix(direction=Suffix.IMPORT)
+        m.urc = Suffix(direction=Suffix.IMPORT)
+        m.sstatus = Suffix(direction=Suffix.IMPORT)
+        return m
+
+    def _solve(self, **kwds):
+        m = self._model()
+        m.dual[m.c] = 42
+        opt = _SolWritingMockASL(self.sol)
+        opt.options.solver = 'cplexamp'
+        results = opt.solve(m, **kwds)
+        return m, results
+
+    def test_direct_load(self):
+        ref, ref_results = self._solve()
+        m, results = self._solve(direct_load=True)
+        self.assertEqual(len(results.solution), 0)
+        self.assertEqual(
+            results.solver.termination_condition,
+            ref_results.solver.termination_condition,
+        )
+        self.assertEqual(str(results.solver.status), 'ok')
+        self.assertEqual(len(m.solutions.symbol_map), 0)
+        for v, ref_v in zip(m.x.values(), ref.x.values()):
+            self.assertEqual(v.value, ref_v.value)
+            self.assertFalse(v.stale)
+        self.assertEqual(sorted(m.x[i].value for i in m.x), [1, 2, 3])
+        for suffix in ('dual', 'urc', 'sstatus'):
+            self.assertEqual(
+                {c.name: val for c, val in getattr(m, suffix).items()},
+                {c.name: val for c, val in getattr(ref, suffix).items()},
+            )
+        self.assertEqual(len(m.dual), 2)
+        self.assertEqual(len(m.urc), 2)
+        self.assertEqual(len(m.sstatus), 1)
+
+    def test_direct_load_keeps_writer_info(self):
+        # The writer info is only kept on the symbol map for direct_load
+        m, results = self._solve(load_solutions=False)
+        self.assertFalse(hasattr(results._smap, 'nl_info'))
+        m, results = self._solve(direct_load=True, load_solutions=False)
+        self.assertIsNotNone(results._direct_solution.nl_info)
+
+    def test_direct_load_default_variable_value(self):
+        # A solution without primal values
+        self.sol = (
+            "mock solver: optimal solution\n\nOptions\n3\n1\n1\n0\n"
+            "2\n2\n3\n0\n"
+            "0.5\n-1.5\n"  # duals
+            "objno 0 0\n"
+        )
+        for direct_load in (False, True):
+            m, results = self._solve(direct_load=direct_load, load_solutions=False)
+            m.solutions.load_from(results, default_variable_value=0)
+            self.assertEqual([v.value for v in m.x.values()], [0] * 3)
+            self.assertEqual(sorted(m.dual.values()), [-1.5, 0.5])
+        m, results = self._solve(direct_load=True)
+        self.assertEqual([v.value for v in m.x.values()], [None] * 3)
+
+    def test_memory_tempfiles(self):
+        dname = memory_tempdir()
+        if dname is None:
+            self.skipTest("no memory-backed filesystem is available")
+        m = self._model()
+        opt = _SolWritingMockASL(self.sol)
+        opt.options.solver = 'cplexamp'
+        with TempfileManager.new_context() as tempfiles:
+            opt.solve(m, memory_tempfiles=True, keepfiles=True)
+            files = list(opt._problem_files) + [opt._soln_file, opt._log_file]
+            for fname in files:
+                tempfiles.add_tempfile(fname, exists=False)
+            for fname in files:
+                self.assertEqual(os.path.dirname(fname), dname)
+            self.assertTrue(os.path.exists(opt._problem_files[0]))
+        self.assertEqual(sorted(m.x[i].value for i in m.x), [1, 2, 3])
+
+    def test_direct_load_deferred(self):
+        m, results = self._solve(direct_load=True, load_solutions=False)
+        self.assertEqual([v.value for v in m.x.values()], [None] * 3)
+        self.assertEqual(len(m.solutions.symbol_map), 0)
+        m.solutions.load_from(results)
+        self.assertEqual(sorted(m.x[i].value for i in m.x), [1, 2, 3])
+        self.assertEqual(sorted(m.dual.values()), [-1.5, 0.5])
+
+    def test_direct_load_unsupported(self):
+        # Solvers that do not read NL files (or return SOL files) load
+        # the solution through the SolverResults
+        m = self._model()
+        opt = SolverFactory('_mock_cplex')
+        with LoggingIntercept() as LOG:
+            opt._presolve(m, direct_load=True)
+        TempfileManager.pop()
+        self.assertIn(
+            "The direct_load option is not supported by solver 'cplex' "
+            "(problem format: cpxlp, results format: soln)",
+            LOG.getvalue().replace('\n', ' '),
+        )
+        self.assertIsNone(opt._nl_info)
+        self.assertFalse(hasattr(m.solutions.symbol_map[opt._smap_id], 'nl_info'))
+
+        with LoggingIntercept() as LOG:
+            m, results = self._solve(direct_load=True)
+        self.assertEqual(LOG.getvalue(), "")
+        self.assertEqual(len(results.solution), 0)
+
+
 class mip_all(mock_all):
     def setUp(self):
         self.do_setup(True)
@@ -0,0 +1,131 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2022
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import os
+import threading
+
+import pyomo.common.unittest as unittest
+from pyomo.common.errors import ApplicationError
+from pyomo.common.tempfiles import TempfileManager
+
+import pyomo.environ
+
+from pyomo.core import ConcreteModel, Var, Constraint, Objective, Suffix
+from pyomo.opt import SolverManagerFactory, TerminationCondition
+from pyomo.opt.parallel.manager import ActionStatus, solve_all_instances
+from pyomo.solvers.tests.mip.test_asl import _SolWritingMockASL
+
+_sol = (
+    "mock solver: optimal solution\n\nOptions\n3\n1\n1\n0\n"
+    "1\n1\n2\n2\n"
+    "0.5\n"  # duals
+    "1\n2\n"  # primals
+    "objno 0 0\n"
+)
+
+
+class _BarrierMockASL(_SolWritingMockASL):
+    """Mock ASL solver whose executions must overlap to complete"""
+
+    def __init__(self, barrier, rc=0, **kwds):
+        _SolWritingMockASL.__init__(self, _sol, **kwds)
+        self.options.solver = 'cplexamp'
+        self._barrier = barrier
+        self._mock_rc = rc
+
+    def _execute_command(self, cmd):
+        self._barrier.wait()
+        rc, log = _SolWritingMockASL._execute_command(self, cmd)
+        return [self._mock_rc, log]
+
+
+def _model():
+    m = ConcreteModel()
+    m.x = Var([1, 2], bounds=(0, 10))
+    m.c = Constraint(expr=m.x[1] + m.x[2] >= 1)
+    m.o = Objective(expr=m.x[1] + m.x[2])
+    m.dual = Suffix(direction=Suffix.IMPORT)
+    return m
+
+
+class TestLocalSolverManager(unittest.TestCase):
+    def test_solve_all(self):
+        # The barrier requires both solver executions to run concurrently
+        opt = _BarrierMockASL(threading.Barrier(2, timeout=10))
+        models = [_model() for i in range(4)]
+        depth = len(TempfileManager._context_stack)
+        with SolverManagerFactory('local', max_workers=2) as manager:
+            self.assertEqual(manager.max_workers, 2)
+            solve_all_instances(manager, opt, models)
+        self.assertEqual(len(TempfileManager._context_stack), depth)
+        for m in models:
+            self.assertEqual(sorted(v.value for v in m.x.values()), [1, 2])
+            self.assertEqual(list(m.dual.values()), [0.5])
+            self.assertEqual(len(m.solutions.symbol_map), 0)
+
+    def test_wait_any(self):
+        opt = _BarrierMockASL(threading.Barrier(3, timeout=10))
+        models = [_model() for i in range(3)]
+        with SolverManagerFactory('local', max_workers=3) as manager:
+            ahs = [manager.queue(m, solver=opt, load_solutions=False) for m in models]
+            self.assertEqual(manager.num_queued(), 3)
+            ah = manager.wait_any()
+            self.assertIn(ah, ahs)
+            self.assertEqual(ah.status, ActionStatus.done)
+            manager.wait_all(ahs)
+            self.assertEqual(manager.num_queued(), 0)
+            for ah, m in zip(ahs, models):
+                self.assertEqual(ah.status, ActionStatus.done)
+                self.assertEqual(
+                    sorted(ah.timing.keys()), ['load', 'solve', 'wait', 'write']
+                )
+                self.assertTrue(all(t >= 0 for t in ah.timing.values()))
+                results = manager.get_results(ah)
+                self.assertEqual(
+                    results.solver.termination_condition, TerminationCondition.optimal
+                )
+                self.assertEqual(len(results.solution), 1)
+                self.assertEqual([v.value for v in m.x.values()], [None, None])
+                m.solutions.load_from(results)
+                self.assertEqual(sorted(v.value for v in m.x.values()), [1, 2])
+
+    def test_solver_error(self):
+        opt = _BarrierMockASL(threading.Barrier(1), rc=1)
+        depth = len(TempfileManager._context_stack)
+        with SolverManagerFactory('local', max_workers=1) as manager:
+            ah = manager.queue(_model(), solver=opt)
+            with self.assertRaisesRegex(ApplicationError, "did not exit normally"):
+                manager.wait_any()
+            self.assertEqual(ah.status, ActionStatus.error)
+        self.assertEqual(len(TempfileManager._context_stack), depth)
+
+    def test_exit_releases_outstanding_jobs(self):
+        opt = _BarrierMockASL(threading.Barrier(1))
+        models = [_model() for i in range(2)]
+        depth = len(TempfileManager._context_stack)
+        with SolverManagerFactory('local', max_workers=1) as manager:
+            ahs = [manager.queue(m, solver=opt) for m in models]
+            jobs = list(manager._jobs.values())
+            files = [
+                f[1] for job in jobs for f in job[3].tempfiles if os.path.exists(f[1])
+            ]
+            self.assertTrue(any(f.endswith('.nl') for f in files))
+        self.assertEqual(len(TempfileManager._context_stack), depth)
+        self.assertEqual(manager._jobs, {})
+        self.assertFalse(any(os.path.exists(f) for f in files))
+        for ah, m in zip(ahs, models):
+            self.assertEqual(ah.status, ActionStatus.error)
+            self.assertEqual(len(m.solutions.symbol_map), 0)
+            self.assertEqual([v.value for v in m.x.values()], [None, None])
+
+
+if __name__ == "__main__":
+    unittest.main()
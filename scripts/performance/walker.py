@@ -0,0 +1,85 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2022
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+#
+# Compare the time to write LP and NL files (and to walk expressions)
+# using the Python and compiled StreamBasedExpressionVisitor walkers.
+# The compiled walker must first be built with
+#
+#    pyomo build-extensions
+#
+# Usage: python walker.py [N]
+#
+
+import io
+import sys
+import timeit
+
+import pyomo.core.expr.visitor as visitor
+from pyomo.core.expr.visitor import identify_variables
+from pyomo.environ import ConcreteModel, Constraint, Objective, RangeSet, Var
+from pyomo.repn.plugins.lp_writer import LPWriter
+from pyomo.repn.plugins.nl_writer import NLWriter
+
+
+def linear_model(N):
+    m = ConcreteModel()
+    m.I = RangeSet(N)
+    m.x = Var(m.I, bounds=(0, 1))
+    m.y = Var(m.I)
+    m.c = Constraint(
+        m.I,
+        rule=lambda m, i: sum((j + 1) * m.x[(i + j) % N + 1] for j in range(5))
+        - 2 * m.y[i]
+        >= 1,
+    )
+    m.o = Objective(expr=sum(m.x[i] + m.y[i] for i in m.I))
+    return m
+
+
+def nonlinear_model(N):
+    m = linear_model(N)
+    m.d = Constraint(
+        m.I,
+        rule=lambda m, i: 2 * m.x[i] + 3 * m.y[i] * m.x[i] - m.x[i] ** 2 / (1 + m.y[i])
+        <= 5,
+    )
+    return m
+
+
+def walk_variables(m):
+    for con in m.component_data_objects(Constraint, active=True):
+        list(identify_variables(con.body))
+
+
+def run(N, repeat=3):
+    cases = [
+        ('LP write', linear_model(N), lambda m: LPWriter().write(m, io.StringIO())),
+        ('NL write', nonlinear_model(N), lambda m: NLWriter().write(m, io.StringIO())),
+        ('identify_variables', nonlinear_model(N), walk_variables),
+    ]
+    compiled = visitor.compiled_walker_available
+    if not compiled:
+        print("WARNING: the compiled walker is not available; only timing Python")
+    print("%-20s %12s %12s %8s" % ('', 'Python', 'Compiled', 'Speedup'))
+    for name, m, fcn in cases:
+        visitor.compiled_walker_available = False
+        py = min(timeit.repeat(lambda: fcn(m), number=1, repeat=repeat))
+        if compiled:
+            visitor.compiled_walker_available = True
+            cy = min(timeit.repeat(lambda: fcn(m), number=1, repeat=repeat))
+            print("%-20s %12.3f %12.3f %7.2fx" % (name, py, cy, py / cy))
+        else:
+            print("%-20s %12.3f" % (name, py))
+    visitor.compiled_walker_available = compiled
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
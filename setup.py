@@ -278,6 +278,7 @@ setup_kwargs = dict(
         "pyomo.contrib.mcpp": ["*.cpp"],
         "pyomo.contrib.pynumero": ['src/*', 'src/tests/*'],
         "pyomo.contrib.viewer": ["*.ui"],
+        "pyomo.core.expr": ["*.pxd"],
     },
     ext_modules=ext_modules,
     entry_points="""